@@ -18,10 +18,10 @@ def _first_positional_index(argv: list[str]) -> int | None:
             return None
         if a == "--":
             return None
-        if a in ("--home", "-C", "--cd"):
+        if a in ("--home", "-C", "--cd", "--mind-cache"):
             i += 2
             continue
-        if a.startswith("--home=") or a.startswith("--cd="):
+        if a.startswith("--home=") or a.startswith("--cd=") or a.startswith("--mind-cache="):
             i += 1
             continue
         if a == "--here":
@@ -102,6 +102,11 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(_rewrite_cli_argv(raw_argv))
     home_dir = Path(str(args.home)).expanduser().resolve() if args.home else default_home_dir()
     cfg = load_config(home_dir)
+    mind_cache = str(getattr(args, "mind_cache", "") or "").strip()
+    if mind_cache:
+        mind_cfg = dict(cfg.get("mind") or {})
+        mind_cfg["cache"] = {**dict(mind_cfg.get("cache") or {}), "mode": mind_cache}
+        cfg = {**cfg, "mind": mind_cfg}
 
     from .cli_dispatch import dispatch
 
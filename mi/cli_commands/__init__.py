@@ -1,19 +1,46 @@
-from .show_tail import handle_show, handle_tail
-from .knowledge_workflow import handle_knowledge_workflow_host_commands
-from .claim_ops import handle_claim_commands
-from .node_ops import handle_node_commands
-from .edge_ops import handle_edge_commands
-from .why_ops import handle_why_commands
-from .workflow_ops import handle_workflow_commands
-from .host_ops import handle_host_commands
-from .runtime_ops import handle_run_memory_gc_commands
-from .project_status_ops import handle_status_project_commands
-from .config_values_ops import handle_config_init_values_settings_commands
-from .values_set_flow import run_values_set_flow
+"""CLI command handlers.
+
+Handlers are resolved lazily (PEP 562): importing this package, or one handler, does not
+import the other command modules (and their runtime/Thought DB dependencies).
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+# Public name -> submodule that defines it.
+_HANDLER_MODULES = {
+    "handle_show": "show_tail",
+    "handle_tail": "show_tail",
+    "handle_perf": "perf_ops",
+    "handle_knowledge_workflow_host_commands": "knowledge_workflow",
+    "handle_claim_commands": "claim_ops",
+    "handle_node_commands": "node_ops",
+    "handle_edge_commands": "edge_ops",
+    "handle_why_commands": "why_ops",
+    "handle_workflow_commands": "workflow_ops",
+    "handle_host_commands": "host_ops",
+    "handle_run_memory_gc_commands": "runtime_ops",
+    "handle_status_project_commands": "project_status_ops",
+    "handle_config_init_values_settings_commands": "config_values_ops",
+    "run_values_set_flow": "values_set_flow",
+}
+
+
+def __getattr__(name: str) -> Any:
+    mod = _HANDLER_MODULES.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{mod}", __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "handle_show",
     "handle_tail",
+    "handle_perf",
     "handle_knowledge_workflow_host_commands",
     "handle_claim_commands",
     "handle_node_commands",
@@ -26,3 +53,7 @@ __all__ = [
     "handle_config_init_values_settings_commands",
     "run_values_set_flow",
 ]
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
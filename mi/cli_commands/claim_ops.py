@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
 import sys
 from pathlib import Path
@@ -9,6 +10,7 @@ from typing import Any, Callable
 from ..core.paths import ProjectPaths
 from ..core.storage import iter_jsonl, now_rfc3339
 from ..providers.provider_factory import make_mind_provider
+from ..runtime.autopilot.segment_state import replay_segment_journal, segment_journal_path
 from ..runtime.evidence import EvidenceWriter, new_run_id
 from ..runtime.inspect import tail_json_objects
 from ..runtime.prompts import mine_claims_prompt
@@ -34,20 +36,6 @@ def handle_claim_commands(
         tdb = ThoughtDbStore(home_dir=home_dir, project_paths=pp)
         tdb_app = ThoughtDbApplicationService(tdb=tdb, project_paths=pp)
 
-        def _iter_effective_claims(
-            *,
-            include_inactive: bool,
-            include_aliases: bool,
-            as_of_ts: str,
-            filter_fn: Any,
-        ) -> list[dict]:
-            return tdb_app.list_effective_claims(
-                include_inactive=include_inactive,
-                include_aliases=include_aliases,
-                as_of_ts=as_of_ts,
-                filter_fn=filter_fn,
-            )
-
         def _find_claim_effective(cid: str) -> tuple[str, dict[str, Any] | None]:
             """Return (scope, claim) searching project then global."""
             return tdb_app.find_claim_effective(cid)
@@ -86,24 +74,20 @@ def handle_claim_commands(
                         return False
                 return True
 
-            if scope == "effective":
-                items = _iter_effective_claims(
+            # Newest first, streamed from the views' asserted_ts order: --limit stops early.
+            try:
+                it = tdb_app.iter_claims_recent_first(
+                    scope=scope,
                     include_inactive=include_inactive,
                     include_aliases=include_aliases,
                     as_of_ts=as_of_ts,
                     filter_fn=_claim_matches,
+                    after_id=str(getattr(args, "after", "") or "").strip(),
                 )
-            else:
-                v = tdb.load_view(scope=scope)
-                items = [
-                    x
-                    for x in v.iter_claims(include_inactive=include_inactive, include_aliases=include_aliases, as_of_ts=as_of_ts)
-                    if isinstance(x, dict) and _claim_matches(x)
-                ]
-                items.sort(key=lambda x: str(x.get("asserted_ts") or ""), reverse=True)
-
-            if limit > 0:
-                items = items[:limit]
+                items = list(itertools.islice(it, limit)) if limit > 0 else list(it)
+            except ValueError as e:
+                print(str(e), file=sys.stderr)
+                return 2
 
             if getattr(args, "json", False):
                 print(json.dumps(items, indent=2, sort_keys=True))
@@ -483,6 +467,8 @@ def handle_claim_commands(
                 seg = None
             except Exception:
                 seg = None
+            if isinstance(seg, dict):
+                replay_segment_journal(seg, journal_path=segment_journal_path(pp.segment_state_path))
 
             seg_records: list[dict[str, Any]] = []
             if isinstance(seg, dict) and bool(seg.get("open", False)) and isinstance(seg.get("records"), list):
@@ -500,7 +486,7 @@ def handle_claim_commands(
             allowed_set = set(allowed)
 
             pp.transcripts_dir.mkdir(parents=True, exist_ok=True)
-            mind = make_mind_provider(cfg, project_root=project_root, transcripts_dir=pp.transcripts_dir)
+            mind = make_mind_provider(cfg, project_root=project_root, transcripts_dir=pp.transcripts_dir, home_dir=home_dir)
             tdb_ctx = tdb_app.build_decide_context(
                 as_of_ts=now_rfc3339(),
                 task=str("(manual claim mine) " + (seg.get("task_hint") if isinstance(seg, dict) else "")).strip(),
@@ -161,12 +161,9 @@ def handle_edge_commands(
 
             scopes = [scope] if scope in ("project", "global") else ["project", "global"]
             for sc in scopes:
-                for e in _iter_edges_for_scope(sc):
-                    if str(e.get("edge_id") or "").strip() == eid:
-                        found_scope = sc
-                        obj = e
-                        break
+                obj = tdb.load_view(scope=sc).edge_by_id(eid)
                 if obj:
+                    found_scope = sc
                     break
 
             if not obj:
@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import argparse
+from importlib import import_module
 from pathlib import Path
 from typing import Any, Callable
 
-from .claim_ops import handle_claim_commands
-from .node_ops import handle_node_commands
-from .edge_ops import handle_edge_commands
-from .why_ops import handle_why_commands
-from .workflow_ops import handle_workflow_commands
-from .host_ops import handle_host_commands
+# Subcommand -> (module, handler); imported on dispatch so one command does not load the others.
+_HANDLERS = {
+    "claim": ("claim_ops", "handle_claim_commands"),
+    "node": ("node_ops", "handle_node_commands"),
+    "edge": ("edge_ops", "handle_edge_commands"),
+    "why": ("why_ops", "handle_why_commands"),
+    "workflow": ("workflow_ops", "handle_workflow_commands"),
+    "host": ("host_ops", "handle_host_commands"),
+}
 
 
 def handle_knowledge_workflow_host_commands(
@@ -22,42 +26,19 @@ def handle_knowledge_workflow_host_commands(
     read_user_line: Callable[[str], str],
     unified_diff: Callable[..., str],
 ) -> int | None:
-    for handler in (
-        handle_claim_commands,
-        handle_node_commands,
-        handle_edge_commands,
-        handle_why_commands,
-    ):
-        rc = handler(
-            args=args,
-            home_dir=home_dir,
-            cfg=cfg,
-            resolve_project_root_from_args=resolve_project_root_from_args,
-            effective_cd_arg=effective_cd_arg,
-        )
-        if rc is not None:
-            return rc
+    target = _HANDLERS.get(str(getattr(args, "cmd", "") or "").strip())
+    if target is None:
+        return None
+    mod_name, fn_name = target
+    handler = getattr(import_module(f".{mod_name}", __package__), fn_name)
 
-    rc = handle_workflow_commands(
-        args=args,
-        home_dir=home_dir,
-        cfg=cfg,
-        resolve_project_root_from_args=resolve_project_root_from_args,
-        effective_cd_arg=effective_cd_arg,
-        read_user_line=read_user_line,
-        unified_diff=unified_diff,
-    )
-    if rc is not None:
-        return rc
-
-    rc = handle_host_commands(
-        args=args,
-        home_dir=home_dir,
-        cfg=cfg,
-        resolve_project_root_from_args=resolve_project_root_from_args,
-        effective_cd_arg=effective_cd_arg,
-    )
-    if rc is not None:
-        return rc
-
-    return None
+    kwargs: dict[str, Any] = {
+        "args": args,
+        "home_dir": home_dir,
+        "cfg": cfg,
+        "resolve_project_root_from_args": resolve_project_root_from_args,
+        "effective_cd_arg": effective_cd_arg,
+    }
+    if mod_name == "workflow_ops":
+        kwargs.update(read_user_line=read_user_line, unified_diff=unified_diff)
+    return handler(**kwargs)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
 import sys
 from pathlib import Path
@@ -35,12 +36,6 @@ def handle_node_commands(
         tdb = ThoughtDbStore(home_dir=home_dir, project_paths=pp)
         tdb_app = ThoughtDbApplicationService(tdb=tdb, project_paths=pp)
 
-        def _iter_effective_nodes(*, include_inactive: bool, include_aliases: bool) -> list[dict[str, Any]]:
-            return tdb_app.list_effective_nodes(
-                include_inactive=include_inactive,
-                include_aliases=include_aliases,
-            )
-
         def _find_node_effective(nid: str) -> tuple[str, dict[str, Any] | None]:
             """Return (scope, node) searching project then global."""
             return tdb_app.find_node_effective(nid)
@@ -80,16 +75,20 @@ def handle_node_commands(
                         return False
                 return True
 
-            if scope == "effective":
-                items = _iter_effective_nodes(include_inactive=include_inactive, include_aliases=include_aliases)
-            else:
-                v = tdb.load_view(scope=scope)
-                items = list(v.iter_nodes(include_inactive=include_inactive, include_aliases=include_aliases))
-                items.sort(key=lambda x: str(x.get("asserted_ts") or ""), reverse=True)
-
-            items = [x for x in items if isinstance(x, dict) and _node_matches(x)]
-            if limit > 0:
-                items = items[:limit]
+            # Newest first, streamed from the views' asserted_ts order: --limit stops early.
+            # Filters apply after the effective node_id dedupe (as before).
+            try:
+                it = tdb_app.iter_nodes_recent_first(
+                    scope=scope,
+                    include_inactive=include_inactive,
+                    include_aliases=include_aliases,
+                    after_id=str(getattr(args, "after", "") or "").strip(),
+                )
+                matched = (x for x in it if isinstance(x, dict) and _node_matches(x))
+                items = list(itertools.islice(matched, limit)) if limit > 0 else list(matched)
+            except ValueError as e:
+                print(str(e), file=sys.stderr)
+                return 2
 
             if getattr(args, "json", False):
                 print(json.dumps(items, indent=2, sort_keys=True))
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Callable
+
+from ..core.paths import ProjectPaths
+from ..core.perf import iter_perf_records, summarize_perf
+
+
+def handle_perf(
+    *,
+    args: argparse.Namespace,
+    home_dir: Path,
+    cfg: dict[str, Any],
+    resolve_project_root_from_args: Callable[..., Path],
+    effective_cd_arg: Callable[[argparse.Namespace], str],
+) -> int:
+    project_root = resolve_project_root_from_args(home_dir, effective_cd_arg(args), cfg=cfg, here=bool(getattr(args, "here", False)))
+    pp = ProjectPaths(home_dir=home_dir, project_root=project_root)
+    report = summarize_perf(iter_perf_records(pp.perf_log_path), run_id=str(getattr(args, "run", "") or ""))
+    report["path"] = str(pp.perf_log_path)
+
+    if bool(getattr(args, "json", False)):
+        print(json.dumps(report, indent=2, sort_keys=True))
+        return 0
+
+    phases = report["phases"]
+    if not phases:
+        print(f"no perf records in {pp.perf_log_path} (enable `runtime.perf.enabled` in config.json)")
+        return 0
+
+    print(f"runs={len(report['runs'])} batches={report['batches']} path={report['path']}")
+    width = max(len("phase"), *(len(str(p["phase"])) for p in phases))
+    print(f"{'phase':<{width}}  {'calls':>6}  {'batches':>7}  {'p50_ms':>10}  {'p95_ms':>10}  {'max_ms':>10}  {'total_ms':>11}")
+    for p in phases:
+        print(
+            f"{p['phase']:<{width}}  {p['calls']:>6}  {p['batches']:>7}  "
+            f"{p['p50_ms']:>10.1f}  {p['p95_ms']:>10.1f}  {p['max_ms']:>10.1f}  {p['total_ms']:>11.1f}"
+        )
+    return 0
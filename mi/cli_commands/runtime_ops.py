@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import json
+import sys
 from pathlib import Path
 from typing import Any, Callable
 
 from ..core.paths import GlobalPaths, ProjectPaths
 from ..memory.service import MemoryService
+from ..providers.mind_cache import MindResponseCache, mind_cache_settings
 from ..providers.provider_factory import make_hands_functions, make_mind_provider
 from ..runtime.gc import archive_project_transcripts
+from ..runtime.run_many import RunManyLimits, load_run_many_manifest, run_many
 from ..runtime.runner import run_autopilot
 from ..thoughtdb import ThoughtDbStore
 from ..thoughtdb.compaction import compact_thoughtdb_dir
@@ -37,7 +40,7 @@ def handle_run_memory_gc_commands(
         hands_exec, hands_resume = make_hands_functions(cfg, live=live, hands_raw=hands_raw, redact=run_redact)
         project_root = resolve_project_root_from_args(home_dir, effective_cd_arg(args), cfg=cfg, here=bool(getattr(args, "here", False)))
         project_paths = ProjectPaths(home_dir=home_dir, project_root=project_root)
-        llm = make_mind_provider(cfg, project_root=project_root, transcripts_dir=project_paths.transcripts_dir)
+        llm = make_mind_provider(cfg, project_root=project_root, transcripts_dir=project_paths.transcripts_dir, home_dir=home_dir)
         hands_provider = ""
         hands_cfg = cfg.get("hands") if isinstance(cfg.get("hands"), dict) else {}
         if isinstance(hands_cfg, dict):
@@ -66,6 +69,57 @@ def handle_run_memory_gc_commands(
             print(result.render_text())
         return 0 if result.status == "done" else 1
 
+    if args.cmd == "run-many":
+        try:
+            entries = load_run_many_manifest(Path(str(args.manifest)))
+        except (OSError, ValueError) as e:
+            print(f"run-many: cannot load manifest: {e}", file=sys.stderr)
+            return 2
+        runtime_cfg = cfg.get("runtime") if isinstance(cfg.get("runtime"), dict) else {}
+        base = RunManyLimits.from_runtime_config(runtime_cfg)
+        mind_rate = getattr(args, "mind_rate", None)
+        limits = RunManyLimits(
+            max_parallel=int(args.max_parallel) if int(args.max_parallel or 0) > 0 else base.max_parallel,
+            hands_cap=int(args.hands_cap) if int(args.hands_cap or 0) > 0 else base.hands_cap,
+            mind_cap=int(args.mind_cap) if int(args.mind_cap or 0) > 0 else base.mind_cap,
+            mind_rate_per_min=max(0.0, float(mind_rate)) if mind_rate is not None else base.mind_rate_per_min,
+        )
+        hands_cfg = cfg.get("hands") if isinstance(cfg.get("hands"), dict) else {}
+        as_json = bool(getattr(args, "json", False))
+
+        def _make_llm(project_root: Path) -> Any:
+            pp = ProjectPaths(home_dir=home_dir, project_root=project_root)
+            return make_mind_provider(cfg, project_root=project_root, transcripts_dir=pp.transcripts_dir, home_dir=home_dir)
+
+        def _print_done(r: dict[str, Any]) -> None:
+            err = f" error={r['error']}" if r.get("error") else ""
+            print(f"[{r['index']}] status={r['status']} batches={r['batches']} wall_s={r['wall_s']} {r['project_root']}{err}", flush=True)
+
+        report = run_many(
+            entries=entries,
+            home_dir=home_dir,
+            limits=limits,
+            make_hands=lambda: make_hands_functions(cfg),
+            make_llm=_make_llm,
+            hands_provider=str(hands_cfg.get("provider") or "").strip(),
+            continue_hands=bool(hands_cfg.get("continue_across_runs", False)),
+            on_run_done=None if as_json else _print_done,
+        )
+        if as_json:
+            print(json.dumps(report, indent=2, sort_keys=True))
+        else:
+            t = report["totals"]
+            qw = report["queue_wait"]
+            print(
+                f"runs={t['runs']} done={t['done']} errors={t['errors']} batches={t['batches']} "
+                f"mind_calls={t['mind_calls']} wall_s={report['wall_s']}"
+            )
+            print(f"throughput: batches/min={t['batches_per_min']} mind_calls/min={t['mind_calls_per_min']}")
+            for name in ("run", "hands", "mind"):
+                w = qw[name]
+                print(f"queue_wait.{name}: count={w['count']} avg_s={w['avg_wait_s']} max_s={w['max_wait_s']}")
+        return 0 if all(r.get("status") == "done" for r in report["runs"]) else 1
+
     if args.cmd == "memory":
         if args.mem_cmd == "index":
             mem = MemoryService(home_dir)
@@ -151,34 +205,35 @@ def handle_run_memory_gc_commands(
 
             if is_global:
                 gp = GlobalPaths(home_dir=home_dir)
-                snap = gp.thoughtdb_global_dir / "view.snapshot.json"
-                res = compact_thoughtdb_dir(thoughtdb_dir=gp.thoughtdb_global_dir, snapshot_path=snap, dry_run=dry_run)
-                res["scope"] = "global"
+                tdb_pp = ProjectPaths(home_dir=home_dir, project_root=Path("."), _project_id="__global__")
+                tdir = gp.thoughtdb_global_dir
             else:
                 project_root = resolve_project_root_from_args(home_dir, effective_cd_arg(args), cfg=cfg, here=bool(getattr(args, "here", False)))
                 pp = ProjectPaths(home_dir=home_dir, project_root=project_root)
-                snap = pp.thoughtdb_dir / "view.snapshot.json"
-                res = compact_thoughtdb_dir(thoughtdb_dir=pp.thoughtdb_dir, snapshot_path=snap, dry_run=dry_run)
-                res["scope"] = "project"
+                tdb_pp = pp
+                tdir = pp.thoughtdb_dir
+            scope = "global" if is_global else "project"
+            snap = tdir / "view.snapshot.json"
+
+            def _rebuild_snapshot() -> None:
+                # Fresh store: rebuild the view from the compacted files, materialize the token
+                # indices, and persist the snapshot with them.
+                tdb = ThoughtDbStore(home_dir=home_dir, project_paths=tdb_pp)
+                view = tdb.load_view(scope=scope)
+                _ = (view.claim_tokens, view.node_tokens)
+                tdb.flush_snapshots_best_effort()
+
+            res = compact_thoughtdb_dir(
+                thoughtdb_dir=tdir,
+                snapshot_path=snap,
+                dry_run=dry_run,
+                rebuild_snapshot=_rebuild_snapshot,
+            )
+            res["scope"] = scope
+            if not is_global:
                 res["project_id"] = pp.project_id
                 res["project_dir"] = str(pp.project_dir)
 
-            # Rebuild snapshot after applying compaction (best-effort).
-            res["snapshot"] = res.get("snapshot") if isinstance(res.get("snapshot"), dict) else {"path": str(snap)}
-            if not dry_run:
-                try:
-                    if is_global:
-                        dummy_pp = ProjectPaths(home_dir=home_dir, project_root=Path("."), _project_id="__global__")
-                        tdb = ThoughtDbStore(home_dir=home_dir, project_paths=dummy_pp)
-                        tdb.load_view(scope="global")
-                    else:
-                        tdb = ThoughtDbStore(home_dir=home_dir, project_paths=pp)  # type: ignore[arg-type]
-                        tdb.load_view(scope="project")
-                    res["snapshot"]["rebuilt"] = True
-                except Exception as e:
-                    res["snapshot"]["rebuilt"] = False
-                    res["snapshot"]["rebuild_error"] = f"{type(e).__name__}: {e}"
-
             if args.json:
                 print(json.dumps(res, indent=2, sort_keys=True))
                 return 0
@@ -193,9 +248,37 @@ def handle_run_memory_gc_commands(
                 cs = item.get("compact_stats") if isinstance(item.get("compact_stats"), dict) else {}
                 planned = w.get("lines") if isinstance(w.get("lines"), int) else cs.get("output_lines")
                 inp = cs.get("input_lines")
-                print(f"{name}: input_lines={inp} output_lines={planned}")
+                tail = f" tail_bytes={w.get('tail_bytes')}" if "tail_bytes" in w else ""
+                print(f"{name}: input_lines={inp} output_lines={planned}{tail}")
             if dry_run:
                 print("Re-run with --apply to compact and archive.")
             return 0
 
+        if args.gc_cmd == "mind-cache":
+            dry_run = not bool(getattr(args, "apply", False))
+            clear = bool(getattr(args, "clear", False))
+            mc = mind_cache_settings(cfg)
+            cache = MindResponseCache(GlobalPaths(home_dir=home_dir).mind_cache_dir, ttl_s=mc["ttl_s"], max_entries=mc["max_entries"])
+            res = {"dry_run": dry_run, "mode": mc["mode"], "clear": clear, "before": cache.status()}
+            if not dry_run:
+                res["removed"] = cache.clear() if clear else cache.prune()
+                res["after"] = cache.status()
+
+            if args.json:
+                print(json.dumps(res, indent=2, sort_keys=True))
+                return 0
+
+            st = res["before"]
+            stats = st.get("stats") if isinstance(st.get("stats"), dict) else {}
+            mode = "dry-run" if dry_run else "applied"
+            print(f"{mode} mode={mc['mode']} cache_dir={st.get('cache_dir')}")
+            print(f"entries: {st.get('entries')} bytes={st.get('bytes')} ttl_s={st.get('ttl_s')} max_entries={st.get('max_entries')}")
+            print(f"hits: {stats.get('hits')} misses: {stats.get('misses')} hit_rate: {st.get('hit_rate')}")
+            print(f"writes: {stats.get('writes')} expired: {stats.get('expired')} evicted: {stats.get('evicted')}")
+            if dry_run:
+                print("Re-run with --apply to prune" + (" (or --clear --apply to remove all)." if not clear else " (clear all)."))
+            else:
+                print(f"removed: {res.get('removed')}")
+            return 0
+
     return None
@@ -4,14 +4,16 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from ..core.paths import GlobalPaths, ProjectPaths
 from ..core.redact import redact_text
 from ..runtime.inspect import load_last_batch_bundle, summarize_evidence_record, tail_json_objects, tail_raw_lines
 from ..runtime.transcript import last_agent_message_from_transcript, resolve_transcript_path, tail_transcript_lines
-from ..thoughtdb import ThoughtDbStore
-from ..thoughtdb.app_service import ThoughtDbApplicationService
+
+if TYPE_CHECKING:
+    from ..thoughtdb import ThoughtDbStore
+    from ..thoughtdb.app_service import ThoughtDbApplicationService
 
 
 def _latest_transcript_path(pp: ProjectPaths, *, mind: bool) -> Path:
@@ -348,7 +350,7 @@ def _show_evidence_ref(
     if obj is None:
         print(f"evidence event not found: {eid}", file=sys.stderr)
         return 2
-    print_json({"scope": scope, "event": obj})
+    print_json({"scope": scope, "event": obj, "derived": tdb_app.derived_from_event(eid)})
     return 0
 
 
@@ -389,13 +391,9 @@ def _show_edge_ref(
     found_scope = ""
     eobj: dict[str, Any] | None = None
     for sc in ("project", "global"):
-        v = tdb.load_view(scope=sc)
-        for e in v.edges:
-            if isinstance(e, dict) and str(e.get("edge_id") or "").strip() == eid:
-                found_scope = sc
-                eobj = e
-                break
+        eobj = tdb.load_view(scope=sc).edge_by_id(eid)
         if eobj:
+            found_scope = sc
             break
     if not eobj:
         print(f"edge not found: {eid}", file=sys.stderr)
@@ -463,6 +461,10 @@ def handle_show(
 
     project_root = resolve_project_root_from_args(home_dir, effective_cd_arg(args), cfg=cfg, here=bool(getattr(args, "here", False)))
     pp = ProjectPaths(home_dir=home_dir, project_root=project_root)
+    # Deferred: `mi tail` shares this module and should not load Thought DB.
+    from ..thoughtdb import ThoughtDbStore
+    from ..thoughtdb.app_service import ThoughtDbApplicationService
+
     tdb = ThoughtDbStore(home_dir=home_dir, project_paths=pp)
     tdb_app = ThoughtDbApplicationService(tdb=tdb, project_paths=pp)
 
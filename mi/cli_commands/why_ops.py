@@ -31,7 +31,7 @@ def handle_why_commands(
         # Providers/stores.
         tdb = ThoughtDbStore(home_dir=home_dir, project_paths=pp)
         mem = MemoryService(home_dir)
-        mind = make_mind_provider(cfg, project_root=project_root, transcripts_dir=pp.transcripts_dir)
+        mind = make_mind_provider(cfg, project_root=project_root, transcripts_dir=pp.transcripts_dir, home_dir=home_dir)
         tdb_app = ThoughtDbApplicationService(tdb=tdb, project_paths=pp, mem=mem, mind=mind)
 
         top_k = int(getattr(args, "top_k", 12) or 12)
@@ -138,6 +138,71 @@ def handle_why_commands(
                 print(expl)
             return 0
 
+        if args.why_cmd == "run":
+            rt = cfg.get("runtime") if isinstance(cfg.get("runtime"), dict) else {}
+            tdb_cfg = rt.get("thought_db") if isinstance(rt.get("thought_db"), dict) else {}
+            why_cfg = tdb_cfg.get("why_trace") if isinstance(tdb_cfg.get("why_trace"), dict) else {}
+            batch_cfg = why_cfg.get("batch") if isinstance(why_cfg.get("batch"), dict) else {}
+            try:
+                max_targets = int(getattr(args, "max_targets_per_call", 0) or batch_cfg.get("max_targets_per_call", 8) or 8)
+                max_tokens = int(getattr(args, "max_prompt_tokens", 0) or batch_cfg.get("max_prompt_tokens", 12000) or 12000)
+                min_conf = float(why_cfg.get("min_write_confidence", 0.7) or 0.7)
+            except Exception:
+                max_targets, max_tokens, min_conf = 8, 12000, 0.7
+            write_edges = bool(why_cfg.get("write_edges", True)) and not bool(getattr(args, "no_write_edges", False))
+            kinds = set(getattr(args, "kind", None) or ["decide_next"])
+
+            run_id, targets = tdb_app.why_targets_for_run(
+                run_id=str(getattr(args, "run_id", "") or "").strip(),
+                kinds=kinds,
+                top_k=top_k,
+                as_of_ts=as_of_ts,
+            )
+            if not run_id:
+                print(f"run not found in EvidenceLog: {getattr(args, 'run_id', '')}", file=sys.stderr)
+                return 2
+            outcomes = tdb_app.run_why_trace_batch(
+                targets=targets,
+                as_of_ts=as_of_ts,
+                max_prompt_tokens=max_tokens,
+                max_targets_per_call=max_targets,
+                write_edges=write_edges,
+                min_write_confidence=min_conf,
+            )
+
+            evw = EvidenceWriter(path=pp.evidence_log_path, run_id=new_run_id("cli"))
+            payloads: list[dict[str, Any]] = []
+            for t, outcome in zip(targets, outcomes):
+                payloads.append(
+                    evw.append(
+                        {
+                            "kind": "why_trace",
+                            "batch_id": "cli.why_trace",
+                            "ts": now_rfc3339(),
+                            "thread_id": "",
+                            "target": {**t.target, "run_id": run_id},
+                            "as_of_ts": as_of_ts,
+                            "query": t.query,
+                            "candidate_claim_ids": [str(c.get("claim_id") or "") for c in t.candidate_claims if isinstance(c, dict) and str(c.get("claim_id") or "").strip()],
+                            "state": outcome.state,
+                            "mind_transcript_ref": outcome.mind_transcript_ref,
+                            "output": outcome.obj,
+                            "written_edge_ids": list(outcome.written_edge_ids),
+                        }
+                    )
+                )
+            if getattr(args, "json", False):
+                print(json.dumps({"run_id": run_id, "why_traces": payloads}, indent=2, sort_keys=True))
+                return 0
+
+            calls = len({o.mind_transcript_ref for o in outcomes if o.mind_transcript_ref})
+            print(f"run_id={run_id} targets={len(targets)} mind_calls={calls} edges={sum(len(o.written_edge_ids) for o in outcomes)}")
+            for t, outcome in zip(targets, outcomes):
+                out = outcome.obj if isinstance(outcome.obj, dict) else {}
+                chosen = out.get("chosen_claim_ids") if isinstance(out.get("chosen_claim_ids"), list) else []
+                print(f"{t.key} status={out.get('status')} confidence={out.get('confidence')} chosen={','.join(chosen)}")
+            return 0
+
         if args.why_cmd == "claim":
             claim_id = str(getattr(args, "claim_id", "") or "").strip()
             scope = str(getattr(args, "scope", "effective") or "effective").strip()
@@ -309,7 +309,7 @@ def handle_workflow_commands(
                     w0 = apply_global_overrides(w_global0, overlay=overlay2)
                 else:
                     w0 = wf_global.load(wid) if scope == "global" else wf_store.load(wid)
-                llm = make_mind_provider(cfg, project_root=project_root, transcripts_dir=pp.transcripts_dir)
+                llm = make_mind_provider(cfg, project_root=project_root, transcripts_dir=pp.transcripts_dir, home_dir=home_dir)
                 tdb_ctx = tdb_app.build_workflow_edit_context(
                     as_of_ts=now_rfc3339(),
                     task=req,
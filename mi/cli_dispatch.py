@@ -4,24 +4,39 @@ import argparse
 import difflib
 import sys
 from pathlib import Path
-from typing import Any
-
-from . import __version__
-from .cli_commands import (
-    handle_show,
-    handle_tail,
-    handle_knowledge_workflow_host_commands,
-    handle_run_memory_gc_commands,
-    handle_status_project_commands,
-    handle_config_init_values_settings_commands,
-    run_values_set_flow,
-)
+from typing import TYPE_CHECKING, Any
+
+from . import __version__, cli_commands
 from .core.paths import (
     ProjectPaths,
     resolve_cli_project_root,
     record_last_project_selection,
 )
-from .thoughtdb import ThoughtDbStore
+
+if TYPE_CHECKING:
+    from .thoughtdb import ThoughtDbStore
+
+# Subcommand -> handler group. Handler modules (and the runtime/Thought DB code behind them)
+# are imported on dispatch, so e.g. `mi version` / `mi tail` never load the autopilot runtime.
+_COMMAND_GROUPS = {
+    "status": "status_project",
+    "project": "status_project",
+    "config": "config_values",
+    "init": "config_values",
+    "values": "config_values",
+    "settings": "config_values",
+    "run": "runtime",
+    "run-many": "runtime",
+    "memory": "runtime",
+    "gc": "runtime",
+    "claim": "knowledge",
+    "node": "knowledge",
+    "edge": "knowledge",
+    "why": "knowledge",
+    "workflow": "knowledge",
+    "host": "knowledge",
+}
+_GROUP_ORDER = ("status_project", "config_values", "runtime", "knowledge")
 
 
 def _read_stdin_text() -> str:
@@ -92,6 +107,8 @@ def _resolve_project_root_from_args(home_dir: Path, cd_arg: str, *, cfg: dict[st
 
 def dispatch(*, args: argparse.Namespace, home_dir: Path, cfg: dict[str, Any]) -> int:
     def _make_global_tdb() -> ThoughtDbStore:
+        from .thoughtdb import ThoughtDbStore
+
         # Use a dummy ProjectPaths id to avoid accidentally creating a project mapping during global operations.
         dummy_pp = ProjectPaths(home_dir=home_dir, project_root=Path("."), _project_id="__global__")
         return ThoughtDbStore(home_dir=home_dir, project_paths=dummy_pp)
@@ -105,7 +122,7 @@ def dispatch(*, args: argparse.Namespace, home_dir: Path, cfg: dict[str, Any]) -
         dry_run: bool,
         notes: str,
     ) -> dict[str, Any]:
-        return run_values_set_flow(
+        return cli_commands.run_values_set_flow(
             home_dir=home_dir,
             cfg=cfg,
             make_global_tdb=_make_global_tdb,
@@ -122,7 +139,7 @@ def dispatch(*, args: argparse.Namespace, home_dir: Path, cfg: dict[str, Any]) -
         return 0
 
     def _handle_show_cmd() -> int:
-        return handle_show(
+        return cli_commands.handle_show(
             args=args,
             home_dir=home_dir,
             cfg=cfg,
@@ -132,7 +149,16 @@ def dispatch(*, args: argparse.Namespace, home_dir: Path, cfg: dict[str, Any]) -
         )
 
     def _handle_tail_cmd() -> int:
-        return handle_tail(
+        return cli_commands.handle_tail(
+            args=args,
+            home_dir=home_dir,
+            cfg=cfg,
+            resolve_project_root_from_args=_resolve_project_root_from_args,
+            effective_cd_arg=_effective_cd_arg,
+        )
+
+    def _handle_perf_cmd() -> int:
+        return cli_commands.handle_perf(
             args=args,
             home_dir=home_dir,
             cfg=cfg,
@@ -144,55 +170,64 @@ def dispatch(*, args: argparse.Namespace, home_dir: Path, cfg: dict[str, Any]) -
         "version": _handle_version_cmd,
         "show": _handle_show_cmd,
         "tail": _handle_tail_cmd,
+        "perf": _handle_perf_cmd,
     }
     simple = simple_handlers.get(str(getattr(args, "cmd", "") or "").strip())
     if callable(simple):
         return int(simple())
 
-    rc_status_project = handle_status_project_commands(
-        args=args,
-        home_dir=home_dir,
-        cfg=cfg,
-        make_global_tdb=_make_global_tdb,
-        resolve_project_root_from_args=_resolve_project_root_from_args,
-        effective_cd_arg=_effective_cd_arg,
-    )
-    if rc_status_project is not None:
-        return rc_status_project
-
-    rc_cfg_values = handle_config_init_values_settings_commands(
-        args=args,
-        home_dir=home_dir,
-        cfg=cfg,
-        read_stdin_text=_read_stdin_text,
-        do_values_set=_do_values_set,
-        make_global_tdb=_make_global_tdb,
-        resolve_project_root_from_args=_resolve_project_root_from_args,
-        effective_cd_arg=_effective_cd_arg,
-    )
-    if rc_cfg_values is not None:
-        return rc_cfg_values
-
-    rc_runtime = handle_run_memory_gc_commands(
-        args=args,
-        home_dir=home_dir,
-        cfg=cfg,
-        resolve_project_root_from_args=_resolve_project_root_from_args,
-        effective_cd_arg=_effective_cd_arg,
-    )
-    if rc_runtime is not None:
-        return rc_runtime
-
-    rc = handle_knowledge_workflow_host_commands(
-        args=args,
-        home_dir=home_dir,
-        cfg=cfg,
-        resolve_project_root_from_args=_resolve_project_root_from_args,
-        effective_cd_arg=_effective_cd_arg,
-        read_user_line=_read_user_line,
-        unified_diff=_unified_diff,
-    )
-    if rc is not None:
-        return rc
+    def _status_project() -> int | None:
+        return cli_commands.handle_status_project_commands(
+            args=args,
+            home_dir=home_dir,
+            cfg=cfg,
+            make_global_tdb=_make_global_tdb,
+            resolve_project_root_from_args=_resolve_project_root_from_args,
+            effective_cd_arg=_effective_cd_arg,
+        )
+
+    def _config_values() -> int | None:
+        return cli_commands.handle_config_init_values_settings_commands(
+            args=args,
+            home_dir=home_dir,
+            cfg=cfg,
+            read_stdin_text=_read_stdin_text,
+            do_values_set=_do_values_set,
+            make_global_tdb=_make_global_tdb,
+            resolve_project_root_from_args=_resolve_project_root_from_args,
+            effective_cd_arg=_effective_cd_arg,
+        )
+
+    def _runtime() -> int | None:
+        return cli_commands.handle_run_memory_gc_commands(
+            args=args,
+            home_dir=home_dir,
+            cfg=cfg,
+            resolve_project_root_from_args=_resolve_project_root_from_args,
+            effective_cd_arg=_effective_cd_arg,
+        )
+
+    def _knowledge() -> int | None:
+        return cli_commands.handle_knowledge_workflow_host_commands(
+            args=args,
+            home_dir=home_dir,
+            cfg=cfg,
+            resolve_project_root_from_args=_resolve_project_root_from_args,
+            effective_cd_arg=_effective_cd_arg,
+            read_user_line=_read_user_line,
+            unified_diff=_unified_diff,
+        )
+
+    groups = {
+        "status_project": _status_project,
+        "config_values": _config_values,
+        "runtime": _runtime,
+        "knowledge": _knowledge,
+    }
+    routed = _COMMAND_GROUPS.get(str(getattr(args, "cmd", "") or "").strip())
+    for name in (routed,) if routed else _GROUP_ORDER:
+        rc = groups[name]()
+        if rc is not None:
+            return rc
 
     return 2
@@ -32,6 +32,14 @@ def build_parser() -> argparse.ArgumentParser:
         help="Force project root to the current working directory (useful for monorepo subdirs). Ignored if --cd/-C is provided. Must appear before subcommand.",
     )
 
+    parser.add_argument(
+        "--mind-cache",
+        dest="mind_cache",
+        choices=["off", "read", "readwrite"],
+        default=None,
+        help="Override config mind.cache.mode for this invocation (content-addressed Mind response cache). Must appear before subcommand.",
+    )
+
     sub = parser.add_subparsers(dest="cmd", required=True)
 
     add_general_subparsers(sub=sub)
@@ -102,6 +102,30 @@ def add_runtime_subparsers(*, sub: Any) -> None:
     p_tail.add_argument("--jsonl", action="store_true", help="For transcripts: print stored JSONL lines (no pretty formatting).")
     p_tail.add_argument("--redact", action="store_true", help="Redact common secret/token patterns for display.")
 
+    p_many = sub.add_parser(
+        "run-many",
+        help="Run several autopilots concurrently from a manifest (shared Hands/Mind caps; non-interactive).",
+    )
+    p_many.add_argument(
+        "manifest",
+        help="JSON list (or JSONL) of {project_root, task, max_batches}; relative roots resolve against the manifest dir.",
+    )
+    p_many.add_argument("--max-parallel", type=int, default=0, help="Concurrent runs (default: runtime.run_many.max_parallel).")
+    p_many.add_argument("--hands-cap", type=int, default=0, help="Simultaneous Hands processes (default: runtime.run_many.hands_cap).")
+    p_many.add_argument("--mind-cap", type=int, default=0, help="In-flight Mind calls (default: runtime.run_many.mind_cap).")
+    p_many.add_argument(
+        "--mind-rate",
+        type=float,
+        default=None,
+        help="Max Mind call starts per minute across all runs; 0 = unlimited (default: runtime.run_many.mind_rate_per_min).",
+    )
+    p_many.add_argument("--json", action="store_true", help="Print the report as JSON.")
+
+    p_perf = sub.add_parser("perf", help="Summarize per-phase timing spans (p50/p95) recorded with runtime.perf.enabled.")
+    p_perf.add_argument("--cd", default="", help="Project root used to locate MI artifacts.")
+    p_perf.add_argument("--run", default="", help="Only this run_id (or `last`); default: all recorded runs.")
+    p_perf.add_argument("--json", action="store_true", help="Print as JSON.")
+
 
 __all__ = ["add_runtime_subparsers"]
 
@@ -29,6 +29,7 @@ def add_thoughtdb_subparsers(*, sub: Any) -> None:
     )
     p_cll.add_argument("--as-of", default="", help="RFC3339 as-of timestamp (filters valid_from/valid_to; defaults to now).")
     p_cll.add_argument("--limit", type=int, default=0, help="Limit number of results (0 means no limit).")
+    p_cll.add_argument("--after", default="", help="Resume listing after this claim id (cursor from the previous page).")
     p_cll.add_argument("--json", action="store_true", help="Print as JSON.")
 
     p_cls = claim_sub.add_parser("show", help="Show a claim by id.")
@@ -105,6 +106,7 @@ def add_thoughtdb_subparsers(*, sub: Any) -> None:
         help="Filter by derived status (repeatable).",
     )
     p_nl.add_argument("--limit", type=int, default=0, help="Limit number of results (0 means no limit).")
+    p_nl.add_argument("--after", default="", help="Resume listing after this node id (cursor from the previous page).")
     p_nl.add_argument("--json", action="store_true", help="Print as JSON.")
 
     p_ns = node_sub.add_parser("show", help="Show a node by id.")
@@ -196,6 +198,23 @@ def add_thoughtdb_subparsers(*, sub: Any) -> None:
     p_wyc.add_argument("--as-of", default="", help="RFC3339 as-of timestamp (defaults to now).")
     p_wyc.add_argument("--json", action="store_true", help="Print as JSON.")
 
+    p_wyr = why_sub.add_parser("run", help="Batched WhyTrace for every decision of a run (few Mind calls, one edge append).")
+    p_wyr.add_argument("run_id", help="EvidenceLog run_id (run_...) or 'last'.")
+    p_wyr.add_argument("--cd", default="", help="Project root used to locate MI artifacts.")
+    p_wyr.add_argument(
+        "--kind",
+        action="append",
+        choices=["decide_next", "evidence", "hands_input"],
+        default=None,
+        help="EvidenceLog record kinds to trace (repeatable; default: decide_next).",
+    )
+    p_wyr.add_argument("--top-k", type=int, default=12, help="Number of candidate claims to consider per target.")
+    p_wyr.add_argument("--as-of", default="", help="RFC3339 as-of timestamp (defaults to now).")
+    p_wyr.add_argument("--max-targets-per-call", type=int, default=0, help="Targets per Mind call (default: config why_trace.batch).")
+    p_wyr.add_argument("--max-prompt-tokens", type=int, default=0, help="Approximate prompt token budget per call (default: config why_trace.batch).")
+    p_wyr.add_argument("--no-write-edges", action="store_true", help="Do not materialize depends_on edges.")
+    p_wyr.add_argument("--json", action="store_true", help="Print as JSON.")
+
 
 __all__ = ["add_thoughtdb_subparsers"]
 
@@ -176,6 +176,14 @@ def add_workflow_host_subparsers(*, sub: Any) -> None:
     p_gctdb.add_argument("--apply", action="store_true", help="Apply changes (default is dry-run).")
     p_gctdb.add_argument("--json", action="store_true", help="Print result as JSON.")
 
+    p_gcmc = gc_sub.add_parser(
+        "mind-cache",
+        help="Show Mind response cache stats and prune expired/oversize entries (dry-run by default).",
+    )
+    p_gcmc.add_argument("--clear", action="store_true", help="Remove all cache entries and reset stats (with --apply).")
+    p_gcmc.add_argument("--apply", action="store_true", help="Apply changes (default is dry-run).")
+    p_gcmc.add_argument("--json", action="store_true", help="Print result as JSON.")
+
 
 __all__ = ["add_workflow_host_subparsers"]
 
@@ -1,2 +1,2 @@
-"""Core utilities (paths/storage/config/redaction/schema validation)."""
+"""Core utilities (paths/storage/config/redaction/schema validation/perf spans)."""
 
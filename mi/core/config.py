@@ -24,6 +24,13 @@ def default_config() -> dict[str, Any]:
         "mind": {
             # V1 default: use Codex CLI with --output-schema for strict JSON.
             "provider": "codex_schema",  # codex_schema|openai_compatible|anthropic
+            # Optional content-addressed response cache keyed by (provider, base_url, model, generation params, schema, prompt).
+            # Override per invocation with `mi --mind-cache off|read|readwrite ...`.
+            "cache": {
+                "mode": "off",  # off|read|readwrite
+                "ttl_s": 604800,
+                "max_entries": 2000,
+            },
             "openai_compatible": {
                 "base_url": "https://api.openai.com/v1",
                 "model": "",
@@ -32,6 +39,8 @@ def default_config() -> dict[str, Any]:
                 "api_key": "",
                 "timeout_s": 60,
                 "max_retries": 2,
+                # When true, read responses via SSE and stop once a schema-valid JSON object arrives.
+                "stream": False,
             },
             "anthropic": {
                 "base_url": "https://api.anthropic.com",
@@ -43,6 +52,9 @@ def default_config() -> dict[str, Any]:
                 # Required by Anthropic API; allow override to match vendor changes.
                 "anthropic_version": "2023-06-01",
                 "max_tokens": 2048,
+                "stream": False,
+                # When true, send the schema + the prompt's static prefix as cacheable (cache_control) blocks.
+                "prompt_cache": False,
             },
         },
         "hands": {
@@ -122,20 +134,61 @@ def default_config() -> dict[str, Any]:
                 "min_confidence": 0.9,
                 "max_claims_per_checkpoint": 6,
                 "auto_materialize_nodes": True,
+                # Optional: precompute the query-independent decide_next context while Hands runs
+                # (reused only when still exact; otherwise rebuilt synchronously).
+                "speculative_context": False,
+                # Optional: load the global view from a shared, generation-stamped image
+                # (`thoughtdb/global/view.shared.bin`) that every MI process of this home reuses.
+                "shared_global_view": False,
                 "why_trace": {
                     # Optional: run a single WhyTrace at `mi run` end for auditability.
                     "auto_on_run_end": False,
                     "top_k": 12,
                     "min_write_confidence": 0.7,
                     "write_edges": True,
+                    # `mi why run`: several targets per `why_trace_batch` call, within a prompt budget.
+                    "batch": {
+                        "max_targets_per_call": 8,
+                        "max_prompt_tokens": 12000,
+                    },
                 },
             },
+            "checkpoint_async": {
+                # Optional: run checkpoint mining (workflows/preferences/claims/snapshot/nodes) on a
+                # background worker so the next Hands batch does not wait on miner Mind calls.
+                "enabled": False,
+                "max_pending": 2,
+            },
+            "mind_concurrency": {
+                # Optional: issue independent per-batch Mind calls (workflow_progress, risk_judge,
+                # plan_min_checks, auto_answer) concurrently; records are still written in order.
+                "enabled": False,
+                "max_workers": 4,
+            },
+            "perf": {
+                # Optional: record per-phase timing spans (Hands, Mind calls, Thought DB context,
+                # memory search, EvidenceLog writes, checkpoints) to `perf.jsonl`; see `mi perf`.
+                "enabled": False,
+            },
+            "run_many": {
+                # `mi run-many` scheduler limits (CLI flags override): concurrent runs, simultaneous
+                # Hands processes, in-flight Mind calls, and Mind call starts per minute (0 = unlimited).
+                "max_parallel": 4,
+                "hands_cap": 2,
+                "mind_cap": 4,
+                "mind_rate_per_min": 0,
+            },
             "violation_response": {
                 "auto_learn": True,
                 "ask_user_on_high_risk": True,
                 "ask_user_risk_severities": ["high", "critical"],
                 "ask_user_risk_categories": [],
                 "ask_user_respect_should_ask_user": True,
+                # Extra risk markers merged with the built-ins: {"<category>": ["<substring>", ...]}
+                # (case-insensitive). They feed risk signals and interrupt mode `on_any_external`.
+                "risk_markers": {},
+                # Categories whose markers trigger interrupt mode `on_high_risk` (pipe-to-shell always does).
+                "high_risk_categories": ["push", "publish", "delete", "privilege"],
                 # Optional: consolidate multiple per-batch learn_suggested items into a small canonical set.
                 # This is a run-end Mind call (at most one per `mi run`), gated conservatively.
                 "learn_update": {
@@ -316,6 +369,11 @@ def validate_config(cfg: dict[str, Any]) -> dict[str, Any]:
     else:
         errors.append(f"mind.provider: unknown provider {mind_provider!r}")
 
+    mind_cache = mind.get("cache") if isinstance(mind.get("cache"), dict) else {}
+    cache_mode = str(mind_cache.get("mode") or "off").strip().lower()
+    if cache_mode not in ("off", "read", "readwrite"):
+        errors.append(f"mind.cache.mode: invalid value {cache_mode!r} (expected off|read|readwrite)")
+
     # Hands provider validation.
     if hands_provider == "codex":
         need_cmd("codex", context="hands.provider=codex")
@@ -354,6 +412,14 @@ def validate_config(cfg: dict[str, Any]) -> dict[str, Any]:
     else:
         errors.append(f"hands.provider: unknown provider {hands_provider!r}")
 
+    runtime = cfg.get("runtime") if isinstance(cfg.get("runtime"), dict) else {}
+    vr = runtime.get("violation_response") if isinstance(runtime.get("violation_response"), dict) else {}
+    markers = vr.get("risk_markers", {})
+    if not isinstance(markers, dict) or not all(
+        isinstance(v, list) and all(isinstance(m, str) for m in v) for v in markers.values()
+    ):
+        errors.append("runtime.violation_response.risk_markers: expected an object of category -> list of strings")
+
     ok = not errors
     return {"ok": ok, "errors": errors, "warnings": warnings}
 
@@ -386,6 +452,7 @@ def get_config_template(name: str) -> dict[str, Any]:
                     "api_key": "",
                     "timeout_s": 60,
                     "max_retries": 2,
+                    "stream": False,
                 },
             }
         }
@@ -403,6 +470,8 @@ def get_config_template(name: str) -> dict[str, Any]:
                     "max_retries": 2,
                     "anthropic_version": "2023-06-01",
                     "max_tokens": 2048,
+                    "stream": False,
+                    "prompt_cache": False,
                 },
             }
         }
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 import re
 import shutil
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from urllib.parse import urlparse
 
-from .storage import now_rfc3339, read_json_best_effort, write_json_atomic
+from .storage import advisory_lock, now_rfc3339, read_json_best_effort, write_json_atomic
 
 
 def default_home_dir() -> Path:
@@ -86,27 +88,53 @@ def _run_git(root: Path, args: list[str], *, timeout_s: float, limit: int) -> st
     return out
 
 
-def project_identity(project_root: Path) -> dict[str, str]:
-    """Compute a best-effort identity dict for a project root.
+# Env vars that change git repository discovery; the identity cache is bypassed when set.
+_GIT_DISCOVERY_ENV = ("GIT_DIR", "GIT_WORK_TREE", "GIT_COMMON_DIR", "GIT_CEILING_DIRECTORIES", "GIT_DISCOVERY_ACROSS_FILESYSTEM")
+_IDENTITY_CACHE_VERSION = 1
+_IDENTITY_CACHE_MAX_ENTRIES = 256
+# In-process copy of the on-disk identity cache (keyed by cache file path); guarded by the lock
+# (`mi run-many` resolves project ids from several threads).
+_identity_cache_mem: dict[str, dict[str, object]] = {}
+_identity_cache_lock = threading.Lock()
 
-    - For git repos: uses remote origin URL when available, plus a stable relpath
-      within the repo (so different subprojects within a monorepo don't collide).
-    - For non-git: falls back to the resolved absolute path.
-    """
 
-    root = project_root.resolve()
+def _stat_sig(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except Exception:
+        return None
+    return [int(st.st_mtime_ns), int(st.st_size), int(st.st_ino)]
+
+
+def _has_git_marker(dirs: list[Path]) -> bool:
+    return any((d / ".git").exists() for d in dirs)
+
 
+def _compute_project_identity(root: Path) -> tuple[dict[str, str], dict[str, object] | None]:
+    """Compute the identity (git subprocesses); also return cache validation data (None: do not cache)."""
+
+    probe = ""
     if shutil.which("git"):
-        inside = _run_git(root, ["rev-parse", "--is-inside-work-tree"], timeout_s=1, limit=50).lower() == "true"
-    else:
-        inside = False
+        probe = _run_git(
+            root,
+            ["rev-parse", "--is-inside-work-tree", "--show-toplevel", "--absolute-git-dir", "--git-common-dir"],
+            timeout_s=1,
+            limit=8000,
+        )
+    lines = probe.splitlines()
+    inside = len(lines) >= 4 and lines[0].strip().lower() == "true"
 
     if not inside:
         root_s = str(root)
-        return {"kind": "path", "key": "path:" + root_s, "root_path": root_s}
+        # Valid while no `.git` appears in the root or any ancestor.
+        return {"kind": "path", "key": "path:" + root_s, "root_path": root_s}, {"kind": "path"}
 
-    toplevel = _run_git(root, ["rev-parse", "--show-toplevel"], timeout_s=1, limit=2000).strip()
+    toplevel = lines[1].strip()
     toplevel_p = Path(toplevel).resolve() if toplevel else root
+    git_dir = Path(lines[2].strip())
+    common_dir = Path(lines[3].strip())
+    if not common_dir.is_absolute():
+        common_dir = (root / common_dir).resolve()
 
     origin = _run_git(toplevel_p, ["config", "--get", "remote.origin.url"], timeout_s=1, limit=4000).strip()
     origin_norm = _normalize_git_remote(origin)
@@ -131,7 +159,7 @@ def project_identity(project_root: Path) -> dict[str, str]:
         repo_key = "toplevel:" + str(toplevel_p)
 
     key = "git:" + repo_key + (":" + rel if rel else "")
-    return {
+    ident = {
         "kind": "git",
         "key": key,
         "repo_key": repo_key,
@@ -142,6 +170,130 @@ def project_identity(project_root: Path) -> dict[str, str]:
         "git_root_commit": root_commit_s,
         "root_path": str(root),
     }
+    if not origin_norm and not root_commit_s:
+        # The key would change with the first commit, which does not touch HEAD/config.
+        return ident, None
+    head_path = git_dir / "HEAD"
+    config_path = common_dir / "config"
+    check: dict[str, object] = {
+        "kind": "git",
+        "head": [str(head_path), _stat_sig(head_path)],
+        "config": [str(config_path), _stat_sig(config_path)],
+    }
+    return ident, check
+
+
+def _identity_cache_entry_valid(root: Path, entry: dict[str, object]) -> bool:
+    ident = entry.get("identity")
+    check = entry.get("check")
+    if not isinstance(ident, dict) or not isinstance(check, dict):
+        return False
+    if check.get("kind") == "path":
+        return ident.get("kind") == "path" and not _has_git_marker([root, *root.parents])
+    if check.get("kind") != "git" or ident.get("kind") != "git":
+        return False
+    top = Path(str(ident.get("git_toplevel") or ""))
+    if not (top / ".git").exists():
+        return False
+    # A nested repository created between the root and the toplevel changes the identity.
+    between: list[Path] = []
+    d = root
+    while d != top and d != d.parent:
+        between.append(d)
+        d = d.parent
+    if d != top or _has_git_marker(between):
+        return False
+    for name in ("head", "config"):
+        item = check.get(name)
+        if not isinstance(item, list) or len(item) != 2 or item[1] is None:
+            return False
+        if _stat_sig(Path(str(item[0]))) != item[1]:
+            return False
+    return True
+
+
+def _read_identity_cache_entries(path: Path) -> dict[str, object]:
+    try:
+        obj = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        obj = None
+    if not isinstance(obj, dict) or obj.get("version") != _IDENTITY_CACHE_VERSION or not isinstance(obj.get("entries"), dict):
+        return {}
+    return dict(obj["entries"])
+
+
+def _load_identity_cache_entries(path: Path) -> dict[str, object]:
+    """In-process entries of the cache at `path` (loaded once); call with `_identity_cache_lock` held."""
+
+    key = str(path)
+    cached = _identity_cache_mem.get(key)
+    if cached is None:
+        cached = _identity_cache_mem[key] = _read_identity_cache_entries(path)
+    return cached
+
+
+def _entry_ts(entry: object) -> str:
+    return str(entry.get("ts") or "") if isinstance(entry, dict) else ""
+
+
+def _store_identity_cache_entry(path: Path, root: str, entry: dict[str, object] | None) -> None:
+    """Set (or drop, when `entry` is None) one entry and persist it, merged with the file on disk.
+
+    The file is re-read under an advisory lock so concurrent MI processes keep each other's
+    entries (newest `ts` wins per root); the merged result also becomes the in-process copy.
+    """
+
+    with _identity_cache_lock:
+        try:
+            with advisory_lock(path.with_name(path.name + ".lock")):
+                merged = _read_identity_cache_entries(path)
+                for k, v in (_identity_cache_mem.get(str(path)) or {}).items():
+                    if _entry_ts(v) >= _entry_ts(merged.get(k)):
+                        merged[k] = v
+                if entry is None:
+                    merged.pop(root, None)
+                else:
+                    merged[root] = entry
+                if len(merged) > _IDENTITY_CACHE_MAX_ENTRIES:
+                    by_age = sorted(merged, key=lambda k: _entry_ts(merged[k]))
+                    for k in by_age[: len(merged) - _IDENTITY_CACHE_MAX_ENTRIES]:
+                        del merged[k]
+                _identity_cache_mem[str(path)] = merged
+                write_json_atomic(path, {"version": _IDENTITY_CACHE_VERSION, "entries": merged})
+        except Exception:
+            pass
+
+
+def project_identity(project_root: Path, *, home_dir: Path | None = None) -> dict[str, str]:
+    """Compute a best-effort identity dict for a project root.
+
+    - For git repos: uses remote origin URL when available, plus a stable relpath
+      within the repo (so different subprojects within a monorepo don't collide).
+    - For non-git: falls back to the resolved absolute path.
+
+    When `home_dir` is given, results are cached in `<home>/cache/project_identity.json`
+    keyed by resolved path and validated by stat data (the repo's `HEAD`/`config` files and
+    `.git` markers between the path and the toplevel), so repeated commands resolve the
+    identity without spawning `git`.
+    """
+
+    root = project_root.resolve()
+    if home_dir is None or any(os.environ.get(k) for k in _GIT_DISCOVERY_ENV):
+        return _compute_project_identity(root)[0]
+
+    cache_path = GlobalPaths(home_dir=Path(home_dir)).project_identity_cache_path
+    with _identity_cache_lock:
+        entry = _load_identity_cache_entries(cache_path).get(str(root))
+    if isinstance(entry, dict) and _identity_cache_entry_valid(root, entry):
+        return dict(entry["identity"])  # type: ignore[arg-type]
+
+    ident, check = _compute_project_identity(root)
+    if check is None:
+        if entry is not None:
+            _store_identity_cache_entry(cache_path, str(root), None)
+        return ident
+    _store_identity_cache_entry(cache_path, str(root), {"ts": now_rfc3339(), "identity": ident, "check": check})
+    return dict(ident)
 
 
 def resolve_project_id(home_dir: Path, project_root: Path) -> str:
@@ -153,7 +305,7 @@ def resolve_project_id(home_dir: Path, project_root: Path) -> str:
     """
 
     root = project_root.resolve()
-    ident = project_identity(root)
+    ident = project_identity(root, home_dir=home_dir)
     identity_key = str(ident.get("key") or "").strip()
     pid = project_id_for_identity_key(identity_key)
     if pid:
@@ -210,7 +362,7 @@ def resolve_cli_project_root(home_dir: Path, cd: str, *, cwd: Path | None = None
             if p.exists():
                 return p, "env:MI_CD"
 
-    ident_cur = project_identity(cur)
+    ident_cur = project_identity(cur, home_dir=home_dir)
     key_cur = str(ident_cur.get("key") or "").strip()
 
     # If the current directory was previously used as a project root (e.g., a monorepo subproject),
@@ -223,7 +375,7 @@ def resolve_cli_project_root(home_dir: Path, cd: str, *, cwd: Path | None = None
     if git_top:
         top = Path(git_top).resolve()
         if top != cur:
-            ident_top = project_identity(top)
+            ident_top = project_identity(top, home_dir=home_dir)
             key_top = str(ident_top.get("key") or "").strip()
             pid_top = project_id_for_identity_key(key_top)
             if pid_top and (_projects_dir(home_dir) / pid_top).is_dir():
@@ -271,6 +423,11 @@ class ProjectPaths:
     def transcripts_dir(self) -> Path:
         return self.project_dir / "transcripts"
 
+    @property
+    def perf_log_path(self) -> Path:
+        # Optional per-phase timing spans (`runtime.perf.enabled`); diagnostics only.
+        return self.project_dir / "perf.jsonl"
+
     @property
     def workflows_dir(self) -> Path:
         # Project workflow IR is stored in MI home as the source of truth.
@@ -340,6 +497,16 @@ class GlobalPaths:
         # Materialized views (e.g., text index) live here; ledger remains under projects/*.
         return self.home_dir / "indexes"
 
+    @property
+    def mind_cache_dir(self) -> Path:
+        # Optional content-addressed Mind response cache (disposable; safe to delete).
+        return self.home_dir / "cache" / "mind"
+
+    @property
+    def project_identity_cache_path(self) -> Path:
+        # Project identity cache (path -> identity; stat-validated; disposable; safe to delete).
+        return self.home_dir / "cache" / "project_identity.json"
+
     @property
     def thoughtdb_dir(self) -> Path:
         # Thought DB global store (project stores live under projects/<id>/thoughtdb).
@@ -407,7 +574,7 @@ def write_project_selection(home_dir: Path, obj: dict[str, object]) -> None:
 def _selection_entry_for_root(home_dir: Path, project_root: Path) -> dict[str, object]:
     root = Path(project_root).expanduser().resolve()
     pp = ProjectPaths(home_dir=Path(home_dir).expanduser().resolve(), project_root=root)
-    ident = project_identity(root)
+    ident = project_identity(root, home_dir=pp.home_dir)
     return {
         "ts": now_rfc3339(),
         "root_path": str(root),
@@ -0,0 +1,209 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from .storage import append_jsonl, iter_jsonl, now_rfc3339
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+# The recorder of the current `mi run` (None = perf spans disabled; `span()` is then a shared no-op).
+_recorder: "PerfRecorder | None" = None
+
+
+class _Span:
+    __slots__ = ("_rec", "_name", "_parent", "_t0")
+
+    def __init__(self, rec: "PerfRecorder", name: str) -> None:
+        self._rec = rec
+        self._name = name
+        self._parent = ""
+        self._t0 = 0
+
+    def __enter__(self) -> None:
+        stack = self._rec._stack()
+        self._parent = stack[-1] if stack else ""
+        stack.append(self._name)
+        self._t0 = time.monotonic_ns()
+
+    def __exit__(self, *exc: Any) -> bool:
+        t1 = time.monotonic_ns()
+        stack = self._rec._stack()
+        if stack:
+            stack.pop()
+        self._rec._add(self._name, self._parent, self._t0, t1)
+        return False
+
+
+def span(name: str) -> Any:
+    """Time a block as phase `name` (nested spans record their parent; no-op when perf is off)."""
+
+    rec = _recorder
+    if rec is None:
+        return _NO_SPAN
+    return _Span(rec, name)
+
+
+def traced(name: str, fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap `fn` so each call is one `name` span (the span is a no-op while perf is off)."""
+
+    def _call(*args: Any, **kwargs: Any) -> Any:
+        with span(name):
+            return fn(*args, **kwargs)
+
+    return _call
+
+
+def enabled() -> bool:
+    return _recorder is not None
+
+
+class PerfRecorder:
+    """Collects spans for one run and appends one compact `kind=perf` record per batch.
+
+    Record shape (JSONL sidecar, not the EvidenceLog):
+    `{"kind": "perf", "ts", "run_id", "batch_id", "spans": [[name, parent, start_ms, dur_ms], ...]}`
+    where `start_ms` is relative to the recorder start. Spans from helper threads carry no parent
+    and land in the batch that is open when they finish.
+    """
+
+    def __init__(self, *, path: Path, run_id: str) -> None:
+        self.path = Path(path)
+        self.run_id = str(run_id or "")
+        self._t0 = time.monotonic_ns()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._pending: list[list[Any]] = []
+        self._batch_id = "run"
+
+    def _stack(self) -> list[str]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = []
+            self._local.stack = stack
+        return stack
+
+    def _add(self, name: str, parent: str, t0: int, t1: int) -> None:
+        item = [name, parent, round((t0 - self._t0) / 1e6, 3), round((t1 - t0) / 1e6, 3)]
+        with self._lock:
+            self._pending.append(item)
+
+    def begin_batch(self, batch_id: str) -> None:
+        """Flush spans of the previous batch (incl. its checkpoint) and label the next ones."""
+
+        self.flush()
+        with self._lock:
+            self._batch_id = str(batch_id or "") or "run"
+
+    def flush(self) -> None:
+        with self._lock:
+            spans, self._pending = self._pending, []
+            batch_id = self._batch_id
+        if not spans:
+            return
+        rec = {"kind": "perf", "ts": now_rfc3339(), "run_id": self.run_id, "batch_id": batch_id, "spans": spans}
+        try:
+            append_jsonl(self.path, rec)
+        except Exception:
+            # Perf data is diagnostics only; never break a run over it.
+            pass
+
+    def __enter__(self) -> "PerfRecorder":
+        global _recorder
+        self._prev = _recorder
+        _recorder = self
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        global _recorder
+        _recorder = getattr(self, "_prev", None)
+        self.flush()
+        return False
+
+
+def iter_perf_records(path: Path) -> Iterable[dict[str, Any]]:
+    """Yield `kind=perf` records (best-effort: a torn last line is skipped)."""
+
+    try:
+        for obj in iter_jsonl(path):
+            if isinstance(obj, dict) and obj.get("kind") == "perf":
+                yield obj
+    except Exception:
+        return
+
+
+def _pct(sorted_vals: list[float], p: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    idx = max(0, min(len(sorted_vals) - 1, int(math.ceil(p / 100.0 * len(sorted_vals))) - 1))
+    return sorted_vals[idx]
+
+
+def summarize_perf(records: Iterable[dict[str, Any]], *, run_id: str = "") -> dict[str, Any]:
+    """Aggregate perf records into per-phase stats.
+
+    Percentiles are over per-batch totals of a phase (e.g. all Mind decide_next calls of one batch),
+    nearest-rank; `calls` counts individual spans.
+    """
+
+    records = list(records)
+    want = str(run_id or "").strip()
+    if want == "last":
+        want = str(records[-1].get("run_id") or "") if records else ""
+
+    runs: list[str] = []
+    batches: set[tuple[str, str]] = set()
+    per_batch: dict[str, dict[tuple[str, str], float]] = {}
+    calls: dict[str, int] = {}
+    for rec in records:
+        rid = str(rec.get("run_id") or "")
+        if want and rid != want:
+            continue
+        if rid not in runs:
+            runs.append(rid)
+        key = (rid, str(rec.get("batch_id") or ""))
+        batches.add(key)
+        spans = rec.get("spans") if isinstance(rec.get("spans"), list) else []
+        for s in spans:
+            if not isinstance(s, list) or len(s) < 4:
+                continue
+            name = str(s[0] or "")
+            try:
+                dur = float(s[3])
+            except Exception:
+                continue
+            by_batch = per_batch.setdefault(name, {})
+            by_batch[key] = by_batch.get(key, 0.0) + dur
+            calls[name] = calls.get(name, 0) + 1
+
+    phases: list[dict[str, Any]] = []
+    for name, by_batch in per_batch.items():
+        vals = sorted(by_batch.values())
+        phases.append(
+            {
+                "phase": name,
+                "calls": int(calls.get(name, 0)),
+                "batches": len(vals),
+                "p50_ms": round(_pct(vals, 50), 3),
+                "p95_ms": round(_pct(vals, 95), 3),
+                "max_ms": round(vals[-1], 3),
+                "total_ms": round(sum(vals), 3),
+            }
+        )
+    phases.sort(key=lambda x: (-float(x["total_ms"]), str(x["phase"])))
+    return {"runs": runs, "batches": len(batches), "phases": phases}
+
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 
 def _type_name(v: Any) -> str:
@@ -123,3 +123,153 @@ def validate_json_schema(obj: Any, schema: dict[str, Any], *, path: str = "$") -
     # If schema doesn't specify type, accept (we only use typed schemas in MI).
     return errors
 
+
+SchemaValidator = Callable[..., list[str]]
+
+
+def _accept(_obj: Any, _path: str) -> list[str]:
+    return []
+
+
+def _compile(schema: Any) -> Callable[[Any, str], list[str]]:
+    # Mirrors `validate_json_schema` branch-for-branch; keep error strings in sync.
+    if not isinstance(schema, dict):
+        return lambda _obj, path: [f"{path}: schema is not an object"]
+
+    if "anyOf" in schema:
+        subs = schema.get("anyOf")
+        if not isinstance(subs, list) or not subs:
+            return lambda _obj, path: [f"{path}: anyOf must be a non-empty array"]
+        branches: list[tuple[int, Callable[[Any, str], list[str]] | None]] = [
+            (i, _compile(sub) if isinstance(sub, dict) else None) for i, sub in enumerate(subs)
+        ]
+
+        def v_any_of(obj: Any, path: str) -> list[str]:
+            sub_errs: list[list[str]] = []
+            for i, fn in branches:
+                if fn is None:
+                    sub_errs.append([f"{path}: anyOf[{i}] is not an object schema"])
+                    continue
+                e = fn(obj, path)
+                if not e:
+                    return []
+                sub_errs.append(e)
+            sub_errs.sort(key=len)
+            return sub_errs[0] if sub_errs else [f"{path}: anyOf did not match"]
+
+        return v_any_of
+
+    typed = _compile_typed(schema)
+    enum = schema.get("enum") if "enum" in schema else None
+    if not isinstance(enum, list):
+        return typed
+
+    def v_enum(obj: Any, path: str) -> list[str]:
+        if obj not in enum:
+            return [f"{path}: expected one of {enum}, got {_type_name(obj)}={obj!r}"]
+        return typed(obj, path)
+
+    return v_enum
+
+
+def _compile_typed(schema: dict[str, Any]) -> Callable[[Any, str], list[str]]:
+    t = schema.get("type")
+    if not isinstance(t, str):
+        return _accept
+
+    if t == "object":
+        props = schema.get("properties")
+        required = schema.get("required")
+        req_keys = [k for k in required if isinstance(k, str)] if isinstance(required, list) else []
+        allowed = (
+            frozenset(str(k) for k in props.keys())
+            if schema.get("additionalProperties", True) is False and isinstance(props, dict)
+            else None
+        )
+        prop_fns = (
+            [(k, _compile(sub) if isinstance(sub, dict) else None) for k, sub in props.items()]
+            if isinstance(props, dict)
+            else []
+        )
+
+        def v_object(obj: Any, path: str) -> list[str]:
+            if not isinstance(obj, dict):
+                return [f"{path}: expected object, got {_type_name(obj)}"]
+            errors: list[str] = []
+            for k in req_keys:
+                if k not in obj:
+                    errors.append(f"{path}: missing required key {k!r}")
+            if allowed is not None:
+                for k in obj.keys():
+                    if str(k) not in allowed:
+                        errors.append(f"{path}: unexpected key {k!r}")
+            for k, fn in prop_fns:
+                if k not in obj:
+                    continue
+                if fn is None:
+                    errors.append(f"{path}.{k}: invalid subschema")
+                    continue
+                errors.extend(fn(obj[k], f"{path}.{k}"))
+            return errors
+
+        return v_object
+
+    if t == "array":
+        items = schema.get("items")
+        item_fn = _compile(items) if isinstance(items, dict) else None
+
+        def v_array(obj: Any, path: str) -> list[str]:
+            if not isinstance(obj, list):
+                return [f"{path}: expected array, got {_type_name(obj)}"]
+            if item_fn is None:
+                return []
+            errors: list[str] = []
+            for i, item in enumerate(obj):
+                errors.extend(item_fn(item, f"{path}[{i}]"))
+            return errors
+
+        return v_array
+
+    if t == "string":
+        return lambda obj, path: [] if isinstance(obj, str) else [f"{path}: expected string, got {_type_name(obj)}"]
+
+    if t == "number":
+        mn = schema.get("minimum")
+        mx = schema.get("maximum")
+        mn = mn if isinstance(mn, (int, float)) else None
+        mx = mx if isinstance(mx, (int, float)) else None
+
+        def v_number(obj: Any, path: str) -> list[str]:
+            if not isinstance(obj, (int, float)) or isinstance(obj, bool):
+                return [f"{path}: expected number, got {_type_name(obj)}"]
+            errors: list[str] = []
+            if mn is not None and obj < mn:
+                errors.append(f"{path}: expected >= {mn}, got {obj}")
+            if mx is not None and obj > mx:
+                errors.append(f"{path}: expected <= {mx}, got {obj}")
+            return errors
+
+        return v_number
+
+    if t == "boolean":
+        return lambda obj, path: [] if isinstance(obj, bool) else [f"{path}: expected boolean, got {_type_name(obj)}"]
+
+    if t == "null":
+        return lambda obj, path: [] if obj is None else [f"{path}: expected null, got {_type_name(obj)}"]
+
+    return _accept
+
+
+def compile_json_schema(schema: dict[str, Any]) -> SchemaValidator:
+    """Compile `schema` once into a validator closure: `fn(obj, *, path="$") -> list[str]`.
+
+    Same keyword subset and error messages as `validate_json_schema`, without re-walking
+    the schema dict on every call. The schema must not be mutated after compiling.
+    """
+
+    fn = _compile(schema)
+
+    def validate(obj: Any, *, path: str = "$") -> list[str]:
+        return fn(obj, path)
+
+    return validate
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import contextlib
 import json
 import os
 import sys
 import time
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: advisory locks degrade to no-ops
+    fcntl = None  # type: ignore[assignment]
 
 
 def ensure_dir(path: Path) -> None:
@@ -31,6 +37,36 @@ def append_jsonl(path: Path, obj: Any) -> None:
         f.write(json.dumps(obj, sort_keys=True) + "\n")
 
 
+def append_jsonl_many(path: Path, objs: Iterable[Any]) -> None:
+    """Append several records with one open/write (same line format as `append_jsonl`)."""
+
+    lines = "".join(json.dumps(obj, sort_keys=True) + "\n" for obj in objs)
+    if not lines:
+        return
+    ensure_dir(path.parent)
+    with path.open("a", encoding="utf-8") as f:
+        f.write(lines)
+
+
+@contextlib.contextmanager
+def advisory_lock(path: Path, *, shared: bool = False) -> Iterator[None]:
+    """Hold a POSIX `flock` on `path` (created if missing) for the duration of the block.
+
+    Advisory only: it coordinates cooperating MI processes. Without `fcntl` this is a no-op.
+    """
+
+    if fcntl is None:
+        yield
+        return
+    ensure_dir(path.parent)
+    with path.open("a+b") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def iter_jsonl(path: Path) -> Iterable[Any]:
     try:
         with path.open("r", encoding="utf-8") as f:
@@ -98,7 +134,7 @@ def filename_safe_ts(ts: str) -> str:
     return str(ts or "").replace("-", "").replace(":", "")
 
 
-def _quarantine_corrupt_file(path: Path) -> tuple[str, str]:
+def quarantine_corrupt_file(path: Path) -> tuple[str, str]:
     """Best-effort quarantine: rename `path` to `path.corrupt.<ts>[.<n>]`.
 
     Returns (quarantined_to, error). If quarantine fails, quarantined_to is "".
@@ -138,7 +174,7 @@ def read_json_best_effort(
     except FileNotFoundError:
         return default
     except Exception as e:
-        quarantined_to, qerr = _quarantine_corrupt_file(p)
+        quarantined_to, qerr = quarantine_corrupt_file(p)
         item = {
             "path": str(p),
             "label": (str(label or "").strip() or p.name),
@@ -158,7 +194,7 @@ def read_json_best_effort(
     try:
         return json.loads(data)
     except Exception as e:
-        quarantined_to, qerr = _quarantine_corrupt_file(p)
+        quarantined_to, qerr = quarantine_corrupt_file(p)
         item = {
             "path": str(p),
             "label": (str(label or "").strip() or p.name),
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
+import threading
 from pathlib import Path
 from typing import Any, Iterator
 
@@ -25,21 +26,56 @@ def _chunks(items: list[str], *, size: int) -> Iterator[list[str]]:
         yield items[i : i + size]
 
 
+class _HeldConnection:
+    """A shared connection checked out under the backend lock; `close()` only releases the lock."""
+
+    def __init__(self, conn: sqlite3.Connection, lock: threading.RLock) -> None:
+        self._conn = conn
+        self._lock = lock
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def close(self) -> None:
+        try:
+            # Drop anything an aborted operation left uncommitted (no-op after commit).
+            self._conn.rollback()
+        except Exception:
+            pass
+        finally:
+            self._lock.release()
+
+
 class SqliteFtsBackend:
-    """SQLite-backed text index (FTS5/FTS4 best-effort)."""
+    """SQLite-backed text index (FTS5/FTS4 best-effort).
+
+    By default every operation opens its own connection. With `shared_connection=True` (used by
+    `mi run-many`, where several runs in one process share the index) a single connection is reused
+    and operations are serialized on a lock.
+    """
 
     name = "sqlite_fts"
 
-    def __init__(self, home_dir: Path) -> None:
+    def __init__(self, home_dir: Path, *, shared_connection: bool = False) -> None:
         self._home_dir = Path(home_dir).expanduser().resolve()
         self._paths = GlobalPaths(home_dir=self._home_dir)
         self._db_path = self._paths.indexes_dir / "memory.sqlite"
+        self._shared = bool(shared_connection)
+        self._shared_conn: sqlite3.Connection | None = None
+        self._shared_lock = threading.RLock()
 
     @property
     def db_path(self) -> Path:
         return self._db_path
 
     def reset(self) -> None:
+        with self._shared_lock:
+            if self._shared_conn is not None:
+                try:
+                    self._shared_conn.close()
+                except Exception:
+                    pass
+                self._shared_conn = None
         try:
             if self._db_path.exists():
                 self._db_path.unlink()
@@ -47,6 +83,18 @@ class SqliteFtsBackend:
             return
 
     def _connect(self) -> sqlite3.Connection:
+        if self._shared:
+            self._shared_lock.acquire()
+            try:
+                if self._shared_conn is None:
+                    ensure_dir(self._db_path.parent)
+                    conn = sqlite3.connect(str(self._db_path), check_same_thread=False)
+                    conn.row_factory = sqlite3.Row
+                    self._shared_conn = conn
+                return _HeldConnection(self._shared_conn, self._shared_lock)  # type: ignore[return-value]
+            except Exception:
+                self._shared_lock.release()
+                raise
         ensure_dir(self._db_path.parent)
         conn = sqlite3.connect(str(self._db_path))
         conn.row_factory = sqlite3.Row
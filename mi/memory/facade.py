@@ -103,11 +103,18 @@ class MemoryFacade:
     "materialized view" mechanics here so memory backends can evolve.
     """
 
-    def __init__(self, *, home_dir: Path, project_paths: ProjectPaths, runtime_cfg: dict[str, Any]) -> None:
+    def __init__(
+        self,
+        *,
+        home_dir: Path,
+        project_paths: ProjectPaths,
+        runtime_cfg: dict[str, Any],
+        service: MemoryService | None = None,
+    ) -> None:
         self._home_dir = Path(home_dir).expanduser().resolve()
         self._project_paths = project_paths
         self._recall_cfg = CrossProjectRecallConfig.from_runtime_config(runtime_cfg if isinstance(runtime_cfg, dict) else {})
-        self._mem = MemoryService(self._home_dir)
+        self._mem = service if service is not None else MemoryService(self._home_dir)
         self._last_recall_key = ""
         self._structured_ingested = False
 
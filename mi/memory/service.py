@@ -11,6 +11,7 @@ from .ingest import _active_node_items_for_paths, ingest_structured_sources, ite
 from .snapshot import snapshot_item_from_event
 from .types import MemoryItem
 from ..core.paths import GlobalPaths, ProjectPaths
+from ..core.perf import span
 from ..core.storage import iter_jsonl
 
 
@@ -53,13 +54,14 @@ class MemoryService:
         include_global: bool,
         exclude_project_id: str,
     ) -> list[MemoryItem]:
-        return self._backend.search(
-            query=query,
-            top_k=top_k,
-            kinds=kinds,
-            include_global=include_global,
-            exclude_project_id=exclude_project_id,
-        )
+        with span("memory.search"):
+            return self._backend.search(
+                query=query,
+                top_k=top_k,
+                kinds=kinds,
+                include_global=include_global,
+                exclude_project_id=exclude_project_id,
+            )
 
     def status(self) -> dict[str, Any]:
         return self._backend.status()
@@ -107,7 +107,7 @@ def load_project_overlay(*, home_dir: Path, project_root: Path, warnings: list[d
     """
 
     project_paths = ProjectPaths(home_dir=home_dir, project_root=project_root)
-    ident = project_identity(project_root)
+    ident = project_identity(project_root, home_dir=home_dir)
     defaults = _default_overlay(project_paths=project_paths, project_root=project_root, ident=ident)
     raw = read_json_best_effort(project_paths.overlay_path, default=None, label="overlay", warnings=warnings)
     changed = False
@@ -227,7 +227,7 @@ def _run_codex_process(
             item = ev.get("item")
             if isinstance(item, dict) and item.get("type") == "command_execution":
                 cmd = str(item.get("command") or "")
-                if should_interrupt_command(interrupt.mode, cmd):
+                if should_interrupt_command(interrupt.mode, cmd, engine=interrupt.risk_engine):
                     request_interrupt(f"mi.interrupt.requested=1 mode={interrupt.mode} command={cmd}")
 
         if not hands_raw:
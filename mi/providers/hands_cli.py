@@ -109,7 +109,7 @@ def _run_process(
                 found_thread_id = m.group(1)
         if interrupt and line:
             mode = str(interrupt.mode or "")
-            if mode in ("on_high_risk", "on_any_external") and should_interrupt_command(mode, line):
+            if mode in ("on_high_risk", "on_any_external") and should_interrupt_command(mode, line, engine=interrupt.risk_engine):
                 request_interrupt(f"mi.interrupt.requested=1 mode={mode} text={line[:200]}")
 
     exit_code, _duration_ms = run_streaming_process(
@@ -4,7 +4,7 @@ import signal
 from dataclasses import dataclass
 from typing import Iterable
 
-from ..runtime.risk import should_interrupt_text
+from ..runtime.risk import RiskPatternEngine, should_interrupt_text
 
 
 @dataclass(frozen=True)
@@ -12,6 +12,8 @@ class InterruptConfig:
     mode: str  # off|on_high_risk|on_any_external
     signal_sequence: list[str]
     escalation_ms: list[int]
+    # Compiled markers (built-in + `runtime.violation_response.risk_markers`); None = built-in only.
+    risk_engine: RiskPatternEngine | None = None
 
 
 def signal_from_name(name: str) -> int | None:
@@ -23,8 +25,8 @@ def signal_from_name(name: str) -> int | None:
     return getattr(signal, name, None)
 
 
-def should_interrupt_command(mode: str, text: str) -> bool:
-    return should_interrupt_text(mode, text)
+def should_interrupt_command(mode: str, text: str, *, engine: RiskPatternEngine | None = None) -> bool:
+    return should_interrupt_text(mode, text, engine=engine)
 
 
 def compute_escalation_delays_ms(escalation_ms: Iterable[int]) -> list[int]:
@@ -7,13 +7,13 @@ import urllib.request
 from pathlib import Path
 from typing import Any, Callable
 
-from ..core.schema_validate import validate_json_schema
 from ..core.storage import now_rfc3339
 from .mind_errors import MindCallError
 from .mind_utils import append_jsonl as _append_jsonl
 from .mind_utils import extract_json as _extract_json
+from .mind_utils import load_schema
 from .mind_utils import new_mind_transcript_path
-from .mind_utils import schema_path as _schema_path
+from .mind_stream import HttpPostStreamFn, default_http_post_sse, read_streamed_json_object
 from .types import MindProviderResult
 
 
@@ -36,10 +36,28 @@ def _extract_text_from_anthropic(payload: dict[str, Any]) -> str:
     return ""
 
 
+def _extract_stream_delta_from_anthropic(event: dict[str, Any]) -> str:
+    # Messages API streaming: text arrives as content_block_delta/text_delta events.
+    et = event.get("type")
+    if et == "error":
+        err = event.get("error") if isinstance(event.get("error"), dict) else {}
+        raise RuntimeError(f"stream error: {err.get('type') or ''} {err.get('message') or ''}".strip())
+    if et != "content_block_delta":
+        return ""
+    delta = event.get("delta")
+    if isinstance(delta, dict) and delta.get("type") == "text_delta" and isinstance(delta.get("text"), str):
+        return delta["text"]
+    return ""
+
+
 class AnthropicMindProvider:
     """Mind provider using Anthropic's Messages API.
 
     We rely on prompt + local schema validation (best-effort across model versions).
+    With `stream=True`, responses are read via SSE and reading stops once a complete,
+    schema-valid top-level JSON object has arrived.
+    With `prompt_cache=True`, the JSON Schema and the prompt's static prefix (when the
+    prompt builder provides one, see `SplitPrompt`) are sent as `cache_control` blocks.
     """
 
     def __init__(
@@ -53,7 +71,10 @@ class AnthropicMindProvider:
         max_retries: int,
         anthropic_version: str,
         max_tokens: int,
+        stream: bool = False,
+        prompt_cache: bool = False,
         http_post_json: Callable[[str, dict[str, Any], dict[str, str], int], dict[str, Any]] | None = None,
+        http_post_stream: HttpPostStreamFn | None = None,
     ):
         self._base_url = base_url.rstrip("/")
         self._model = model
@@ -63,7 +84,10 @@ class AnthropicMindProvider:
         self._max_retries = int(max_retries)
         self._anthropic_version = str(anthropic_version or "2023-06-01")
         self._max_tokens = int(max_tokens or 2048)
+        self._stream = bool(stream)
+        self._prompt_cache = bool(prompt_cache)
         self._http_post_json = http_post_json or self._default_http_post_json
+        self._http_post_stream = http_post_stream or default_http_post_sse
 
     def _default_http_post_json(self, url: str, body: dict[str, Any], headers: dict[str, str], timeout_s: int) -> dict[str, Any]:
         req = urllib.request.Request(url, data=json.dumps(body).encode("utf-8"), headers=headers, method="POST")
@@ -97,11 +121,8 @@ class AnthropicMindProvider:
                 tag=tag,
             )
 
-        schema_path = _schema_path(schema_filename)
-        schema_text = schema_path.read_text(encoding="utf-8")
-        schema_obj = json.loads(schema_text)
-        if not isinstance(schema_obj, dict):
-            raise ValueError(f"schema {schema_filename} is not an object")
+        schema = load_schema(schema_filename)
+        schema_text = schema.text
 
         transcript_path = new_mind_transcript_path(self._transcripts_dir, tag)
 
@@ -112,12 +133,37 @@ class AnthropicMindProvider:
             "anthropic-version": self._anthropic_version,
         }
 
-        system = (
+        system_text = (
             "You are MI (Mind Incarnation). "
             "Output MUST be a single JSON object matching the provided JSON Schema. "
             "No markdown, no code fences, no extra keys, no commentary."
         )
-        user = (prompt or "").strip() + "\n\nJSON Schema (verbatim):\n" + schema_text.strip() + "\n"
+        system: str | list[dict[str, Any]]
+        user: str | list[dict[str, Any]]
+        prompt_bytes: dict[str, int] | None = None
+        if self._prompt_cache:
+            # Stable material first, marked cacheable: system + schema, then the prompt's static prefix.
+            schema_block = "JSON Schema (verbatim):\n" + schema_text.strip() + "\n"
+            system = [
+                {"type": "text", "text": system_text},
+                {"type": "text", "text": schema_block, "cache_control": {"type": "ephemeral"}},
+            ]
+            static_prefix = str(getattr(prompt, "static_prefix", "") or "")
+            dynamic = (str(prompt)[len(static_prefix) :] if static_prefix else str(prompt or "")).strip()
+            if static_prefix.strip():
+                user = [{"type": "text", "text": static_prefix, "cache_control": {"type": "ephemeral"}}]
+                if dynamic:
+                    user.append({"type": "text", "text": dynamic + "\n"})
+            else:
+                user = dynamic + "\n"
+            prompt_bytes = {
+                "schema": len(schema_block.encode("utf-8")),
+                "static": len(static_prefix.encode("utf-8")),
+                "dynamic": len(dynamic.encode("utf-8")),
+            }
+        else:
+            system = system_text
+            user = (prompt or "").strip() + "\n\nJSON Schema (verbatim):\n" + schema_text.strip() + "\n"
 
         _append_jsonl(
             transcript_path,
@@ -128,6 +174,8 @@ class AnthropicMindProvider:
                 "base_url": self._base_url,
                 "model": self._model,
                 "schema": schema_filename,
+                "prompt_cache": self._prompt_cache,
+                "prompt_bytes": prompt_bytes,
             },
         )
 
@@ -160,6 +208,8 @@ class AnthropicMindProvider:
                     "system": system,
                     "temperature": 0,
                 }
+                if self._stream:
+                    body["stream"] = True
 
                 _append_jsonl(
                     transcript_path,
@@ -172,22 +222,47 @@ class AnthropicMindProvider:
                     },
                 )
 
-                t0 = time.time()
-                payload = self._http_post_json(url, body, headers, self._timeout_s)
-                dt_ms = int((time.time() - t0) * 1000)
+                if self._stream:
+                    streamed = read_streamed_json_object(
+                        lines=self._http_post_stream(url, body, headers, self._timeout_s),
+                        extract_delta=_extract_stream_delta_from_anthropic,
+                        validate=schema.validate,
+                    )
+                    _append_jsonl(
+                        transcript_path,
+                        {
+                            "type": "mi.mind_transcript.response",
+                            "ts": now_rfc3339(),
+                            "attempt": attempt,
+                            "duration_ms": streamed.duration_ms,
+                            "stream": True,
+                            "events": streamed.events,
+                            "stopped_early": streamed.stopped_early,
+                            "time_to_first_token_ms": streamed.time_to_first_token_ms,
+                            "time_to_valid_object_ms": streamed.time_to_valid_object_ms,
+                            "text": streamed.text,
+                        },
+                    )
+                    if streamed.obj is not None:
+                        return MindProviderResult(obj=streamed.obj, transcript_path=transcript_path)
+                    text = streamed.text.strip()
+                else:
+                    t0 = time.time()
+                    payload = self._http_post_json(url, body, headers, self._timeout_s)
+                    dt_ms = int((time.time() - t0) * 1000)
 
-                _append_jsonl(
-                    transcript_path,
-                    {
-                        "type": "mi.mind_transcript.response",
-                        "ts": now_rfc3339(),
-                        "attempt": attempt,
-                        "duration_ms": dt_ms,
-                        "body": payload,
-                    },
-                )
+                    _append_jsonl(
+                        transcript_path,
+                        {
+                            "type": "mi.mind_transcript.response",
+                            "ts": now_rfc3339(),
+                            "attempt": attempt,
+                            "duration_ms": dt_ms,
+                            "body": payload,
+                        },
+                    )
 
-                text = _extract_text_from_anthropic(payload).strip()
+                    text = _extract_text_from_anthropic(payload).strip()
                 last_text = text
 
                 if not text:
@@ -201,7 +276,7 @@ class AnthropicMindProvider:
                         obj = None
 
                 if isinstance(obj, dict):
-                    errs = validate_json_schema(obj, schema_obj)
+                    errs = schema.validate(obj)
                     if not errs:
                         return MindProviderResult(obj=obj, transcript_path=transcript_path)
                     last_errors = errs
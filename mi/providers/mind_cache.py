@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlsplit, urlunsplit
+
+from ..core.storage import advisory_lock, now_rfc3339, read_json_best_effort, write_json_atomic
+from .mind_utils import append_jsonl as _append_jsonl
+from .mind_utils import load_schema
+from .mind_utils import new_mind_transcript_path
+from .types import MindProvider, MindProviderResult
+
+
+MIND_CACHE_MODES = ("off", "read", "readwrite")
+
+_CACHE_KEY_VERSION = "v2"
+_STAT_KEYS = ("hits", "misses", "writes", "expired", "evicted")
+
+
+def mind_cache_settings(cfg: dict[str, Any]) -> dict[str, Any]:
+    """Return normalized `mind.cache` settings: {"mode", "ttl_s", "max_entries"}."""
+
+    mind = cfg.get("mind") if isinstance(cfg.get("mind"), dict) else {}
+    cc = mind.get("cache") if isinstance(mind.get("cache"), dict) else {}
+    mode = str(cc.get("mode") or "off").strip().lower()
+    if mode not in MIND_CACHE_MODES:
+        mode = "off"
+    try:
+        ttl_s = max(0, int(cc.get("ttl_s", 0) or 0))
+    except Exception:
+        ttl_s = 0
+    try:
+        max_entries = max(0, int(cc.get("max_entries", 0) or 0))
+    except Exception:
+        max_entries = 0
+    return {"mode": mode, "ttl_s": ttl_s, "max_entries": max_entries}
+
+
+def _sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _normalize_base_url(base_url: str) -> str:
+    u = str(base_url or "").strip().rstrip("/")
+    parts = urlsplit(u)
+    if not parts.scheme or not parts.netloc:
+        return u
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), parts.query, ""))
+
+
+def mind_cache_key(
+    *,
+    provider: str,
+    model: str,
+    schema_filename: str,
+    prompt: str,
+    base_url: str = "",
+    params: dict[str, Any] | None = None,
+) -> str:
+    """Content address for a Mind call.
+
+    Covers (provider, normalized base_url, model, output-affecting generation params, schema
+    content hash, prompt hash), so the same model name served by two endpoints never shares
+    an entry.
+    """
+
+    try:
+        schema_sha = load_schema(schema_filename).sha256
+    except Exception:
+        schema_sha = "missing:" + str(schema_filename or "")
+    ident = {
+        "v": _CACHE_KEY_VERSION,
+        "provider": str(provider or ""),
+        "base_url": _normalize_base_url(base_url),
+        "model": str(model or ""),
+        "params": dict(params) if isinstance(params, dict) else {},
+        "schema_sha256": schema_sha,
+        "prompt_sha256": _sha256_hex(str(prompt or "").encode("utf-8")),
+    }
+    return _sha256_hex(json.dumps(ident, sort_keys=True, default=str).encode("utf-8"))
+
+
+class MindResponseCache:
+    """On-disk, content-addressed store of validated Mind outputs.
+
+    Layout: `<cache_dir>/entries/<key>.json` + `<cache_dir>/stats.json` (cumulative counters).
+
+    - An entry's age is its file mtime (set when it is written); it is the only TTL clock, used
+      by lookups and `prune` alike. Entries older than `ttl_s` are misses and are removed.
+    - Writes keep an approximate entry count and prune only when it exceeds `max_entries`
+      (down to 90% of it) or every `_PRUNE_EVERY_WRITES` writes when a TTL is set. 0 disables
+      either bound.
+    - Counters are accumulated in memory and merged into `stats.json` under an advisory lock
+      every `_STATS_FLUSH_EVERY` updates, on `flush_stats()`/`status()`, and at interpreter exit,
+      so concurrent processes do not lose each other's counts.
+    """
+
+    _STATS_FLUSH_EVERY = 32
+    _PRUNE_EVERY_WRITES = 64
+
+    def __init__(self, cache_dir: Path, *, ttl_s: int = 0, max_entries: int = 0) -> None:
+        self._dir = Path(cache_dir)
+        self._ttl_s = max(0, int(ttl_s or 0))
+        self._max_entries = max(0, int(max_entries or 0))
+        self._lock = threading.Lock()
+        self._pending: dict[str, int] = {}
+        self._pending_n = 0
+        self._count: int | None = None
+        self._writes_since_prune = 0
+        atexit.register(_flush_at_exit, weakref.ref(self))
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._dir
+
+    @property
+    def entries_dir(self) -> Path:
+        return self._dir / "entries"
+
+    @property
+    def stats_path(self) -> Path:
+        return self._dir / "stats.json"
+
+    def _entry_path(self, key: str) -> Path:
+        return self.entries_dir / f"{key}.json"
+
+    def _bump(self, **deltas: int) -> None:
+        with self._lock:
+            for k, v in deltas.items():
+                if v:
+                    self._pending[k] = self._pending.get(k, 0) + int(v)
+            self._pending_n += 1
+            due = self._pending_n >= self._STATS_FLUSH_EVERY
+        if due:
+            self.flush_stats()
+
+    def flush_stats(self) -> None:
+        """Merge in-memory counter deltas into `stats.json` (best-effort)."""
+
+        with self._lock:
+            deltas, self._pending, self._pending_n = self._pending, {}, 0
+        if not deltas:
+            return
+        try:
+            with advisory_lock(self._dir / "stats.json.lock"):
+                cur = read_json_best_effort(self.stats_path, default=None, label="mind_cache_stats")
+                stats = {k: int(cur.get(k) or 0) for k in _STAT_KEYS} if isinstance(cur, dict) else {k: 0 for k in _STAT_KEYS}
+                for k, v in deltas.items():
+                    stats[k] = int(stats.get(k) or 0) + int(v)
+                stats["updated_ts"] = now_rfc3339()
+                write_json_atomic(self.stats_path, stats)
+        except Exception:
+            pass
+
+    def _expired(self, path: Path, *, now: float) -> bool:
+        if self._ttl_s <= 0:
+            return False
+        try:
+            return (now - path.stat().st_mtime) > self._ttl_s
+        except Exception:
+            return True
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._entry_path(key)
+        entry = read_json_best_effort(path, default=None, label="mind_cache_entry")
+        if not isinstance(entry, dict) or not isinstance(entry.get("obj"), dict):
+            self._bump(misses=1)
+            return None
+        if self._expired(path, now=time.time()):
+            try:
+                path.unlink()
+                self._adjust_count(-1)
+            except Exception:
+                pass
+            self._bump(misses=1, expired=1)
+            return None
+        self._bump(hits=1)
+        return entry
+
+    def _adjust_count(self, delta: int) -> None:
+        with self._lock:
+            if self._count is not None:
+                self._count = max(0, self._count + delta)
+
+    def put(self, key: str, obj: dict[str, Any], *, meta: dict[str, Any]) -> None:
+        path = self._entry_path(key)
+        existed = path.exists()
+        entry = dict(meta)
+        entry.update({"key": key, "created_ts": now_rfc3339(), "obj": obj})
+        write_json_atomic(path, entry)
+
+        with self._lock:
+            if self._count is not None and not existed:
+                self._count += 1
+            self._writes_since_prune += 1
+            count = self._count
+            periodic = self._ttl_s > 0 and self._writes_since_prune >= self._PRUNE_EVERY_WRITES
+        if self._max_entries > 0 and count is None:
+            # First write of this process: count the entries once; later writes keep the count.
+            count = len(self._entries_oldest_first())
+            with self._lock:
+                self._count = count
+        evicted = 0
+        if periodic or (count is not None and count > self._max_entries > 0):
+            # Prune below the bound (10% slack) so a full cache is not rescanned on every write.
+            evicted = self.prune(target=self._max_entries - self._max_entries // 10)
+        self._bump(writes=1, evicted=evicted)
+
+    def _entries_oldest_first(self) -> list[tuple[float, Path]]:
+        out: list[tuple[float, Path]] = []
+        try:
+            for p in self.entries_dir.glob("*.json"):
+                try:
+                    out.append((p.stat().st_mtime, p))
+                except FileNotFoundError:
+                    continue
+        except FileNotFoundError:
+            return []
+        out.sort(key=lambda x: (x[0], x[1].name))
+        return out
+
+    def prune(self, *, target: int | None = None) -> int:
+        """Drop expired entries, then the oldest beyond `max_entries` (or `target`). Returns the number removed."""
+
+        entries = self._entries_oldest_first()
+        doomed: list[Path] = []
+        if self._ttl_s > 0:
+            cutoff = time.time() - self._ttl_s
+            doomed.extend(p for mtime, p in entries if mtime < cutoff)
+            entries = [(mtime, p) for mtime, p in entries if mtime >= cutoff]
+        keep = self._max_entries if target is None else max(1, min(int(target), self._max_entries))
+        if self._max_entries > 0 and len(entries) > keep:
+            doomed.extend(p for _, p in entries[: len(entries) - keep])
+            entries = entries[len(entries) - keep :]
+        n = 0
+        for p in doomed:
+            try:
+                p.unlink()
+                n += 1
+            except FileNotFoundError:
+                continue
+        with self._lock:
+            self._count = len(entries) if self._max_entries > 0 else None
+            self._writes_since_prune = 0
+        return n
+
+    def clear(self) -> int:
+        n = 0
+        for _, p in self._entries_oldest_first():
+            try:
+                p.unlink()
+                n += 1
+            except FileNotFoundError:
+                continue
+        with self._lock:
+            self._pending, self._pending_n = {}, 0
+            self._count = 0 if self._max_entries > 0 else None
+        try:
+            self.stats_path.unlink()
+        except FileNotFoundError:
+            pass
+        return n
+
+    def status(self) -> dict[str, Any]:
+        self.flush_stats()
+        entries = self._entries_oldest_first()
+        total_bytes = 0
+        for _, p in entries:
+            try:
+                total_bytes += p.stat().st_size
+            except FileNotFoundError:
+                continue
+        cur = read_json_best_effort(self.stats_path, default=None, label="mind_cache_stats")
+        stats = {k: int(cur.get(k) or 0) for k in _STAT_KEYS} if isinstance(cur, dict) else {k: 0 for k in _STAT_KEYS}
+        lookups = stats["hits"] + stats["misses"]
+        return {
+            "cache_dir": str(self._dir),
+            "entries": len(entries),
+            "bytes": total_bytes,
+            "ttl_s": self._ttl_s,
+            "max_entries": self._max_entries,
+            "stats": stats,
+            "hit_rate": (round(stats["hits"] / lookups, 4) if lookups else None),
+        }
+
+
+def _flush_at_exit(ref: "weakref.ref[MindResponseCache]") -> None:
+    cache = ref()
+    if cache is not None:
+        cache.flush_stats()
+
+
+class CachingMindProvider:
+    """MindProvider wrapper that serves repeated Mind calls from disk (see `mind_cache_key`).
+
+    - mode=read: serve hits, never write.
+    - mode=readwrite: serve hits and store validated outputs of misses.
+    Hits still write a small mind transcript (pointing at the cache entry) so audit pointers stay valid.
+    Failed calls (MindCallError) are never cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        inner: MindProvider,
+        cache: MindResponseCache,
+        mode: str,
+        provider: str,
+        model: str,
+        transcripts_dir: Path,
+        base_url: str = "",
+        params: dict[str, Any] | None = None,
+    ) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._mode = mode if mode in MIND_CACHE_MODES else "off"
+        self._provider = str(provider or "")
+        self._model = str(model or "")
+        self._base_url = str(base_url or "")
+        self._params = dict(params) if isinstance(params, dict) else {}
+        self._transcripts_dir = transcripts_dir
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "writes": 0}
+
+    @property
+    def inner(self) -> MindProvider:
+        return self._inner
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] = int(self.stats.get(key) or 0) + 1
+
+    def call(self, *, schema_filename: str, prompt: str, tag: str) -> MindProviderResult:
+        if self._mode == "off":
+            return self._inner.call(schema_filename=schema_filename, prompt=prompt, tag=tag)
+
+        key = mind_cache_key(
+            provider=self._provider,
+            model=self._model,
+            schema_filename=schema_filename,
+            prompt=prompt,
+            base_url=self._base_url,
+            params=self._params,
+        )
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._count("hits")
+            transcript_path = new_mind_transcript_path(self._transcripts_dir, tag)
+            _append_jsonl(
+                transcript_path,
+                {
+                    "type": "mi.mind_transcript.header",
+                    "ts": now_rfc3339(),
+                    "provider": self._provider,
+                    "model": self._model,
+                    "schema": schema_filename,
+                    "cache": self._mode,
+                },
+            )
+            _append_jsonl(
+                transcript_path,
+                {
+                    "type": "mi.mind_transcript.cache_hit",
+                    "ts": now_rfc3339(),
+                    "key": key,
+                    "cached_ts": str(entry.get("created_ts") or ""),
+                    "source_transcript_path": str(entry.get("transcript_path") or ""),
+                    "body": entry["obj"],
+                },
+            )
+            return MindProviderResult(obj=dict(entry["obj"]), transcript_path=transcript_path)
+
+        self._count("misses")
+        res = self._inner.call(schema_filename=schema_filename, prompt=prompt, tag=tag)
+        if self._mode == "readwrite" and isinstance(res.obj, dict):
+            try:
+                self._cache.put(
+                    key,
+                    res.obj,
+                    meta={
+                        "provider": self._provider,
+                        "model": self._model,
+                        "schema": schema_filename,
+                        "tag": tag,
+                        "transcript_path": str(res.transcript_path),
+                    },
+                )
+                self._count("writes")
+            except Exception:
+                # Cache writes are best-effort; never fail a successful Mind call.
+                pass
+        return res
@@ -7,13 +7,13 @@ import urllib.request
 from pathlib import Path
 from typing import Any, Callable
 
-from ..core.schema_validate import validate_json_schema
 from ..core.storage import now_rfc3339
 from .mind_errors import MindCallError
 from .mind_utils import append_jsonl as _append_jsonl
 from .mind_utils import extract_json as _extract_json
+from .mind_utils import load_schema
 from .mind_utils import new_mind_transcript_path
-from .mind_utils import schema_path as _schema_path
+from .mind_stream import HttpPostStreamFn, default_http_post_sse, read_streamed_json_object
 from .types import MindProviderResult
 
 
@@ -33,10 +33,26 @@ def _extract_text_from_openai_like(payload: dict[str, Any]) -> str:
     return ""
 
 
+def _extract_stream_delta_from_openai_like(event: dict[str, Any]) -> str:
+    # OpenAI-style chat.completions streaming: choices[0].delta.content chunks.
+    err = event.get("error")
+    if isinstance(err, dict):
+        raise RuntimeError(f"stream error: {err.get('message') or err}")
+    choices = event.get("choices")
+    if not isinstance(choices, list) or not choices or not isinstance(choices[0], dict):
+        return ""
+    delta = choices[0].get("delta")
+    if isinstance(delta, dict) and isinstance(delta.get("content"), str):
+        return delta["content"]
+    return ""
+
+
 class OpenAICompatibleMindProvider:
     """Mind provider using an OpenAI-compatible Chat Completions endpoint.
 
     This is best-effort across vendors: we rely on prompt + local schema validation.
+    With `stream=True`, responses are read via SSE and reading stops once a complete,
+    schema-valid top-level JSON object has arrived.
     """
 
     def __init__(
@@ -48,7 +64,9 @@ class OpenAICompatibleMindProvider:
         transcripts_dir: Path,
         timeout_s: int,
         max_retries: int,
+        stream: bool = False,
         http_post_json: Callable[[str, dict[str, Any], dict[str, str], int], dict[str, Any]] | None = None,
+        http_post_stream: HttpPostStreamFn | None = None,
     ):
         self._base_url = base_url.rstrip("/")
         self._model = model
@@ -56,7 +74,9 @@ class OpenAICompatibleMindProvider:
         self._transcripts_dir = transcripts_dir
         self._timeout_s = int(timeout_s)
         self._max_retries = int(max_retries)
+        self._stream = bool(stream)
         self._http_post_json = http_post_json or self._default_http_post_json
+        self._http_post_stream = http_post_stream or default_http_post_sse
 
     def _default_http_post_json(self, url: str, body: dict[str, Any], headers: dict[str, str], timeout_s: int) -> dict[str, Any]:
         req = urllib.request.Request(url, data=json.dumps(body).encode("utf-8"), headers=headers, method="POST")
@@ -90,11 +110,8 @@ class OpenAICompatibleMindProvider:
                 tag=tag,
             )
 
-        schema_path = _schema_path(schema_filename)
-        schema_text = schema_path.read_text(encoding="utf-8")
-        schema_obj = json.loads(schema_text)
-        if not isinstance(schema_obj, dict):
-            raise ValueError(f"schema {schema_filename} is not an object")
+        schema = load_schema(schema_filename)
+        schema_text = schema.text
 
         transcript_path = new_mind_transcript_path(self._transcripts_dir, tag)
 
@@ -139,6 +156,8 @@ class OpenAICompatibleMindProvider:
                     "messages": messages,
                     "temperature": 0,
                 }
+                if self._stream:
+                    body["stream"] = True
                 _append_jsonl(
                     transcript_path,
                     {
@@ -150,22 +169,47 @@ class OpenAICompatibleMindProvider:
                     },
                 )
 
-                t0 = time.time()
-                payload = self._http_post_json(url, body, headers, self._timeout_s)
-                dt_ms = int((time.time() - t0) * 1000)
+                if self._stream:
+                    streamed = read_streamed_json_object(
+                        lines=self._http_post_stream(url, body, headers, self._timeout_s),
+                        extract_delta=_extract_stream_delta_from_openai_like,
+                        validate=schema.validate,
+                    )
+                    _append_jsonl(
+                        transcript_path,
+                        {
+                            "type": "mi.mind_transcript.response",
+                            "ts": now_rfc3339(),
+                            "attempt": attempt,
+                            "duration_ms": streamed.duration_ms,
+                            "stream": True,
+                            "events": streamed.events,
+                            "stopped_early": streamed.stopped_early,
+                            "time_to_first_token_ms": streamed.time_to_first_token_ms,
+                            "time_to_valid_object_ms": streamed.time_to_valid_object_ms,
+                            "text": streamed.text,
+                        },
+                    )
+                    if streamed.obj is not None:
+                        return MindProviderResult(obj=streamed.obj, transcript_path=transcript_path)
+                    text = streamed.text.strip()
+                else:
+                    t0 = time.time()
+                    payload = self._http_post_json(url, body, headers, self._timeout_s)
+                    dt_ms = int((time.time() - t0) * 1000)
 
-                _append_jsonl(
-                    transcript_path,
-                    {
-                        "type": "mi.mind_transcript.response",
-                        "ts": now_rfc3339(),
-                        "attempt": attempt,
-                        "duration_ms": dt_ms,
-                        "body": payload,
-                    },
-                )
+                    _append_jsonl(
+                        transcript_path,
+                        {
+                            "type": "mi.mind_transcript.response",
+                            "ts": now_rfc3339(),
+                            "attempt": attempt,
+                            "duration_ms": dt_ms,
+                            "body": payload,
+                        },
+                    )
 
-                text = _extract_text_from_openai_like(payload).strip()
+                    text = _extract_text_from_openai_like(payload).strip()
                 last_text = text
 
                 if not text:
@@ -179,7 +223,7 @@ class OpenAICompatibleMindProvider:
                         obj = None
 
                 if isinstance(obj, dict):
-                    errs = validate_json_schema(obj, schema_obj)
+                    errs = schema.validate(obj)
                     if not errs:
                         return MindProviderResult(obj=obj, transcript_path=transcript_path)
                     last_errors = errs
@@ -4,8 +4,10 @@ from pathlib import Path
 from typing import Any, Callable, Dict
 
 from ..core.config import resolve_api_key
+from ..core.paths import GlobalPaths
 from .llm import MiLlm
 from .mind_anthropic import AnthropicMindProvider
+from .mind_cache import CachingMindProvider, MindResponseCache, mind_cache_settings
 from .mind_openai_compat import OpenAICompatibleMindProvider
 from .types import MindProvider
 
@@ -13,6 +15,10 @@ from .types import MindProvider
 # Use typing.* here (not built-in generics) since this alias is evaluated at import time.
 MindProviderFactory = Callable[[Dict[str, Any], Path, Path], MindProvider]
 
+_OPENAI_COMPATIBLE_BASE_URL = "https://api.openai.com/v1"
+_ANTHROPIC_BASE_URL = "https://api.anthropic.com"
+_ANTHROPIC_MAX_TOKENS = 2048
+
 
 def _build_codex_schema(cfg: dict[str, Any], project_root: Path, transcripts_dir: Path) -> MindProvider:
     # V1 default: call Codex itself with a JSON schema and parse the JSON from the response.
@@ -24,12 +30,13 @@ def _build_openai_compatible(cfg: dict[str, Any], _project_root: Path, transcrip
     oc = mind.get("openai_compatible") if isinstance(mind.get("openai_compatible"), dict) else {}
     api_key = resolve_api_key(oc if isinstance(oc, dict) else {})
     return OpenAICompatibleMindProvider(
-        base_url=str(oc.get("base_url") or "").strip() or "https://api.openai.com/v1",
+        base_url=str(oc.get("base_url") or "").strip() or _OPENAI_COMPATIBLE_BASE_URL,
         model=str(oc.get("model") or "").strip(),
         api_key=api_key,
         transcripts_dir=transcripts_dir,
         timeout_s=int(oc.get("timeout_s") or 60),
         max_retries=int(oc.get("max_retries") or 2),
+        stream=bool(oc.get("stream", False)),
     )
 
 
@@ -38,14 +45,16 @@ def _build_anthropic(cfg: dict[str, Any], _project_root: Path, transcripts_dir:
     ac = mind.get("anthropic") if isinstance(mind.get("anthropic"), dict) else {}
     api_key = resolve_api_key(ac if isinstance(ac, dict) else {})
     return AnthropicMindProvider(
-        base_url=str(ac.get("base_url") or "").strip() or "https://api.anthropic.com",
+        base_url=str(ac.get("base_url") or "").strip() or _ANTHROPIC_BASE_URL,
         model=str(ac.get("model") or "").strip(),
         api_key=api_key,
         transcripts_dir=transcripts_dir,
         timeout_s=int(ac.get("timeout_s") or 60),
         max_retries=int(ac.get("max_retries") or 2),
         anthropic_version=str(ac.get("anthropic_version") or "2023-06-01").strip(),
-        max_tokens=int(ac.get("max_tokens") or 2048),
+        max_tokens=int(ac.get("max_tokens") or _ANTHROPIC_MAX_TOKENS),
+        stream=bool(ac.get("stream", False)),
+        prompt_cache=bool(ac.get("prompt_cache", False)),
     )
 
 
@@ -60,10 +69,61 @@ def mind_provider_names() -> list[str]:
     return sorted(_MIND_FACTORIES.keys())
 
 
-def make_mind_provider(cfg: dict[str, Any], *, project_root: Path, transcripts_dir: Path) -> MindProvider:
+def _provider_model(cfg: dict[str, Any], provider: str) -> str:
+    mind = cfg.get("mind") if isinstance(cfg.get("mind"), dict) else {}
+    sub = mind.get(provider) if isinstance(mind.get(provider), dict) else {}
+    return str(sub.get("model") or "").strip()
+
+
+def _provider_cache_identity(cfg: dict[str, Any], provider: str) -> tuple[str, dict[str, Any]]:
+    """Endpoint + output-affecting generation params of a provider (part of the cache key)."""
+
+    mind = cfg.get("mind") if isinstance(cfg.get("mind"), dict) else {}
+    sub = mind.get(provider) if isinstance(mind.get(provider), dict) else {}
+    if provider == "openai_compatible":
+        return str(sub.get("base_url") or "").strip() or _OPENAI_COMPATIBLE_BASE_URL, {}
+    if provider == "anthropic":
+        base_url = str(sub.get("base_url") or "").strip() or _ANTHROPIC_BASE_URL
+        return base_url, {"max_tokens": int(sub.get("max_tokens") or _ANTHROPIC_MAX_TOKENS)}
+    return "", {}
+
+
+def make_mind_provider(
+    cfg: dict[str, Any],
+    *,
+    project_root: Path,
+    transcripts_dir: Path,
+    home_dir: Path | None = None,
+) -> MindProvider:
+    """Build the configured Mind provider.
+
+    When `home_dir` is given and `mind.cache.mode` is not `off`, the provider is wrapped
+    in a content-addressed response cache under `<home>/cache/mind`.
+    """
+
     mind = cfg.get("mind") if isinstance(cfg.get("mind"), dict) else {}
     provider = str(mind.get("provider") or "codex_schema").strip()
     fn = _MIND_FACTORIES.get(provider)
     if fn is None:
         raise ValueError(f"unknown mind provider: {provider}")
-    return fn(cfg, project_root, transcripts_dir)
+    inner = fn(cfg, project_root, transcripts_dir)
+
+    cache_cfg = mind_cache_settings(cfg)
+    if home_dir is None or cache_cfg["mode"] == "off":
+        return inner
+    cache = MindResponseCache(
+        GlobalPaths(home_dir=home_dir).mind_cache_dir,
+        ttl_s=cache_cfg["ttl_s"],
+        max_entries=cache_cfg["max_entries"],
+    )
+    base_url, params = _provider_cache_identity(cfg, provider)
+    return CachingMindProvider(
+        inner=inner,
+        cache=cache,
+        mode=cache_cfg["mode"],
+        provider=provider,
+        model=_provider_model(cfg, provider),
+        transcripts_dir=transcripts_dir,
+        base_url=base_url,
+        params=params,
+    )
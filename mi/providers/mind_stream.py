@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import json
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator
+
+from ..core.schema_validate import SchemaValidator
+
+
+# (url, body, headers, timeout_s) -> iterable of raw SSE lines (without trailing newlines).
+HttpPostStreamFn = Callable[[str, dict[str, Any], dict[str, str], int], Iterable[str]]
+
+
+class JsonObjectScanner:
+    """Incremental scanner that detects complete top-level JSON objects in streamed text.
+
+    Feed text chunks in order; `feed` returns the source text of every top-level
+    `{...}` object that closed within the chunk. Text outside objects (prose, code
+    fences) is ignored. String literals and escapes are tracked so braces inside
+    strings do not affect depth.
+    """
+
+    def __init__(self) -> None:
+        self._buf: list[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> list[str]:
+        done: list[str] = []
+        for ch in chunk or "":
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                    self._buf = [ch]
+                continue
+
+            self._buf.append(ch)
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch == "{":
+                self._depth += 1
+            elif ch == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    done.append("".join(self._buf))
+                    self._buf = []
+        return done
+
+
+def iter_sse_data(lines: Iterable[str]) -> Iterator[str]:
+    """Yield the `data:` payload of each Server-Sent Event (multi-line data joined by newlines).
+
+    Stops at the OpenAI-style `[DONE]` sentinel.
+    """
+
+    data: list[str] = []
+    for raw in lines:
+        line = str(raw or "").rstrip("\r\n")
+        if not line:
+            if data:
+                payload = "\n".join(data)
+                data = []
+                if payload.strip() == "[DONE]":
+                    return
+                yield payload
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if field == "data":
+            data.append(value[1:] if value.startswith(" ") else value)
+    if data:
+        payload = "\n".join(data)
+        if payload.strip() != "[DONE]":
+            yield payload
+
+
+def default_http_post_sse(url: str, body: dict[str, Any], headers: dict[str, str], timeout_s: int) -> Iterator[str]:
+    """POST a JSON body and yield decoded response lines as they arrive.
+
+    Closing the returned generator closes the underlying HTTP connection.
+    """
+
+    hdrs = dict(headers)
+    hdrs.setdefault("Accept", "text/event-stream")
+    req = urllib.request.Request(url, data=json.dumps(body).encode("utf-8"), headers=hdrs, method="POST")
+    try:
+        resp = urllib.request.urlopen(req, timeout=timeout_s)
+    except urllib.error.HTTPError as e:
+        data = e.read().decode("utf-8", errors="replace") if e.fp else ""
+        raise RuntimeError(f"http error status={e.code} body={data[:2000]}") from e
+    except Exception as e:
+        raise RuntimeError(f"http request failed: {e}") from e
+    with resp:
+        for raw in resp:
+            yield raw.decode("utf-8", errors="replace")
+
+
+@dataclass
+class StreamedJsonResult:
+    """Outcome of reading one streamed Mind response."""
+
+    text: str
+    obj: dict[str, Any] | None
+    events: int
+    stopped_early: bool
+    duration_ms: int
+    time_to_first_token_ms: int | None
+    time_to_valid_object_ms: int | None
+
+
+def read_streamed_json_object(
+    *,
+    lines: Iterable[str],
+    extract_delta: Callable[[dict[str, Any]], str],
+    validate: SchemaValidator,
+) -> StreamedJsonResult:
+    """Consume an SSE response until a schema-valid top-level JSON object is seen.
+
+    - `extract_delta` maps one decoded SSE event to its text delta ("" when none).
+    - `validate` is a compiled schema validator (see `compile_json_schema`).
+    - Reading stops as soon as a complete object validates; trailing tokens are not awaited.
+    - When no object validates, the full text is returned (obj=None) so callers can run
+      their usual parse/validate/repair path over it.
+    """
+
+    t0 = time.monotonic()
+    scanner = JsonObjectScanner()
+    parts: list[str] = []
+    events = 0
+    ttft_ms: int | None = None
+    valid_ms: int | None = None
+    found: dict[str, Any] | None = None
+
+    it = iter(lines)
+    try:
+        for payload in iter_sse_data(it):
+            try:
+                ev = json.loads(payload)
+            except Exception:
+                continue
+            if not isinstance(ev, dict):
+                continue
+            events += 1
+            delta = extract_delta(ev)
+            if not delta:
+                continue
+            if ttft_ms is None:
+                ttft_ms = int((time.monotonic() - t0) * 1000)
+            parts.append(delta)
+            for cand in scanner.feed(delta):
+                try:
+                    obj = json.loads(cand)
+                except Exception:
+                    continue
+                if isinstance(obj, dict) and not validate(obj):
+                    found = obj
+                    break
+            if found is not None:
+                valid_ms = int((time.monotonic() - t0) * 1000)
+                break
+    finally:
+        close = getattr(it, "close", None)
+        if callable(close):
+            close()
+
+    return StreamedJsonResult(
+        text="".join(parts),
+        obj=found,
+        events=events,
+        stopped_early=found is not None,
+        duration_ms=int((time.monotonic() - t0) * 1000),
+        time_to_first_token_ms=ttft_ms,
+        time_to_valid_object_ms=valid_ms,
+    )
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from ..core.schema_validate import SchemaValidator, compile_json_schema
 from ..core.storage import ensure_dir, filename_safe_ts, now_rfc3339
 
 
@@ -12,6 +16,38 @@ def schema_path(name: str) -> Path:
     return Path(__file__).resolve().parents[1] / "schemas" / name
 
 
+@dataclass(frozen=True)
+class LoadedSchema:
+    """A Mind output schema read, parsed, and compiled once per process."""
+
+    name: str
+    path: Path
+    text: str
+    obj: dict[str, Any]
+    sha256: str
+    validate: SchemaValidator
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(name: str) -> LoadedSchema:
+    """Load `mi/schemas/<name>` once per process (schemas ship with the package and do not change)."""
+
+    path = schema_path(name)
+    raw = path.read_bytes()
+    text = raw.decode("utf-8")
+    obj = json.loads(text)
+    if not isinstance(obj, dict):
+        raise ValueError(f"schema {name} is not an object")
+    return LoadedSchema(
+        name=name,
+        path=path,
+        text=text,
+        obj=obj,
+        sha256=hashlib.sha256(raw).hexdigest(),
+        validate=compile_json_schema(obj),
+    )
+
+
 def extract_json(text: str) -> Any:
     text = (text or "").strip()
     if not text:
@@ -1,7 +1,14 @@
 from .types import AutopilotResult
 from .checks import _looks_like_user_question, _empty_auto_answer, _empty_evidence_obj, _empty_check_plan, _should_plan_checks
 from .looping import _normalize_for_sig, _loop_sig, _loop_pattern
-from .observation import _truncate, _batch_summary, _detect_risk_signals, _detect_risk_signals_from_transcript, _observe_repo
+from .observation import (
+    RepoObservationCache,
+    _truncate,
+    _batch_summary,
+    _detect_risk_signals,
+    _detect_risk_signals_from_transcript,
+    _observe_repo,
+)
 from .learn_flow import maybe_run_learn_update_on_run_end
 from .why_flow import maybe_run_why_trace_on_run_end
 from .workflow_cursor import match_workflow_for_task, workflow_step_ids, load_active_workflow
@@ -35,6 +42,8 @@ from .risk_flow import WorkflowRiskPhaseDeps, run_workflow_and_risk_phase
 from .extract_flow import ExtractEvidenceDeps, run_extract_evidence_phase
 from .preaction_flow import PreactionPhaseDeps, run_preaction_phase
 from .predecide_flow import BatchPredecideDeps, BatchPredecideResult, run_batch_predecide
+from .mind_prefetch import MindPhaseSpec, MindPrefetcher
+from .checkpoint_worker import CheckpointWorker
 from .services import (
     ChecksService,
     RiskService,
@@ -63,6 +72,7 @@ __all__ = [
     "_detect_risk_signals",
     "_detect_risk_signals_from_transcript",
     "_observe_repo",
+    "RepoObservationCache",
     "maybe_run_learn_update_on_run_end",
     "maybe_run_why_trace_on_run_end",
     "match_workflow_for_task",
@@ -127,4 +137,7 @@ __all__ = [
     "BatchPredecideDeps",
     "BatchPredecideResult",
     "run_batch_predecide",
+    "MindPhaseSpec",
+    "MindPrefetcher",
+    "CheckpointWorker",
 ]
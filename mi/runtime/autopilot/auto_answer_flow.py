@@ -13,10 +13,8 @@ class AutoAnswerQueryDeps:
     empty_auto_answer: Callable[[], dict[str, Any]]
 
 
-def query_auto_answer_to_hands(
+def build_auto_answer_prompt(
     *,
-    batch_idx: int,
-    batch_id: str,
     task: str,
     hands_provider: str,
     runtime_cfg: dict[str, Any],
@@ -26,11 +24,11 @@ def query_auto_answer_to_hands(
     check_plan: dict[str, Any],
     recent_evidence: list[dict[str, Any]],
     hands_last_message: str,
-    deps: AutoAnswerQueryDeps,
-) -> tuple[dict[str, Any], str, str]:
-    """Query auto_answer_to_hands and normalize fallback output."""
+    prompt_builder: Callable[..., str],
+) -> str:
+    """Build the auto_answer_to_hands prompt (shared by the query and concurrent prefetch)."""
 
-    prompt = deps.auto_answer_prompt_builder(
+    return prompt_builder(
         task=task,
         hands_provider=hands_provider,
         runtime_cfg=runtime_cfg if isinstance(runtime_cfg, dict) else {},
@@ -41,6 +39,37 @@ def query_auto_answer_to_hands(
         recent_evidence=recent_evidence if isinstance(recent_evidence, list) else [],
         hands_last_message=str(hands_last_message or ""),
     )
+
+
+def query_auto_answer_to_hands(
+    *,
+    batch_idx: int,
+    batch_id: str,
+    task: str,
+    hands_provider: str,
+    runtime_cfg: dict[str, Any],
+    project_overlay: dict[str, Any],
+    thought_db_context: dict[str, Any],
+    repo_observation: dict[str, Any],
+    check_plan: dict[str, Any],
+    recent_evidence: list[dict[str, Any]],
+    hands_last_message: str,
+    deps: AutoAnswerQueryDeps,
+) -> tuple[dict[str, Any], str, str]:
+    """Query auto_answer_to_hands and normalize fallback output."""
+
+    prompt = build_auto_answer_prompt(
+        task=task,
+        hands_provider=hands_provider,
+        runtime_cfg=runtime_cfg,
+        project_overlay=project_overlay,
+        thought_db_context=thought_db_context,
+        repo_observation=repo_observation,
+        check_plan=check_plan,
+        recent_evidence=recent_evidence,
+        hands_last_message=hands_last_message,
+        prompt_builder=deps.auto_answer_prompt_builder,
+    )
     aa_obj, mind_ref, state = deps.mind_call(
         schema_filename="auto_answer_to_hands.json",
         prompt=prompt,
@@ -49,6 +49,30 @@ def append_check_plan_record_with_tracking(
     return out
 
 
+def build_plan_min_checks_prompt(
+    *,
+    task: str,
+    hands_provider: str,
+    runtime_cfg: dict[str, Any],
+    project_overlay: dict[str, Any],
+    thought_db_context: dict[str, Any],
+    recent_evidence: list[dict[str, Any]],
+    repo_observation: dict[str, Any],
+    prompt_builder: Callable[..., str],
+) -> str:
+    """Build the plan_min_checks prompt (shared by the query and concurrent prefetch)."""
+
+    return prompt_builder(
+        task=task,
+        hands_provider=hands_provider,
+        runtime_cfg=runtime_cfg if isinstance(runtime_cfg, dict) else {},
+        project_overlay=project_overlay if isinstance(project_overlay, dict) else {},
+        thought_db_context=thought_db_context if isinstance(thought_db_context, dict) else {},
+        recent_evidence=recent_evidence if isinstance(recent_evidence, list) else [],
+        repo_observation=repo_observation if isinstance(repo_observation, dict) else {},
+    )
+
+
 def call_plan_min_checks(
     *,
     batch_id: str,
@@ -66,14 +90,15 @@ def call_plan_min_checks(
 ) -> tuple[dict[str, Any], str, str]:
     """Call plan_min_checks with normalized fallback on skipped/error."""
 
-    checks_prompt = deps.plan_min_checks_prompt_builder(
+    checks_prompt = build_plan_min_checks_prompt(
         task=task,
         hands_provider=hands_provider,
-        runtime_cfg=runtime_cfg if isinstance(runtime_cfg, dict) else {},
-        project_overlay=project_overlay if isinstance(project_overlay, dict) else {},
-        thought_db_context=thought_db_context if isinstance(thought_db_context, dict) else {},
-        recent_evidence=recent_evidence if isinstance(recent_evidence, list) else [],
-        repo_observation=repo_observation if isinstance(repo_observation, dict) else {},
+        runtime_cfg=runtime_cfg,
+        project_overlay=project_overlay,
+        thought_db_context=thought_db_context,
+        recent_evidence=recent_evidence,
+        repo_observation=repo_observation,
+        prompt_builder=deps.plan_min_checks_prompt_builder,
     )
     checks_obj, mind_ref, state = deps.mind_call(
         schema_filename="plan_min_checks.json",
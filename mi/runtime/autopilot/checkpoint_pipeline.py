@@ -20,6 +20,8 @@ class CheckpointPipelineDeps:
     new_segment_state: Callable[..., dict[str, Any]]
     now_ts: Callable[[], str]
     truncate: Callable[[str, int], str]
+    # Optional: queue the post-decision mining job (async checkpoint mode) instead of running it inline.
+    submit_mining: Callable[[Callable[[], None]], None] | None = None
 
 
 @dataclass(frozen=True)
@@ -143,9 +145,68 @@ def run_checkpoint_pipeline(
             persist_segment_state=True,
         )
 
-    if bool(out.get("should_mine_workflow", False)):
+    seg_state_obj = dict(segment_state) if isinstance(segment_state, dict) else {}
+    seg_records = list(segment_records)
+    checkpoint_kind = str(out.get("checkpoint_kind") or "")
+    checkpoint_notes = str(out.get("notes") or "")
+
+    def _mining_job() -> None:
+        run_checkpoint_mining(
+            segment_state=seg_state_obj,
+            segment_records=seg_records,
+            base_batch_id=base_bid,
+            thread_id=str(thread_id or ""),
+            task=task,
+            should_mine_workflow=bool(out.get("should_mine_workflow", False)),
+            should_mine_preferences=bool(out.get("should_mine_preferences", False)),
+            checkpoint_kind=checkpoint_kind,
+            checkpoint_notes=checkpoint_notes,
+            status_hint=str(status_hint or ""),
+            planned_next_input=str(planned_next_input or ""),
+            note=(note or "").strip(),
+            evidence_window=evidence_window,
+            deps=deps,
+        )
+
+    if deps.submit_mining is not None:
+        deps.submit_mining(_mining_job)
+    else:
+        _mining_job()
+
+    new_state = deps.new_segment_state(reason=f"checkpoint:{out.get('checkpoint_kind')}", thread_hint=str(thread_id or ""))
+    new_records = new_state.get("records") if isinstance(new_state.get("records"), list) else []
+    new_state["records"] = new_records
+    return CheckpointPipelineResult(
+        segment_state=new_state if isinstance(new_state, dict) else {},
+        segment_records=new_records if isinstance(new_records, list) else [],
+        last_checkpoint_key=new_last_key,
+        persist_segment_state=True,
+    )
+
+
+def run_checkpoint_mining(
+    *,
+    segment_state: dict[str, Any],
+    segment_records: list[dict[str, Any]],
+    base_batch_id: str,
+    thread_id: str,
+    task: str,
+    should_mine_workflow: bool,
+    should_mine_preferences: bool,
+    checkpoint_kind: str,
+    checkpoint_notes: str,
+    status_hint: str,
+    planned_next_input: str,
+    note: str,
+    evidence_window: list[dict[str, Any]],
+    deps: CheckpointPipelineDeps,
+) -> None:
+    """Mine + materialize one checkpointed segment (inline or as a queued async job)."""
+
+    base_bid = str(base_batch_id or "")
+    if should_mine_workflow:
         deps.mine_workflow_from_segment(seg_evidence=segment_records, base_batch_id=base_bid, source="checkpoint")
-    if bool(out.get("should_mine_preferences", False)):
+    if should_mine_preferences:
         deps.mine_preferences_from_segment(seg_evidence=segment_records, base_batch_id=base_bid, source="checkpoint")
     deps.mine_claims_from_segment(seg_evidence=segment_records, base_batch_id=base_bid, source="checkpoint")
 
@@ -155,9 +216,9 @@ def run_checkpoint_pipeline(
         batch_id=f"{base_bid}.snapshot",
         thread_id=str(thread_id or ""),
         task_fallback=task,
-        checkpoint_kind=str(out.get("checkpoint_kind") or ""),
+        checkpoint_kind=str(checkpoint_kind or ""),
         status_hint=str(status_hint or ""),
-        checkpoint_notes=str(out.get("notes") or ""),
+        checkpoint_notes=str(checkpoint_notes or ""),
     )
     snap_rec: dict[str, Any] | None = None
     if snap:
@@ -175,18 +236,8 @@ def run_checkpoint_pipeline(
         seg_evidence=segment_records,
         snapshot_rec=snap_rec,
         base_batch_id=base_bid,
-        checkpoint_kind=str(out.get("checkpoint_kind") or ""),
+        checkpoint_kind=str(checkpoint_kind or ""),
         status_hint=str(status_hint or ""),
         planned_next_input=str(planned_next_input or ""),
-        note=(note or "").strip(),
-    )
-
-    new_state = deps.new_segment_state(reason=f"checkpoint:{out.get('checkpoint_kind')}", thread_hint=str(thread_id or ""))
-    new_records = new_state.get("records") if isinstance(new_state.get("records"), list) else []
-    new_state["records"] = new_records
-    return CheckpointPipelineResult(
-        segment_state=new_state if isinstance(new_state, dict) else {},
-        segment_records=new_records if isinstance(new_records, list) else [],
-        last_checkpoint_key=new_last_key,
-        persist_segment_state=True,
+        note=str(note or ""),
     )
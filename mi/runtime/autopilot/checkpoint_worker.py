@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+
+class CheckpointWorker:
+    """Background worker for checkpoint mining jobs (opt-in async checkpoint mode).
+
+    Concurrency model (kept deliberately coarse):
+    - A single run lock guards all shared run state (stores, overlay, EvidenceLog, windows).
+      The run-loop thread holds it by default and releases it only while it waits on
+      Hands or on a Mind provider (`unlocked(fn)` wrappers); the worker holds it while a job
+      touches state and releases it during the job's own Mind calls.
+    - Each job reserves one EvidenceLog seq at submit time (`reserve_slots`); its records share
+      that seq (numbered by `sub_seq`), so their event ids are deterministic regardless of when the
+      job runs. They are buffered and written as one contiguous block when the job finishes.
+    - Getters registered with `pin(...)` return the value captured at submit time when called
+      from a job (segment id/thread id/status are those of the checkpointed segment).
+    - The queue is bounded (`max_pending`); `drain()` is the run-end barrier.
+    """
+
+    def __init__(
+        self,
+        *,
+        reserve_slots: Callable[[], Any],
+        evidence_append: Callable[[dict[str, Any]], Any],
+        max_pending: int = 2,
+    ) -> None:
+        self._reserve_slots = reserve_slots
+        self._evidence_append = evidence_append
+        self._queue: queue.Queue[tuple[Callable[[], None], Any, dict[str, Any]] | None] = queue.Queue(
+            maxsize=max(1, int(max_pending or 1))
+        )
+        self._run_lock = threading.Lock()
+        self._owner: int | None = None
+        self._local = threading.local()
+        self._pins: dict[str, Callable[[], Any]] = {}
+        self._thread: threading.Thread | None = None
+        self._errors: list[BaseException] = []
+        self.stats = {"submitted": 0, "completed": 0, "failed": 0}
+
+    # Run lock
+    def _acquire(self) -> None:
+        self._run_lock.acquire()
+        self._owner = threading.get_ident()
+
+    def _release(self) -> None:
+        self._owner = None
+        self._run_lock.release()
+
+    @contextmanager
+    def released(self) -> Iterator[None]:
+        """Release the run lock for the duration (no-op when this thread does not hold it)."""
+
+        if self._owner != threading.get_ident():
+            yield
+            return
+        self._release()
+        try:
+            yield
+        finally:
+            self._acquire()
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the run lock for the duration (helper threads that read shared run state)."""
+
+        if self._owner == threading.get_ident():
+            yield
+            return
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    def unlocked(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a blocking call (Hands exec, Mind provider) so it runs without the run lock."""
+
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            with self.released():
+                return fn(*args, **kwargs)
+
+        return _call
+
+    # Job context
+    def pin(self, name: str, getter: Callable[[], Any]) -> Callable[[], Any]:
+        """Return a getter that yields the submit-time value inside jobs (live value elsewhere)."""
+
+        self._pins[str(name)] = getter
+
+        def _get() -> Any:
+            pinned = getattr(self._local, "pinned", None)
+            if isinstance(pinned, dict) and name in pinned:
+                return pinned[name]
+            return getter()
+
+        return _get
+
+    def evidence_append(self, rec: dict[str, Any]) -> Any:
+        """EvidenceLog append that uses the current job's reserved block (when inside a job)."""
+
+        slots = getattr(self._local, "slots", None)
+        if slots is not None:
+            return slots.append(rec)
+        return self._evidence_append(rec)
+
+    # Lifecycle
+    def start(self) -> None:
+        """Start the worker; the calling (run-loop) thread takes the run lock."""
+
+        if self._thread is not None:
+            return
+        self._acquire()
+        self._thread = threading.Thread(target=self._loop, name="mi-checkpoint", daemon=True)
+        self._thread.start()
+
+    def submit(self, job: Callable[[], None]) -> None:
+        """Queue a mining job (blocks without the run lock while the queue is full)."""
+
+        pinned: dict[str, Any] = {}
+        for name, getter in self._pins.items():
+            try:
+                pinned[name] = getter()
+            except Exception:
+                pinned[name] = None
+        slots = self._reserve_slots()
+        self.stats["submitted"] += 1
+        with self.released():
+            self._queue.put((job, slots, pinned))
+
+    def _loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                job, slots, pinned = item
+                self._acquire()
+                self._local.slots = slots
+                self._local.pinned = pinned
+                try:
+                    job()
+                    self.stats["completed"] += 1
+                except BaseException as e:
+                    self.stats["failed"] += 1
+                    self._errors.append(e)
+                finally:
+                    try:
+                        slots.flush()
+                    except Exception as e:
+                        self._errors.append(e)
+                    self._local.slots = None
+                    self._local.pinned = None
+                    self._release()
+            finally:
+                self._queue.task_done()
+
+    def drain(self) -> None:
+        """Run-end barrier: wait for queued jobs; re-raise the first job error (if any)."""
+
+        if self._thread is None:
+            return
+        with self.released():
+            self._queue.join()
+        if self._errors:
+            err = self._errors[0]
+            self._errors.clear()
+            raise err
+
+    def close(self) -> None:
+        """Drain, stop the worker thread, and give up the run lock."""
+
+        if self._thread is None:
+            return
+        try:
+            self.drain()
+        finally:
+            with self.released():
+                self._queue.put(None)
+                self._thread.join()
+            self._thread = None
+            if self._owner == threading.get_ident():
+                self._release()
@@ -26,8 +26,13 @@ def append_evidence_with_tracking(
     evidence_obj: dict[str, Any],
     evidence_window: list[dict[str, Any]],
     deps: EvidenceAppendDeps,
+    repo_probe: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Append one evidence event and sync evidence window + segment state."""
+    """Append one evidence event and sync evidence window + segment state.
+
+    `repo_probe` (git probe timings) is written to the EvidenceLog record only: the window and
+    segment copies feed Mind prompts, which must not carry run-to-run timing noise.
+    """
 
     rec = deps.evidence_append(
         {
@@ -41,9 +46,10 @@ def append_evidence_with_tracking(
             "transcript_observation": transcript_observation if isinstance(transcript_observation, dict) else {},
             "repo_observation": repo_observation if isinstance(repo_observation, dict) else {},
             **(evidence_obj if isinstance(evidence_obj, dict) else {}),
+            **({"repo_probe": repo_probe} if isinstance(repo_probe, dict) and repo_probe else {}),
         }
     )
-    out = rec if isinstance(rec, dict) else {}
+    out = {k: v for k, v in rec.items() if k != "repo_probe"} if isinstance(rec, dict) else {}
     deps.append_window(evidence_window, out)
     deps.segment_add(out)
     return out
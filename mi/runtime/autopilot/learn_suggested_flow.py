@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 
 
 @dataclass(frozen=True)
 class LearnSuggestedDeps:
     claim_signature_fn: Callable[..., str]
-    existing_signature_map: Callable[[str], dict[str, str]]
+    existing_signature_map: Callable[[str], Mapping[str, str]]
     append_claim_create: Callable[..., str]
     evidence_append: Callable[[dict[str, Any]], Any]
     now_ts: Callable[[], str]
@@ -61,6 +61,7 @@ def apply_learn_suggested(
         "project": deps.existing_signature_map("project"),
         "global": deps.existing_signature_map("global"),
     }
+    learned: dict[str, dict[str, str]] = {"project": {}, "global": {}}
 
     for item in norm:
         scope0 = str(item.get("scope") or "").strip()
@@ -73,7 +74,7 @@ def apply_learn_suggested(
         sc = "global" if scope0 == "global" else "project"
         pid = deps.project_id if sc == "project" else ""
         sig = deps.claim_signature_fn(claim_type="preference", scope=sc, project_id=pid, text=text)
-        existing = sig_to_id.get(sc, {}).get(sig)
+        existing = learned[sc].get(sig) or sig_to_id[sc].get(sig)
         if existing:
             applied_claim_ids.append(str(existing))
             continue
@@ -103,7 +104,7 @@ def apply_learn_suggested(
         except Exception:
             continue
 
-        sig_to_id.setdefault(sc, {})[sig] = cid
+        learned[sc][sig] = cid
         applied_claim_ids.append(cid)
 
     rec = deps.evidence_append(
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import copy
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from ...providers.types import MindCallFn, MindProviderResult
+
+
+@dataclass(frozen=True)
+class MindPhaseSpec:
+    """One Mind phase that may be issued ahead of the sequential batch pipeline.
+
+    - `build_prompt` receives the outputs (`obj`, or None on error/skip) of the phases named
+      in `after`, keyed by phase name; it returns the prompt, or None to skip this phase.
+    - `schema_filename` + `tag` must match what the sequential phase later passes to mind_call.
+    """
+
+    name: str
+    schema_filename: str
+    tag: str
+    build_prompt: Callable[[dict[str, dict[str, Any] | None]], str | None]
+    after: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class _Pending:
+    name: str
+    prompt: str
+    future: Future[MindProviderResult]
+
+
+class MindPrefetcher:
+    """MindCallFn wrapper that runs declared-independent phase calls concurrently.
+
+    `prefetch(specs)` builds the prompts of phases without dependencies and submits their
+    provider calls to a thread pool. The pipeline then runs its phases in the usual order;
+    when a phase calls this wrapper with a prefetched (schema_filename, tag) *and the same
+    prompt*, it waits for that result instead of issuing a new request. A differing prompt
+    (pipeline state changed since the fork point) discards the prefetched result, issues a
+    live call and counts `stale`, so a phase never consumes an answer to another prompt.
+
+    A phase with `after` dependencies is built and submitted once the pipeline has released
+    all of them via `release(name, obj)` -- i.e. after it recorded their final (postprocessed)
+    outputs, so the dependent prompt sees the same pipeline state as the sequential call.
+    Prompts are only ever built on the calling thread; a prompt-building error skips the
+    prefetch (`build_errors`) and never surfaces as a Mind error. Circuit-breaker bookkeeping
+    and EvidenceLog writes stay in the caller (MindCaller), so record order is deterministic.
+
+    `unlocked` wraps only the blocking parts (waiting on a prefetched result, the live provider
+    call), e.g. to release the run lock; prompt building always runs with the caller's lock.
+
+    Unconsumed results are discarded on the next `prefetch`/`discard`.
+    """
+
+    def __init__(
+        self,
+        *,
+        llm_call: MindCallFn,
+        max_workers: int = 4,
+        enabled_getter: Callable[[], bool] | None = None,
+        unlocked: Callable[[Callable[..., Any]], Callable[..., Any]] | None = None,
+    ) -> None:
+        self._llm_call = llm_call
+        self._unlocked = unlocked
+        self._max_workers = max(1, int(max_workers or 1))
+        self._enabled_getter = enabled_getter
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: dict[tuple[str, str], _Pending] = {}
+        # Phases waiting on dependencies and the outputs released by the pipeline.
+        self._waiting: list[MindPhaseSpec] = []
+        self._outputs: dict[str, dict[str, Any] | None] = {}
+        self._lock = threading.Lock()
+        self.stats = {"prefetched": 0, "consumed": 0, "discarded": 0, "stale": 0, "build_errors": 0}
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mi-mind")
+        return self._pool
+
+    def discard(self) -> None:
+        """Forget unconsumed prefetches (in-flight calls finish in the background)."""
+
+        with self._lock:
+            self.stats["discarded"] += len(self._pending)
+            self._pending.clear()
+            self._waiting.clear()
+            self._outputs.clear()
+
+    def prefetch(self, specs: list[MindPhaseSpec], *, keep_pending: bool = False) -> None:
+        """Declare phases for the current batch (`keep_pending` adds to earlier declarations)."""
+
+        if not keep_pending:
+            self.discard()
+        if self._enabled_getter is not None and not bool(self._enabled_getter()):
+            return
+        for spec in specs:
+            if spec.after:
+                with self._lock:
+                    self._waiting.append(spec)
+                continue
+            self._submit(spec, {})
+        self._submit_ready()
+
+    def _submit(self, spec: MindPhaseSpec, objs: dict[str, dict[str, Any] | None]) -> None:
+        try:
+            prompt = spec.build_prompt(copy.deepcopy(objs))
+        except Exception:
+            with self._lock:
+                self.stats["build_errors"] += 1
+            return
+        if prompt is None:
+            return
+        fut = self._executor().submit(self._llm_call, schema_filename=spec.schema_filename, prompt=prompt, tag=spec.tag)
+        with self._lock:
+            self._pending[(spec.schema_filename, spec.tag)] = _Pending(name=spec.name, prompt=prompt, future=fut)
+            self.stats["prefetched"] += 1
+
+    def _submit_ready(self) -> None:
+        with self._lock:
+            ready = [s for s in self._waiting if all(n in self._outputs for n in s.after)]
+            self._waiting = [s for s in self._waiting if s not in ready]
+            objs = dict(self._outputs)
+        for spec in ready:
+            self._submit(spec, {n: objs.get(n) for n in spec.after})
+
+    def release(self, name: str, obj: dict[str, Any] | None) -> None:
+        """Record a phase's final output (after the pipeline recorded it) and submit its dependents."""
+
+        with self._lock:
+            self._outputs[str(name)] = obj if isinstance(obj, dict) else None
+        self._submit_ready()
+
+    def _blocking(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        return self._unlocked(fn) if self._unlocked is not None else fn
+
+    def __call__(self, *, schema_filename: str, prompt: str, tag: str) -> MindProviderResult:
+        key = (str(schema_filename), str(tag))
+        with self._lock:
+            entry = self._pending.pop(key, None)
+            if entry is not None and entry.prompt != prompt:
+                self.stats["stale"] += 1
+                entry = None
+        if entry is None:
+            return self._blocking(self._llm_call)(schema_filename=schema_filename, prompt=prompt, tag=tag)
+        try:
+            return self._blocking(entry.future.result)()
+        finally:
+            # A provider error is surfaced to the caller (MindCaller records it in order).
+            with self._lock:
+                self.stats["consumed"] += 1
+
+    def close(self) -> None:
+        self.discard()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
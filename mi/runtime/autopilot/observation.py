@@ -3,11 +3,14 @@ from __future__ import annotations
 import json
 import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterator, TextIO
 
 from ...providers.types import HandsRunResult
-from ..risk import detect_risk_signals_from_command, detect_risk_signals_from_text_line
+from ..risk import RiskPatternEngine, default_risk_engine, detect_risk_signals_from_command, detect_risk_signals_from_text_line
 from ..transcript import summarize_codex_events, summarize_hands_transcript, open_transcript_text
 
 
@@ -44,11 +47,11 @@ def _batch_summary(result: HandsRunResult) -> dict[str, Any]:
     }
 
 
-def _detect_risk_signals(result: HandsRunResult) -> list[str]:
+def _detect_risk_signals(result: HandsRunResult, *, engine: RiskPatternEngine | None = None) -> list[str]:
     signals: list[str] = []
     for item in result.iter_command_executions():
         cmd = str(item.get("command") or "")
-        signals.extend(detect_risk_signals_from_command(cmd))
+        signals.extend(detect_risk_signals_from_command(cmd, engine=engine))
     seen: set[str] = set()
     out: list[str] = []
     for s in signals:
@@ -59,11 +62,33 @@ def _detect_risk_signals(result: HandsRunResult) -> list[str]:
     return out
 
 
-def _detect_risk_signals_from_transcript(transcript_path: Path) -> list[str]:
+_RISK_SCAN_CHUNK_CHARS = 1 << 20
+
+
+def _iter_risk_candidate_rows(f: TextIO, eng: RiskPatternEngine) -> Iterator[str]:
+    """Yield transcript rows that may carry a risk marker, scanning the file in large chunks."""
+
+    tail = ""
+    while True:
+        chunk = f.read(_RISK_SCAN_CHUNK_CHARS)
+        if not chunk:
+            if tail:
+                yield from eng.candidate_rows(tail)
+            return
+        buf = tail + chunk
+        cut = buf.rfind("\n") + 1
+        tail = buf[cut:]
+        if cut:
+            # Most rows carry no marker: they are skipped here, before paying for json.loads.
+            yield from eng.candidate_rows(buf[:cut])
+
+
+def _detect_risk_signals_from_transcript(transcript_path: Path, *, engine: RiskPatternEngine | None = None) -> list[str]:
+    eng = engine or default_risk_engine()
     signals: list[str] = []
     try:
         with open_transcript_text(transcript_path) as f:
-            for row in f:
+            for row in _iter_risk_candidate_rows(f, eng):
                 row = row.strip()
                 if not row:
                     continue
@@ -81,7 +106,7 @@ def _detect_risk_signals_from_transcript(transcript_path: Path) -> list[str]:
                 line = raw.strip()
                 if not line:
                     continue
-                signals.extend(detect_risk_signals_from_text_line(line, limit=200))
+                signals.extend(detect_risk_signals_from_text_line(line, limit=200, engine=eng))
                 if len(signals) >= 20:
                     break
     except Exception:
@@ -97,7 +122,66 @@ def _detect_risk_signals_from_transcript(transcript_path: Path) -> list[str]:
     return out
 
 
-def _observe_repo(project_root: Path) -> dict[str, Any]:
+@dataclass
+class RepoObservationCache:
+    """Per-run memo for `_observe_repo` git probes.
+
+    - Static probes (inside-work-tree, toplevel, git dirs) are run once.
+    - `HEAD` / `diff --cached --stat` are reused while the `HEAD`, ref and index files are unchanged.
+    - `diff --stat` is reused while the index and the working-tree change set (porcelain status +
+      stat of each changed path) are unchanged. `status --porcelain` itself always runs.
+
+    `last_probe` holds the timing of the latest observation (`git_probe_ms`: per-probe wall time
+    for the probes that ran, `git_probe_reused`: reused probes). It is kept out of the returned
+    observation, which is fed verbatim into Mind prompts and must stay deterministic.
+    """
+
+    static: dict[str, Any] | None = None
+    index_fp: tuple[Any, ...] | None = None
+    worktree_fp: tuple[Any, ...] | None = None
+    git_head: str = ""
+    git_diff_stat: str = ""
+    git_diff_cached_stat: str = ""
+    last_probe: dict[str, Any] = field(default_factory=dict)
+
+
+def _stat_fp(path: Path) -> tuple[int, int, int]:
+    try:
+        st = path.stat()
+    except Exception:
+        return 0, 0, 0
+    return int(st.st_mtime_ns), int(st.st_size), int(st.st_ino)
+
+
+def _git_index_fp(git_dir: Path, common_dir: Path) -> tuple[Any, ...]:
+    """Fingerprint of the files that determine HEAD and the index (changes on commit/checkout/add)."""
+
+    head_path = git_dir / "HEAD"
+    try:
+        head = head_path.read_text(encoding="utf-8").strip()
+    except Exception:
+        head = ""
+    ref_fp: tuple[int, int, int] = (0, 0, 0)
+    if head.startswith("ref:"):
+        ref_fp = _stat_fp(common_dir / head[4:].strip())
+    return head, _stat_fp(head_path), ref_fp, _stat_fp(common_dir / "packed-refs"), _stat_fp(git_dir / "index")
+
+
+def _worktree_fp(root: Path, porcelain: str) -> tuple[Any, ...]:
+    """Fingerprint of the working-tree change set: porcelain lines + stat of each changed path."""
+
+    out: list[Any] = []
+    for line in porcelain.splitlines():
+        path = line[3:].split(" -> ")[-1].strip()
+        if not path or path.startswith('"'):
+            # Quoted (escaped) paths are not resolved here; never treat the set as unchanged.
+            out.append(object())
+            continue
+        out.append((line, _stat_fp(root / path)))
+    return tuple(out)
+
+
+def _observe_repo(project_root: Path, *, cache: RepoObservationCache | None = None) -> dict[str, Any]:
     root = project_root.resolve()
     stack_hints: list[str] = []
     test_hints: list[str] = []
@@ -154,43 +238,116 @@ def _observe_repo(project_root: Path) -> dict[str, Any]:
         except Exception:
             pass
 
-    if shutil.which("git"):
+    def _run_git(args: list[str], *, timeout_s: float, limit: int | None) -> str:
         try:
             p = subprocess.run(
-                ["git", "rev-parse", "--is-inside-work-tree"],
+                ["git", *args],
                 cwd=root,
                 capture_output=True,
                 text=True,
-                timeout=1,
+                timeout=timeout_s,
                 check=False,
             )
-            git_is_repo = p.returncode == 0 and p.stdout.strip().lower() == "true"
+            out = (p.stdout or "").strip()
+            if p.returncode != 0 and not out:
+                out = (p.stderr or "").strip()
+            return _truncate(out, limit) if limit is not None else out
         except Exception:
-            git_is_repo = False
+            failed.add(" ".join(args))
+            return ""
+
+    probe_ms: dict[str, float] = {}
+    reused: list[str] = []
+    failed: set[str] = set()
+
+    def _timed(name: str, fn: Callable[[], Any]) -> Any:
+        t0 = time.perf_counter()
+        try:
+            return fn()
+        finally:
+            probe_ms[name] = round((time.perf_counter() - t0) * 1000.0, 3)
 
-    def _run_git(args: list[str], *, timeout_s: float, limit: int) -> str:
+    def _static_probe() -> dict[str, Any]:
+        static: dict[str, Any] = {"is_repo": False, "root": "", "git_dir": "", "common_dir": ""}
+        if not shutil.which("git"):
+            return static
         try:
             p = subprocess.run(
-                ["git", *args],
+                ["git", "rev-parse", "--is-inside-work-tree", "--show-toplevel", "--absolute-git-dir", "--git-common-dir"],
                 cwd=root,
                 capture_output=True,
                 text=True,
-                timeout=timeout_s,
+                timeout=1,
                 check=False,
             )
-            out = (p.stdout or "").strip()
-            if p.returncode != 0 and not out:
-                out = (p.stderr or "").strip()
-            return _truncate(out, limit)
         except Exception:
-            return ""
+            return static
+        lines = (p.stdout or "").splitlines()
+        if p.returncode != 0 or len(lines) < 4 or lines[0].strip().lower() != "true":
+            return static
+        git_dir = Path(lines[2].strip())
+        common_dir = Path(lines[3].strip())
+        if not common_dir.is_absolute():
+            common_dir = (root / common_dir).resolve()
+        static.update(is_repo=True, root=_truncate(lines[1].strip(), 500), git_dir=str(git_dir), common_dir=str(common_dir))
+        return static
+
+    if cache is not None and cache.static is not None:
+        static = cache.static
+        reused.append("rev_parse")
+    else:
+        static = _timed("rev_parse", _static_probe)
+        # Only a positive result is memoised (Hands may `git init` during the run).
+        if cache is not None and static.get("is_repo"):
+            cache.static = static
 
+    git_is_repo = bool(static.get("is_repo"))
     if git_is_repo:
-        git_root = _run_git(["rev-parse", "--show-toplevel"], timeout_s=1, limit=500)
-        git_head = _run_git(["rev-parse", "--abbrev-ref", "HEAD"], timeout_s=1, limit=200)
-        git_status_porcelain = _run_git(["status", "--porcelain"], timeout_s=2, limit=4000)
-        git_diff_stat = _run_git(["diff", "--stat"], timeout_s=2, limit=4000)
-        git_diff_cached_stat = _run_git(["diff", "--cached", "--stat"], timeout_s=2, limit=4000)
+        git_root = str(static.get("root") or "")
+        git_dir = Path(str(static.get("git_dir") or ""))
+        common_dir = Path(str(static.get("common_dir") or ""))
+        index_fp = _git_index_fp(git_dir, common_dir) if cache is not None else None
+        index_same = cache is not None and index_fp == cache.index_fp
+
+        # Probes are independent `git` processes; run them concurrently.
+        jobs: dict[str, Callable[[], str]] = {
+            "status": lambda: _run_git(["status", "--porcelain"], timeout_s=2, limit=None),
+        }
+        if not index_same:
+            jobs["head"] = lambda: _run_git(["rev-parse", "--abbrev-ref", "HEAD"], timeout_s=1, limit=200)
+            jobs["diff"] = lambda: _run_git(["diff", "--stat"], timeout_s=2, limit=4000)
+            jobs["diff_cached"] = lambda: _run_git(["diff", "--cached", "--stat"], timeout_s=2, limit=4000)
+        with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="mi-git") as pool:
+            futs = {name: pool.submit(_timed, name, fn) for name, fn in jobs.items()}
+            status_full = futs["status"].result()
+            git_status_porcelain = _truncate(status_full, 4000)
+            worktree_fp: tuple[Any, ...] | None = None
+            if cache is not None:
+                worktree_fp = (object(),) if "status --porcelain" in failed else _worktree_fp(root, status_full)
+            if "diff" in futs:
+                git_diff_stat = futs["diff"].result()
+            elif cache is not None and worktree_fp == cache.worktree_fp:
+                git_diff_stat = cache.git_diff_stat
+                reused.append("diff")
+            else:
+                git_diff_stat = _timed("diff", lambda: _run_git(["diff", "--stat"], timeout_s=2, limit=4000))
+            if index_same and cache is not None:
+                git_head = cache.git_head
+                git_diff_cached_stat = cache.git_diff_cached_stat
+                reused.extend(["head", "diff_cached"])
+            else:
+                git_head = futs["head"].result()
+                git_diff_cached_stat = futs["diff_cached"].result()
+
+        if cache is not None:
+            # Re-read after the probes: `git status` may refresh (rewrite) the index.
+            cache.index_fp = _git_index_fp(git_dir, common_dir)
+            cache.worktree_fp = worktree_fp
+            cache.git_head = git_head
+            cache.git_diff_stat = git_diff_stat
+            cache.git_diff_cached_stat = git_diff_cached_stat
+    if cache is not None:
+        cache.last_probe = {"git_probe_ms": probe_ms, "git_probe_reused": reused}
 
     return {
         "project_root": str(root),
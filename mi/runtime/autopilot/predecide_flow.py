@@ -23,6 +23,10 @@ class BatchPredecideDeps:
     workflow_risk_deps: WorkflowRiskPhaseDeps
     checks_deps: PlanChecksAutoAnswerDeps
     preaction_deps: PreactionPhaseDeps
+    # Optional: issue the Mind calls of independent post-extract phases concurrently
+    # (see `MindPrefetcher`); phases still run and record in the order below. Called with
+    # stage="post_extract" after extract_evidence and stage="post_risk" once the risk gate passed.
+    prefetch_mind_phases: Callable[..., None] | None = None
 
 
 @dataclass(frozen=True)
@@ -53,6 +57,20 @@ def run_batch_predecide(*, batch_idx: int, deps: BatchPredecideDeps) -> BatchPre
         deps=deps.extract_deps,
     )
 
+    if deps.prefetch_mind_phases is not None:
+        deps.prefetch_mind_phases(
+            stage="post_extract",
+            batch_idx=batch_idx,
+            batch_id=batch_id,
+            ctx=ctx,
+            result=result,
+            summary=deps.dict_or_empty(summary),
+            evidence_obj=deps.dict_or_empty(evidence_obj),
+            repo_obs=deps.dict_or_empty(repo_obs),
+            hands_last=hands_last,
+            tdb_ctx_batch_obj=deps.dict_or_empty(tdb_ctx_batch_obj),
+        )
+
     risk_out = run_workflow_and_risk_phase(
         batch_idx=batch_idx,
         batch_id=batch_id,
@@ -68,6 +86,20 @@ def run_batch_predecide(*, batch_idx: int, deps: BatchPredecideDeps) -> BatchPre
     if isinstance(risk_out, bool):
         return BatchPredecideResult(batch_id=batch_id, out=risk_out)
 
+    if deps.prefetch_mind_phases is not None:
+        deps.prefetch_mind_phases(
+            stage="post_risk",
+            batch_idx=batch_idx,
+            batch_id=batch_id,
+            ctx=ctx,
+            result=result,
+            summary=deps.dict_or_empty(summary),
+            evidence_obj=deps.dict_or_empty(evidence_obj),
+            repo_obs=deps.dict_or_empty(repo_obs),
+            hands_last=hands_last,
+            tdb_ctx_batch_obj=deps.dict_or_empty(tdb_ctx_batch_obj),
+        )
+
     checks_obj, auto_answer_obj = run_plan_checks_and_auto_answer(
         batch_idx=batch_idx,
         batch_id=batch_id,
@@ -12,6 +12,30 @@ class RiskPredecideDeps:
     maybe_prompt_continue: Callable[..., bool | None]
 
 
+def build_risk_judge_prompt(
+    *,
+    risk_signals: list[str],
+    hands_last: str,
+    tdb_ctx_batch_obj: dict[str, Any],
+    task: str,
+    hands_provider: str,
+    runtime_cfg: dict[str, Any],
+    project_overlay: dict[str, Any],
+    risk_judge_prompt_builder: Callable[..., str],
+) -> str:
+    """Build the risk_judge prompt (shared by the query and concurrent prefetch)."""
+
+    return risk_judge_prompt_builder(
+        task=task,
+        hands_provider=hands_provider,
+        runtime_cfg=runtime_cfg if isinstance(runtime_cfg, dict) else {},
+        project_overlay=project_overlay if isinstance(project_overlay, dict) else {},
+        thought_db_context=tdb_ctx_batch_obj if isinstance(tdb_ctx_batch_obj, dict) else {},
+        risk_signals=[str(x) for x in risk_signals if str(x).strip()],
+        hands_last_message=str(hands_last or ""),
+    )
+
+
 def query_risk_judge(
     *,
     batch_idx: int,
@@ -36,14 +60,15 @@ def query_risk_judge(
         reason="risk_signal",
         query=(" ".join(signals) + "\n" + str(task or "")).strip(),
     )
-    risk_prompt = risk_judge_prompt_builder(
+    risk_prompt = build_risk_judge_prompt(
+        risk_signals=signals,
+        hands_last=hands_last,
+        tdb_ctx_batch_obj=tdb_ctx_batch_obj,
         task=task,
         hands_provider=hands_provider,
-        runtime_cfg=runtime_cfg if isinstance(runtime_cfg, dict) else {},
-        project_overlay=project_overlay if isinstance(project_overlay, dict) else {},
-        thought_db_context=tdb_ctx_batch_obj if isinstance(tdb_ctx_batch_obj, dict) else {},
-        risk_signals=signals,
-        hands_last_message=str(hands_last or ""),
+        runtime_cfg=runtime_cfg,
+        project_overlay=project_overlay,
+        risk_judge_prompt_builder=risk_judge_prompt_builder,
     )
     risk_obj, risk_mind_ref, risk_state = mind_call(
         schema_filename="risk_judge.json",
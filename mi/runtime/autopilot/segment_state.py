@@ -1,8 +1,40 @@
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
+from ...core.storage import quarantine_corrupt_file, ensure_dir
+
+# Header fields of a segment; any change forces a snapshot (journal lines only add records).
+_HEADER_KEYS = ("version", "open", "segment_id", "created_ts", "thread_id", "task_hint", "reason")
+
+
+def segment_journal_path(path: Path) -> Path:
+    """Journal sidecar of a segment snapshot (`segment_state.json` -> `segment_state.journal.jsonl`)."""
+
+    return Path(path).with_suffix(".journal.jsonl")
+
+
+@dataclass
+class SegmentJournal:
+    """What of the open segment is already on disk (snapshot + journal lines).
+
+    Journal lines are `{"segment_id", "n", "ts", "record"}`; `n` counts records journaled in
+    this segment, and each snapshot stores the last `n` it folded in (`journal_n`), so replay only
+    applies newer lines of the same segment (a crash between snapshot and journal reset is safe).
+    """
+
+    header: dict[str, Any] = field(default_factory=dict)
+    n: int = 0
+    last: Any = None
+    lines: int = 0
+
+
+def _header(segment_state: dict[str, Any]) -> dict[str, Any]:
+    return {k: segment_state.get(k) for k in _HEADER_KEYS}
+
 
 def new_segment_state(
     *,
@@ -27,13 +59,80 @@ def new_segment_state(
     }
 
 
+def replay_segment_journal(
+    segment_state: dict[str, Any],
+    *,
+    journal_path: Path,
+    state_warnings: list[dict[str, Any]] | None = None,
+    quarantine: bool = False,
+) -> int:
+    """Append journaled records newer than the snapshot to `segment_state["records"]`.
+
+    Returns the highest journal `n` seen. A torn last line (interrupted append) is ignored; a
+    corrupt earlier line stops the replay and, with `quarantine=True`, moves the journal aside.
+    """
+
+    recs = segment_state.get("records")
+    if not isinstance(recs, list):
+        recs = []
+        segment_state["records"] = recs
+    try:
+        n_max = int(segment_state.get("journal_n") or 0)
+    except Exception:
+        n_max = 0
+    seg_id = str(segment_state.get("segment_id") or "")
+    try:
+        lines = journal_path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return n_max
+    except Exception:
+        return n_max
+
+    for i, line in enumerate(lines):
+        if not line.strip():
+            continue
+        try:
+            obj = json.loads(line)
+            n = int(obj["n"])
+            rec = obj["record"]
+        except Exception as e:
+            if i == len(lines) - 1:
+                break
+            if quarantine:
+                quarantined_to, qerr = quarantine_corrupt_file(journal_path)
+                if state_warnings is not None:
+                    state_warnings.append(
+                        {
+                            "path": str(journal_path),
+                            "label": "segment_journal",
+                            "error": f"{type(e).__name__}: {e}",
+                            "quarantined_to": quarantined_to,
+                            "quarantine_error": qerr,
+                            "used_default": False,
+                        }
+                    )
+            break
+        if str(obj.get("segment_id") or "") != seg_id or n <= n_max or not isinstance(rec, dict):
+            continue
+        recs.append(rec)
+        n_max = n
+        ts = str(obj.get("ts") or "")
+        if ts:
+            segment_state["updated_ts"] = ts
+    return n_max
+
+
 def load_segment_state(
     *,
     path: Path,
     read_json_best_effort: Callable[..., Any],
     state_warnings: list[dict[str, Any]],
     thread_hint: str,
+    journal: SegmentJournal | None = None,
+    segment_max_records: int = 0,
 ) -> dict[str, Any] | None:
+    """Load the open segment buffer; with `journal`, replay journaled records onto the snapshot."""
+
     obj = read_json_best_effort(
         path,
         default=None,
@@ -55,9 +154,64 @@ def load_segment_state(
     st = str(obj.get("thread_id") or "").strip()
     if th and st and th != st:
         return None
+
+    if journal is not None:
+        n = replay_segment_journal(
+            obj,
+            journal_path=segment_journal_path(path),
+            state_warnings=state_warnings,
+            quarantine=True,
+        )
+        obj.pop("journal_n", None)
+        if segment_max_records > 0 and len(obj["records"]) > segment_max_records:
+            obj["records"] = obj["records"][-segment_max_records:]
+        # The next persist writes a fresh snapshot that folds in the replayed lines (and drops a torn tail).
+        journal.header = {}
+        journal.n = max(int(journal.n), int(n))
     return obj
 
 
+def _append_journal(
+    *,
+    path: Path,
+    journal: SegmentJournal,
+    segment_state: dict[str, Any],
+    records: list[Any],
+    compact_every: int,
+) -> bool:
+    """Journal the records added since the last persist; False when a snapshot is needed instead."""
+
+    if not journal.header or _header(segment_state) != journal.header:
+        return False
+    start = 0
+    if journal.last is not None:
+        for i in range(len(records) - 1, -1, -1):
+            if records[i] is journal.last:
+                start = i + 1
+                break
+        else:
+            return False
+    new = records[start:]
+    if not new:
+        return True
+    if compact_every > 0 and journal.lines + len(new) > compact_every:
+        return False
+
+    seg_id = str(segment_state.get("segment_id") or "")
+    ts = str(segment_state.get("updated_ts") or "")
+    out: list[str] = []
+    for rec in new:
+        journal.n += 1
+        out.append(json.dumps({"segment_id": seg_id, "n": journal.n, "ts": ts, "record": rec}, sort_keys=True))
+    jp = segment_journal_path(path)
+    ensure_dir(jp.parent)
+    with jp.open("a", encoding="utf-8") as f:
+        f.write("\n".join(out) + "\n")
+    journal.lines += len(new)
+    journal.last = new[-1]
+    return True
+
+
 def persist_segment_state(
     *,
     enabled: bool,
@@ -66,7 +220,15 @@ def persist_segment_state(
     segment_max_records: int,
     now_ts: Callable[[], str],
     write_json_atomic: Callable[[Path, Any], None],
+    journal: SegmentJournal | None = None,
 ) -> None:
+    """Persist the segment buffer.
+
+    Without `journal`, rewrite the snapshot. With `journal`, append only the records added since
+    the last persist; rewrite the snapshot (and drop the journal) when the segment header changed
+    or after `segment_max_records` journal lines, so IO per added record stays O(1) amortized.
+    """
+
     if not enabled:
         return
     try:
@@ -74,18 +236,39 @@ def persist_segment_state(
         recs = segment_state.get("records")
         if isinstance(recs, list) and len(recs) > segment_max_records:
             segment_state["records"] = recs[-segment_max_records:]
-        write_json_atomic(path, segment_state)
+        if journal is None:
+            write_json_atomic(path, segment_state)
+            return
+
+        recs = segment_state.get("records") if isinstance(segment_state.get("records"), list) else []
+        if _append_journal(
+            path=path,
+            journal=journal,
+            segment_state=segment_state,
+            records=recs,
+            compact_every=int(segment_max_records),
+        ):
+            return
+        write_json_atomic(path, {**segment_state, "journal_n": int(journal.n)})
+        journal.header = _header(segment_state)
+        journal.last = recs[-1] if recs else None
+        journal.lines = 0
+        try:
+            segment_journal_path(path).unlink()
+        except FileNotFoundError:
+            pass
     except Exception:
         return
 
 
 def clear_segment_state(*, path: Path) -> None:
-    try:
-        path.unlink()
-    except FileNotFoundError:
-        return
-    except Exception:
-        return
+    for p in (path, segment_journal_path(path)):
+        try:
+            p.unlink()
+        except FileNotFoundError:
+            continue
+        except Exception:
+            continue
 
 
 def add_segment_record(
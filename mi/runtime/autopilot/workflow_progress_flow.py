@@ -33,10 +33,8 @@ def build_workflow_progress_latest_evidence(
     }
 
 
-def query_workflow_progress(
+def build_workflow_progress_prompt(
     *,
-    batch_idx: int,
-    batch_id: str,
     task: str,
     hands_provider: str,
     runtime_cfg: dict[str, Any],
@@ -47,11 +45,11 @@ def query_workflow_progress(
     last_batch_input: str,
     hands_last_message: str,
     thought_db_context: dict[str, Any],
-    deps: WorkflowProgressQueryDeps,
-) -> tuple[dict[str, Any], str, str]:
-    """Run workflow_progress query and normalize return shape."""
+    prompt_builder: Callable[..., str],
+) -> str:
+    """Build the workflow_progress prompt (shared by the query and concurrent prefetch)."""
 
-    wf_prog_prompt = deps.workflow_progress_prompt_builder(
+    return prompt_builder(
         task=task,
         hands_provider=hands_provider,
         runtime_cfg=runtime_cfg if isinstance(runtime_cfg, dict) else {},
@@ -63,6 +61,39 @@ def query_workflow_progress(
         last_batch_input=last_batch_input,
         hands_last_message=hands_last_message,
     )
+
+
+def query_workflow_progress(
+    *,
+    batch_idx: int,
+    batch_id: str,
+    task: str,
+    hands_provider: str,
+    runtime_cfg: dict[str, Any],
+    project_overlay: dict[str, Any],
+    active_workflow: dict[str, Any],
+    workflow_run: dict[str, Any],
+    latest_evidence: dict[str, Any],
+    last_batch_input: str,
+    hands_last_message: str,
+    thought_db_context: dict[str, Any],
+    deps: WorkflowProgressQueryDeps,
+) -> tuple[dict[str, Any], str, str]:
+    """Run workflow_progress query and normalize return shape."""
+
+    wf_prog_prompt = build_workflow_progress_prompt(
+        task=task,
+        hands_provider=hands_provider,
+        runtime_cfg=runtime_cfg,
+        project_overlay=project_overlay,
+        active_workflow=active_workflow,
+        workflow_run=workflow_run,
+        latest_evidence=latest_evidence,
+        last_batch_input=last_batch_input,
+        hands_last_message=hands_last_message,
+        thought_db_context=thought_db_context,
+        prompt_builder=deps.workflow_progress_prompt_builder,
+    )
     wf_prog_obj, wf_prog_ref, wf_prog_state = deps.mind_call(
         schema_filename="workflow_progress.json",
         prompt=wf_prog_prompt,
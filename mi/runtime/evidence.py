@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 import secrets
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from ..core.storage import append_jsonl, now_rfc3339
+from ..core.perf import span
+from ..core.storage import append_jsonl, append_jsonl_many, now_rfc3339
 
 
 def new_run_id(prefix: str = "run") -> str:
@@ -18,17 +20,25 @@ def new_run_id(prefix: str = "run") -> str:
 class EvidenceWriter:
     """Append-only EvidenceLog writer with stable event identifiers.
 
-    - event_id: unique within the log (derived from run_id + seq)
+    - event_id: unique within the log (derived from run_id + seq [+ sub_seq])
     - run_id: unique per writer/session (e.g., one `mi run` invocation)
-    - seq: monotonically increasing within the run_id
+    - seq: assigned in increasing order within the run_id
+
+    `reserve()` assigns one seq to a block of records produced later (e.g., by a background
+    checkpoint job): the block's records share that seq and are numbered by `sub_seq` (1, 2, ...),
+    so their event ids are deterministic however long the job runs or how many records it writes.
+    The block is written as one contiguous run of lines when it is flushed, i.e. possibly after
+    lines with a higher seq: within a run, log order is (seq, sub_seq) order except that a
+    reserved block may appear later than its seq. Readers that need run order sort by
+    (seq, sub_seq) (`evidence_order_key`).
     """
 
     path: Path
     run_id: str
     seq: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False, compare=False)
 
-    def append(self, rec: dict[str, Any]) -> dict[str, Any]:
-        self.seq += 1
+    def _stamp(self, rec: dict[str, Any], *, seq: int, sub_seq: int = 0) -> dict[str, Any]:
         obj = dict(rec) if isinstance(rec, dict) else {"value": rec}
 
         # Best-effort: ensure ts exists.
@@ -37,8 +47,58 @@ class EvidenceWriter:
             obj["ts"] = now_rfc3339()
 
         obj["run_id"] = str(self.run_id or "").strip() or new_run_id("run")
-        obj["seq"] = int(self.seq)
-        obj["event_id"] = f"ev_{obj['run_id']}_{int(self.seq):06d}"
+        obj["seq"] = int(seq)
+        obj["event_id"] = f"ev_{obj['run_id']}_{int(seq):06d}"
+        if sub_seq:
+            obj["sub_seq"] = int(sub_seq)
+            obj["event_id"] += f"_{int(sub_seq):03d}"
+        return obj
+
+    def append(self, rec: dict[str, Any]) -> dict[str, Any]:
+        with span("evidence.append"), self._lock:
+            self.seq += 1
+            obj = self._stamp(rec, seq=self.seq)
+            append_jsonl(self.path, obj)
+            return obj
+
+    def reserve(self) -> "EvidenceSlots":
+        with self._lock:
+            self.seq += 1
+            return EvidenceSlots(writer=self, seq=self.seq)
+
+
+@dataclass
+class EvidenceSlots:
+    """A deferred block of EvidenceLog records sharing one reserved seq (see `EvidenceWriter.reserve`).
 
-        append_jsonl(self.path, obj)
+    `append` stamps and buffers a record (its event_id is final immediately); `flush` writes the
+    buffered records as one contiguous run of lines.
+    """
+
+    writer: EvidenceWriter
+    seq: int
+    used: int = 0
+    pending: list[dict[str, Any]] = field(default_factory=list)
+
+    def append(self, rec: dict[str, Any]) -> dict[str, Any]:
+        self.used += 1
+        obj = self.writer._stamp(rec, seq=self.seq, sub_seq=self.used)
+        self.pending.append(obj)
         return obj
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        with span("evidence.append"), self.writer._lock:
+            append_jsonl_many(self.writer.path, self.pending)
+        self.pending.clear()
+
+
+def evidence_order_key(obj: dict[str, Any]) -> tuple[int, int]:
+    """Sort key restoring run order of one run's EvidenceLog records ((seq, sub_seq); missing = 0)."""
+
+    out: list[int] = []
+    for k in ("seq", "sub_seq"):
+        v = obj.get(k) if isinstance(obj, dict) else None
+        out.append(v if isinstance(v, int) else 0)
+    return out[0], out[1]
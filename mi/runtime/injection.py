@@ -59,13 +59,39 @@ def collect_canonical_pref_goal_claims(
     Order:
     1) Global values claims tagged `values:base` (preference/goal)
     2) Other recent preference/goal claims (project first, then global)
+
+    Memoised per (project view, global view) generation until the next claim validity boundary.
     """
 
-    v_proj = tdb.load_view(scope="project")
-    v_glob = tdb.load_view(scope="global")
+    key = f"canonical_pref_goal_claims:{int(max_values)}:{int(max_other)}"
+    return list(
+        tdb.memo_for_views(
+            key,
+            as_of_ts=as_of_ts,
+            build=lambda v_proj, v_glob: _collect_canonical_pref_goal_claims(
+                v_proj=v_proj,
+                v_glob=v_glob,
+                as_of_ts=as_of_ts,
+                max_values=max_values,
+                max_other=max_other,
+            ),
+        )
+    )
+
+
+def _collect_canonical_pref_goal_claims(
+    *,
+    v_proj: ThoughtDbView,
+    v_glob: ThoughtDbView,
+    as_of_ts: str,
+    max_values: int,
+    max_other: int,
+) -> list[dict[str, Any]]:
+    # One pass per view; the three sections below all walk the same newest-first lists.
+    pref_goal = {"project": _iter_pref_goal_claims(v_proj, as_of_ts=as_of_ts), "global": _iter_pref_goal_claims(v_glob, as_of_ts=as_of_ts)}
 
     values_raw: list[dict[str, Any]] = []
-    for c in _iter_pref_goal_claims(v_glob, as_of_ts=as_of_ts):
+    for c in pref_goal["global"]:
         tags = c.get("tags") if isinstance(c.get("tags"), list) else []
         tagset = {str(x).strip() for x in tags if str(x).strip()}
         if VALUES_BASE_TAG in tagset:
@@ -76,8 +102,8 @@ def collect_canonical_pref_goal_claims(
 
     pinned: list[dict[str, Any]] = []
     if PINNED_PREF_GOAL_TAGS:
-        for view, _scope in ((v_proj, "project"), (v_glob, "global")):
-            for c in _iter_pref_goal_claims(view, as_of_ts=as_of_ts):
+        for view, scope in ((v_proj, "project"), (v_glob, "global")):
+            for c in pref_goal[scope]:
                 cid = str(c.get("claim_id") or "").strip()
                 if not cid or cid in seen_ids:
                     continue
@@ -96,7 +122,7 @@ def collect_canonical_pref_goal_claims(
 
     other: list[dict[str, Any]] = []
     for view, scope in ((v_proj, "project"), (v_glob, "global")):
-        for c in _iter_pref_goal_claims(view, as_of_ts=as_of_ts):
+        for c in pref_goal[scope]:
             cid = str(c.get("claim_id") or "").strip()
             if not cid or cid in seen_ids:
                 continue
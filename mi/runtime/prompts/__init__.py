@@ -11,7 +11,7 @@ from .mining import checkpoint_decide_prompt, learn_update_prompt, mine_claims_p
 from .risk import risk_judge_prompt
 from .values import compile_values_prompt, values_claim_patch_prompt
 from .workflow import edit_workflow_prompt, suggest_workflow_prompt, workflow_progress_prompt
-from .why_trace import why_trace_prompt
+from .why_trace import why_trace_batch_prompt, why_trace_prompt
 
 __all__ = [
     "auto_answer_to_hands_prompt",
@@ -29,6 +29,7 @@ __all__ = [
     "suggest_workflow_prompt",
     "values_claim_patch_prompt",
     "workflow_progress_prompt",
+    "why_trace_batch_prompt",
     "why_trace_prompt",
 ]
 
@@ -7,3 +7,35 @@ from typing import Any
 def _to_json(obj: Any) -> str:
     return json.dumps(obj, indent=2, sort_keys=True)
 
+
+class SplitPrompt(str):
+    """Prompt text that remembers its static (cacheable) prefix.
+
+    The string value is the full prompt, byte-identical to a plain builder output, so
+    callers and providers that do not care about caching see no difference. Providers
+    that support prompt prefix caching read `static_prefix` / `dynamic_suffix`.
+    """
+
+    static_prefix: str
+
+    def __new__(cls, text: str, static_prefix: str = "") -> "SplitPrompt":
+        obj = super().__new__(cls, text)
+        prefix = str(static_prefix or "")
+        obj.static_prefix = prefix if prefix and text.startswith(prefix) else ""
+        return obj
+
+    @property
+    def dynamic_suffix(self) -> str:
+        return str(self)[len(self.static_prefix) :]
+
+
+def _split_prompt(static_lines: list[str], dynamic_lines: list[str]) -> SplitPrompt:
+    """Join prompt lines like the plain builders do, recording where the static part ends.
+
+    Static lines should only hold material that is stable across batches of a run
+    (instructions, task, runtime config, overlay); per-batch inputs go in `dynamic_lines`.
+    """
+
+    text = "\n".join([*static_lines, *dynamic_lines]).strip() + "\n"
+    prefix = "\n".join(static_lines).lstrip() + "\n" if static_lines else ""
+    return SplitPrompt(text, prefix)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ._util import _to_json
+from ._util import _split_prompt, _to_json
 
 
 def plan_min_checks_prompt(
@@ -15,7 +15,7 @@ def plan_min_checks_prompt(
     recent_evidence: list[dict[str, Any]],
     repo_observation: dict[str, Any],
 ) -> str:
-    return "\n".join(
+    return _split_prompt(
         [
             "You are MI (Mind Incarnation).",
             "Plan minimal, high-information verification checks to reduce uncertainty.",
@@ -43,6 +43,8 @@ def plan_min_checks_prompt(
             "ProjectOverlay:",
             _to_json(project_overlay),
             "",
+        ],
+        [
             "Thought DB context (canonical values/preferences; may be empty):",
             _to_json(thought_db_context if isinstance(thought_db_context, dict) else {}),
             "",
@@ -53,6 +55,6 @@ def plan_min_checks_prompt(
             _to_json(recent_evidence),
             "",
             "Now plan the minimal checks and produce a Hands instruction if needed.",
-        ]
-    ).strip() + "\n"
+        ],
+    )
 
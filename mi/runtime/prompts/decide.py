@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ._util import _to_json
+from ._util import _split_prompt, _to_json
 
 
 def decide_next_prompt(
@@ -20,7 +20,7 @@ def decide_next_prompt(
     check_plan: dict[str, Any],
     auto_answer: dict[str, Any],
 ) -> str:
-    return "\n".join(
+    return _split_prompt(
         [
             "You are MI (Mind Incarnation), operating above Hands.",
             "Decide what to do next after a Hands batch, minimizing user burden.",
@@ -56,6 +56,8 @@ def decide_next_prompt(
             "ProjectOverlay:",
             _to_json(project_overlay),
             "",
+        ],
+        [
             "Thought DB context (deterministic retrieval; may be empty):",
             _to_json(thought_db_context if isinstance(thought_db_context, dict) else {}),
             "",
@@ -81,8 +83,8 @@ def decide_next_prompt(
             hands_last_message.strip(),
             "",
             "Now decide the next action.",
-        ]
-    ).strip() + "\n"
+        ],
+    )
 
 
 def auto_answer_to_hands_prompt(
@@ -97,7 +99,7 @@ def auto_answer_to_hands_prompt(
     recent_evidence: list[dict[str, Any]],
     hands_last_message: str,
 ) -> str:
-    return "\n".join(
+    return _split_prompt(
         [
             "You are MI (Mind Incarnation), operating above Hands.",
             "Your job: answer Hands' question(s) as the user when possible, using values/preferences + evidence + memory, to minimize user burden.",
@@ -129,6 +131,8 @@ def auto_answer_to_hands_prompt(
             "ProjectOverlay:",
             _to_json(project_overlay),
             "",
+        ],
+        [
             "Thought DB context (canonical values/preferences; may be empty):",
             _to_json(thought_db_context if isinstance(thought_db_context, dict) else {}),
             "",
@@ -145,6 +149,6 @@ def auto_answer_to_hands_prompt(
             hands_last_message.strip(),
             "",
             "Now decide whether MI can answer Hands, and output the JSON.",
-        ]
-    ).strip() + "\n"
+        ],
+    )
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ._util import _to_json
+from ._util import _split_prompt, _to_json
 
 
 def extract_evidence_prompt(
@@ -14,7 +14,7 @@ def extract_evidence_prompt(
     hands_batch_summary: dict[str, Any],
     repo_observation: dict[str, Any],
 ) -> str:
-    return "\n".join(
+    return _split_prompt(
         [
             "You are MI (Mind Incarnation).",
             "Extract durable evidence from a Hands batch run.",
@@ -29,6 +29,8 @@ def extract_evidence_prompt(
             "MI light injection (what Hands was told):",
             light_injection.strip(),
             "",
+        ],
+        [
             "Batch input sent to Hands (verbatim):",
             (batch_input or "").strip(),
             "",
@@ -41,6 +43,6 @@ def extract_evidence_prompt(
             "Repo observation (read-only heuristic):",
             _to_json(repo_observation),
             "",
-        ]
-    ).strip() + "\n"
+        ],
+    )
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ._util import _to_json
+from ._util import _split_prompt, _to_json
 
 
 def risk_judge_prompt(
@@ -15,7 +15,7 @@ def risk_judge_prompt(
     risk_signals: list[str],
     hands_last_message: str,
 ) -> str:
-    return "\n".join(
+    return _split_prompt(
         [
             "You are MI (Mind Incarnation).",
             "Assess risk for a Hands batch using user values/preferences and evidence.",
@@ -36,6 +36,8 @@ def risk_judge_prompt(
             "ProjectOverlay:",
             _to_json(project_overlay),
             "",
+        ],
+        [
             "Thought DB context (canonical values/preferences; may be empty):",
             _to_json(thought_db_context if isinstance(thought_db_context, dict) else {}),
             "",
@@ -46,6 +48,6 @@ def risk_judge_prompt(
             hands_last_message.strip(),
             "",
             "Now output the risk judgement.",
-        ]
-    ).strip() + "\n"
+        ],
+    )
 
@@ -49,3 +49,57 @@ def why_trace_prompt(
         ]
     ).strip() + "\n"
 
+
+
+def why_trace_batch_prompt(
+    *,
+    items: list[dict[str, Any]],
+    as_of_ts: str,
+    notes: str,
+) -> str:
+    """Several WhyTrace targets in one call; each item is {target_key, target, candidate_claims}."""
+
+    packed: list[dict[str, Any]] = []
+    for it in items or []:
+        if not isinstance(it, dict):
+            continue
+        cands = it.get("candidate_claims") if isinstance(it.get("candidate_claims"), list) else []
+        packed.append(
+            {
+                "target_key": str(it.get("target_key") or "").strip(),
+                "target": it.get("target") if isinstance(it.get("target"), dict) else {},
+                "candidate_claim_ids": [
+                    str(c.get("claim_id") or "").strip()
+                    for c in cands
+                    if isinstance(c, dict) and str(c.get("claim_id") or "").strip()
+                ],
+                "candidate_claims": cands,
+            }
+        )
+    return "\n".join(
+        [
+            "You are MI (Mind Incarnation).",
+            "Perform root-cause tracing for EACH target below: select a minimal support set of atomic Claims that best explain each target decision/action/event.",
+            "",
+            "Rules:",
+            "- Output MUST be a single JSON object matching the provided JSON Schema.",
+            "- No markdown, no extra keys, no extra commentary.",
+            "- Output exactly one entry in `traces` per target, with the target's `target_key` copied verbatim.",
+            "- For each target, you MUST select claim ids ONLY from THAT target's candidate_claim_ids list.",
+            "- Choose the MINIMAL set of claims that explains each target (usually 1-5).",
+            "- Consider temporal validity: as_of_ts must fall within valid_from/valid_to when present; avoid out-of-window claims.",
+            "- If a target has insufficient evidence, set its status=insufficient, chosen_claim_ids=[], and explain what's missing.",
+            "- Treat targets independently; do not carry conclusions from one target to another.",
+            "",
+            "as_of_ts:",
+            (as_of_ts or "").strip(),
+            "",
+            "Targets (compact JSON; each with its own candidates):",
+            _to_json(packed),
+            "",
+            "Run notes:",
+            (notes or "").strip(),
+            "",
+            "Now output the WhyTrace batch JSON.",
+        ]
+    ).strip() + "\n"
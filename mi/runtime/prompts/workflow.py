@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from ._util import _to_json
+from ._util import _split_prompt, _to_json
 
 
 def workflow_progress_prompt(
@@ -18,7 +18,7 @@ def workflow_progress_prompt(
     last_batch_input: str,
     hands_last_message: str,
 ) -> str:
-    return "\n".join(
+    return _split_prompt(
         [
             "You are MI (Mind Incarnation).",
             "Infer workflow step progress from evidence, without enforcing step-by-step reporting.",
@@ -50,6 +50,8 @@ def workflow_progress_prompt(
             "ProjectOverlay (may include prior workflow_run state):",
             _to_json(project_overlay),
             "",
+        ],
+        [
             "Thought DB context (canonical values/preferences; may be empty):",
             _to_json(thought_db_context if isinstance(thought_db_context, dict) else {}),
             "",
@@ -69,8 +71,8 @@ def workflow_progress_prompt(
             (hands_last_message or "").strip(),
             "",
             "Now output the workflow progress JSON.",
-        ]
-    ).strip() + "\n"
+        ],
+    )
 
 
 def suggest_workflow_prompt(
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable
+import functools
+import re
+from typing import Any, Iterable
 
 
 def _truncate(text: str, limit: int) -> str:
@@ -9,113 +11,207 @@ def _truncate(text: str, limit: int) -> str:
     return text[: limit - 3] + "..."
 
 
-def _dedup_keep_order(items: Iterable[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for s in items:
-        if s in seen:
-            continue
-        seen.add(s)
-        out.append(s)
-    return out
-
-
-# Central marker lists used by both risk-signal extraction and the optional interrupt/terminate mode.
-_MARKERS_ANY_EXTERNAL = [
+# Built-in marker rules (lowercase substrings), in signal order. Every category marker also counts as
+# "external" for interrupt mode `on_any_external`; `_HIGH_RISK_CATEGORIES` (+ pipe-to-shell markers)
+# are the `on_high_risk` set.
+_BUILTIN_RULES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    # External irreversible actions.
+    ("push", ("git push",)),
+    ("publish", ("npm publish", "twine upload")),
     # Package install / dependency changes.
-    "pip install",
-    "npm install",
-    "pnpm install",
-    "yarn add",
+    ("install", ("pip install", "npm install", "pnpm install", "yarn add")),
     # Network fetches.
-    "curl ",
-    "wget ",
-    # Publishing / pushing / irreversible external actions.
-    "git push",
-    "npm publish",
-    "twine upload",
+    ("network", ("curl ", "wget ")),
     # Local destructive / privilege escalation.
-    "rm -rf",
-    "rm -r",
-    "sudo ",
-]
+    ("delete", ("rm -rf", "rm -r")),
+    ("privilege", ("sudo ",)),
+)
+_HIGH_RISK_CATEGORIES = ("push", "publish", "delete", "privilege")
+# "Pipe to shell" patterns: high risk for interrupts, but not a risk-signal category of their own.
+_PIPE_TO_SHELL_MARKERS = ("curl | sh", "curl|sh", "wget | sh", "wget|sh")
+
+# JSON string escaping leaves these characters untouched, so a marker made only of them can be
+# searched in a raw JSONL row before the row is parsed.
+_JSON_PLAIN = re.compile(r"^[\x20-\x7e]*$")
+# Non-ASCII characters whose lower() contains ASCII (U+0130 -> "i̇", U+212A -> "k"). JSON rows carry them
+# as escapes, so the raw-row pre-filter treats those escapes as candidates too.
+_ASCII_LOWERING_ESCAPES = ("\\u0130", "\\u212a")
+
+
+class RiskPatternEngine:
+    """All risk markers compiled into single alternation regexes, matched against `text.lower()`.
+
+    - `categories(text)`: risk-signal categories in rule order (a line without any marker costs one
+      `lower()` and one failed `search`, however many markers are configured)
+    - `should_interrupt(mode, text)`: interrupt predicate for `off|on_high_risk|on_any_external`
+
+    Semantics match the substring checks `marker in text.lower()`: overlapping markers are found via
+    a lookahead scan, and a marker implies the categories of every marker it contains.
+    """
 
-_MARKERS_HIGH_RISK = [
-    # External irreversible actions.
-    "git push",
-    "npm publish",
-    "twine upload",
-    # Destructive / privilege escalation.
-    "rm -rf",
-    "rm -r",
-    "sudo ",
-    # "Pipe to shell" patterns (often high risk).
-    "curl | sh",
-    "curl|sh",
-    "wget | sh",
-    "wget|sh",
-]
-
-
-def should_interrupt_text(mode: str, text: str) -> bool:
+    def __init__(
+        self,
+        rules: Iterable[tuple[str, Iterable[str]]],
+        *,
+        high_risk_categories: Iterable[str],
+        high_risk_markers: Iterable[str] = (),
+    ) -> None:
+        order: list[str] = []
+        cats_by_marker: dict[str, set[str]] = {}
+        for cat, markers in rules:
+            c = str(cat or "").strip()
+            if not c:
+                continue
+            if c not in order:
+                order.append(c)
+            for m in markers:
+                ms = str(m or "").lower()
+                if ms.strip():
+                    cats_by_marker.setdefault(ms, set()).add(c)
+        high_cats = {str(c or "").strip() for c in high_risk_categories}
+        extra_high = {str(m or "").lower() for m in high_risk_markers if str(m or "").strip()}
+
+        external = set(cats_by_marker)
+        high = {m for m, cs in cats_by_marker.items() if cs & high_cats} | extra_high
+        everything = external | high
+
+        self._order = tuple(order)
+        # A match of marker `m` at some position also covers every marker contained in `m`.
+        self._cats: dict[str, frozenset[str]] = {
+            m: frozenset(c for m2, cs in cats_by_marker.items() if m2 in m for c in cs) for m in everything
+        }
+        self._any_re = self._compile(everything, lookahead=False)
+        self._scan_re = self._compile(everything, lookahead=True)
+        self._external_re = self._compile(external, lookahead=False)
+        self._high_re = self._compile(high, lookahead=False)
+        self.json_prefilter_ok = all(_JSON_PLAIN.match(m) and '"' not in m and "\\" not in m for m in everything)
+        self._row_re = self._compile(everything | set(_ASCII_LOWERING_ESCAPES), lookahead=False) if self.json_prefilter_ok else None
+
+    @staticmethod
+    def _compile(markers: Iterable[str], *, lookahead: bool) -> re.Pattern[str] | None:
+        alts = sorted(set(markers), key=lambda m: (-len(m), m))
+        if not alts:
+            return None
+        body = "|".join(re.escape(m) for m in alts)
+        # Case-sensitive on purpose: callers lower() first (an IGNORECASE alternation is several
+        # times slower in `re` than lower() + a literal-prefix scan).
+        return re.compile(f"(?=({body}))" if lookahead else body)
+
+    def search(self, text: str) -> bool:
+        """True when `text` contains any marker (cheap pre-filter)."""
+
+        return self._any_re is not None and self._any_re.search(text.lower()) is not None
+
+    def categories(self, text: str) -> list[str]:
+        if self._any_re is None or self._scan_re is None:
+            return []
+        lower = text.lower()
+        if self._any_re.search(lower) is None:
+            return []
+        found: set[str] = set()
+        for m in self._scan_re.finditer(lower):
+            found |= self._cats.get(m.group(1), frozenset())
+        return [c for c in self._order if c in found]
+
+    def candidate_rows(self, text: str) -> list[str]:
+        """Lines of a raw JSONL chunk that may carry a marker, in order (one regex pass per chunk).
+
+        Rows are not decoded: only the returned ones need `json.loads`. Returns every line when the
+        markers cannot be matched against raw JSON (see `json_prefilter_ok`).
+        """
+
+        if self._row_re is None:
+            return text.splitlines()
+        lower = text.lower()
+        if len(lower) != len(text):
+            # Unescaped non-ASCII changed length under lower(): positions no longer line up.
+            return [ln for ln in text.splitlines() if self._row_re.search(ln.lower()) is not None]
+        out: list[str] = []
+        end = -1
+        for m in self._row_re.finditer(lower):
+            pos = m.start()
+            if pos < end:
+                continue
+            start = text.rfind("\n", 0, pos) + 1
+            end = text.find("\n", pos)
+            if end < 0:
+                end = len(text)
+            out.append(text[start:end])
+        return out
+
+    def should_interrupt(self, mode: str, text: str) -> bool:
+        mode = (mode or "").strip()
+        if mode == "off":
+            return False
+        rx = self._external_re if mode == "on_any_external" else self._high_re
+        return rx is not None and rx.search((text or "").lower()) is not None
+
+
+_DEFAULT_ENGINE = RiskPatternEngine(
+    _BUILTIN_RULES,
+    high_risk_categories=_HIGH_RISK_CATEGORIES,
+    high_risk_markers=_PIPE_TO_SHELL_MARKERS,
+)
+
+
+def default_risk_engine() -> RiskPatternEngine:
+    return _DEFAULT_ENGINE
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_engine(extra: tuple[tuple[str, tuple[str, ...]], ...], high: tuple[str, ...]) -> RiskPatternEngine:
+    return RiskPatternEngine(
+        _BUILTIN_RULES + extra,
+        high_risk_categories=high,
+        high_risk_markers=_PIPE_TO_SHELL_MARKERS,
+    )
+
+
+def risk_engine_from_config(runtime_cfg: dict[str, Any] | None) -> RiskPatternEngine:
+    """Engine for `runtime.violation_response.risk_markers` / `high_risk_categories` (compiled once per setting)."""
+
+    cfg = runtime_cfg if isinstance(runtime_cfg, dict) else {}
+    vr = cfg.get("violation_response") if isinstance(cfg.get("violation_response"), dict) else {}
+    raw = vr.get("risk_markers") if isinstance(vr.get("risk_markers"), dict) else {}
+    extra: list[tuple[str, tuple[str, ...]]] = []
+    for cat, markers in raw.items():
+        c = str(cat or "").strip()
+        if not c or not isinstance(markers, list):
+            continue
+        ms = tuple(str(m) for m in markers if isinstance(m, str) and m.strip())
+        if ms:
+            extra.append((c, ms))
+    high_raw = vr.get("high_risk_categories")
+    high = tuple(str(x).strip() for x in high_raw if str(x).strip()) if isinstance(high_raw, list) else _HIGH_RISK_CATEGORIES
+    if not extra and high == _HIGH_RISK_CATEGORIES:
+        return _DEFAULT_ENGINE
+    return _compile_engine(tuple(extra), high)
+
+
+def should_interrupt_text(mode: str, text: str, *, engine: RiskPatternEngine | None = None) -> bool:
     """Best-effort predicate for interrupt/terminate mode.
 
     mode: off|on_high_risk|on_any_external
     """
 
-    mode = (mode or "").strip()
-    if mode == "off":
-        return False
-    lower = (text or "").lower()
-    markers = _MARKERS_ANY_EXTERNAL if mode == "on_any_external" else _MARKERS_HIGH_RISK
-    return any(m in lower for m in markers)
+    return (engine or _DEFAULT_ENGINE).should_interrupt(mode, str(text or ""))
 
 
-def detect_risk_signals_from_command(cmd: str) -> list[str]:
+def detect_risk_signals_from_command(cmd: str, *, engine: RiskPatternEngine | None = None) -> list[str]:
     """Return risk signals in the format: '<category>: <detail>'."""
 
     cmd = str(cmd or "")
-    lower = cmd.lower()
-    signals: list[str] = []
-
-    if "git push" in lower:
-        signals.append(f"push: {cmd}")
-    if "npm publish" in lower or "twine upload" in lower:
-        signals.append(f"publish: {cmd}")
-    if "pip install" in lower or "npm install" in lower or "pnpm install" in lower or "yarn add" in lower:
-        signals.append(f"install: {cmd}")
-    if "curl " in lower or "wget " in lower:
-        signals.append(f"network: {cmd}")
-    if "rm -rf" in lower or "rm -r" in lower:
-        signals.append(f"delete: {cmd}")
-    if "sudo " in lower:
-        signals.append(f"privilege: {cmd}")
-
-    return _dedup_keep_order(signals)
-
-
-def detect_risk_signals_from_text_line(line: str, *, limit: int = 200) -> list[str]:
+    return [f"{c}: {cmd}" for c in (engine or _DEFAULT_ENGINE).categories(cmd)]
+
+
+def detect_risk_signals_from_text_line(line: str, *, limit: int = 200, engine: RiskPatternEngine | None = None) -> list[str]:
     """Best-effort risk detection from raw stdout/stderr transcript text."""
 
     raw = str(line or "").strip()
     if not raw:
         return []
-    lower = raw.lower()
+    cats = (engine or _DEFAULT_ENGINE).categories(raw)
+    if not cats:
+        return []
     detail = _truncate(raw, limit)
-
-    signals: list[str] = []
-    if "git push" in lower:
-        signals.append(f"push: {detail}")
-    if "npm publish" in lower or "twine upload" in lower:
-        signals.append(f"publish: {detail}")
-    if "pip install" in lower or "npm install" in lower or "pnpm install" in lower or "yarn add" in lower:
-        signals.append(f"install: {detail}")
-    if "curl " in lower or "wget " in lower:
-        signals.append(f"network: {detail}")
-    if "rm -rf" in lower or "rm -r" in lower:
-        signals.append(f"delete: {detail}")
-    if "sudo " in lower:
-        signals.append(f"privilege: {detail}")
-
-    return _dedup_keep_order(signals)
-
+    return [f"{c}: {detail}" for c in cats]
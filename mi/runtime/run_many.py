@@ -0,0 +1,345 @@
+"""`mi run-many`: run several autopilots concurrently in one process.
+
+Each manifest entry is an ordinary `mi run` (own EvidenceLog, overlay, segment buffer, Thought DB
+project scope). Runs share:
+- one memory-index connection (`SqliteFtsBackend(shared_connection=True)`)
+- the global-scope Thought DB view cache
+- a cap on simultaneous Hands processes
+- a cap (and optional rate limit) on in-flight Mind calls
+
+Entries that resolve to the same project run one after another, as one job (one parallel slot).
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+from ..core.paths import ProjectPaths
+from ..core.storage import now_rfc3339
+from ..memory.backends.sqlite_fts import SqliteFtsBackend
+from ..memory.service import MemoryService
+from ..providers.types import HandsExecFn, HandsResumeFn, MindProvider, MindProviderResult
+from . import wiring as W
+from .wiring.run_from_boot import run_autopilot_from_boot
+
+
+_DEFAULT_MAX_BATCHES = 8
+
+
+@dataclass(frozen=True)
+class RunManyEntry:
+    project_root: str
+    task: str
+    max_batches: int
+
+
+@dataclass(frozen=True)
+class RunManyLimits:
+    max_parallel: int = 4
+    hands_cap: int = 2
+    mind_cap: int = 4
+    mind_rate_per_min: float = 0.0  # 0 = no rate limit
+
+    @classmethod
+    def from_runtime_config(cls, runtime_cfg: dict[str, Any]) -> RunManyLimits:
+        cfg = runtime_cfg.get("run_many") if isinstance(runtime_cfg.get("run_many"), dict) else {}
+
+        def _int(key: str, default: int) -> int:
+            try:
+                return max(1, int(cfg.get(key, default) or default))
+            except Exception:
+                return default
+
+        try:
+            rate = max(0.0, float(cfg.get("mind_rate_per_min", 0.0) or 0.0))
+        except Exception:
+            rate = 0.0
+        return cls(
+            max_parallel=_int("max_parallel", 4),
+            hands_cap=_int("hands_cap", 2),
+            mind_cap=_int("mind_cap", 4),
+            mind_rate_per_min=rate,
+        )
+
+
+def load_run_many_manifest(path: Path) -> list[RunManyEntry]:
+    """Load a manifest: a JSON list (or `{"runs": [...]}`) or JSONL of `{project_root, task, max_batches}`.
+
+    `cd` is accepted as an alias of `project_root`; relative roots resolve against the manifest dir.
+    Raises ValueError on malformed entries.
+    """
+
+    p = Path(path).expanduser()
+    text = p.read_text(encoding="utf-8")
+    items: list[Any]
+    try:
+        obj = json.loads(text)
+        if isinstance(obj, dict) and isinstance(obj.get("runs"), list):
+            items = list(obj["runs"])
+        elif isinstance(obj, list):
+            items = obj
+        else:
+            items = [obj]
+    except json.JSONDecodeError:
+        items = []
+        for n, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{p}:{n}: invalid JSON ({e.msg})") from e
+
+    out: list[RunManyEntry] = []
+    for i, it in enumerate(items):
+        if not isinstance(it, dict):
+            raise ValueError(f"{p}: entry {i} is not an object")
+        root = str(it.get("project_root") or it.get("cd") or "").strip()
+        task = str(it.get("task") or "").strip()
+        if not root or not task:
+            raise ValueError(f"{p}: entry {i} needs project_root and task")
+        root_path = Path(root).expanduser()
+        if not root_path.is_absolute():
+            root_path = p.parent / root_path
+        try:
+            max_batches = int(it.get("max_batches", _DEFAULT_MAX_BATCHES) or _DEFAULT_MAX_BATCHES)
+        except Exception as e:
+            raise ValueError(f"{p}: entry {i} has an invalid max_batches") from e
+        out.append(RunManyEntry(project_root=str(root_path.resolve()), task=task, max_batches=max(1, max_batches)))
+    return out
+
+
+class _WaitStats:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def add(self, wait_s: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total_s += wait_s
+            self.max_s = max(self.max_s, wait_s)
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            avg = self.total_s / self.count if self.count else 0.0
+            return {"count": self.count, "avg_wait_s": round(avg, 3), "max_wait_s": round(self.max_s, 3), "total_wait_s": round(self.total_s, 3)}
+
+
+class _Gate:
+    """A counting semaphore with optional start-rate pacing; records how long callers queued."""
+
+    def __init__(self, cap: int, *, rate_per_min: float = 0.0) -> None:
+        self._sem = threading.BoundedSemaphore(max(1, int(cap)))
+        self._interval = 60.0 / rate_per_min if rate_per_min > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+        self.stats = _WaitStats()
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        t0 = time.monotonic()
+        self._sem.acquire()
+        try:
+            if self._interval > 0:
+                with self._lock:
+                    now = time.monotonic()
+                    start = max(now, self._next_start)
+                    self._next_start = start + self._interval
+                if start > now:
+                    time.sleep(start - now)
+            self.stats.add(time.monotonic() - t0)
+            yield
+        finally:
+            self._sem.release()
+
+
+class _GatedMind:
+    """MindProvider proxy: every `call` runs under the shared Mind gate."""
+
+    def __init__(self, inner: MindProvider, gate: _Gate) -> None:
+        self._inner = inner
+        self._gate = gate
+
+    def call(self, *, schema_filename: str, prompt: str, tag: str) -> MindProviderResult:
+        with self._gate.hold():
+            return self._inner.call(schema_filename=schema_filename, prompt=prompt, tag=tag)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._inner, name)
+
+
+def _gated_hands(
+    hands_exec: HandsExecFn,
+    hands_resume: HandsResumeFn | None,
+    gate: _Gate,
+) -> tuple[HandsExecFn, HandsResumeFn | None]:
+    def _exec(**kwargs: Any) -> Any:
+        with gate.hold():
+            return hands_exec(**kwargs)
+
+    if hands_resume is None:
+        return _exec, None
+
+    def _resume(**kwargs: Any) -> Any:
+        with gate.hold():
+            return hands_resume(**kwargs)
+
+    return _exec, _resume
+
+
+def _no_user_answer(question: str) -> str:
+    # Unattended: an empty answer takes the same path as a user who declines/does not answer.
+    return ""
+
+
+def run_many(
+    *,
+    entries: list[RunManyEntry],
+    home_dir: Path,
+    limits: RunManyLimits,
+    make_hands: Callable[[], tuple[HandsExecFn, HandsResumeFn | None]],
+    make_llm: Callable[[Path], MindProvider],
+    hands_provider: str = "",
+    continue_hands: bool = False,
+    on_run_done: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Run `entries` concurrently and return a report (per-run results + aggregate throughput).
+
+    Runs are non-interactive (`ask_user` gets an empty answer) and quiet; per-phase perf spans are
+    off because the span recorder is process-global. A failing run is reported, not raised.
+    """
+
+    home = Path(home_dir).expanduser().resolve()
+    mem_service = MemoryService(home, backend=SqliteFtsBackend(home, shared_connection=True))
+    global_view_cache: dict[str, Any] = {}
+    hands_gate = _Gate(limits.hands_cap)
+    mind_gate = _Gate(limits.mind_cap, rate_per_min=limits.mind_rate_per_min)
+    run_wait = _WaitStats()
+
+    def _group_key(idx: int, entry: RunManyEntry) -> str:
+        try:
+            return ProjectPaths(home_dir=home, project_root=Path(entry.project_root)).project_id
+        except Exception:
+            # Reported by `_run_one`; never merged with another entry.
+            return f"entry:{idx}"
+
+    def _run_one(idx: int, entry: RunManyEntry, submitted: float) -> dict[str, Any]:
+        out: dict[str, Any] = {
+            "index": idx,
+            "project_root": entry.project_root,
+            "task": entry.task,
+            "max_batches": entry.max_batches,
+            "status": "error",
+            "batches": 0,
+            "project_id": "",
+            "evidence_log": "",
+            "wall_s": 0.0,
+            "queue_wait_s": 0.0,
+            "error": "",
+        }
+        try:
+            project_root = Path(entry.project_root)
+            pp = ProjectPaths(home_dir=home, project_root=project_root)
+            out["project_id"] = pp.project_id
+            t_start = time.monotonic()
+            out["queue_wait_s"] = round(t_start - submitted, 3)
+            run_wait.add(t_start - submitted)
+            try:
+                hands_exec, hands_resume = _gated_hands(*make_hands(), hands_gate)
+                llm = _GatedMind(make_llm(project_root), mind_gate)
+                boot = W.bootstrap_autopilot_run(
+                    task=entry.task,
+                    project_root=str(project_root),
+                    home_dir=str(home),
+                    hands_provider=hands_provider,
+                    continue_hands=continue_hands,
+                    reset_hands=False,
+                    llm=llm,
+                    hands_exec=hands_exec,
+                    hands_resume=hands_resume,
+                    hands_resume_default_sentinel=object(),
+                    live=False,
+                    quiet=True,
+                    redact=False,
+                    read_user_answer=_no_user_answer,
+                    mem_service=mem_service,
+                    global_view_cache=global_view_cache,
+                )
+                result = run_autopilot_from_boot(
+                    boot=boot,
+                    task=entry.task,
+                    max_batches=entry.max_batches,
+                    continue_hands=continue_hands,
+                    reset_hands=False,
+                    why_trace_on_run_end=False,
+                    no_mi_prompt=False,
+                    perf_spans=False,
+                )
+                out["status"] = str(result.status or "")
+                out["batches"] = int(result.batches)
+                out["evidence_log"] = str(result.evidence_log_path)
+            finally:
+                out["wall_s"] = round(time.monotonic() - t_start, 3)
+        except Exception as e:
+            out["status"] = "error"
+            out["error"] = f"{type(e).__name__}: {e}"
+        if on_run_done is not None:
+            try:
+                on_run_done(out)
+            except Exception:
+                pass
+        return out
+
+    def _run_group(items: list[tuple[int, RunManyEntry]], submitted: float) -> list[dict[str, Any]]:
+        return [_run_one(i, e, submitted) for i, e in items]
+
+    # Same-project entries form one sequential job, so they never hold parallel slots while waiting.
+    groups: dict[str, list[tuple[int, RunManyEntry]]] = {}
+    for i, e in enumerate(entries):
+        groups.setdefault(_group_key(i, e), []).append((i, e))
+
+    started_ts = now_rfc3339()
+    t0 = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, int(limits.max_parallel)), thread_name_prefix="mi-run-many") as pool:
+        futures = [pool.submit(_run_group, items, time.monotonic()) for items in groups.values()]
+        runs = sorted((r for f in futures for r in f.result()), key=lambda r: int(r["index"]))
+    wall_s = time.monotonic() - t0
+
+    total_batches = sum(int(r.get("batches") or 0) for r in runs)
+    mind = mind_gate.stats.to_dict()
+    minutes = wall_s / 60.0 if wall_s > 0 else 0.0
+    return {
+        "started_ts": started_ts,
+        "wall_s": round(wall_s, 3),
+        "limits": {
+            "max_parallel": limits.max_parallel,
+            "hands_cap": limits.hands_cap,
+            "mind_cap": limits.mind_cap,
+            "mind_rate_per_min": limits.mind_rate_per_min,
+        },
+        "runs": runs,
+        "totals": {
+            "runs": len(runs),
+            "done": sum(1 for r in runs if r.get("status") == "done"),
+            "errors": sum(1 for r in runs if r.get("status") == "error"),
+            "batches": total_batches,
+            "mind_calls": int(mind["count"]),
+            "batches_per_min": round(total_batches / minutes, 3) if minutes else 0.0,
+            "mind_calls_per_min": round(int(mind["count"]) / minutes, 3) if minutes else 0.0,
+        },
+        "queue_wait": {
+            "run": run_wait.to_dict(),
+            "hands": hands_gate.stats.to_dict(),
+            "mind": mind,
+        },
+    }
@@ -7,6 +7,7 @@ centralizing bootstrap/config parsing code in testable modules.
 from .bootstrap import BootstrappedAutopilotRun, bootstrap_autopilot_run
 from .auto_answer import (
     AutoAnswerQueryWiringDeps,
+    build_auto_answer_prompt_wired,
     query_auto_answer_to_hands_wired,
 )
 from .ask_user import (
@@ -17,8 +18,9 @@ from .ask_user import (
     ask_user_redecide_with_input_wired,
     handle_decide_next_ask_user_wired,
 )
-from .check_plan import CheckPlanWiringDeps, plan_checks_and_record_wired
+from .check_plan import CheckPlanWiringDeps, build_plan_min_checks_prompt_wired, plan_checks_and_record_wired
 from .checkpoints import CheckpointWiringDeps, run_checkpoint_pipeline_wired
+from .decide_context import SpeculativeDecideContext
 from .decide_next import (
     DecideNextQueryWiringDeps,
     DecideRecordEffectsWiringDeps,
@@ -63,11 +65,13 @@ from .risk_predecide import (
     RiskEventRecordWiringDeps,
     RiskJudgeWiringDeps,
     append_risk_event_wired,
+    build_risk_judge_prompt_wired,
     query_risk_judge_wired,
 )
 from .workflow_progress import (
     WorkflowProgressWiringDeps,
     apply_workflow_progress_wired,
+    build_workflow_progress_prompt_wired,
 )
 from .predecide_user import (
     PredecideUserWiringDeps,
@@ -89,6 +93,7 @@ __all__ = [
     "bootstrap_autopilot_run",
     "AutoAnswerQueryWiringDeps",
     "query_auto_answer_to_hands_wired",
+    "build_auto_answer_prompt_wired",
     "AskUserAutoAnswerAttemptWiringDeps",
     "ask_user_auto_answer_attempt_wired",
     "AskUserRedecideWithInputWiringDeps",
@@ -97,8 +102,10 @@ __all__ = [
     "handle_decide_next_ask_user_wired",
     "CheckPlanWiringDeps",
     "plan_checks_and_record_wired",
+    "build_plan_min_checks_prompt_wired",
     "CheckpointWiringDeps",
     "run_checkpoint_pipeline_wired",
+    "SpeculativeDecideContext",
     "DecideNextQueryWiringDeps",
     "query_decide_next_wired",
     "DecideRecordEffectsWiringDeps",
@@ -142,8 +149,10 @@ __all__ = [
     "StateWarningsFlusher",
     "RiskJudgeWiringDeps",
     "query_risk_judge_wired",
+    "build_risk_judge_prompt_wired",
     "RiskEventRecordWiringDeps",
     "append_risk_event_wired",
     "WorkflowProgressWiringDeps",
     "apply_workflow_progress_wired",
+    "build_workflow_progress_prompt_wired",
 ]
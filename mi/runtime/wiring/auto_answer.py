@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Callable
 
-from ..autopilot.auto_answer_flow import AutoAnswerQueryDeps, query_auto_answer_to_hands
+from ..autopilot.auto_answer_flow import AutoAnswerQueryDeps, build_auto_answer_prompt, query_auto_answer_to_hands
 
 
 @dataclass(frozen=True)
@@ -21,6 +21,30 @@ class AutoAnswerQueryWiringDeps:
     empty_auto_answer: Callable[[], dict[str, Any]]
 
 
+def build_auto_answer_prompt_wired(
+    *,
+    hands_last: str,
+    repo_obs: dict[str, Any],
+    checks_obj: dict[str, Any],
+    tdb_ctx_batch_obj: dict[str, Any],
+    deps: AutoAnswerQueryWiringDeps,
+) -> str:
+    """Build the auto_answer_to_hands prompt without calling Mind."""
+
+    return build_auto_answer_prompt(
+        task=str(deps.task or ""),
+        hands_provider=str(deps.hands_provider or ""),
+        runtime_cfg=deps.runtime_cfg_getter() if callable(deps.runtime_cfg_getter) else {},
+        project_overlay=deps.project_overlay if isinstance(deps.project_overlay, dict) else {},
+        thought_db_context=tdb_ctx_batch_obj if isinstance(tdb_ctx_batch_obj, dict) else {},
+        repo_observation=repo_obs if isinstance(repo_obs, dict) else {},
+        check_plan=checks_obj if isinstance(checks_obj, dict) else {},
+        recent_evidence=deps.recent_evidence if isinstance(deps.recent_evidence, list) else [],
+        hands_last_message=str(hands_last or ""),
+        prompt_builder=deps.auto_answer_prompt_builder,
+    )
+
+
 def query_auto_answer_to_hands_wired(
     *,
     batch_idx: int,
@@ -10,6 +10,7 @@ from ...core.redact import redact_text
 from ...core.storage import ensure_dir, now_rfc3339
 from ..evidence import EvidenceWriter, new_run_id
 from ...memory.facade import MemoryFacade
+from ...memory.service import MemoryService
 from ...project.overlay_store import load_project_overlay, write_project_overlay
 from ...providers.codex_runner import run_codex_exec, run_codex_resume
 from ...providers.llm import MiLlm
@@ -73,12 +74,17 @@ def bootstrap_autopilot_run(
     quiet: bool,
     redact: bool,
     read_user_answer: Callable[[str], str],
+    mem_service: MemoryService | None = None,
+    global_view_cache: dict[str, Any] | None = None,
 ) -> BootstrappedAutopilotRun:
     """Bootstrap MI runtime state + durable stores for `mi run` (behavior-preserving).
 
     Note: overlay/hands_state/workflow_run dict identities are preserved across refreshes.
     Callers may hold references to these dicts and see in-place updates after
     `refresh_overlay_refs()` is invoked by flows.
+
+    `mem_service` / `global_view_cache` let several runs in one process (`mi run-many`) share the
+    memory index connection and the global Thought DB view; per-project state stays per run.
     """
 
     project_path = Path(project_root).resolve()
@@ -135,9 +141,15 @@ def bootstrap_autopilot_run(
     wf_store = WorkflowStore(project_paths)
     wf_global_store = GlobalWorkflowStore(GlobalPaths(home_dir=home))
     wf_registry = WorkflowRegistry(project_store=wf_store, global_store=wf_global_store)
-    mem = MemoryFacade(home_dir=home, project_paths=project_paths, runtime_cfg=runtime_cfg)
+    mem = MemoryFacade(home_dir=home, project_paths=project_paths, runtime_cfg=runtime_cfg, service=mem_service)
     mem.ensure_structured_ingested()
-    tdb = ThoughtDbStore(home_dir=home, project_paths=project_paths)
+    tdb_cfg = runtime_cfg.get("thought_db") if isinstance(runtime_cfg.get("thought_db"), dict) else {}
+    tdb = ThoughtDbStore(
+        home_dir=home,
+        project_paths=project_paths,
+        global_view_cache=global_view_cache,
+        shared_global_view=bool(tdb_cfg.get("shared_global_view", False)),
+    )
     tdb_app = ThoughtDbApplicationService(tdb=tdb, project_paths=project_paths, mem=mem.service)
     evw = EvidenceWriter(path=project_paths.evidence_log_path, run_id=new_run_id("run"))
 
@@ -57,8 +57,16 @@ def build_checkpoint_mining_wiring_bundle(
     evidence_append: Callable[[dict[str, Any]], Any],
     handle_learn_suggested: Callable[..., list[str]],
     new_segment_state: Callable[..., dict[str, Any]],
+    mining_mind_call: Callable[..., Any] | None = None,
+    submit_mining: Callable[[Callable[[], None]], None] | None = None,
 ) -> CheckpointMiningWiringBundle:
-    """Build checkpoint + mining wiring and expose a checkpoint runner closure."""
+    """Build checkpoint + mining wiring and expose a checkpoint runner closure.
+
+    Async checkpoint mode passes `submit_mining` (queue) and `mining_mind_call` (the worker's
+    own Mind caller); `checkpoint_decide` itself always runs inline via `mind_call`.
+    """
+
+    miner_mind_call = mining_mind_call if callable(mining_mind_call) else mind_call
 
     def _enabled_effective_workflows() -> list[dict[str, Any]]:
         workflows = wf_registry.enabled_workflows_effective(overlay=overlay) or []
@@ -86,7 +94,7 @@ def build_checkpoint_mining_wiring_bundle(
         wf_sigs_counted_in_run=wf_sigs_counted_in_run,
         build_decide_context=build_decide_context,
         suggest_workflow_prompt_builder=P.suggest_workflow_prompt,
-        mind_call=mind_call,
+        mind_call=miner_mind_call,
         evidence_append=evidence_append,
         load_workflow_candidates=lambda: load_workflow_candidates(project_paths, warnings=state_warnings),
         write_workflow_candidates=lambda obj: write_workflow_candidates(project_paths, obj),
@@ -113,12 +121,12 @@ def build_checkpoint_mining_wiring_bundle(
         pref_sigs_counted_in_run=pref_sigs_counted_in_run,
         build_decide_context=build_decide_context,
         mine_preferences_prompt_builder=P.mine_preferences_prompt,
-        mind_call=mind_call,
+        mind_call=miner_mind_call,
         evidence_append=evidence_append,
         load_preference_candidates=lambda: load_preference_candidates(project_paths, warnings=state_warnings),
         write_preference_candidates=lambda obj: write_preference_candidates(project_paths, obj),
         flush_state_warnings=flush_state_warnings,
-        existing_signature_map=lambda scope: tdb.existing_signature_map(scope=scope),
+        existing_signature_map=lambda scope: tdb.signature_index(scope=scope),
         claim_signature_fn=claim_signature,
         preference_signature_fn=preference_signature,
         handle_learn_suggested=handle_learn_suggested,
@@ -140,7 +148,7 @@ def build_checkpoint_mining_wiring_bundle(
         segment_id_getter=segment_id_getter,
         build_decide_context=build_decide_context,
         mine_claims_prompt_builder=P.mine_claims_prompt,
-        mind_call=mind_call,
+        mind_call=miner_mind_call,
         apply_mined_output=tdb.apply_mined_output,
         evidence_append=evidence_append,
         now_ts=now_ts,
@@ -227,6 +235,7 @@ def build_checkpoint_mining_wiring_bundle(
         new_segment_state=new_segment_state,
         now_ts=now_ts,
         truncate=truncate,
+        submit_mining=submit_mining,
     )
 
     def run_checkpoint_pipeline(**kwargs: Any) -> Any:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
 from typing import Any, Callable
 
@@ -16,6 +17,7 @@ class PredecideWiringBundle:
     apply_workflow_progress: Callable[..., None]
     plan_checks: Callable[..., dict[str, Any]]
     maybe_auto_answer: Callable[..., dict[str, Any]]
+    mind_phase_specs: Callable[..., list[AP.MindPhaseSpec]]
 
 
 def build_predecide_wiring_bundle(
@@ -39,6 +41,9 @@ def build_predecide_wiring_bundle(
     set_last_evidence_rec: Callable[[dict[str, Any] | None], None],
     plan_checks_and_record: Callable[..., tuple[dict[str, Any], str, str]],
     append_auto_answer_record: Callable[..., dict[str, Any]],
+    check_plan_wiring: W.CheckPlanWiringDeps | None = None,
+    repo_probe_getter: Callable[[], dict[str, Any]] | None = None,
+    release_mind_phase: Callable[[str, dict[str, Any] | None], None] | None = None,
 ) -> PredecideWiringBundle:
     """Build extract/workflow/check/auto-answer wiring used by run_batch_predecide."""
 
@@ -50,6 +55,7 @@ def build_predecide_wiring_bundle(
         persist_segment_state=persist_segment_state,
         now_ts=now_ts,
         thread_id_getter=thread_id_getter,
+        repo_probe_getter=repo_probe_getter,
     )
     extract_evidence_wiring = W.ExtractEvidenceContextWiringDeps(
         task=task,
@@ -155,10 +161,14 @@ def build_predecide_wiring_bundle(
             notes_on_skipped="skipped: mind_circuit_open (plan_min_checks)",
             notes_on_error="mind_error: plan_min_checks failed; see EvidenceLog kind=mind_error",
         )
-        if isinstance(checks_obj, dict):
+        if not isinstance(checks_obj, dict):
+            checks_obj = AP._empty_check_plan()
+        else:
             emit_prefixed("[mi]", AP.compose_check_plan_log(checks_obj))
-            return checks_obj
-        return AP._empty_check_plan()
+        if release_mind_phase is not None:
+            # The check_plan record is in evidence_window now: dependent prefetches may build.
+            release_mind_phase("plan_min_checks", checks_obj)
+        return checks_obj
 
     auto_answer_query_wiring = W.AutoAnswerQueryWiringDeps(
         task=task,
@@ -208,9 +218,97 @@ def build_predecide_wiring_bundle(
         )
         return auto_answer_obj if isinstance(auto_answer_obj, dict) else AP._empty_auto_answer()
 
+    def mind_phase_specs(
+        *,
+        batch_idx: int,
+        batch_id: str,
+        ctx: AP.BatchExecutionContext,
+        summary: dict[str, Any],
+        evidence_obj: dict[str, Any],
+        repo_obs: dict[str, Any],
+        hands_last: str,
+        tdb_ctx_batch_obj: dict[str, Any],
+    ) -> list[AP.MindPhaseSpec]:
+        """Declare workflow_progress / plan_min_checks / auto_answer for concurrent prefetch.
+
+        workflow_progress and plan_min_checks depend only on extract_evidence output;
+        auto_answer depends on the recorded check plan (planned or skipped), so it is built only
+        once `plan_checks` released it.
+        """
+
+        # Dependent prompts are built later (after their dependencies were consumed): snapshot the
+        # inputs so pipeline mutations in between cannot leak into them.
+        summary = copy.deepcopy(summary) if isinstance(summary, dict) else {}
+        evidence_obj = copy.deepcopy(evidence_obj) if isinstance(evidence_obj, dict) else {}
+        repo_obs = copy.deepcopy(repo_obs) if isinstance(repo_obs, dict) else {}
+        tdb_ctx = copy.deepcopy(tdb_ctx_batch_obj) if isinstance(tdb_ctx_batch_obj, dict) else {}
+        specs = [
+            AP.MindPhaseSpec(
+                name="workflow_progress",
+                schema_filename="workflow_progress.json",
+                tag=f"wf_progress_b{batch_idx}",
+                build_prompt=lambda _deps: W.build_workflow_progress_prompt_wired(
+                    batch_id=batch_id,
+                    summary=summary,
+                    evidence_obj=evidence_obj,
+                    repo_obs=repo_obs,
+                    hands_last=hands_last,
+                    tdb_ctx_batch_obj=tdb_ctx,
+                    last_batch_input=str(ctx.batch_input or ""),
+                    deps=workflow_progress_wiring,
+                ),
+            )
+        ]
+
+        should_plan = AP._should_plan_checks(
+            summary=summary,
+            evidence_obj=evidence_obj,
+            hands_last_message=hands_last,
+            repo_observation=repo_obs,
+        )
+        if should_plan and check_plan_wiring is not None:
+            specs.append(
+                AP.MindPhaseSpec(
+                    name="plan_min_checks",
+                    schema_filename="plan_min_checks.json",
+                    tag=f"checks_b{batch_idx}",
+                    build_prompt=lambda _deps: W.build_plan_min_checks_prompt_wired(
+                        thought_db_context=tdb_ctx,
+                        repo_observation=repo_obs,
+                        deps=check_plan_wiring,
+                    ),
+                )
+            )
+
+        if AP._looks_like_user_question(hands_last):
+
+            def _aa_prompt(deps_out: dict[str, dict[str, Any] | None]) -> str | None:
+                checks_obj = deps_out.get("plan_min_checks")
+                if not isinstance(checks_obj, dict):
+                    return None
+                return W.build_auto_answer_prompt_wired(
+                    hands_last=hands_last,
+                    repo_obs=repo_obs,
+                    checks_obj=checks_obj,
+                    tdb_ctx_batch_obj=tdb_ctx,
+                    deps=auto_answer_query_wiring,
+                )
+
+            specs.append(
+                AP.MindPhaseSpec(
+                    name="auto_answer_to_hands",
+                    schema_filename="auto_answer_to_hands.json",
+                    tag=f"autoanswer_b{batch_idx}",
+                    build_prompt=_aa_prompt,
+                    after=("plan_min_checks",),
+                )
+            )
+        return specs
+
     return PredecideWiringBundle(
         extract_evidence_and_context=extract_evidence_and_context,
         apply_workflow_progress=apply_workflow_progress,
         plan_checks=plan_checks,
         maybe_auto_answer=maybe_auto_answer,
+        mind_phase_specs=mind_phase_specs,
     )
@@ -7,6 +7,7 @@ from mi.runtime import autopilot as AP
 from mi.runtime import prompts as P
 import mi.runtime.wiring as W
 from mi.runtime.autopilot import risk_predecide as RP
+from mi.runtime.risk import risk_engine_from_config
 
 
 @dataclass(frozen=True)
@@ -15,6 +16,7 @@ class RiskPredecideWiringBundle:
 
     detect_risk_signals: Callable[..., list[str]]
     judge_and_handle_risk: Callable[..., bool | None]
+    mind_phase_specs: Callable[..., list[AP.MindPhaseSpec]]
 
 
 def build_risk_predecide_wiring_bundle(
@@ -39,12 +41,14 @@ def build_risk_predecide_wiring_bundle(
 ) -> RiskPredecideWiringBundle:
     """Build risk predecide wiring closures used in the predecide phase."""
 
+    risk_engine = risk_engine_from_config(runtime_cfg)
+
     def detect_risk_signals(*, result: Any, ctx: AP.BatchExecutionContext) -> list[str]:
         """Detect risk signals from structured events, then transcript fallback when needed."""
 
-        risk_signals = AP._detect_risk_signals(result)
+        risk_signals = AP._detect_risk_signals(result, engine=risk_engine)
         if not risk_signals and not (isinstance(getattr(result, "events", None), list) and result.events):
-            risk_signals = AP._detect_risk_signals_from_transcript(ctx.hands_transcript)
+            risk_signals = AP._detect_risk_signals_from_transcript(ctx.hands_transcript, engine=risk_engine)
         return [str(x) for x in risk_signals if str(x).strip()]
 
     risk_judge_wiring = W.RiskJudgeWiringDeps(
@@ -161,7 +165,35 @@ def build_risk_predecide_wiring_bundle(
             ),
         )
 
+    def mind_phase_specs(
+        *,
+        batch_idx: int,
+        result: Any,
+        ctx: AP.BatchExecutionContext,
+        hands_last: str,
+        tdb_ctx_batch_obj: dict[str, Any],
+    ) -> list[AP.MindPhaseSpec]:
+        """Declare risk_judge for concurrent prefetch (only when risk signals are present)."""
+
+        risk_signals = detect_risk_signals(result=result, ctx=ctx)
+        if not risk_signals:
+            return []
+        return [
+            AP.MindPhaseSpec(
+                name="risk_judge",
+                schema_filename="risk_judge.json",
+                tag=f"risk_b{batch_idx}",
+                build_prompt=lambda _deps: W.build_risk_judge_prompt_wired(
+                    risk_signals=risk_signals,
+                    hands_last=hands_last,
+                    tdb_ctx_batch_obj=tdb_ctx_batch_obj if isinstance(tdb_ctx_batch_obj, dict) else {},
+                    deps=risk_judge_wiring,
+                ),
+            )
+        ]
+
     return RiskPredecideWiringBundle(
         detect_risk_signals=detect_risk_signals,
         judge_and_handle_risk=judge_and_handle_risk,
+        mind_phase_specs=mind_phase_specs,
     )
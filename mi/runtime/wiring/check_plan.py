@@ -3,7 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Callable
 
-from ..autopilot.check_plan_flow import CheckPlanFlowDeps, plan_checks_and_record
+from ..autopilot.check_plan_flow import CheckPlanFlowDeps, build_plan_min_checks_prompt, plan_checks_and_record
 
 
 @dataclass(frozen=True)
@@ -67,3 +67,23 @@ def plan_checks_and_record_wired(
             mind_call=deps.mind_call,
         ),
     )
+
+
+def build_plan_min_checks_prompt_wired(
+    *,
+    thought_db_context: dict[str, Any] | None,
+    repo_observation: dict[str, Any] | None,
+    deps: CheckPlanWiringDeps,
+) -> str:
+    """Build the plan_min_checks prompt without calling Mind or recording."""
+
+    return build_plan_min_checks_prompt(
+        task=str(deps.task or ""),
+        hands_provider=str(deps.hands_provider or ""),
+        runtime_cfg=deps.runtime_cfg_getter() if callable(deps.runtime_cfg_getter) else {},
+        project_overlay=deps.project_overlay if isinstance(deps.project_overlay, dict) else {},
+        thought_db_context=thought_db_context if isinstance(thought_db_context, dict) else {},
+        recent_evidence=deps.evidence_window if isinstance(deps.evidence_window, list) else [],
+        repo_observation=repo_observation if isinstance(repo_observation, dict) else {},
+        prompt_builder=deps.plan_min_checks_prompt_builder,
+    )
@@ -29,6 +29,7 @@ class CheckpointWiringDeps:
     new_segment_state: Callable[..., dict[str, Any]]
     now_ts: Callable[[], str]
     truncate: Callable[[str, int], str]
+    submit_mining: Callable[[Callable[[], None]], None] | None = None
 
 
 def run_checkpoint_pipeline_wired(
@@ -72,6 +73,7 @@ def run_checkpoint_pipeline_wired(
             new_segment_state=deps.new_segment_state,
             now_ts=deps.now_ts,
             truncate=deps.truncate,
+            submit_mining=deps.submit_mining,
         ),
     )
 
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager
+
+
+class SpeculativeDecideContext:
+    """Thought DB decide-context builder with speculative precomputation (wiring-only).
+
+    `wrap_hands(run_hands)` builds the query-independent context base on a helper thread while
+    Hands runs, and waits for it when Hands returns (so the helper never overlaps with run-loop
+    writes). `build(...)` (same signature as the runner's `_build_decide_context`) reuses that
+    base when it is still fresh (views unchanged, no validity boundary crossed) and only runs
+    the query-dependent part; otherwise it rebuilds synchronously. The result is identical to
+    a non-speculative build.
+
+    The first build after each speculation records `kind="tdb_context_speculation"` with timings.
+    """
+
+    def __init__(
+        self,
+        *,
+        tdb_app: Any,
+        task: str,
+        now_ts: Callable[[], str],
+        evidence_append: Callable[[dict[str, Any]], Any],
+        thread_id_getter: Callable[[], str],
+        guard: Callable[[], ContextManager[Any]] | None = None,
+        wait: Callable[[Callable[[], Any]], Any] | None = None,
+    ) -> None:
+        self._tdb_app = tdb_app
+        self._task = str(task or "")
+        self._now_ts = now_ts
+        self._evidence_append = evidence_append
+        self._thread_id_getter = thread_id_getter
+        # guard: held by the helper thread while it reads stores (async checkpoint run lock).
+        # wait: runs the blocking wait (e.g., without the run lock) on the caller thread.
+        self._guard = guard
+        self._wait = wait
+        self._pool: ThreadPoolExecutor | None = None
+        self._pending: Future[tuple[Any, float]] | None = None
+        self._pending_batch_id = ""
+        self._base: Any = None
+        self._settled: dict[str, Any] | None = None
+        self.stats = {"speculated": 0, "hits": 0, "misses": 0, "saved_ms": 0.0}
+
+    def _build_base(self) -> tuple[Any, float]:
+        t0 = time.perf_counter()
+        with self._guard() if callable(self._guard) else nullcontext():
+            base = self._tdb_app.build_decide_context_base(as_of_ts=self._now_ts())
+        return base, (time.perf_counter() - t0) * 1000.0
+
+    def start(self, *, batch_id: str) -> None:
+        """Kick off a speculative base build (replaces any unconsumed one)."""
+
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mi-tdb-ctx")
+        self._pending = self._pool.submit(self._build_base)
+        self._pending_batch_id = str(batch_id or "")
+        self._settled = None
+        self.stats["speculated"] += 1
+
+    def settle(self) -> None:
+        """Wait for the pending speculative build (keeps its result for the next `build`)."""
+
+        fut = self._pending
+        if fut is None:
+            return
+        self._pending = None
+        t0 = time.perf_counter()
+        try:
+            base, base_ms = self._wait(fut.result) if callable(self._wait) else fut.result()
+            err = ""
+        except Exception as e:
+            base, base_ms, err = None, 0.0, str(e) or type(e).__name__
+        self._base = base
+        self._settled = {"base_ms": base_ms, "wait_ms": (time.perf_counter() - t0) * 1000.0, "error": err}
+
+    def wrap_hands(self, run_hands: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap `run_hands(ctx=...)` so the base is precomputed while Hands runs."""
+
+        def _run(*, ctx: Any) -> Any:
+            self.start(batch_id=str(getattr(ctx, "batch_id", "") or ""))
+            try:
+                return run_hands(ctx=ctx)
+            finally:
+                self.settle()
+
+        return _run
+
+    def build(self, *, hands_last_message: str, recent_evidence: list[dict[str, Any]]) -> Any:
+        self.settle()
+        settled = self._settled
+        self._settled = None
+
+        as_of_ts = self._now_ts()
+        t0 = time.perf_counter()
+        base = self._base
+        hit = base is not None and bool(self._tdb_app.decide_context_base_is_fresh(base, as_of_ts=as_of_ts))
+        if not hit:
+            base = self._tdb_app.build_decide_context_base(as_of_ts=as_of_ts)
+            self._base = base
+        ctx = self._tdb_app.finish_decide_context(
+            base=base,
+            as_of_ts=as_of_ts,
+            task=self._task,
+            hands_last_message=str(hands_last_message or ""),
+            recent_evidence=recent_evidence if isinstance(recent_evidence, list) else [],
+        )
+        build_ms = (time.perf_counter() - t0) * 1000.0
+
+        if settled is not None:
+            base_ms = float(settled.get("base_ms") or 0.0)
+            wait_ms = float(settled.get("wait_ms") or 0.0)
+            saved_ms = max(0.0, base_ms - wait_ms) if hit else 0.0
+            self.stats["hits" if hit else "misses"] += 1
+            self.stats["saved_ms"] = round(float(self.stats["saved_ms"]) + saved_ms, 3)
+            self._evidence_append(
+                {
+                    "kind": "tdb_context_speculation",
+                    "batch_id": self._pending_batch_id,
+                    "ts": as_of_ts,
+                    "thread_id": str(self._thread_id_getter() or ""),
+                    "hit": bool(hit),
+                    "reason": "fresh" if hit else ("error" if settled.get("error") else "stale"),
+                    "base_ms": round(base_ms, 3),
+                    "wait_ms": round(wait_ms, 3),
+                    "build_ms": round(build_ms, 3),
+                    "saved_ms": round(saved_ms, 3),
+                }
+            )
+        return ctx
+
+    def close(self) -> None:
+        self._pending = None
+        self._settled = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
@@ -17,6 +17,8 @@ class EvidenceRecordWiringDeps:
     persist_segment_state: Callable[[], None]
     now_ts: Callable[[], str]
     thread_id_getter: Callable[[], str | None]
+    # Optional: timing of the latest repo observation (EvidenceLog only; see RepoObservationCache).
+    repo_probe_getter: Callable[[], dict[str, Any]] | None = None
 
 
 def append_evidence_with_tracking_wired(
@@ -42,6 +44,7 @@ def append_evidence_with_tracking_wired(
         repo_observation=repo_observation if isinstance(repo_observation, dict) else {},
         evidence_obj=evidence_obj if isinstance(evidence_obj, dict) else {},
         evidence_window=deps.evidence_window if isinstance(deps.evidence_window, list) else [],
+        repo_probe=deps.repo_probe_getter() if callable(deps.repo_probe_getter) else None,
         deps=EvidenceAppendDeps(
             evidence_append=deps.evidence_append,
             append_window=deps.append_window,
@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Callable
 
+from ...core.perf import span
 from ..autopilot.mind_call_flow import MindCallDeps, MindCallState, run_mind_call
 from ...providers.types import MindCallFn
 
@@ -37,26 +38,28 @@ class MindCaller:
     ) -> tuple[dict[str, Any] | None, str, str]:
         """Call Mind (best-effort) and return (obj, mind_transcript_ref, state)."""
 
-        res = run_mind_call(
-            state=MindCallState(
-                failures_total=int(self.failures_total),
-                failures_consecutive=int(self.failures_consecutive),
-                circuit_open=bool(self.circuit_open),
-            ),
-            thread_id=str(self.thread_id_getter() or ""),
-            batch_id=str(batch_id or ""),
-            schema_filename=str(schema_filename or ""),
-            prompt=str(prompt or ""),
-            tag=str(tag or ""),
-            threshold=int(self.threshold),
-            evidence_window=self.evidence_window,
-            deps=MindCallDeps(
-                llm_call=self.llm_call,
-                evidence_append=self.evidence_append,
-                now_ts=self.now_ts,
-                truncate=self.truncate,
-            ),
-        )
+        with span("mind." + str(schema_filename or "").removesuffix(".json")):
+            res = run_mind_call(
+                state=MindCallState(
+                    failures_total=int(self.failures_total),
+                    failures_consecutive=int(self.failures_consecutive),
+                    circuit_open=bool(self.circuit_open),
+                ),
+                thread_id=str(self.thread_id_getter() or ""),
+                batch_id=str(batch_id or ""),
+                schema_filename=str(schema_filename or ""),
+                # Keep str subclasses (e.g., SplitPrompt) intact so providers can see the static prefix.
+                prompt=(prompt if isinstance(prompt, str) else str(prompt or "")),
+                tag=str(tag or ""),
+                threshold=int(self.threshold),
+                evidence_window=self.evidence_window,
+                deps=MindCallDeps(
+                    llm_call=self.llm_call,
+                    evidence_append=self.evidence_append,
+                    now_ts=self.now_ts,
+                    truncate=self.truncate,
+                ),
+            )
         self.failures_total = int(res.next_state.failures_total)
         self.failures_consecutive = int(res.next_state.failures_consecutive)
         self.circuit_open = bool(res.next_state.circuit_open)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 
 from ..autopilot.checkpoint_mining import (
     PreferenceMiningDeps,
@@ -102,7 +102,7 @@ class PreferenceMiningWiringDeps:
     load_preference_candidates: Callable[[], dict[str, Any]]
     write_preference_candidates: Callable[[dict[str, Any]], None]
     flush_state_warnings: Callable[[], None]
-    existing_signature_map: Callable[[str], dict[str, str]]
+    existing_signature_map: Callable[[str], Mapping[str, str]]
     claim_signature_fn: Callable[..., str]
     preference_signature_fn: Callable[..., str]
     handle_learn_suggested: Callable[..., list[str]]
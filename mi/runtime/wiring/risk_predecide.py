@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Callable
 
 from ..autopilot.risk_event_flow import RiskEventAppendDeps, append_risk_event_with_tracking
+from ..autopilot.risk_predecide import build_risk_judge_prompt
 from ..autopilot.risk_predecide import query_risk_judge as run_query_risk_judge
 
 
@@ -49,6 +50,27 @@ def query_risk_judge_wired(
     )
 
 
+def build_risk_judge_prompt_wired(
+    *,
+    risk_signals: list[str],
+    hands_last: str,
+    tdb_ctx_batch_obj: dict[str, Any],
+    deps: RiskJudgeWiringDeps,
+) -> str:
+    """Build the risk_judge prompt without recall or a Mind call."""
+
+    return build_risk_judge_prompt(
+        risk_signals=[str(x) for x in (risk_signals if isinstance(risk_signals, list) else [])],
+        hands_last=str(hands_last or ""),
+        tdb_ctx_batch_obj=tdb_ctx_batch_obj if isinstance(tdb_ctx_batch_obj, dict) else {},
+        task=str(deps.task or ""),
+        hands_provider=str(deps.hands_provider or ""),
+        runtime_cfg=deps.runtime_cfg_getter() if callable(deps.runtime_cfg_getter) else {},
+        project_overlay=deps.project_overlay if isinstance(deps.project_overlay, dict) else {},
+        risk_judge_prompt_builder=deps.risk_judge_prompt_builder,
+    )
+
+
 @dataclass(frozen=True)
 class RiskEventRecordWiringDeps:
     """Wiring bundle for risk_event evidence/segment recording."""
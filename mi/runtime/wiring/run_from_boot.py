@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from typing import Any, Callable
 
 import mi.runtime.wiring as W
@@ -20,6 +21,7 @@ from .bundles import (
 from mi.runtime.runner_helpers import get_check_input
 from mi.runtime.composition import build_run_loop_orchestrator
 from mi.runtime.runner_state import RunnerStateAccess, RunnerWiringState
+from mi.core.perf import PerfRecorder, span, traced
 from mi.core.storage import now_rfc3339
 from mi.thoughtdb.operational_defaults import resolve_operational_defaults
 from mi.project.overlay_store import write_project_overlay
@@ -33,7 +35,7 @@ from .run_from_boot_builders import (
     build_cross_project_recall_writer,
     build_decide_next_logger,
     build_learn_suggested_handler,
-    build_mind_call,
+    build_mind_caller,
     build_run_end_callbacks,
     build_runtime_cfg_for_prompts,
     build_segment_adder,
@@ -50,8 +52,13 @@ def run_autopilot_from_boot(
     reset_hands: bool,
     why_trace_on_run_end: bool,
     no_mi_prompt: bool,
+    perf_spans: bool = True,
 ) -> AP.AutopilotResult:
-    """Run the MI autopilot loop after `bootstrap_autopilot_run` (behavior-preserving)."""
+    """Run the MI autopilot loop after `bootstrap_autopilot_run` (behavior-preserving).
+
+    `perf_spans=False` ignores `runtime.perf.enabled`; the span recorder is process-global, so
+    concurrent runs in one process (`mi run-many`) must not install it.
+    """
 
     _read_user_answer = boot.run_session.read_user_answer
     project_path = boot.project_path
@@ -91,6 +98,8 @@ def run_autopilot_from_boot(
     state_access = RunnerStateAccess(state)
 
     def _build_decide_context(*, hands_last_message: str, recent_evidence: list[dict[str, Any]]) -> Any:
+        if decide_speculator is not None:
+            return decide_speculator.build(hands_last_message=hands_last_message, recent_evidence=recent_evidence)
         return tdb_app.build_decide_context(
             as_of_ts=now_rfc3339(),
             task=task,
@@ -156,12 +165,66 @@ def run_autopilot_from_boot(
 
     learn_suggested_records_this_run: list[dict[str, Any]] = []
 
-    _mind_call = build_mind_call(
+    # Optional: per-phase timing spans (one compact record per batch in the perf sidecar).
+    perf_recorder: PerfRecorder | None = None
+    if bool(feats.perf_enabled) and perf_spans:
+        perf_recorder = PerfRecorder(path=project_paths.perf_log_path, run_id=evw.run_id)
+
+    # Optional: async checkpoint mode (mining jobs overlap with the next Hands batch).
+    checkpoint_worker: AP.CheckpointWorker | None = None
+    if bool(feats.checkpoint_async_enabled) and checkpoint_enabled:
+        checkpoint_worker = AP.CheckpointWorker(
+            reserve_slots=evw.reserve,
+            evidence_append=evw.append,
+            max_pending=int(feats.checkpoint_async_max_pending),
+        )
+    _evidence_append = checkpoint_worker.evidence_append if checkpoint_worker is not None else evw.append
+
+    def _unlocked(fn: Any) -> Any:
+        return checkpoint_worker.unlocked(fn) if checkpoint_worker is not None and callable(fn) else fn
+
+    # Optional: concurrent per-batch Mind phases (prefetch; bookkeeping stays sequential).
+    mind_prefetcher: AP.MindPrefetcher | None = None
+    if bool(feats.mind_concurrency_enabled):
+        mind_prefetcher = AP.MindPrefetcher(
+            llm_call=llm.call,
+            max_workers=int(feats.mind_concurrency_max_workers),
+            enabled_getter=lambda: not bool(mind_caller.circuit_open),
+            # Only the provider wait runs without the run lock; dependent prompts are built with it.
+            unlocked=(checkpoint_worker.unlocked if checkpoint_worker is not None else None),
+        )
+    mind_caller = build_mind_caller(
         llm=llm,
         evidence_append=evw.append,
         evidence_window=evidence_window,
         thread_id_getter=_cur_thread_id,
+        llm_call=(mind_prefetcher if mind_prefetcher is not None else _unlocked(llm.call)),
     )
+    _mind_call = mind_caller.call
+
+    # Mining jobs get their own circuit breaker; their records land in the job's reserved block.
+    _mining_mind_call: Any = None
+    if checkpoint_worker is not None:
+        _mining_mind_call = build_mind_caller(
+            llm=llm,
+            evidence_append=checkpoint_worker.evidence_append,
+            evidence_window=[],
+            thread_id_getter=checkpoint_worker.pin("thread_id", _cur_thread_id),
+            llm_call=_unlocked(llm.call),
+        ).call
+
+    # Optional: precompute the query-independent decide context while Hands runs.
+    decide_speculator: W.SpeculativeDecideContext | None = None
+    if bool(feats.tdb_speculative_context):
+        decide_speculator = W.SpeculativeDecideContext(
+            tdb_app=tdb_app,
+            task=task,
+            now_ts=now_rfc3339,
+            evidence_append=_evidence_append,
+            thread_id_getter=_cur_thread_id,
+            guard=(checkpoint_worker.locked if checkpoint_worker is not None else None),
+            wait=_unlocked(lambda fn: fn()),
+        )
 
     _log_decide_next = build_decide_next_logger(
         evidence_append=evw.append,
@@ -175,7 +238,7 @@ def run_autopilot_from_boot(
         state_access=state_access,
         learn_suggested_records_this_run=learn_suggested_records_this_run,
         tdb=tdb,
-        evidence_append=evw.append,
+        evidence_append=_evidence_append,
         now_ts=now_rfc3339,
     )
 
@@ -259,6 +322,9 @@ def run_autopilot_from_boot(
                 return ""
             return str(state.segment_state.get("segment_id") or "")
 
+        def _pin(name: str, getter: Any) -> Any:
+            return checkpoint_worker.pin(name, getter) if checkpoint_worker is not None else getter
+
         checkpoint_bundle = build_checkpoint_mining_wiring_bundle(
             checkpoint_enabled=bool(checkpoint_enabled),
             wf_auto_mine=bool(wf_auto_mine),
@@ -284,18 +350,24 @@ def run_autopilot_from_boot(
             tdb=tdb,
             now_ts=now_rfc3339,
             truncate=AP._truncate,
-            thread_id_getter=_cur_thread_id,
-            segment_id_getter=_get_segment_id,
-            executed_batches_getter=state_access.get_executed_batches,
-            status_getter=state_access.get_status,
-            notes_getter=state_access.get_notes,
+            thread_id_getter=_pin("thread_id", _cur_thread_id),
+            segment_id_getter=_pin("segment_id", _get_segment_id),
+            executed_batches_getter=_pin("executed_batches", state_access.get_executed_batches),
+            status_getter=_pin("status", state_access.get_status),
+            notes_getter=_pin("notes", state_access.get_notes),
             wf_sigs_counted_in_run=wf_sigs_counted_in_run,
             pref_sigs_counted_in_run=pref_sigs_counted_in_run,
             build_decide_context=_build_decide_context,
             mind_call=_mind_call,
-            evidence_append=evw.append,
+            evidence_append=_evidence_append,
             handle_learn_suggested=_handle_learn_suggested,
             new_segment_state=_new_segment_state,
+            mining_mind_call=_mining_mind_call,
+            submit_mining=(
+                (lambda job: checkpoint_worker.submit(traced("checkpoint.mining", job)))
+                if checkpoint_worker is not None
+                else None
+            ),
         )
 
         checkpoint_callbacks = build_checkpoint_callbacks(
@@ -408,14 +480,16 @@ def run_autopilot_from_boot(
         decide = _build_decide(interaction=interaction, next_input=next_input)
 
         def _build_predecide_stack(*, interaction: Any, preaction: Any) -> AP.BatchPredecideDeps:
+            # Shared by repo observation and the evidence record (probe timings are logged, not prompted).
+            repo_cache = AP.RepoObservationCache()
             hands_runner = build_hands_runner_bundle(
                 project_root=project_path,
                 transcripts_dir=project_paths.transcripts_dir,
                 cur_provider=cur_provider,
                 interrupt_cfg=interrupt_cfg,
                 overlay=phase_dicts.overlay,
-                hands_exec=hands_exec,
-                hands_resume=hands_resume,
+                hands_exec=_unlocked(hands_exec),
+                hands_resume=_unlocked(hands_resume),
                 home_dir=home,
                 now_ts=now_rfc3339,
                 emit_prefixed=_emit_prefixed,
@@ -447,6 +521,9 @@ def run_autopilot_from_boot(
                 set_last_evidence_rec=state_access.set_last_evidence_rec,
                 plan_checks_and_record=_plan_checks_and_record,
                 append_auto_answer_record=interaction.append_auto_answer_record,
+                check_plan_wiring=testless.check_plan_wiring,
+                repo_probe_getter=lambda: repo_cache.last_probe,
+                release_mind_phase=(mind_prefetcher.release if mind_prefetcher is not None else None),
             )
 
             risk = build_risk_predecide_wiring_bundle(
@@ -485,6 +562,59 @@ def run_autopilot_from_boot(
                 thread_id_getter=state_access.get_thread_id_opt,
             )
 
+            def _prefetch_mind_phases(
+                *,
+                stage: str,
+                batch_idx: int,
+                batch_id: str,
+                ctx: AP.BatchExecutionContext,
+                result: Any,
+                summary: dict[str, Any],
+                evidence_obj: dict[str, Any],
+                repo_obs: dict[str, Any],
+                hands_last: str,
+                tdb_ctx_batch_obj: dict[str, Any],
+            ) -> None:
+                if mind_prefetcher is None:
+                    return
+                risk_specs = risk.mind_phase_specs(
+                    batch_idx=batch_idx,
+                    result=result,
+                    ctx=ctx,
+                    hands_last=hands_last,
+                    tdb_ctx_batch_obj=tdb_ctx_batch_obj,
+                )
+                if stage == "post_risk":
+                    # Checks/auto_answer were held back until the risk verdict let the batch continue.
+                    if risk_specs:
+                        specs = predecide.mind_phase_specs(
+                            batch_idx=batch_idx,
+                            batch_id=batch_id,
+                            ctx=ctx,
+                            summary=summary,
+                            evidence_obj=evidence_obj,
+                            repo_obs=repo_obs,
+                            hands_last=hands_last,
+                            tdb_ctx_batch_obj=tdb_ctx_batch_obj,
+                        )
+                        mind_prefetcher.prefetch([s for s in specs if s.name != "workflow_progress"], keep_pending=True)
+                    return
+                specs = predecide.mind_phase_specs(
+                    batch_idx=batch_idx,
+                    batch_id=batch_id,
+                    ctx=ctx,
+                    summary=summary,
+                    evidence_obj=evidence_obj,
+                    repo_obs=repo_obs,
+                    hands_last=hands_last,
+                    tdb_ctx_batch_obj=tdb_ctx_batch_obj,
+                )
+                if risk_specs:
+                    # The risk gate may stop the batch or ask the user: don't pay for checks/auto_answer
+                    # before its verdict (they are declared at stage="post_risk").
+                    specs = [s for s in specs if s.name == "workflow_progress"] + risk_specs
+                mind_prefetcher.prefetch(specs)
+
             return build_batch_predecide_deps(
                 project_path=project_path,
                 batch_ctx=batch_ctx,
@@ -492,6 +622,9 @@ def run_autopilot_from_boot(
                 workflow_risk=workflow_risk,
                 predecide=predecide,
                 preaction=preaction,
+                prefetch_mind_phases=(_prefetch_mind_phases if mind_prefetcher is not None else None),
+                wrap_run_hands=(decide_speculator.wrap_hands if decide_speculator is not None else None),
+                repo_cache=repo_cache,
             )
 
         batch_predecide_deps = _build_predecide_stack(interaction=interaction, preaction=preaction)
@@ -508,22 +641,26 @@ def run_autopilot_from_boot(
     checkpoint_callbacks = assembly.checkpoint_callbacks
 
     def _run_predecide_via_service(req: AP.BatchRunRequest) -> bool | AP.PreactionDecision:
-        out = AP.run_batch_predecide(
-            batch_idx=int(req.batch_idx),
-            deps=batch_predecide_deps,
-        )
+        if perf_recorder is not None:
+            perf_recorder.begin_batch(str(req.batch_id or f"b{int(req.batch_idx)}"))
+        with span("batch.predecide"):
+            out = AP.run_batch_predecide(
+                batch_idx=int(req.batch_idx),
+                deps=batch_predecide_deps,
+            )
         state_access.set_last_batch_id(str(out.batch_id or f"b{int(req.batch_idx)}"))
         return out.out
 
     def _run_decide_via_service(req: AP.BatchRunRequest, preaction: AP.PreactionDecision) -> bool:
-        return decide.run_decide_phase(
-            batch_idx=int(req.batch_idx),
-            batch_id=str(req.batch_id or f"b{int(req.batch_idx)}"),
-            hands_last=str(preaction.hands_last or ""),
-            repo_obs=preaction.repo_obs if isinstance(preaction.repo_obs, dict) else {},
-            checks_obj=preaction.checks_obj if isinstance(preaction.checks_obj, dict) else {},
-            auto_answer_obj=preaction.auto_answer_obj if isinstance(preaction.auto_answer_obj, dict) else AP._empty_auto_answer(),
-        )
+        with span("batch.decide"):
+            return decide.run_decide_phase(
+                batch_idx=int(req.batch_idx),
+                batch_id=str(req.batch_id or f"b{int(req.batch_idx)}"),
+                hands_last=str(preaction.hands_last or ""),
+                repo_obs=preaction.repo_obs if isinstance(preaction.repo_obs, dict) else {},
+                checks_obj=preaction.checks_obj if isinstance(preaction.checks_obj, dict) else {},
+                auto_answer_obj=preaction.auto_answer_obj if isinstance(preaction.auto_answer_obj, dict) else AP._empty_auto_answer(),
+            )
 
     run_end = build_run_end_callbacks(
         enabled_why_trace=bool(auto_why_on_end),
@@ -546,19 +683,40 @@ def run_autopilot_from_boot(
         state=state,
     )
 
+    def _learn_runner() -> None:
+        if perf_recorder is not None:
+            perf_recorder.begin_batch("run_end")
+        # Run-end barrier: queued checkpoint mining must land before the learn update reads it.
+        if checkpoint_worker is not None:
+            with span("checkpoint.drain"):
+                checkpoint_worker.drain()
+        with span("run_end.learn"):
+            run_end.learn_runner()
+
     orchestrator = build_run_loop_orchestrator(
         max_batches=int(max_batches),
         run_predecide_phase=_run_predecide_via_service,
         run_decide_phase=_run_decide_via_service,
         checkpoint_enabled=bool(checkpoint_enabled),
-        checkpoint_runner=checkpoint_callbacks.runner,
-        learn_runner=run_end.learn_runner,
-        why_runner=run_end.why_runner,
+        checkpoint_runner=traced("checkpoint", checkpoint_callbacks.runner),
+        learn_runner=_learn_runner,
+        why_runner=traced("run_end.why", run_end.why_runner),
         snapshot_flusher=tdb.flush_snapshots_best_effort,
         state_warning_flusher=_flush_state_warnings,
         state=state_access,
     )
-    orchestrator.run()
+    if checkpoint_worker is not None:
+        checkpoint_worker.start()
+    with perf_recorder if perf_recorder is not None else nullcontext():
+        try:
+            orchestrator.run()
+        finally:
+            if checkpoint_worker is not None:
+                checkpoint_worker.close()
+            if mind_prefetcher is not None:
+                mind_prefetcher.close()
+            if decide_speculator is not None:
+                decide_speculator.close()
 
     return AP.AutopilotResult(
         status=state_access.get_status(),
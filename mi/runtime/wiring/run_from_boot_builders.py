@@ -5,6 +5,7 @@ import time
 from dataclasses import dataclass
 from typing import Any, Callable
 
+from mi.core.perf import traced
 from mi.core.storage import now_rfc3339, read_json_best_effort, write_json_atomic
 from mi.runtime import autopilot as AP
 from mi.runtime.autopilot import learn_suggested_flow as LS
@@ -56,13 +57,20 @@ def build_batch_predecide_deps(
     workflow_risk: Any,
     predecide: Any,
     preaction: Any,
+    prefetch_mind_phases: Callable[..., None] | None = None,
+    wrap_run_hands: Callable[[Callable[..., Any]], Callable[..., Any]] | None = None,
+    repo_cache: AP.RepoObservationCache | None = None,
 ) -> AP.BatchPredecideDeps:
     """Build AP.BatchPredecideDeps for AP.run_batch_predecide (behavior-preserving)."""
 
+    repo_cache = repo_cache if repo_cache is not None else AP.RepoObservationCache()
+    run_hands = traced("hands", hands_runner.run_hands_batch)
+    if wrap_run_hands is not None:
+        run_hands = wrap_run_hands(run_hands)
     return AP.BatchPredecideDeps(
         build_context=batch_ctx.build_context,
-        run_hands=hands_runner.run_hands_batch,
-        observe_repo=lambda: AP._observe_repo(project_path),
+        run_hands=run_hands,
+        observe_repo=traced("observe_repo", lambda: AP._observe_repo(project_path, cache=repo_cache)),
         dict_or_empty=dict_or_empty,
         extract_deps=AP.ExtractEvidenceDeps(extract_context=predecide.extract_evidence_and_context),
         workflow_risk_deps=workflow_risk.deps,
@@ -74,6 +82,7 @@ def build_batch_predecide_deps(
             apply_preactions=preaction.apply_preactions,
             empty_auto_answer=AP._empty_auto_answer,
         ),
+        prefetch_mind_phases=prefetch_mind_phases,
     )
 
 
@@ -154,21 +163,39 @@ def bootstrap_segment_state_if_enabled(
     flush_state_warnings()
 
 
-def build_mind_call(
+def build_mind_caller(
     *,
     llm: Any,
     evidence_append: Any,
     evidence_window: list[dict[str, Any]],
     thread_id_getter: Any,
-) -> Any:
+    llm_call: Any = None,
+) -> MindCaller:
+    """Build the per-run MindCaller; `llm_call` overrides `llm.call` (e.g., a MindPrefetcher)."""
+
     return MindCaller(
-        llm_call=llm.call,
+        llm_call=llm_call if callable(llm_call) else llm.call,
         evidence_append=evidence_append,
         now_ts=now_rfc3339,
         truncate=AP._truncate,
         thread_id_getter=thread_id_getter,
         evidence_window=evidence_window,
         threshold=2,
+    )
+
+
+def build_mind_call(
+    *,
+    llm: Any,
+    evidence_append: Any,
+    evidence_window: list[dict[str, Any]],
+    thread_id_getter: Any,
+) -> Any:
+    return build_mind_caller(
+        llm=llm,
+        evidence_append=evidence_append,
+        evidence_window=evidence_window,
+        thread_id_getter=thread_id_getter,
     ).call
 
 
@@ -306,7 +333,7 @@ def build_learn_suggested_handler(
             runtime_cfg=runtime_cfg if isinstance(runtime_cfg, dict) else {},
             deps=LS.LearnSuggestedDeps(
                 claim_signature_fn=claim_signature,
-                existing_signature_map=lambda scope: tdb.existing_signature_map(scope=scope),
+                existing_signature_map=lambda scope: tdb.signature_index(scope=scope),
                 append_claim_create=tdb.append_claim_create,
                 evidence_append=evidence_append,
                 now_ts=now_ts,
@@ -381,6 +408,7 @@ __all__ = [
     "build_decide_next_logger",
     "build_learn_suggested_handler",
     "build_mind_call",
+    "build_mind_caller",
     "build_run_end_callbacks",
     "build_runtime_cfg_for_prompts",
     "build_segment_adder",
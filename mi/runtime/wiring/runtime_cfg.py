@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Any
 
 from ...providers.interrupts import InterruptConfig
+from ..risk import risk_engine_from_config
 
 
 @dataclass(frozen=True)
@@ -21,6 +22,12 @@ class ParsedRuntimeFeatures:
     why_write_edges: bool
     checkpoint_enabled: bool
     interrupt_cfg: InterruptConfig | None
+    mind_concurrency_enabled: bool = False
+    mind_concurrency_max_workers: int = 4
+    checkpoint_async_enabled: bool = False
+    checkpoint_async_max_pending: int = 2
+    tdb_speculative_context: bool = False
+    perf_enabled: bool = False
 
 
 def parse_runtime_features(*, runtime_cfg: dict[str, Any], why_trace_on_run_end: bool) -> ParsedRuntimeFeatures:
@@ -45,6 +52,9 @@ def parse_runtime_features(*, runtime_cfg: dict[str, Any], why_trace_on_run_end:
         tdb_min_conf = 0.9
     tdb_min_conf = max(0.0, min(1.0, tdb_min_conf))
 
+    # Optional: speculative decide_next context precompute (opt-in; no extra mind calls).
+    tdb_speculative_context = bool(tdb_cfg.get("speculative_context", False)) and bool(tdb_enabled)
+
     try:
         tdb_max_claims = int(tdb_cfg.get("max_claims_per_checkpoint", 6) or 6)
     except Exception:
@@ -76,11 +86,35 @@ def parse_runtime_features(*, runtime_cfg: dict[str, Any], why_trace_on_run_end:
     intr_signals = intr.get("signal_sequence") or ["SIGINT", "SIGTERM", "SIGKILL"]
     intr_escalation = intr.get("escalation_ms") or [2000, 5000]
     interrupt_cfg = (
-        InterruptConfig(mode=intr_mode, signal_sequence=[str(s) for s in intr_signals], escalation_ms=[int(x) for x in intr_escalation])
+        InterruptConfig(
+            mode=intr_mode,
+            signal_sequence=[str(s) for s in intr_signals],
+            escalation_ms=[int(x) for x in intr_escalation],
+            risk_engine=risk_engine_from_config(runtime_cfg),
+        )
         if intr_mode in ("on_high_risk", "on_any_external")
         else None
     )
 
+    mc_cfg = runtime_cfg.get("mind_concurrency") if isinstance(runtime_cfg.get("mind_concurrency"), dict) else {}
+    mind_concurrency_enabled = bool(mc_cfg.get("enabled", False))
+    try:
+        mind_concurrency_max_workers = int(mc_cfg.get("max_workers", 4) or 4)
+    except Exception:
+        mind_concurrency_max_workers = 4
+    mind_concurrency_max_workers = max(1, min(8, mind_concurrency_max_workers))
+
+    ca_cfg = runtime_cfg.get("checkpoint_async") if isinstance(runtime_cfg.get("checkpoint_async"), dict) else {}
+    checkpoint_async_enabled = bool(ca_cfg.get("enabled", False)) and bool(checkpoint_enabled)
+    try:
+        checkpoint_async_max_pending = int(ca_cfg.get("max_pending", 2) or 2)
+    except Exception:
+        checkpoint_async_max_pending = 2
+    checkpoint_async_max_pending = max(1, min(8, checkpoint_async_max_pending))
+
+    perf_cfg = runtime_cfg.get("perf") if isinstance(runtime_cfg.get("perf"), dict) else {}
+    perf_enabled = bool(perf_cfg.get("enabled", False))
+
     return ParsedRuntimeFeatures(
         wf_auto_mine=bool(wf_auto_mine),
         pref_auto_mine=bool(pref_auto_mine),
@@ -95,5 +129,11 @@ def parse_runtime_features(*, runtime_cfg: dict[str, Any], why_trace_on_run_end:
         why_write_edges=bool(why_write_edges),
         checkpoint_enabled=bool(checkpoint_enabled),
         interrupt_cfg=interrupt_cfg,
+        mind_concurrency_enabled=bool(mind_concurrency_enabled),
+        mind_concurrency_max_workers=int(mind_concurrency_max_workers),
+        checkpoint_async_enabled=bool(checkpoint_async_enabled),
+        checkpoint_async_max_pending=int(checkpoint_async_max_pending),
+        tdb_speculative_context=bool(tdb_speculative_context),
+        perf_enabled=bool(perf_enabled),
     )
 
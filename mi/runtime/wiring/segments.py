@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import secrets
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
-from ..autopilot.segment_state import clear_segment_state, load_segment_state, new_segment_state, persist_segment_state
+from ..autopilot.segment_state import (
+    SegmentJournal,
+    clear_segment_state,
+    load_segment_state,
+    new_segment_state,
+    persist_segment_state,
+)
 
 
 @dataclass(frozen=True)
@@ -15,6 +21,9 @@ class SegmentStateIO:
 
     This is wiring-only: the segment buffer is an internal mechanism for checkpoint-driven
     mining/materialization. It does not impose a step protocol on the Hands agent.
+
+    Persists append added records to `segment_state.journal.jsonl` and only periodically
+    rewrite the snapshot (see `persist_segment_state`).
     """
 
     path: Path
@@ -25,6 +34,7 @@ class SegmentStateIO:
     write_json_atomic: Callable[[Path, Any], None]
     state_warnings: list[dict[str, Any]]
     segment_max_records: int = 40
+    journal: SegmentJournal = field(default_factory=SegmentJournal, compare=False, repr=False)
 
     def new_state(self, *, reason: str, thread_hint: str) -> dict[str, Any]:
         return new_segment_state(
@@ -42,6 +52,8 @@ class SegmentStateIO:
             read_json_best_effort=self.read_json_best_effort,
             state_warnings=self.state_warnings,
             thread_hint=str(thread_hint or "").strip(),
+            journal=self.journal,
+            segment_max_records=int(self.segment_max_records),
         )
 
     def persist(self, *, enabled: bool, segment_state: dict[str, Any]) -> None:
@@ -52,6 +64,7 @@ class SegmentStateIO:
             segment_max_records=int(self.segment_max_records),
             now_ts=self.now_ts,
             write_json_atomic=self.write_json_atomic,
+            journal=self.journal,
         )
 
     def clear(self) -> None:
@@ -8,6 +8,7 @@ from ..autopilot.workflow_progress_flow import (
     apply_workflow_progress_and_persist,
     append_workflow_progress_event,
     build_workflow_progress_latest_evidence,
+    build_workflow_progress_prompt,
     query_workflow_progress,
 )
 
@@ -110,3 +111,41 @@ def apply_workflow_progress_wired(
         now_ts=deps.now_ts,
     )
 
+
+def build_workflow_progress_prompt_wired(
+    *,
+    batch_id: str,
+    summary: dict[str, Any],
+    evidence_obj: dict[str, Any],
+    repo_obs: dict[str, Any],
+    hands_last: str,
+    tdb_ctx_batch_obj: dict[str, Any],
+    last_batch_input: str,
+    deps: WorkflowProgressWiringDeps,
+) -> str | None:
+    """Build the workflow_progress prompt without calling Mind (None when no workflow is active)."""
+
+    active_wf = deps.load_active_workflow(
+        workflow_run=deps.workflow_run if isinstance(deps.workflow_run, dict) else {},
+        load_effective=deps.workflow_load_effective,
+    )
+    if not (isinstance(active_wf, dict) and active_wf):
+        return None
+    return build_workflow_progress_prompt(
+        task=str(deps.task or ""),
+        hands_provider=str(deps.hands_provider or ""),
+        runtime_cfg=deps.runtime_cfg_getter() if callable(deps.runtime_cfg_getter) else {},
+        project_overlay=deps.project_overlay if isinstance(deps.project_overlay, dict) else {},
+        active_workflow=active_wf,
+        workflow_run=deps.workflow_run if isinstance(deps.workflow_run, dict) else {},
+        latest_evidence=build_workflow_progress_latest_evidence(
+            batch_id=str(batch_id or ""),
+            summary=summary if isinstance(summary, dict) else {},
+            evidence_obj=evidence_obj if isinstance(evidence_obj, dict) else {},
+            repo_obs=repo_obs if isinstance(repo_obs, dict) else {},
+        ),
+        last_batch_input=str(last_batch_input or ""),
+        hands_last_message=str(hands_last or ""),
+        thought_db_context=tdb_ctx_batch_obj if isinstance(tdb_ctx_batch_obj, dict) else {},
+        prompt_builder=deps.workflow_progress_prompt_builder,
+    )
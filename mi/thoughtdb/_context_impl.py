@@ -103,36 +103,63 @@ class ThoughtDbContext:
         }
 
 
-def build_decide_next_thoughtdb_context(
+@dataclass(frozen=True)
+class ThoughtDbContextBase:
+    """Query-independent part of the decide_next context (views, fixed nodes, values, prefs).
+
+    It can be built ahead of time (e.g., while Hands runs) and finished later with the
+    query-dependent part. It stays exact while both views are unchanged (same cached view
+    objects) and no claim validity boundary (`valid_from`/`valid_to`) was crossed since `as_of_ts`.
+    """
+
+    as_of_ts: str
+    v_proj: ThoughtDbView
+    v_glob: ThoughtDbView
+    next_validity_boundary_ts: str
+    max_nodes: int
+    max_values_claims: int
+    max_pref_goal_claims: int
+    nodes: list[dict[str, Any]]
+    node_ids: list[str]
+    values_claims: list[dict[str, Any]]
+    values_ids: list[str]
+    pref_goal_claims: list[dict[str, Any]]
+    pref_goal_ids: list[str]
+
+    def is_fresh(self, *, v_proj: ThoughtDbView, v_glob: ThoughtDbView, as_of_ts: str) -> bool:
+        if v_proj is not self.v_proj or v_glob is not self.v_glob:
+            return False
+        t = str(as_of_ts or "").strip()
+        if t < self.as_of_ts:
+            return False
+        return not self.next_validity_boundary_ts or t < self.next_validity_boundary_ts
+
+
+def _next_validity_boundary(views: tuple[ThoughtDbView, ...], *, as_of_ts: str) -> str:
+    """Return the earliest claim valid_from/valid_to strictly after as_of_ts ("" when none)."""
+
+    best = ""
+    for view in views:
+        b = view.claim_validity.next_boundary_after(as_of_ts)
+        if b and (not best or b < best):
+            best = b
+    return best
+
+
+def build_thoughtdb_context_base(
     *,
     tdb: ThoughtDbStore,
     as_of_ts: str,
-    task: str,
-    hands_last_message: str,
-    recent_evidence: list[dict[str, Any]],
-    mem: MemoryService | None = None,
     max_nodes: int = 6,
     max_values_claims: int = 8,
     max_pref_goal_claims: int = 8,
-    max_query_claims: int = 10,
-    max_edges: int = 20,
-) -> ThoughtDbContext:
-    """Build a compact Thought DB context for decide_next (always-on, small budget)."""
+) -> ThoughtDbContextBase:
+    """Build the query-independent part of the decide_next context (no Memory/FTS access)."""
 
     t = str(as_of_ts or "").strip()
-    q = _collect_query_text(task=task, hands_last_message=hands_last_message, recent_evidence=recent_evidence)
-    tokens = tokenize_query(q, max_tokens=18)
-    q_compact = " ".join(tokens).strip()
-
     v_proj = tdb.load_view(scope="project")
     v_glob = tdb.load_view(scope="global")
 
-    seeds = None
-    seed_notes = ""
-    if q_compact and isinstance(mem, MemoryService):
-        seeds = seed_ids_from_memory(mem=mem, query_compact=q_compact, project_id=v_proj.project_id, candidate_k=50)
-        seed_notes = seeds.notes
-
     def _claim_active_and_valid(view: ThoughtDbView, claim_id: str) -> bool:
         return claim_active_and_valid(view, claim_id, as_of_ts=t)
 
@@ -144,6 +171,7 @@ def build_decide_next_thoughtdb_context(
     nodes: list[dict[str, Any]] = []
     max_nodes_total = max(0, int(max_nodes))
     included_node_ids: set[str] = set()
+    node_ids: list[str] = []
 
     def _add_node_by_id(nid: str, *, view: ThoughtDbView) -> None:
         nonlocal nodes
@@ -154,6 +182,7 @@ def build_decide_next_thoughtdb_context(
             return
         nodes.append(_compact_node(n, view=view))
         included_node_ids.add(nid)
+        node_ids.append(nid)
 
     # Always include the latest global values summary node (if present).
     best_vs_id = ""
@@ -186,57 +215,6 @@ def build_decide_next_thoughtdb_context(
         _add_node_by_id(nid, view=v_proj)
         recent_added += 1
 
-    # Query-ranked nodes: prefer Memory FTS seeds; fall back to token scanning.
-    if len(nodes) < max_nodes_total and seeds:
-        for nid in seeds.project_node_ids:
-            if len(nodes) >= max_nodes_total:
-                break
-            if nid in included_node_ids:
-                continue
-            if not _node_active(v_proj, nid):
-                continue
-            _add_node_by_id(nid, view=v_proj)
-        for nid in seeds.global_node_ids:
-            if len(nodes) >= max_nodes_total:
-                break
-            if nid in included_node_ids:
-                continue
-            if not _node_active(v_glob, nid):
-                continue
-            _add_node_by_id(nid, view=v_glob)
-
-    if len(nodes) < max_nodes_total and tokens:
-        scored_nodes: list[tuple[int, int, str, str, ThoughtDbView]] = []
-        for view, scope_rank in ((v_proj, 0), (v_glob, 1)):
-            for n in view.iter_nodes(include_inactive=False, include_aliases=False):
-                if not isinstance(n, dict):
-                    continue
-                nid = str(n.get("node_id") or "").strip()
-                if not nid or nid in included_node_ids:
-                    continue
-                title = str(n.get("title") or "").strip()
-                text = str(n.get("text") or "").strip()
-                if not title and not text:
-                    continue
-                score = _score_tokens(tokens, text=(title + "\n" + text).strip())
-                if score <= 0:
-                    continue
-                ts = str(n.get("asserted_ts") or "").strip()
-                scored_nodes.append((score, scope_rank, ts, nid, view))
-
-        scored_nodes.sort(key=lambda x: str(x[2] or ""), reverse=True)
-        scored_nodes.sort(key=lambda x: int(x[1]), reverse=False)
-        scored_nodes.sort(key=lambda x: -int(x[0]), reverse=False)
-
-        for _score, _rank, _ts, nid, view in scored_nodes:
-            if len(nodes) >= max_nodes_total:
-                break
-            if nid in included_node_ids:
-                continue
-            if not _node_active(view, nid):
-                continue
-            _add_node_by_id(nid, view=view)
-
     # Values claims: active global preference/goal claims tagged as values:base.
     values_claims: list[dict[str, Any]] = []
     values_ids: set[str] = set()
@@ -316,6 +294,131 @@ def build_decide_next_thoughtdb_context(
             pref_goal_claims.append(_compact_claim(c, view=view))
             pref_goal_ids.add(cid)
 
+    return ThoughtDbContextBase(
+        as_of_ts=t,
+        v_proj=v_proj,
+        v_glob=v_glob,
+        next_validity_boundary_ts=_next_validity_boundary((v_proj, v_glob), as_of_ts=t),
+        max_nodes=int(max_nodes),
+        max_values_claims=int(max_values_claims),
+        max_pref_goal_claims=int(max_pref_goal_claims),
+        nodes=nodes,
+        node_ids=node_ids,
+        values_claims=values_claims,
+        values_ids=sorted(values_ids),
+        pref_goal_claims=pref_goal_claims,
+        pref_goal_ids=sorted(pref_goal_ids),
+    )
+
+
+def finish_thoughtdb_context(
+    *,
+    base: ThoughtDbContextBase,
+    as_of_ts: str,
+    task: str,
+    hands_last_message: str,
+    recent_evidence: list[dict[str, Any]],
+    mem: MemoryService | None = None,
+    max_query_claims: int = 10,
+    max_edges: int = 20,
+) -> ThoughtDbContext:
+    """Add the query-dependent part (FTS seeds, token scan, 1-hop expansion, edges) to a base."""
+
+    t = str(as_of_ts or "").strip()
+    q = _collect_query_text(task=task, hands_last_message=hands_last_message, recent_evidence=recent_evidence)
+    tokens = tokenize_query(q, max_tokens=18)
+    q_compact = " ".join(tokens).strip()
+
+    v_proj = base.v_proj
+    v_glob = base.v_glob
+    max_nodes = int(base.max_nodes)
+    max_values_claims = int(base.max_values_claims)
+    max_pref_goal_claims = int(base.max_pref_goal_claims)
+
+    seeds = None
+    seed_notes = ""
+    if q_compact and isinstance(mem, MemoryService):
+        seeds = seed_ids_from_memory(mem=mem, query_compact=q_compact, project_id=v_proj.project_id, candidate_k=50)
+        seed_notes = seeds.notes
+
+    def _claim_active_and_valid(view: ThoughtDbView, claim_id: str) -> bool:
+        return claim_active_and_valid(view, claim_id, as_of_ts=t)
+
+    def _node_active(view: ThoughtDbView, node_id: str) -> bool:
+        return node_active(view, node_id)
+
+    nodes: list[dict[str, Any]] = list(base.nodes)
+    max_nodes_total = max(0, int(max_nodes))
+    included_node_ids: set[str] = set(base.node_ids)
+
+    def _add_node_by_id(nid: str, *, view: ThoughtDbView) -> None:
+        nonlocal nodes
+        if len(nodes) >= max_nodes_total:
+            return
+        n = view.nodes_by_id.get(nid)
+        if not isinstance(n, dict):
+            return
+        nodes.append(_compact_node(n, view=view))
+        included_node_ids.add(nid)
+
+    # Query-ranked nodes: prefer Memory FTS seeds; fall back to token scanning.
+    if len(nodes) < max_nodes_total and seeds:
+        for nid in seeds.project_node_ids:
+            if len(nodes) >= max_nodes_total:
+                break
+            if nid in included_node_ids:
+                continue
+            if not _node_active(v_proj, nid):
+                continue
+            _add_node_by_id(nid, view=v_proj)
+        for nid in seeds.global_node_ids:
+            if len(nodes) >= max_nodes_total:
+                break
+            if nid in included_node_ids:
+                continue
+            if not _node_active(v_glob, nid):
+                continue
+            _add_node_by_id(nid, view=v_glob)
+
+    if len(nodes) < max_nodes_total and tokens:
+        scored_nodes: list[tuple[int, int, str, str, ThoughtDbView]] = []
+        for view, scope_rank in ((v_proj, 0), (v_glob, 1)):
+            # Only ids whose text contains a query token can score > 0 (token index; same order as iter_nodes).
+            for nid in view.node_tokens.candidates(tokens):
+                n = view.nodes_by_id.get(nid)
+                if not isinstance(n, dict) or nid in included_node_ids or not _node_active(view, nid):
+                    continue
+                nid = str(n.get("node_id") or "").strip()
+                if not nid or nid in included_node_ids:
+                    continue
+                title = str(n.get("title") or "").strip()
+                text = str(n.get("text") or "").strip()
+                if not title and not text:
+                    continue
+                score = _score_tokens(tokens, text=(title + "\n" + text).strip())
+                if score <= 0:
+                    continue
+                ts = str(n.get("asserted_ts") or "").strip()
+                scored_nodes.append((score, scope_rank, ts, nid, view))
+
+        scored_nodes.sort(key=lambda x: str(x[2] or ""), reverse=True)
+        scored_nodes.sort(key=lambda x: int(x[1]), reverse=False)
+        scored_nodes.sort(key=lambda x: -int(x[0]), reverse=False)
+
+        for _score, _rank, _ts, nid, view in scored_nodes:
+            if len(nodes) >= max_nodes_total:
+                break
+            if nid in included_node_ids:
+                continue
+            if not _node_active(view, nid):
+                continue
+            _add_node_by_id(nid, view=view)
+
+    values_claims: list[dict[str, Any]] = list(base.values_claims)
+    values_ids: set[str] = set(base.values_ids)
+    pref_goal_claims: list[dict[str, Any]] = list(base.pref_goal_claims)
+    pref_goal_ids: set[str] = set(base.pref_goal_ids)
+
     # Query-ranked claims: prefer Memory FTS seeds; fall back to token scanning.
     query_claims: list[dict[str, Any]] = []
     included_claim_ids: set[str] = set(values_ids) | set(pref_goal_ids)
@@ -365,8 +468,10 @@ def build_decide_next_thoughtdb_context(
     if len(query_claims) < max(0, int(max_query_claims)) and tokens:
         scored: list[tuple[int, int, str, str, ThoughtDbView]] = []
         for view, scope_rank in ((v_proj, 0), (v_glob, 1)):
-            for c in view.iter_claims(include_inactive=False, include_aliases=False, as_of_ts=t):
-                if not isinstance(c, dict):
+            # Only ids whose text contains a query token can score > 0 (token index; same order as iter_claims).
+            for cid in view.claim_tokens.candidates(tokens):
+                c = view.claims_by_id.get(cid)
+                if not isinstance(c, dict) or cid in included_claim_ids or not _claim_active_and_valid(view, cid):
                     continue
                 cid = str(c.get("claim_id") or "").strip()
                 if not cid or cid in included_claim_ids:
@@ -506,3 +611,38 @@ def build_decide_next_thoughtdb_context(
         edges=edges,
         notes=notes,
     )
+
+
+def build_decide_next_thoughtdb_context(
+    *,
+    tdb: ThoughtDbStore,
+    as_of_ts: str,
+    task: str,
+    hands_last_message: str,
+    recent_evidence: list[dict[str, Any]],
+    mem: MemoryService | None = None,
+    max_nodes: int = 6,
+    max_values_claims: int = 8,
+    max_pref_goal_claims: int = 8,
+    max_query_claims: int = 10,
+    max_edges: int = 20,
+) -> ThoughtDbContext:
+    """Build a compact Thought DB context for decide_next (always-on, small budget)."""
+
+    base = build_thoughtdb_context_base(
+        tdb=tdb,
+        as_of_ts=as_of_ts,
+        max_nodes=max_nodes,
+        max_values_claims=max_values_claims,
+        max_pref_goal_claims=max_pref_goal_claims,
+    )
+    return finish_thoughtdb_context(
+        base=base,
+        as_of_ts=as_of_ts,
+        task=task,
+        hands_last_message=hands_last_message,
+        recent_evidence=recent_evidence,
+        mem=mem,
+        max_query_claims=max_query_claims,
+        max_edges=max_edges,
+    )
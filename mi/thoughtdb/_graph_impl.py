@@ -53,21 +53,6 @@ def _resolve_id_effective(v_proj: ThoughtDbView, v_glob: ThoughtDbView, id0: str
     return i
 
 
-def _reverse_aliases(v: ThoughtDbView) -> dict[str, set[str]]:
-    """Build canonical_id -> {alias_ids} map from redirects (best-effort)."""
-
-    rev: dict[str, set[str]] = {}
-    for dup in v.redirects_same_as:
-        d = str(dup or "").strip()
-        if not d:
-            continue
-        canon = v.resolve_id(d)
-        if not canon or canon == d:
-            continue
-        rev.setdefault(canon, set()).add(d)
-    return rev
-
-
 def _iter_edges_for_keys(
     v: ThoughtDbView,
     *,
@@ -210,8 +195,6 @@ def _edge_out(
 class _EffectiveViews:
     proj: ThoughtDbView
     glob: ThoughtDbView
-    aliases_proj: dict[str, set[str]]
-    aliases_glob: dict[str, set[str]]
 
     def resolve_id(self, id0: str) -> str:
         return _resolve_id_effective(self.proj, self.glob, id0)
@@ -220,10 +203,7 @@ class _EffectiveViews:
         c = (canon or "").strip()
         if not c:
             return set()
-        out: set[str] = set()
-        out |= self.aliases_proj.get(c, set())
-        out |= self.aliases_glob.get(c, set())
-        return out
+        return self.proj.aliases_of(c) | self.glob.aliases_of(c)
 
     def find_claim(self, cid: str) -> tuple[ThoughtDbView | None, dict[str, Any] | None]:
         c = (cid or "").strip()
@@ -313,19 +293,10 @@ def build_subgraph_for_id(
     # View(s)
     eff: _EffectiveViews | None = None
     v_single: ThoughtDbView | None = None
-    aliases_single: dict[str, set[str]] = {}
     if sc == "effective":
-        v_proj = tdb.load_view(scope="project")
-        v_glob = tdb.load_view(scope="global")
-        eff = _EffectiveViews(
-            proj=v_proj,
-            glob=v_glob,
-            aliases_proj=_reverse_aliases(v_proj),
-            aliases_glob=_reverse_aliases(v_glob),
-        )
+        eff = _EffectiveViews(proj=tdb.load_view(scope="project"), glob=tdb.load_view(scope="global"))
     else:
         v_single = tdb.load_view(scope=sc)
-        aliases_single = _reverse_aliases(v_single)
 
     def node_key(id0: str) -> str:
         i = (id0 or "").strip()
@@ -349,7 +320,8 @@ def build_subgraph_for_id(
         if eff is not None:
             out |= eff.alias_keys_for(canon)
         else:
-            out |= aliases_single.get(canon, set())
+            assert v_single is not None
+            out |= v_single.aliases_of(canon)
         return {x for x in out if str(x).strip()}
 
     def status_and_view_for(id0: str) -> tuple[str, str, ThoughtDbView | None]:
@@ -407,6 +379,26 @@ def build_subgraph_for_id(
             return v_single, canon
         return None, ""
 
+    admit_memo: dict[str, bool] = {}
+
+    def admitted(id0: str) -> bool:
+        """Whether a (non-root) neighbor passes the inactive filter; memoised (dense graphs revisit ids)."""
+
+        hit = admit_memo.get(id0)
+        if hit is not None:
+            return hit
+        ok = True
+        kind, st, v_used = status_and_view_for(id0)
+        if kind == "claim" and v_used is not None:
+            cid = v_used.resolve_id(id0)
+            cobj = v_used.claims_by_id.get(cid) if isinstance(v_used.claims_by_id.get(cid), dict) else None
+            if isinstance(cobj, dict) and (not include_inactive) and (st != "active" or (not _claim_valid_as_of(cobj, as_of_ts=asof))):
+                ok = False
+        elif kind == "node" and (not include_inactive) and st != "active":
+            ok = False
+        admit_memo[id0] = ok
+        return ok
+
     # BFS traversal
     root_key = node_key(rid)
     queue: deque[tuple[str, int]] = deque([(root_key, 0)])
@@ -469,15 +461,8 @@ def build_subgraph_for_id(
                     continue
 
                 # Filter inactive items (root is always included).
-                if nb_key != root_key:
-                    kind, st, v_used = status_and_view_for(nb_key)
-                    if kind == "claim" and v_used is not None:
-                        cid = v_used.resolve_id(nb_key)
-                        cobj = v_used.claims_by_id.get(cid) if isinstance(v_used.claims_by_id.get(cid), dict) else None
-                        if isinstance(cobj, dict) and (not include_inactive) and (st != "active" or (not _claim_valid_as_of(cobj, as_of_ts=asof))):
-                            continue
-                    elif kind == "node" and (not include_inactive) and st != "active":
-                        continue
+                if nb_key != root_key and not admitted(nb_key):
+                    continue
 
                 included.add(nb_key)
                 prev = seen_depth.get(nb_key)
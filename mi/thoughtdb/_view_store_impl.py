@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 from ..core.storage import now_rfc3339, read_json, atomic_write_json
 from .model import (
@@ -10,7 +11,131 @@ from .model import (
     ThoughtDbView,
     claim_signature,
     edge_key,
+    follow_redirects,
+    source_event_ids,
 )
+from .shared_view import load_shared_view, write_shared_view
+from .token_index import TokenIndex, claim_index_text, node_index_text
+
+
+def _source_event_index(
+    claims_by_id: dict[str, Any],
+    nodes_by_id: dict[str, Any],
+    edges: list[dict[str, Any]],
+) -> dict[str, list[str]]:
+    """Build the provenance index (event_id -> citing claim/node/edge ids)."""
+
+    index: dict[str, list[str]] = {}
+    for rid, obj in [*claims_by_id.items(), *nodes_by_id.items(), *((str(e.get("edge_id") or "").strip(), e) for e in edges)]:
+        if not rid or not isinstance(obj, dict):
+            continue
+        for eid in source_event_ids(obj):
+            ids = index.setdefault(eid, [])
+            if rid not in ids:
+                ids.append(rid)
+    return index
+
+
+def _with_source_events(index: dict[str, list[str]], *, obj: dict[str, Any], rid: str) -> dict[str, list[str]]:
+    """Copy-on-write: return `index` plus `rid` under every event id `obj` cites."""
+
+    eids = source_event_ids(obj)
+    if not rid or not eids:
+        return index
+    out = dict(index)
+    for eid in eids:
+        cur = out.get(eid) or []
+        if rid not in cur:
+            out[eid] = [*cur, rid]
+    return out
+
+
+def _edge_pos_index(edges: list[dict[str, Any]]) -> dict[str, int]:
+    out: dict[str, int] = {}
+    for i, e in enumerate(edges):
+        eid = str(e.get("edge_id") or "").strip() if isinstance(e, dict) else ""
+        if eid:
+            out.setdefault(eid, i)
+    return out
+
+
+def _alias_index(redirects: dict[str, str]) -> dict[str, set[str]]:
+    """canonical_id -> {alias ids} for same_as redirects (what `ThoughtDbView.resolve_id` resolves to)."""
+
+    out: dict[str, set[str]] = {}
+    for dup in redirects:
+        d = str(dup or "").strip()
+        if not d:
+            continue
+        canon = follow_redirects(d, redirects)
+        if canon and canon != d:
+            out.setdefault(canon, set()).add(d)
+    return out
+
+
+def _claim_sig(c: Any, *, scope: str, project_id: str) -> str:
+    if not isinstance(c, dict):
+        return ""
+    ct = str(c.get("claim_type") or "").strip()
+    text = str(c.get("text") or "").strip()
+    if not ct or not text:
+        return ""
+    return claim_signature(claim_type=ct, scope=scope, project_id=project_id, text=text)
+
+
+def _claim_signature_index(claims_by_id: dict[str, Any], *, scope: str, project_id: str) -> dict[str, str]:
+    """claim_id -> `claim_signature` (claims without a type or text have none)."""
+
+    out: dict[str, str] = {}
+    for cid, c in claims_by_id.items():
+        sig = _claim_sig(c, scope=scope, project_id=project_id)
+        if sig:
+            out[cid] = sig
+    return out
+
+
+def _signature_owner_index(claims_by_id: dict[str, Any], sig_by_id: dict[str, str], redirects: dict[str, str]) -> dict[str, str]:
+    """signature -> first claim id (claims_by_id order) that is not a same_as alias (no hashing)."""
+
+    out: dict[str, str] = {}
+    for cid in claims_by_id:
+        sig = sig_by_id.get(cid)
+        if sig and cid not in redirects and sig not in out:
+            out[sig] = cid
+    return out
+
+
+def _edge_key_index(edges: list[dict[str, Any]]) -> set[str]:
+    out: set[str] = set()
+    for e in edges:
+        if not isinstance(e, dict):
+            continue
+        et = str(e.get("edge_type") or "").strip()
+        frm = str(e.get("from_id") or "").strip()
+        to = str(e.get("to_id") or "").strip()
+        if et and frm and to:
+            out.add(edge_key(edge_type=et, from_id=frm, to_id=to))
+    return out
+
+
+def _insert_by_ts_desc(ids: list[str], new_id: str, *, records: dict[str, Any]) -> list[str]:
+    """Copy of `ids` (asserted_ts desc) with `new_id` where a full rebuild's stable sort puts it.
+
+    That is after every id with an equal or newer ts (appends within the same second keep their
+    append order), so listings from a hot view match a cold load.
+    """
+
+    def ts_of(x: str) -> str:
+        r = records.get(x)
+        return str(r.get("asserted_ts") or "").strip() if isinstance(r, dict) else ""
+
+    out = [x for x in ids if x != new_id]
+    t = ts_of(new_id)
+    i = 0
+    while i < len(out) and ts_of(out[i]) >= t:
+        i += 1
+    out.insert(i, new_id)
+    return out
 
 
 class ThoughtViewStore:
@@ -26,6 +151,8 @@ class ThoughtViewStore:
         project_id_for_scope: Callable[[str], str],
         scope_metas: Callable[[str], tuple[tuple[int, int], tuple[int, int], tuple[int, int]]],
         view_snapshot_path: Callable[[str], Path],
+        global_view_cache: dict[str, Any] | None = None,
+        shared_view_path: Callable[[str], Path] | None = None,
     ) -> None:
         self._claims_path_for_scope = claims_path_for_scope
         self._edges_path_for_scope = edges_path_for_scope
@@ -35,6 +162,18 @@ class ThoughtViewStore:
         self._scope_metas = scope_metas
         self._view_snapshot_path = view_snapshot_path
         self._view_cache: dict[str, tuple[ThoughtDbView, tuple[tuple[int, int], tuple[int, int], tuple[int, int]]]] = {}
+        # Optional: a dict shared by several stores of the same MI home (e.g., `mi run-many`) that
+        # holds the global-scope entry; entries are (view, metas) and are re-validated on every load.
+        self._global_view_cache = global_view_cache
+        # Optional: a cross-process shared image of the global view (`shared_view.py`); when set,
+        # global cold loads try it first and every global build/flush republishes it.
+        self._shared_view_path = shared_view_path
+        self.shared_view_generation = 0
+
+    def _cache(self, scope: str) -> dict[str, Any]:
+        if scope == "global" and self._global_view_cache is not None:
+            return self._global_view_cache
+        return self._view_cache
 
     def _snapshot_metas_obj(self, metas: tuple[tuple[int, int], tuple[int, int], tuple[int, int]]) -> dict[str, dict[str, int]]:
         return {
@@ -141,14 +280,27 @@ class ThoughtViewStore:
             node_ts.append((str(n.get("asserted_ts") or "").strip(), str(nid)))
         node_ts.sort(key=lambda x: x[0], reverse=True)
 
+        claims_by_id = {str(k): v for k, v in claims_by_id.items() if str(k).strip() and isinstance(v, dict)}
+        nodes_by_id = {str(k): v for k, v in nodes_by_id.items() if str(k).strip() and isinstance(v, dict)}
+        edges = [x for x in edges if isinstance(x, dict)]
+
+        redirects_same_as = {str(k): str(v).strip() for k, v in redirects.items() if str(k).strip() and str(v).strip()}
+        tok = obj.get("token_index") if isinstance(obj.get("token_index"), dict) else {}
+
         pid = self._project_id_for_scope(scope)
+        # Signatures hash (scope, project_id, text): reuse persisted ones only for the same project.
+        sigs = obj.get("claim_signatures")
+        if isinstance(sigs, dict) and str(obj.get("project_id") or "") == str(pid or ""):
+            sig_by_id = {str(k): str(v) for k, v in sigs.items() if str(k) in claims_by_id and str(v).strip()}
+        else:
+            sig_by_id = _claim_signature_index(claims_by_id, scope=scope, project_id=pid)
         return ThoughtDbView(
             scope=scope,
             project_id=pid,
-            claims_by_id={str(k): v for k, v in claims_by_id.items() if str(k).strip() and isinstance(v, dict)},
-            nodes_by_id={str(k): v for k, v in nodes_by_id.items() if str(k).strip() and isinstance(v, dict)},
-            edges=[x for x in edges if isinstance(x, dict)],
-            redirects_same_as={str(k): str(v).strip() for k, v in redirects.items() if str(k).strip() and str(v).strip()},
+            claims_by_id=claims_by_id,
+            nodes_by_id=nodes_by_id,
+            edges=edges,
+            redirects_same_as=redirects_same_as,
             superseded_ids={str(x).strip() for x in superseded_ids if str(x).strip()},
             retracted_ids={str(x).strip() for x in retracted_ids if str(x).strip()},
             retracted_node_ids={str(x).strip() for x in retracted_node_ids if str(x).strip()},
@@ -158,6 +310,14 @@ class ThoughtViewStore:
             edges_by_to=edges_by_to,
             claim_ids_by_asserted_ts_desc=[cid for _ts, cid in claim_ts if cid],
             node_ids_by_asserted_ts_desc=[nid for _ts, nid in node_ts if nid],
+            ids_by_source_event=_source_event_index(claims_by_id, nodes_by_id, edges),
+            edge_pos_by_id=_edge_pos_index(edges),
+            aliases_by_canonical=_alias_index(redirects_same_as),
+            claim_token_index=TokenIndex.from_obj(tok.get("claims"), ids=claims_by_id),
+            node_token_index=TokenIndex.from_obj(tok.get("nodes"), ids=nodes_by_id),
+            signature_by_claim_id=sig_by_id,
+            claim_id_by_signature=_signature_owner_index(claims_by_id, sig_by_id, redirects_same_as),
+            edge_keys=_edge_key_index(edges),
         )
 
     def _write_view_snapshot(
@@ -186,9 +346,51 @@ class ThoughtViewStore:
                 "retracted_ids": sorted(view.retracted_ids),
                 "retracted_node_ids": sorted(view.retracted_node_ids),
             },
+            # Derived indices are rebuilt on load; signatures are persisted since they cost a hash per claim.
+            "claim_signatures": view.signature_by_claim_id,
         }
+        claim_tokens, node_tokens = view.token_indexes_built()
+        if claim_tokens is not None or node_tokens is not None:
+            # Persist token indices once built (decide_next fallback) so cold loads skip re-tokenizing.
+            obj["token_index"] = {
+                "claims": claim_tokens.to_obj() if claim_tokens is not None else None,
+                "nodes": node_tokens.to_obj() if node_tokens is not None else None,
+            }
         atomic_write_json(path, obj)
 
+    def _load_shared_view(self, *, scope: str, metas: tuple[tuple[int, int], tuple[int, int], tuple[int, int]]) -> ThoughtDbView | None:
+        if scope != "global" or self._shared_view_path is None:
+            return None
+        got = load_shared_view(
+            self._shared_view_path(scope),
+            source_metas=self._snapshot_metas_obj(metas),
+            project_id=self._project_id_for_scope(scope),
+        )
+        if got is None:
+            return None
+        self.shared_view_generation = got[0]
+        return got[1]
+
+    def _publish_shared_view(
+        self,
+        *,
+        scope: str,
+        metas: tuple[tuple[int, int], tuple[int, int], tuple[int, int]],
+        view: ThoughtDbView,
+    ) -> None:
+        """Publish the global view as the shared image (best-effort)."""
+
+        if scope != "global" or self._shared_view_path is None:
+            return
+        try:
+            self.shared_view_generation = write_shared_view(
+                self._shared_view_path(scope),
+                view=view,
+                source_metas=self._snapshot_metas_obj(metas),
+            )
+        except Exception:
+            pass
+
     def update_cache_after_append(self, *, scope: str, obj: dict[str, Any]) -> None:
         """Incrementally update an in-memory cached view after an append (best-effort)."""
 
@@ -196,7 +398,13 @@ class ThoughtViewStore:
         if sc not in ("project", "global"):
             sc = "project"
 
-        cached = self._view_cache.get(sc)
+        if sc == "global" and self._global_view_cache is not None:
+            # Shared across stores: patching copy-on-write views from several threads could drop
+            # a concurrent append, so just invalidate; the next load re-validates and rebuilds.
+            self._global_view_cache.pop(sc, None)
+            return
+
+        cached = self._cache(sc).get(sc)
         if not cached:
             return
         view = cached[0]
@@ -207,6 +415,10 @@ class ThoughtViewStore:
 
         kind = str(obj.get("kind") or "").strip()
         v2: ThoughtDbView | None = None
+        # Token indices are carried forward only once materialized (otherwise built lazily on use).
+        claim_tokens, node_tokens = view.token_indexes_built()
+        sig_by_id, id_by_sig, edge_keys = view.signature_by_claim_id, view.claim_id_by_signature, view.edge_keys
+        validity = view.validity_index_built()
 
         if kind == "claim":
             cid = str(obj.get("claim_id") or "").strip()
@@ -226,8 +438,26 @@ class ThoughtViewStore:
                 nxt.add(cid)
                 claims_by_tag[ts] = nxt
 
-            ids = list(view.claim_ids_by_asserted_ts_desc)
-            ids.insert(0, cid)
+            ids = _insert_by_ts_desc(view.claim_ids_by_asserted_ts_desc, cid, records=claims_by_id)
+            if claim_tokens is not None:
+                claim_tokens = claim_tokens.with_doc(cid, claim_index_text(obj))
+            if validity is not None:
+                validity = validity.with_claim(cid, obj)
+
+            # One hash per appended claim; the owner map only needs a rebuild when a re-appended id
+            # changes its signature (owners follow claims_by_id order, which keeps first positions).
+            sig = _claim_sig(obj, scope=view.scope, project_id=view.project_id)
+            if sig != sig_by_id.get(cid, "") or cid not in view.claims_by_id:
+                sig_by_id = dict(sig_by_id)
+                if sig:
+                    sig_by_id[cid] = sig
+                else:
+                    sig_by_id.pop(cid, None)
+                if cid in view.claims_by_id:
+                    id_by_sig = _signature_owner_index(claims_by_id, sig_by_id, view.redirects_same_as)
+                elif sig and sig not in id_by_sig and cid not in view.redirects_same_as:
+                    id_by_sig = dict(id_by_sig)
+                    id_by_sig[sig] = cid
 
             v2 = ThoughtDbView(
                 scope=view.scope,
@@ -245,6 +475,15 @@ class ThoughtViewStore:
                 edges_by_to=view.edges_by_to,
                 claim_ids_by_asserted_ts_desc=ids,
                 node_ids_by_asserted_ts_desc=view.node_ids_by_asserted_ts_desc,
+                ids_by_source_event=_with_source_events(view.ids_by_source_event, obj=obj, rid=cid),
+                edge_pos_by_id=view.edge_pos_by_id,
+                aliases_by_canonical=view.aliases_by_canonical,
+                claim_token_index=claim_tokens,
+                node_token_index=node_tokens,
+                signature_by_claim_id=sig_by_id,
+                claim_id_by_signature=id_by_sig,
+                edge_keys=edge_keys,
+                claim_validity_index=validity,
             )
 
         elif kind == "claim_retract":
@@ -269,6 +508,15 @@ class ThoughtViewStore:
                 edges_by_to=view.edges_by_to,
                 claim_ids_by_asserted_ts_desc=view.claim_ids_by_asserted_ts_desc,
                 node_ids_by_asserted_ts_desc=view.node_ids_by_asserted_ts_desc,
+                ids_by_source_event=view.ids_by_source_event,
+                edge_pos_by_id=view.edge_pos_by_id,
+                aliases_by_canonical=view.aliases_by_canonical,
+                claim_token_index=claim_tokens,
+                node_token_index=node_tokens,
+                signature_by_claim_id=sig_by_id,
+                claim_id_by_signature=id_by_sig,
+                edge_keys=edge_keys,
+                claim_validity_index=validity,
             )
 
         elif kind == "node":
@@ -289,8 +537,9 @@ class ThoughtViewStore:
                 nxt.add(nid)
                 nodes_by_tag[ts] = nxt
 
-            ids = list(view.node_ids_by_asserted_ts_desc)
-            ids.insert(0, nid)
+            ids = _insert_by_ts_desc(view.node_ids_by_asserted_ts_desc, nid, records=nodes_by_id)
+            if node_tokens is not None:
+                node_tokens = node_tokens.with_doc(nid, node_index_text(obj))
 
             v2 = ThoughtDbView(
                 scope=view.scope,
@@ -308,6 +557,15 @@ class ThoughtViewStore:
                 edges_by_to=view.edges_by_to,
                 claim_ids_by_asserted_ts_desc=view.claim_ids_by_asserted_ts_desc,
                 node_ids_by_asserted_ts_desc=ids,
+                ids_by_source_event=_with_source_events(view.ids_by_source_event, obj=obj, rid=nid),
+                edge_pos_by_id=view.edge_pos_by_id,
+                aliases_by_canonical=view.aliases_by_canonical,
+                claim_token_index=claim_tokens,
+                node_token_index=node_tokens,
+                signature_by_claim_id=sig_by_id,
+                claim_id_by_signature=id_by_sig,
+                edge_keys=edge_keys,
+                claim_validity_index=validity,
             )
 
         elif kind == "node_retract":
@@ -332,6 +590,15 @@ class ThoughtViewStore:
                 edges_by_to=view.edges_by_to,
                 claim_ids_by_asserted_ts_desc=view.claim_ids_by_asserted_ts_desc,
                 node_ids_by_asserted_ts_desc=view.node_ids_by_asserted_ts_desc,
+                ids_by_source_event=view.ids_by_source_event,
+                edge_pos_by_id=view.edge_pos_by_id,
+                aliases_by_canonical=view.aliases_by_canonical,
+                claim_token_index=claim_tokens,
+                node_token_index=node_tokens,
+                signature_by_claim_id=sig_by_id,
+                claim_id_by_signature=id_by_sig,
+                edge_keys=edge_keys,
+                claim_validity_index=validity,
             )
 
         elif kind == "edge":
@@ -356,11 +623,26 @@ class ThoughtViewStore:
             nxtt.append(obj)
             edges_by_to[to] = nxtt
 
+            edge_pos_by_id = view.edge_pos_by_id
+            eid = str(obj.get("edge_id") or "").strip()
+            if eid and eid not in edge_pos_by_id:
+                edge_pos_by_id = dict(edge_pos_by_id)
+                edge_pos_by_id[eid] = len(edges) - 1
+
             redirects = view.redirects_same_as
+            aliases = view.aliases_by_canonical
             if et == "same_as":
                 redirects2 = dict(view.redirects_same_as)
                 redirects2[frm] = to
                 redirects = redirects2
+                # A new redirect can re-home whole alias chains; same_as edges are rare, so rebuild.
+                aliases = _alias_index(redirects)
+                id_by_sig = _signature_owner_index(view.claims_by_id, sig_by_id, redirects)
+
+            k = edge_key(edge_type=et, from_id=frm, to_id=to)
+            if k not in edge_keys:
+                edge_keys = set(edge_keys)
+                edge_keys.add(k)
 
             superseded = view.superseded_ids
             if et == "supersedes":
@@ -384,18 +666,30 @@ class ThoughtViewStore:
                 edges_by_to=edges_by_to,
                 claim_ids_by_asserted_ts_desc=view.claim_ids_by_asserted_ts_desc,
                 node_ids_by_asserted_ts_desc=view.node_ids_by_asserted_ts_desc,
+                ids_by_source_event=_with_source_events(view.ids_by_source_event, obj=obj, rid=eid),
+                edge_pos_by_id=edge_pos_by_id,
+                aliases_by_canonical=aliases,
+                claim_token_index=claim_tokens,
+                node_token_index=node_tokens,
+                signature_by_claim_id=sig_by_id,
+                claim_id_by_signature=id_by_sig,
+                edge_keys=edge_keys,
+                claim_validity_index=validity,
             )
 
         if v2 is None:
             return
 
         metas = self._scope_metas(sc)
-        self._view_cache[sc] = (v2, metas)
+        self._cache(sc)[sc] = (v2, metas)
 
     def flush_snapshots_best_effort(self) -> None:
         """Persist view snapshots for any cached scopes (best-effort)."""
 
-        for sc, (view, _metas) in list(self._view_cache.items()):
+        cached = list(self._view_cache.items())
+        if self._global_view_cache is not None and "global" in self._global_view_cache:
+            cached.append(("global", self._global_view_cache["global"]))
+        for sc, (view, _metas) in cached:
             if sc not in ("project", "global"):
                 continue
             if not isinstance(view, ThoughtDbView):
@@ -403,7 +697,8 @@ class ThoughtViewStore:
             try:
                 metas2 = self._scope_metas(sc)
                 self._write_view_snapshot(scope=sc, metas=metas2, view=view)
-                self._view_cache[sc] = (view, metas2)
+                self._publish_shared_view(scope=sc, metas=metas2, view=view)
+                self._cache(sc)[sc] = (view, metas2)
             except Exception:
                 continue
 
@@ -413,17 +708,23 @@ class ThoughtViewStore:
             sc = "project"
 
         metas = self._scope_metas(sc)
-        cached = self._view_cache.get(sc)
+        cached = self._cache(sc).get(sc)
         if cached and cached[1] == metas:
             return cached[0]
 
+        shared = self._load_shared_view(scope=sc, metas=metas)
+        if shared is not None:
+            self._cache(sc)[sc] = (shared, metas)
+            return shared
+
         snap = None
         try:
             snap = self._load_view_snapshot(scope=sc, metas=metas)
         except Exception:
             snap = None
         if snap is not None:
-            self._view_cache[sc] = (snap, metas)
+            self._cache(sc)[sc] = (snap, metas)
+            self._publish_shared_view(scope=sc, metas=metas, view=snap)
             return snap
 
         claims_path = self._claims_path_for_scope(sc)
@@ -511,6 +812,7 @@ class ThoughtViewStore:
                 continue
             node_ts.append((str(n.get("asserted_ts") or "").strip(), nid))
         node_ts.sort(key=lambda x: x[0], reverse=True)
+        sig_by_id = _claim_signature_index(claims_by_id, scope=sc, project_id=pid)
 
         view = ThoughtDbView(
             scope=sc,
@@ -524,60 +826,37 @@ class ThoughtViewStore:
             edges_by_to=edges_by_to,
             claim_ids_by_asserted_ts_desc=[cid for _ts, cid in claim_ts if cid],
             node_ids_by_asserted_ts_desc=[nid for _ts, nid in node_ts if nid],
+            ids_by_source_event=_source_event_index(claims_by_id, nodes_by_id, edges),
+            edge_pos_by_id=_edge_pos_index(edges),
+            aliases_by_canonical=_alias_index(redirects),
+            signature_by_claim_id=sig_by_id,
+            claim_id_by_signature=_signature_owner_index(claims_by_id, sig_by_id, redirects),
+            edge_keys=_edge_key_index(edges),
             redirects_same_as=redirects,
             superseded_ids=superseded,
             retracted_ids=retracted,
             retracted_node_ids=retracted_nodes,
         )
-        self._view_cache[sc] = (view, metas)
+        self._cache(sc)[sc] = (view, metas)
         try:
             self._write_view_snapshot(scope=sc, metas=metas, view=view)
         except Exception:
             pass
+        self._publish_shared_view(scope=sc, metas=metas, view=view)
         return view
 
     def existing_signatures(self, *, scope: str) -> set[str]:
-        v = self.load_view(scope=scope)
-        out: set[str] = set()
-        for c in v.iter_claims(include_inactive=True, include_aliases=True):
-            if not isinstance(c, dict):
-                continue
-            ct = str(c.get("claim_type") or "").strip()
-            text = str(c.get("text") or "").strip()
-            if not ct or not text:
-                continue
-            out.add(claim_signature(claim_type=ct, scope=v.scope, project_id=v.project_id, text=text))
-        return out
+        return set(self.load_view(scope=scope).signature_by_claim_id.values())
 
     def existing_signature_map(self, *, scope: str) -> dict[str, str]:
-        """Return signature -> canonical claim_id for the scope (best-effort)."""
+        """Return signature -> canonical claim_id for the scope (a copy; callers may extend it)."""
 
-        v = self.load_view(scope=scope)
-        out: dict[str, str] = {}
-        for cid, c in v.claims_by_id.items():
-            if cid in v.redirects_same_as:
-                continue
-            if not isinstance(c, dict):
-                continue
-            ct = str(c.get("claim_type") or "").strip()
-            text = str(c.get("text") or "").strip()
-            if not ct or not text:
-                continue
-            sig = claim_signature(claim_type=ct, scope=v.scope, project_id=v.project_id, text=text)
-            if sig and sig not in out:
-                out[sig] = cid
-        return out
+        return dict(self.load_view(scope=scope).claim_id_by_signature)
+
+    def signature_index(self, *, scope: str) -> Mapping[str, str]:
+        """Read-only signature -> canonical claim_id map (no copy; for per-checkpoint dedupe)."""
+
+        return MappingProxyType(self.load_view(scope=scope).claim_id_by_signature)
 
     def existing_edge_keys(self, *, scope: str) -> set[str]:
-        v = self.load_view(scope=scope)
-        out: set[str] = set()
-        for e in v.edges:
-            if not isinstance(e, dict):
-                continue
-            et = str(e.get("edge_type") or "").strip()
-            frm = str(e.get("from_id") or "").strip()
-            to = str(e.get("to_id") or "").strip()
-            if not et or not frm or not to:
-                continue
-            out.add(edge_key(edge_type=et, from_id=frm, to_id=to))
-        return out
+        return set(self.load_view(scope=scope).edge_keys)
@@ -1,24 +1,46 @@
 from __future__ import annotations
 
+import heapq
+import itertools
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 from ..core.paths import GlobalPaths, ProjectPaths
+from ..core.perf import span
 from ..memory.service import MemoryService
-from .context import ThoughtDbContext, build_decide_next_thoughtdb_context
+from .context import (
+    ThoughtDbContext,
+    ThoughtDbContextBase,
+    build_decide_next_thoughtdb_context,
+    build_thoughtdb_context_base,
+    finish_thoughtdb_context,
+)
 from .graph import build_subgraph_for_id
-from .model import claim_signature
+from .model import claim_text_key
 from .store import ThoughtDbStore
 from .why import (
     WhyTraceOutcome,
+    WhyTraceTarget,
     collect_candidate_claims,
     collect_candidate_claims_for_target,
+    collect_why_targets_for_events,
+    evidence_events_for_run,
     find_evidence_event,
     query_from_evidence_event,
     run_why_trace,
+    run_why_trace_batch,
 )
 
 
+def _listing_ts(obj: dict[str, Any]) -> str:
+    return str(obj.get("asserted_ts") or "").strip()
+
+
+def _record_ts(view: Any, kind: str, rid: str) -> str:
+    rec = (view.claims_by_id if kind == "claim" else view.nodes_by_id).get(rid)
+    return _listing_ts(rec) if isinstance(rec, dict) else ""
+
+
 class ThoughtDbApplicationService:
     """Application-facing Thought DB helpers.
 
@@ -58,20 +80,72 @@ class ThoughtDbApplicationService:
         max_query_claims: int = 10,
         max_edges: int = 20,
     ) -> ThoughtDbContext:
-        return build_decide_next_thoughtdb_context(
-            tdb=self._tdb,
+        with span("tdb.decide_context"):
+            return build_decide_next_thoughtdb_context(
+                tdb=self._tdb,
+                as_of_ts=str(as_of_ts or "").strip(),
+                task=str(task or ""),
+                hands_last_message=str(hands_last_message or ""),
+                recent_evidence=recent_evidence if isinstance(recent_evidence, list) else [],
+                mem=self._mem,
+                max_nodes=max_nodes,
+                max_values_claims=max_values_claims,
+                max_pref_goal_claims=max_pref_goal_claims,
+                max_query_claims=max_query_claims,
+                max_edges=max_edges,
+            )
+
+    def build_decide_context_base(
+        self,
+        *,
+        as_of_ts: str,
+        max_nodes: int = 6,
+        max_values_claims: int = 8,
+        max_pref_goal_claims: int = 8,
+    ) -> ThoughtDbContextBase:
+        """Query-independent part of `build_decide_context` (safe to precompute)."""
+
+        with span("tdb.decide_context_base"):
+            return build_thoughtdb_context_base(
+                tdb=self._tdb,
+                as_of_ts=str(as_of_ts or "").strip(),
+                max_nodes=max_nodes,
+                max_values_claims=max_values_claims,
+                max_pref_goal_claims=max_pref_goal_claims,
+            )
+
+    def decide_context_base_is_fresh(self, base: ThoughtDbContextBase, *, as_of_ts: str) -> bool:
+        return base.is_fresh(
+            v_proj=self._tdb.load_view(scope="project"),
+            v_glob=self._tdb.load_view(scope="global"),
             as_of_ts=str(as_of_ts or "").strip(),
-            task=str(task or ""),
-            hands_last_message=str(hands_last_message or ""),
-            recent_evidence=recent_evidence if isinstance(recent_evidence, list) else [],
-            mem=self._mem,
-            max_nodes=max_nodes,
-            max_values_claims=max_values_claims,
-            max_pref_goal_claims=max_pref_goal_claims,
-            max_query_claims=max_query_claims,
-            max_edges=max_edges,
         )
 
+    def finish_decide_context(
+        self,
+        *,
+        base: ThoughtDbContextBase,
+        as_of_ts: str,
+        task: str,
+        hands_last_message: str,
+        recent_evidence: list[dict[str, Any]],
+        max_query_claims: int = 10,
+        max_edges: int = 20,
+    ) -> ThoughtDbContext:
+        """Complete a (fresh) base with the query-dependent part; equals `build_decide_context`."""
+
+        with span("tdb.decide_context_finish"):
+            return finish_thoughtdb_context(
+                base=base,
+                as_of_ts=str(as_of_ts or "").strip(),
+                task=str(task or ""),
+                hands_last_message=str(hands_last_message or ""),
+                recent_evidence=recent_evidence if isinstance(recent_evidence, list) else [],
+                mem=self._mem,
+                max_query_claims=max_query_claims,
+                max_edges=max_edges,
+            )
+
     def build_workflow_edit_context(
         self,
         *,
@@ -184,18 +258,63 @@ class ThoughtDbApplicationService:
                 return found_scope, obj
         return "", None
 
-    def list_effective_claims(
+    def _listing_starts(self, views: list[Any], *, kind: str, after_id: str) -> list[int]:
+        """Per-view start positions for a listing that resumes right after `after_id` (cursor)."""
+
+        def _first_pos(v: Any, cts: str, *, include_equal: bool) -> int:
+            # First position in the (asserted_ts desc) order whose ts is < cts (or <= cts).
+            ids = v.claim_ids_by_asserted_ts_desc if kind == "claim" else v.node_ids_by_asserted_ts_desc
+            lo, hi = 0, len(ids)
+            while lo < hi:
+                mid = (lo + hi) // 2
+                t = _record_ts(v, kind, ids[mid])
+                if t > cts or (t == cts and not include_equal):
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+
+        if not after_id:
+            return [0] * len(views)
+        hit: tuple[int, int, str] | None = None
+        for i, v in enumerate(views):
+            if after_id not in (v.claims_by_id if kind == "claim" else v.nodes_by_id):
+                continue
+            ids = v.claim_ids_by_asserted_ts_desc if kind == "claim" else v.node_ids_by_asserted_ts_desc
+            cts = _record_ts(v, kind, after_id)
+            pos = _first_pos(v, cts, include_equal=True)
+            while pos < len(ids) and ids[pos] != after_id and _record_ts(v, kind, ids[pos]) == cts:
+                pos += 1
+            if pos < len(ids) and ids[pos] == after_id:
+                hit = (i, pos, cts)
+                break
+        if hit is None:
+            raise ValueError(f"unknown {kind} id for --after: {after_id}")
+        ci, cpos, cts = hit
+        # Merged order is (asserted_ts desc, project before global): in another scope, equal-ts items
+        # sort before the cursor when that scope comes first, after it otherwise.
+        return [cpos + 1 if i == ci else _first_pos(v, cts, include_equal=i > ci) for i, v in enumerate(views)]
+
+    def iter_claims_recent_first(
         self,
         *,
+        scope: str,
         include_inactive: bool,
         include_aliases: bool,
         as_of_ts: str,
         filter_fn: Callable[[dict[str, Any]], bool] | None = None,
-    ) -> list[dict[str, Any]]:
-        proj = self._view("project")
-        glob = self._view("global")
-        out: list[dict[str, Any]] = []
-        seen: set[str] = set()
+        after_id: str = "",
+    ) -> Iterator[dict[str, Any]]:
+        """Claims newest first (`asserted_ts` desc), streamed from the views' precomputed orders.
+
+        scope=effective merges project + global (a global claim is skipped when a listed project
+        claim has the same type + normalized text). Items and order equal sorting the full list;
+        the first k items cost O(k). `after_id` resumes right after that claim (cursor pagination).
+        """
+
+        sc = str(scope or "project").strip()
+        views = [self._view("project"), self._view("global")] if sc == "effective" else [self._view(sc)]
+        starts = self._listing_starts(views, kind="claim", after_id=str(after_id or "").strip())
 
         def _ok(obj: dict[str, Any]) -> bool:
             if filter_fn is None:
@@ -205,45 +324,69 @@ class ThoughtDbApplicationService:
             except Exception:
                 return False
 
-        def _sig_for(c: dict[str, Any]) -> str:
-            ct = str(c.get("claim_type") or "").strip()
-            text = str(c.get("text") or "").strip()
-            return claim_signature(claim_type=ct, scope="effective", project_id="", text=text)
+        def _stream(v: Any, start: int) -> Iterator[dict[str, Any]]:
+            ids = v.claim_ids_by_asserted_ts_desc
+            for i in range(start, len(ids)):
+                c = v.claim_for_listing(ids[i], include_inactive=include_inactive, include_aliases=include_aliases, as_of_ts=as_of_ts)
+                if c is not None and _ok(c):
+                    yield c
 
-        for c in proj.iter_claims(include_inactive=include_inactive, include_aliases=include_aliases, as_of_ts=as_of_ts):
-            if not isinstance(c, dict):
-                continue
-            if not _ok(c):
-                continue
-            sig = _sig_for(c)
-            if sig:
-                seen.add(sig)
-            out.append(c)
+        if len(views) == 1:
+            yield from _stream(views[0], starts[0])
+            return
 
-        for c in glob.iter_claims(include_inactive=include_inactive, include_aliases=include_aliases, as_of_ts=as_of_ts):
-            if not isinstance(c, dict):
-                continue
-            if not _ok(c):
-                continue
-            sig = _sig_for(c)
-            if sig and sig in seen:
-                continue
-            out.append(c)
+        proj, glob = views
+        listed: dict[str, bool] = {}
 
-        out.sort(key=lambda x: str(x.get("asserted_ts") or ""), reverse=True)
-        return out
+        def _project_lists(cid: str) -> bool:
+            if cid not in listed:
+                c = proj.claim_for_listing(cid, include_inactive=include_inactive, include_aliases=include_aliases, as_of_ts=as_of_ts)
+                listed[cid] = c is not None and _ok(c)
+            return listed[cid]
 
-    def list_effective_nodes(
+        def _global_stream() -> Iterator[dict[str, Any]]:
+            for c in _stream(glob, starts[1]):
+                key = claim_text_key(claim_type=str(c.get("claim_type") or ""), text=str(c.get("text") or ""))
+                if any(_project_lists(pid) for pid in proj.claim_ids_by_text_key.get(key, ())):
+                    continue
+                yield c
+
+        yield from heapq.merge(_stream(proj, starts[0]), _global_stream(), key=_listing_ts, reverse=True)
+
+    def list_effective_claims(
         self,
         *,
         include_inactive: bool,
         include_aliases: bool,
+        as_of_ts: str,
         filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        limit: int = 0,
+        after_id: str = "",
     ) -> list[dict[str, Any]]:
-        proj = self._view("project")
-        glob = self._view("global")
-        out: list[dict[str, Any]] = []
-        seen: set[str] = set()
+        it = self.iter_claims_recent_first(
+            scope="effective",
+            include_inactive=include_inactive,
+            include_aliases=include_aliases,
+            as_of_ts=as_of_ts,
+            filter_fn=filter_fn,
+            after_id=after_id,
+        )
+        return list(itertools.islice(it, limit)) if limit > 0 else list(it)
+
+    def iter_nodes_recent_first(
+        self,
+        *,
+        scope: str,
+        include_inactive: bool,
+        include_aliases: bool,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        after_id: str = "",
+    ) -> Iterator[dict[str, Any]]:
+        """Nodes newest first; like `iter_claims_recent_first` (effective dedupe is by node_id)."""
+
+        sc = str(scope or "project").strip()
+        views = [self._view("project"), self._view("global")] if sc == "effective" else [self._view(sc)]
+        starts = self._listing_starts(views, kind="node", after_id=str(after_id or "").strip())
 
         def _ok(obj: dict[str, Any]) -> bool:
             if filter_fn is None:
@@ -253,44 +396,81 @@ class ThoughtDbApplicationService:
             except Exception:
                 return False
 
-        for n in proj.iter_nodes(include_inactive=include_inactive, include_aliases=include_aliases):
-            if not isinstance(n, dict):
-                continue
-            if not _ok(n):
-                continue
-            nid = str(n.get("node_id") or "").strip()
-            if nid:
-                seen.add(nid)
-            out.append(n)
+        def _stream(v: Any, start: int) -> Iterator[dict[str, Any]]:
+            ids = v.node_ids_by_asserted_ts_desc
+            for i in range(start, len(ids)):
+                n = v.node_for_listing(ids[i], include_inactive=include_inactive, include_aliases=include_aliases)
+                if n is not None and _ok(n):
+                    yield n
 
-        for n in glob.iter_nodes(include_inactive=include_inactive, include_aliases=include_aliases):
-            if not isinstance(n, dict):
-                continue
-            if not _ok(n):
-                continue
-            nid = str(n.get("node_id") or "").strip()
-            if nid and nid in seen:
-                continue
-            out.append(n)
+        if len(views) == 1:
+            yield from _stream(views[0], starts[0])
+            return
 
-        out.sort(key=lambda x: str(x.get("asserted_ts") or ""), reverse=True)
-        return out
+        proj, glob = views
+
+        def _global_stream() -> Iterator[dict[str, Any]]:
+            for n in _stream(glob, starts[1]):
+                nid = str(n.get("node_id") or "").strip()
+                pn = proj.node_for_listing(nid, include_inactive=include_inactive, include_aliases=include_aliases) if nid else None
+                if pn is not None and _ok(pn):
+                    continue
+                yield n
+
+        yield from heapq.merge(_stream(proj, starts[0]), _global_stream(), key=_listing_ts, reverse=True)
+
+    def list_effective_nodes(
+        self,
+        *,
+        include_inactive: bool,
+        include_aliases: bool,
+        filter_fn: Callable[[dict[str, Any]], bool] | None = None,
+        limit: int = 0,
+        after_id: str = "",
+    ) -> list[dict[str, Any]]:
+        it = self.iter_nodes_recent_first(
+            scope="effective",
+            include_inactive=include_inactive,
+            include_aliases=include_aliases,
+            filter_fn=filter_fn,
+            after_id=after_id,
+        )
+        return list(itertools.islice(it, limit)) if limit > 0 else list(it)
 
     def related_edges_for_id(self, *, scope: str, item_id: str) -> list[dict[str, Any]]:
+        """Edges with `item_id` (or its canonical id) as an endpoint, in append order (adjacency lookups)."""
+
         iid = str(item_id or "").strip()
         if not iid:
             return []
         sc = self._norm_scope(scope)
         v = self._view(sc)
         canon = v.resolve_id(iid)
-        out: list[dict[str, Any]] = []
-        for e in v.edges:
-            if not isinstance(e, dict):
+        found: dict[int, tuple[int, dict[str, Any]]] = {}
+        for k in {iid, canon}:
+            if not k:
                 continue
-            frm = str(e.get("from_id") or "").strip()
-            to = str(e.get("to_id") or "").strip()
-            if iid in (frm, to) or (canon and canon in (frm, to)):
-                out.append(e)
+            for e in (v.edges_by_from.get(k) or []) + (v.edges_by_to.get(k) or []):
+                if isinstance(e, dict) and id(e) not in found:
+                    pos = v.edge_pos_by_id.get(str(e.get("edge_id") or "").strip(), len(v.edges))
+                    found[id(e)] = (pos, e)
+        return [e for _pos, e in sorted(found.values(), key=lambda x: x[0])]
+
+    def derived_from_event(self, event_id: str) -> dict[str, list[dict[str, str]]]:
+        """Claims/nodes/edges (project + global) whose `source_refs` cite an EvidenceLog event."""
+
+        eid = str(event_id or "").strip()
+        out: dict[str, list[dict[str, str]]] = {"claims": [], "nodes": [], "edges": []}
+        if not eid:
+            return out
+        for sc in ("project", "global"):
+            v = self._view(sc)
+            for cid in v.ids_citing_event(eid, kind="claim"):
+                out["claims"].append({"scope": sc, "claim_id": cid, "status": v.claim_status(cid)})
+            for nid in v.ids_citing_event(eid, kind="node"):
+                out["nodes"].append({"scope": sc, "node_id": nid, "status": v.node_status(nid)})
+            for edge_id in v.ids_citing_event(eid, kind="edge"):
+                out["edges"].append({"scope": sc, "edge_id": edge_id})
         return out
 
     def find_evidence_event(self, *, evidence_log_path: Path, event_id: str) -> dict[str, Any] | None:
@@ -407,3 +587,48 @@ class ThoughtDbApplicationService:
             write_edges_from_event_id=write_edges_from_event_id,
             min_write_confidence=float(min_write_confidence),
         )
+
+    def why_targets_for_run(
+        self,
+        *,
+        run_id: str,
+        kinds: set[str],
+        top_k: int,
+        as_of_ts: str,
+    ) -> tuple[str, list[WhyTraceTarget]]:
+        """Resolve a run's EvidenceLog events (`run_id="last"` allowed) and prepare WhyTrace targets in one pass."""
+
+        rid, objs = evidence_events_for_run(evidence_log_path=self._pp.evidence_log_path, run_id=run_id, kinds=kinds)
+        if self._mem is None or not objs:
+            return rid, []
+        return rid, collect_why_targets_for_events(
+            tdb=self._tdb,
+            mem=self._mem,
+            project_paths=self._pp,
+            target_objs=objs,
+            top_k=top_k,
+            as_of_ts=as_of_ts,
+        )
+
+    def run_why_trace_batch(
+        self,
+        *,
+        targets: list[WhyTraceTarget],
+        as_of_ts: str,
+        max_prompt_tokens: int,
+        max_targets_per_call: int,
+        write_edges: bool = True,
+        min_write_confidence: float = 0.7,
+    ) -> list[WhyTraceOutcome]:
+        if self._mind is None:
+            raise RuntimeError("mind provider is not bound")
+        return run_why_trace_batch(
+            mind=self._mind,
+            tdb=self._tdb,
+            targets=targets,
+            as_of_ts=as_of_ts,
+            max_prompt_tokens=int(max_prompt_tokens),
+            max_targets_per_call=int(max_targets_per_call),
+            write_edges=bool(write_edges),
+            min_write_confidence=float(min_write_confidence),
+        )
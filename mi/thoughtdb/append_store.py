@@ -3,7 +3,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Callable
 
-from ..core.storage import append_jsonl, now_rfc3339
+from ..core.storage import append_jsonl, append_jsonl_many, now_rfc3339
+from .compaction import append_lock
 from .model import THOUGHTDB_VERSION, new_claim_id, new_edge_id, new_node_id
 
 
@@ -80,7 +81,9 @@ class ThoughtAppendStore:
             "confidence": float(confidence),
             "notes": (notes or "").strip(),
         }
-        append_jsonl(self._claims_path_for_scope(sc), obj)
+        path = self._claims_path_for_scope(sc)
+        with append_lock(path):
+            append_jsonl(path, obj)
         try:
             self._on_append(sc, obj)
         except Exception:
@@ -113,7 +116,9 @@ class ThoughtAppendStore:
             "rationale": (rationale or "").strip(),
             "source_refs": refs,
         }
-        append_jsonl(self._claims_path_for_scope(sc), obj)
+        path = self._claims_path_for_scope(sc)
+        with append_lock(path):
+            append_jsonl(path, obj)
         try:
             self._on_append(sc, obj)
         except Exception:
@@ -180,7 +185,9 @@ class ThoughtAppendStore:
             "confidence": conf,
             "notes": (notes or "").strip(),
         }
-        append_jsonl(self._nodes_path_for_scope(sc), obj)
+        path = self._nodes_path_for_scope(sc)
+        with append_lock(path):
+            append_jsonl(path, obj)
         try:
             self._on_append(sc, obj)
         except Exception:
@@ -213,13 +220,15 @@ class ThoughtAppendStore:
             "rationale": (rationale or "").strip(),
             "source_refs": refs,
         }
-        append_jsonl(self._nodes_path_for_scope(sc), obj)
+        path = self._nodes_path_for_scope(sc)
+        with append_lock(path):
+            append_jsonl(path, obj)
         try:
             self._on_append(sc, obj)
         except Exception:
             pass
 
-    def append_edge(
+    def _edge_record(
         self,
         *,
         edge_type: str,
@@ -229,7 +238,7 @@ class ThoughtAppendStore:
         visibility: str,
         source_event_ids: list[str],
         notes: str,
-    ) -> str:
+    ) -> dict[str, Any]:
         sc = (scope or "project").strip()
         if sc not in ("project", "global"):
             sc = "project"
@@ -246,28 +255,84 @@ class ThoughtAppendStore:
         if vis not in ("private", "project", "global"):
             vis = "project"
 
-        self._ensure_scope_dirs(sc)
-        eid = new_edge_id()
-        pid = self._project_id_for_scope(sc)
         ev_ids = [str(x).strip() for x in (source_event_ids or []) if str(x).strip()]
         refs = [{"kind": "evidence_event", "event_id": x} for x in ev_ids[:8]]
-        obj: dict[str, Any] = {
+        return {
             "kind": "edge",
             "version": THOUGHTDB_VERSION,
-            "edge_id": eid,
+            "edge_id": new_edge_id(),
             "edge_type": et,
             "from_id": frm,
             "to_id": to,
             "visibility": vis,
             "scope": sc,
-            "project_id": pid,
+            "project_id": self._project_id_for_scope(sc),
             "asserted_ts": now_rfc3339(),
             "source_refs": refs,
             "notes": (notes or "").strip(),
         }
-        append_jsonl(self._edges_path_for_scope(sc), obj)
+
+    def append_edge(
+        self,
+        *,
+        edge_type: str,
+        from_id: str,
+        to_id: str,
+        scope: str,
+        visibility: str,
+        source_event_ids: list[str],
+        notes: str,
+    ) -> str:
+        obj = self._edge_record(
+            edge_type=edge_type,
+            from_id=from_id,
+            to_id=to_id,
+            scope=scope,
+            visibility=visibility,
+            source_event_ids=source_event_ids,
+            notes=notes,
+        )
+        sc = obj["scope"]
+        self._ensure_scope_dirs(sc)
+        path = self._edges_path_for_scope(sc)
+        with append_lock(path):
+            append_jsonl(path, obj)
         try:
             self._on_append(sc, obj)
         except Exception:
             pass
-        return eid
+        return str(obj["edge_id"])
+
+    def append_edges(self, edges: list[dict[str, Any]]) -> list[str]:
+        """Append many edges with one write per scope.
+
+        Each item takes the `append_edge` keyword arguments. Invalid items raise ValueError
+        before anything is written. Returns edge ids in input order.
+        """
+
+        recs = [
+            self._edge_record(
+                edge_type=str(e.get("edge_type") or ""),
+                from_id=str(e.get("from_id") or ""),
+                to_id=str(e.get("to_id") or ""),
+                scope=str(e.get("scope") or "project"),
+                visibility=str(e.get("visibility") or "project"),
+                source_event_ids=list(e.get("source_event_ids") or []),
+                notes=str(e.get("notes") or ""),
+            )
+            for e in edges
+        ]
+        for sc in ("project", "global"):
+            batch = [r for r in recs if r["scope"] == sc]
+            if not batch:
+                continue
+            self._ensure_scope_dirs(sc)
+            path = self._edges_path_for_scope(sc)
+            with append_lock(path):
+                append_jsonl_many(path, batch)
+            for obj in batch:
+                try:
+                    self._on_append(sc, obj)
+                except Exception:
+                    pass
+        return [str(r["edge_id"]) for r in recs]
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import contextlib
 import gzip
 import hashlib
 import json
 import os
+import shutil
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Callable, Iterator
 
-from ..core.storage import ensure_dir, filename_safe_ts, iter_jsonl, now_rfc3339
+from ..core.storage import advisory_lock, ensure_dir, filename_safe_ts, now_rfc3339
+
+# Appenders hold this lock shared for each write; the online compactor takes it exclusively
+# only to copy the concurrent tail and swap files.
+COMPACTION_LOCK_FILENAME = ".compaction.lock"
+
+
+def append_lock(data_path: Path) -> contextlib.AbstractContextManager[None]:
+    """Shared advisory lock for appending to a Thought DB JSONL file."""
+
+    return advisory_lock(Path(data_path).parent / COMPACTION_LOCK_FILENAME, shared=True)
 
 
 def _sha256_file(path: Path) -> str:
@@ -21,7 +33,21 @@ def _sha256_file(path: Path) -> str:
     return h.hexdigest()
 
 
-def _archive_gzip(*, src: Path, dest_gz: Path, dry_run: bool) -> dict[str, Any]:
+def _iter_complete_lines(path: Path, *, limit: int) -> Iterator[bytes]:
+    """Raw newline-terminated lines within the first `limit` bytes (a partial last line is not yielded)."""
+
+    pos = 0
+    with path.open("rb") as f:
+        for line in f:
+            if pos + len(line) > limit or not line.endswith(b"\n"):
+                return
+            pos += len(line)
+            yield line
+
+
+def _archive_gzip(*, src: Path, dest_gz: Path, limit: int, dry_run: bool) -> dict[str, Any]:
+    """Archive the first `limit` bytes of `src` (the compacted prefix) as gzip, streaming."""
+
     src = Path(src).expanduser().resolve()
     dest_gz = Path(dest_gz).expanduser().resolve()
 
@@ -30,16 +56,15 @@ def _archive_gzip(*, src: Path, dest_gz: Path, dry_run: bool) -> dict[str, Any]:
     if dest_gz.exists():
         return {"path": str(src), "status": "skip", "reason": "archive_exists", "archive_path": str(dest_gz)}
 
-    orig_bytes = int(src.stat().st_size)
     if dry_run:
-        return {"path": str(src), "status": "plan", "archive_path": str(dest_gz), "original_bytes": orig_bytes}
+        return {"path": str(src), "status": "plan", "archive_path": str(dest_gz), "original_bytes": int(limit)}
 
     ensure_dir(dest_gz.parent)
     h = hashlib.sha256()
     written = 0
     with src.open("rb") as f_in, gzip.open(dest_gz, "wb") as f_out:
-        while True:
-            chunk = f_in.read(1024 * 1024)
+        while written < limit:
+            chunk = f_in.read(min(1024 * 1024, limit - written))
             if not chunk:
                 break
             h.update(chunk)
@@ -56,116 +81,6 @@ def _archive_gzip(*, src: Path, dest_gz: Path, dry_run: bool) -> dict[str, Any]:
     }
 
 
-def _atomic_write_jsonl(path: Path, rows: Iterable[dict[str, Any]], *, dry_run: bool) -> dict[str, Any]:
-    path = Path(path).expanduser().resolve()
-
-    n = 0
-    out_bytes = 0
-
-    # Precompute a compacted byte size estimate in dry-run without writing a file.
-    if dry_run:
-        for obj in rows:
-            line = json.dumps(obj, sort_keys=True) + "\n"
-            out_bytes += len(line.encode("utf-8"))
-            n += 1
-        return {"path": str(path), "status": "plan", "lines": n, "bytes": out_bytes}
-
-    ensure_dir(path.parent)
-    tmp = path.with_suffix(path.suffix + f".tmp.{os.getpid()}")
-    with tmp.open("w", encoding="utf-8") as f:
-        for obj in rows:
-            line = json.dumps(obj, sort_keys=True) + "\n"
-            out_bytes += len(line.encode("utf-8"))
-            f.write(line)
-            n += 1
-    tmp.replace(path)
-    return {"path": str(path), "status": "written", "lines": n, "bytes": out_bytes}
-
-
-def _compact_claims_jsonl(*, path: Path) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    """Return (rows, stats) for a compacted claims.jsonl (best-effort, strict kinds)."""
-
-    claims_by_id: dict[str, dict[str, Any]] = {}
-    retract_last: dict[str, tuple[int, dict[str, Any]]] = {}
-    unknown: set[str] = set()
-
-    total = 0
-    for idx, obj in enumerate(iter_jsonl(path)):
-        total += 1
-        if not isinstance(obj, dict):
-            continue
-        k = str(obj.get("kind") or "").strip()
-        if k == "claim":
-            cid = str(obj.get("claim_id") or "").strip()
-            if cid:
-                claims_by_id[cid] = obj
-        elif k == "claim_retract":
-            cid = str(obj.get("claim_id") or "").strip()
-            if cid:
-                retract_last[cid] = (idx, obj)
-        elif k:
-            unknown.add(k)
-
-    if unknown:
-        raise ValueError(f"unknown claims record kinds: {sorted(unknown)}")
-
-    creates = list(claims_by_id.values())
-    creates.sort(key=lambda x: (str(x.get("asserted_ts") or "").strip(), str(x.get("claim_id") or "").strip()))
-
-    retracts = [obj for _idx, obj in sorted(retract_last.values(), key=lambda t: t[0])]
-
-    rows = [*creates, *retracts]
-    stats = {
-        "input_lines": total,
-        "output_lines": len(rows),
-        "claims": len(claims_by_id),
-        "retracts": len(retract_last),
-    }
-    return rows, stats
-
-
-def _compact_nodes_jsonl(*, path: Path) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    """Return (rows, stats) for a compacted nodes.jsonl (best-effort, strict kinds)."""
-
-    nodes_by_id: dict[str, dict[str, Any]] = {}
-    retract_last: dict[str, tuple[int, dict[str, Any]]] = {}
-    unknown: set[str] = set()
-
-    total = 0
-    for idx, obj in enumerate(iter_jsonl(path)):
-        total += 1
-        if not isinstance(obj, dict):
-            continue
-        k = str(obj.get("kind") or "").strip()
-        if k == "node":
-            nid = str(obj.get("node_id") or "").strip()
-            if nid:
-                nodes_by_id[nid] = obj
-        elif k == "node_retract":
-            nid = str(obj.get("node_id") or "").strip()
-            if nid:
-                retract_last[nid] = (idx, obj)
-        elif k:
-            unknown.add(k)
-
-    if unknown:
-        raise ValueError(f"unknown nodes record kinds: {sorted(unknown)}")
-
-    creates = list(nodes_by_id.values())
-    creates.sort(key=lambda x: (str(x.get("asserted_ts") or "").strip(), str(x.get("node_id") or "").strip()))
-
-    retracts = [obj for _idx, obj in sorted(retract_last.values(), key=lambda t: t[0])]
-
-    rows = [*creates, *retracts]
-    stats = {
-        "input_lines": total,
-        "output_lines": len(rows),
-        "nodes": len(nodes_by_id),
-        "retracts": len(retract_last),
-    }
-    return rows, stats
-
-
 def _edge_key(obj: dict[str, Any], *, idx: int) -> str:
     et = str(obj.get("edge_type") or "").strip()
     frm = str(obj.get("from_id") or "").strip()
@@ -178,46 +93,102 @@ def _edge_key(obj: dict[str, Any], *, idx: int) -> str:
     return f"idx:{idx}"
 
 
-def _compact_edges_jsonl(*, path: Path) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-    """Return (rows, stats) for a compacted edges.jsonl (keep last per key, preserve last-occurrence order)."""
+# file -> (create kind, retract kind, id field); edges are keyed by `_edge_key` instead.
+_RECORD_KINDS = {
+    "claims": ("claim", "claim_retract", "claim_id"),
+    "nodes": ("node", "node_retract", "node_id"),
+}
 
-    unknown: set[str] = set()
-    last_index: dict[str, int] = {}
 
+def _scan(name: str, *, path: Path, limit: int) -> tuple[set[int], dict[str, Any], int]:
+    """Pass 1: pick the line indices to keep within the first `limit` bytes.
+
+    Claims/nodes keep the last create and the last retract per id; edges keep the last record per
+    (edge_type, from_id, to_id). Only small per-id/per-key line indices are held in memory.
+    Returns (kept line indices, stats, end offset of the last complete line).
+    """
+
+    last: dict[str, int] = {}
+    unknown: set[str] = set()
     total = 0
-    for idx, obj in enumerate(iter_jsonl(path)):
+    end = 0
+    n_create = 0
+    for idx, raw in enumerate(_iter_complete_lines(path, limit=limit)):
+        end += len(raw)
+        if not raw.strip():
+            continue
         total += 1
+        obj = json.loads(raw)
         if not isinstance(obj, dict):
             continue
         k = str(obj.get("kind") or "").strip()
-        if k != "edge":
-            if k:
-                unknown.add(k)
+        if name == "edges":
+            if k != "edge":
+                if k:
+                    unknown.add(k)
+                continue
+            last[_edge_key(obj, idx=idx)] = idx
             continue
-        key = _edge_key(obj, idx=idx)
-        last_index[key] = idx
+        create, retract, id_field = _RECORD_KINDS[name]
+        rid = str(obj.get(id_field) or "").strip()
+        if k == create:
+            if rid:
+                if f"c:{rid}" not in last:
+                    n_create += 1
+                last[f"c:{rid}"] = idx
+        elif k == retract:
+            if rid:
+                last[f"r:{rid}"] = idx
+        elif k:
+            unknown.add(k)
 
     if unknown:
-        raise ValueError(f"unknown edges record kinds: {sorted(unknown)}")
+        raise ValueError(f"unknown {name} record kinds: {sorted(unknown)}")
+
+    keep = set(last.values())
+    if name == "edges":
+        stats = {"input_lines": total, "output_lines": len(keep), "unique_keys": len(last)}
+    else:
+        stats = {"input_lines": total, "output_lines": len(keep), name: n_create, "retracts": len(last) - n_create}
+    return keep, stats, end
 
-    out: list[dict[str, Any]] = []
-    kept = 0
-    for idx, obj in enumerate(iter_jsonl(path)):
-        if not isinstance(obj, dict):
-            continue
-        if str(obj.get("kind") or "").strip() != "edge":
-            continue
-        key = _edge_key(obj, idx=idx)
-        if last_index.get(key) == idx:
-            out.append(obj)
-            kept += 1
-
-    stats = {
-        "input_lines": total,
-        "output_lines": kept,
-        "unique_keys": len(last_index),
-    }
-    return out, stats
+
+def _write_kept(*, path: Path, tmp: Path, keep: set[int], limit: int, dry_run: bool) -> dict[str, Any]:
+    """Pass 2: stream kept lines (verbatim, original order) of the prefix into `tmp`."""
+
+    n = 0
+    out_bytes = 0
+    f_out = None if dry_run else tmp.open("wb")
+    try:
+        for idx, raw in enumerate(_iter_complete_lines(path, limit=limit)):
+            if idx not in keep:
+                continue
+            n += 1
+            out_bytes += len(raw)
+            if f_out is not None:
+                f_out.write(raw)
+    finally:
+        if f_out is not None:
+            f_out.close()
+    return {"path": str(path), "status": "plan" if dry_run else "staged", "lines": n, "bytes": out_bytes}
+
+
+def _swap_in(*, path: Path, tmp: Path, offset: int, ino: int) -> dict[str, Any]:
+    """Append the tail written since `offset` to `tmp` and atomically replace `path` (caller holds the lock)."""
+
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return {"status": "skip", "reason": "vanished", "tail_bytes": 0}
+    if st.st_ino != ino or st.st_size < offset:
+        return {"status": "skip", "reason": "replaced", "tail_bytes": 0}
+    tail = int(st.st_size) - offset
+    if tail:
+        with path.open("rb") as f_in, tmp.open("ab") as f_out:
+            f_in.seek(offset)
+            shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+    os.replace(tmp, path)
+    return {"status": "written", "tail_bytes": tail}
 
 
 def compact_thoughtdb_dir(
@@ -225,18 +196,21 @@ def compact_thoughtdb_dir(
     thoughtdb_dir: Path,
     snapshot_path: Path,
     dry_run: bool,
+    rebuild_snapshot: Callable[[], None] | None = None,
 ) -> dict[str, Any]:
-    """Compact a Thought DB directory (claims/edges/nodes) with archival backup (best-effort).
-
-    - Archives the current JSONL files under thoughtdb_dir/archive/<ts>/ as .gz.
-    - Rewrites claims/edges/nodes JSONL files into a compacted form.
-    - Deletes the persisted view snapshot so it can be rebuilt from compacted files.
+    """Compact a Thought DB directory (claims/edges/nodes) online, with archival backup (best-effort).
+
+    - Records each file's current size and compacts only that prefix, streaming (two passes;
+      memory holds line indices per id/key, not records). Writers keep appending meanwhile.
+    - Archives each compacted prefix under thoughtdb_dir/archive/<ts>/ as .gz.
+    - Under the exclusive compaction lock, appends whatever was written past the recorded offset
+      to the compacted file and atomically replaces the original, then deletes the stale view
+      snapshot. Appenders (`append_lock`) wait only for this short swap.
+    - Calls `rebuild_snapshot` (if given) to write a fresh view snapshot from the compacted files.
     """
 
     tdir = Path(thoughtdb_dir).expanduser().resolve()
-    claims_path = tdir / "claims.jsonl"
-    edges_path = tdir / "edges.jsonl"
-    nodes_path = tdir / "nodes.jsonl"
+    paths = {name: tdir / f"{name}.jsonl" for name in ("claims", "edges", "nodes")}
 
     stamp = filename_safe_ts(now_rfc3339())
     archive_dir = tdir / "archive" / stamp
@@ -249,65 +223,86 @@ def compact_thoughtdb_dir(
         "snapshot": {"path": str(snapshot_path), "deleted": False},
     }
 
-    claims_rows, claims_stats = _compact_claims_jsonl(path=claims_path)
-    edges_rows, edges_stats = _compact_edges_jsonl(path=edges_path)
-    nodes_rows, nodes_stats = _compact_nodes_jsonl(path=nodes_path)
-
-    # Archive current files first (safe, reversible).
-    out["files"]["claims"] = {
-        "archive": _archive_gzip(src=claims_path, dest_gz=archive_dir / "claims.jsonl.gz", dry_run=dry_run),
-        "compact_stats": claims_stats,
-    }
-    out["files"]["edges"] = {
-        "archive": _archive_gzip(src=edges_path, dest_gz=archive_dir / "edges.jsonl.gz", dry_run=dry_run),
-        "compact_stats": edges_stats,
-    }
-    out["files"]["nodes"] = {
-        "archive": _archive_gzip(src=nodes_path, dest_gz=archive_dir / "nodes.jsonl.gz", dry_run=dry_run),
-        "compact_stats": nodes_stats,
-    }
-
-    # Write compacted files.
-    out["files"]["claims"]["write"] = _atomic_write_jsonl(claims_path, claims_rows, dry_run=dry_run)
-    out["files"]["edges"]["write"] = _atomic_write_jsonl(edges_path, edges_rows, dry_run=dry_run)
-    out["files"]["nodes"]["write"] = _atomic_write_jsonl(nodes_path, nodes_rows, dry_run=dry_run)
-
-    # Snapshot invalidates when metas change; delete it explicitly to force rebuild.
-    snap = Path(snapshot_path).expanduser().resolve()
-    if snap.exists():
+    # Pass 1 for every file before touching anything (unknown kinds abort the whole operation).
+    plans: dict[str, tuple[set[int], int, int]] = {}
+    for name, path in paths.items():
+        if not path.is_file():
+            out["files"][name] = {"archive": {"path": str(path), "status": "skip", "reason": "missing"}, "compact_stats": {}}
+            continue
+        st = path.stat()
+        keep, stats, end = _scan(name, path=path, limit=int(st.st_size))
+        plans[name] = (keep, end, int(st.st_ino))
+        out["files"][name] = {"compact_stats": stats, "offset": end}
+
+    staged: dict[str, Path] = {}
+    try:
+        for name, (keep, end, _ino) in plans.items():
+            path = paths[name]
+            out["files"][name]["archive"] = _archive_gzip(src=path, dest_gz=archive_dir / f"{name}.jsonl.gz", limit=end, dry_run=dry_run)
+            tmp = path.with_name(path.name + f".compact.{os.getpid()}")
+            out["files"][name]["write"] = _write_kept(path=path, tmp=tmp, keep=keep, limit=end, dry_run=dry_run)
+            if not dry_run:
+                staged[name] = tmp
+
+        snap = Path(snapshot_path).expanduser().resolve()
         if dry_run:
-            out["snapshot"]["deleted"] = True
-            out["snapshot"]["status"] = "plan_delete"
-        else:
-            try:
-                snap.unlink()
+            if snap.exists():
                 out["snapshot"]["deleted"] = True
-                out["snapshot"]["status"] = "deleted"
-            except Exception as e:
-                out["snapshot"]["status"] = f"delete_failed:{type(e).__name__}"
-
-    if not dry_run:
-        # Emit a small manifest for audit/debug.
-        man = {
-            "kind": "mi.thoughtdb.compaction_manifest",
-            "version": "v1",
-            "ts": now_rfc3339(),
-            "thoughtdb_dir": str(tdir),
-            "files": {
-                "claims": {"path": str(claims_path), "sha256": (_sha256_file(claims_path) if claims_path.exists() else "")},
-                "edges": {"path": str(edges_path), "sha256": (_sha256_file(edges_path) if edges_path.exists() else "")},
-                "nodes": {"path": str(nodes_path), "sha256": (_sha256_file(nodes_path) if nodes_path.exists() else "")},
-            },
-        }
+                out["snapshot"]["status"] = "plan_delete"
+            return out
+
+        with advisory_lock(tdir / COMPACTION_LOCK_FILENAME):
+            for name, tmp in list(staged.items()):
+                _keep, end, ino = plans[name]
+                res = _swap_in(path=paths[name], tmp=tmp, offset=end, ino=ino)
+                out["files"][name]["write"].update(res)
+                if res["status"] == "written":
+                    staged.pop(name)
+            # Snapshot invalidates when metas change; delete it explicitly to force a rebuild.
+            if snap.exists():
+                try:
+                    snap.unlink()
+                    out["snapshot"]["deleted"] = True
+                    out["snapshot"]["status"] = "deleted"
+                except Exception as e:
+                    out["snapshot"]["status"] = f"delete_failed:{type(e).__name__}"
+    finally:
+        for tmp in staged.values():
+            with contextlib.suppress(FileNotFoundError):
+                tmp.unlink()
+
+    if rebuild_snapshot is not None:
         try:
-            ensure_dir(archive_dir)
-            (archive_dir / "manifest.json").write_text(json.dumps(man, indent=2, sort_keys=True) + "\n", encoding="utf-8")
-            out["manifest_path"] = str(archive_dir / "manifest.json")
-        except Exception:
-            pass
+            rebuild_snapshot()
+            out["snapshot"]["rebuilt"] = True
+        except Exception as e:
+            out["snapshot"]["rebuilt"] = False
+            out["snapshot"]["rebuild_error"] = f"{type(e).__name__}: {e}"
+
+    # Emit a small manifest for audit/debug.
+    man = {
+        "kind": "mi.thoughtdb.compaction_manifest",
+        "version": "v1",
+        "ts": now_rfc3339(),
+        "thoughtdb_dir": str(tdir),
+        "files": {
+            name: {
+                "path": str(path),
+                "sha256": (_sha256_file(path) if path.exists() else ""),
+                "compacted_offset": int(out["files"][name].get("offset") or 0),
+                "tail_bytes": int((out["files"][name].get("write") or {}).get("tail_bytes") or 0),
+            }
+            for name, path in paths.items()
+        },
+    }
+    try:
+        ensure_dir(archive_dir)
+        (archive_dir / "manifest.json").write_text(json.dumps(man, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        out["manifest_path"] = str(archive_dir / "manifest.json")
+    except Exception:
+        pass
 
     return out
 
 
-__all__ = ["compact_thoughtdb_dir"]
-
+__all__ = ["COMPACTION_LOCK_FILENAME", "append_lock", "compact_thoughtdb_dir"]
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from ._context_impl import ThoughtDbContext, build_decide_next_thoughtdb_context
-
-__all__ = ["ThoughtDbContext", "build_decide_next_thoughtdb_context"]
+from ._context_impl import (
+    ThoughtDbContext,
+    ThoughtDbContextBase,
+    build_decide_next_thoughtdb_context,
+    build_thoughtdb_context_base,
+    finish_thoughtdb_context,
+)
 
+__all__ = [
+    "ThoughtDbContext",
+    "ThoughtDbContextBase",
+    "build_decide_next_thoughtdb_context",
+    "build_thoughtdb_context_base",
+    "finish_thoughtdb_context",
+]
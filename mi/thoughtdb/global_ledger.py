@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 from typing import Any, Iterable
 
 from ..runtime.evidence import EvidenceWriter, new_run_id
 from ..core.paths import GlobalPaths
-from ..core.storage import iter_jsonl, now_rfc3339
+from ..core.storage import atomic_write_json, iter_jsonl, now_rfc3339, read_json
 
 
 def append_global_event(*, home_dir: Path, kind: str, payload: dict[str, Any]) -> dict[str, Any]:
@@ -31,3 +32,59 @@ def iter_global_events(*, home_dir: Path) -> Iterable[dict[str, Any]]:
     for obj in iter_jsonl(gp.global_evidence_log_path):
         if isinstance(obj, dict):
             yield obj
+
+
+def _last_event_index_path(gp: GlobalPaths) -> Path:
+    return gp.global_dir / "evidence.last_by_kind.json"
+
+
+def last_global_event(*, home_dir: Path, kind: str) -> dict[str, Any] | None:
+    """Newest global EvidenceLog event of `kind` (None when there is none).
+
+    Served from a small pointer index (`global/evidence.last_by_kind.json`: newest event per kind
+    plus the log size/inode it covers). Only the bytes appended since the index was written are
+    scanned; a shrunk or replaced log is rescanned from the start. Derived and safe to delete.
+    """
+
+    gp = GlobalPaths(home_dir=Path(home_dir).expanduser().resolve())
+    log = gp.global_evidence_log_path
+    try:
+        st = log.stat()
+    except FileNotFoundError:
+        return None
+    idx_path = _last_event_index_path(gp)
+    try:
+        idx = read_json(idx_path, default=None)
+    except Exception:
+        idx = None
+    start = 0
+    events: dict[str, Any] = {}
+    if isinstance(idx, dict) and isinstance(idx.get("events"), dict) and idx.get("ino") == st.st_ino:
+        size = idx.get("size")
+        if isinstance(size, int) and 0 <= size <= st.st_size:
+            start = size
+            events = dict(idx["events"])
+
+    if start < st.st_size:
+        end = start
+        with log.open("rb") as f:
+            f.seek(start)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # torn tail (append in progress): pick it up next time
+                end += len(raw)
+                try:
+                    obj = json.loads(raw)
+                except Exception:
+                    continue
+                if isinstance(obj, dict):
+                    k = str(obj.get("kind") or "").strip()
+                    if k:
+                        events[k] = obj
+        try:
+            atomic_write_json(idx_path, {"ino": st.st_ino, "size": end, "events": events})
+        except Exception:
+            pass
+
+    ev = events.get(str(kind or "").strip())
+    return ev if isinstance(ev, dict) else None
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import functools
 import hashlib
 import secrets
 import time
 from dataclasses import dataclass, field
 from typing import Any, Iterable
 
+from .temporal_index import ValidityIndex
+from .token_index import TokenIndex, claim_index_text, node_index_text
+
 THOUGHTDB_VERSION = "v1"
 VIEW_SNAPSHOT_KIND = "mi.thoughtdb.view_snapshot"
 VIEW_SNAPSHOT_VERSION = "v1"
@@ -33,6 +37,12 @@ def claim_signature(*, claim_type: str, scope: str, project_id: str, text: str)
     return hashlib.sha256(base.encode("utf-8")).hexdigest()
 
 
+def claim_text_key(*, claim_type: str, text: str) -> str:
+    """Normalized (claim_type, text) key: equal keys <=> equal `claim_signature` within one scope."""
+
+    return f"{(claim_type or '').strip()}|{_norm_text(text)}"
+
+
 def min_visibility(a: str, b: str) -> str:
     """Return the more restrictive visibility label (private < project < global)."""
 
@@ -50,6 +60,20 @@ def edge_key(*, edge_type: str, from_id: str, to_id: str) -> str:
     return f"{(edge_type or '').strip()}|{(from_id or '').strip()}|{(to_id or '').strip()}"
 
 
+def source_event_ids(obj: dict[str, Any]) -> list[str]:
+    """EvidenceLog event ids cited by a record's `source_refs` (in order, deduped)."""
+
+    refs = obj.get("source_refs") if isinstance(obj.get("source_refs"), list) else []
+    out: list[str] = []
+    for r in refs:
+        if not isinstance(r, dict):
+            continue
+        eid = str(r.get("event_id") or "").strip()
+        if eid and eid not in out:
+            out.append(eid)
+    return out
+
+
 def follow_redirects(start: str, redirects: dict[str, str], *, limit: int = 20) -> str:
     cur = (start or "").strip()
     if not cur:
@@ -86,6 +110,21 @@ class ThoughtDbView:
     edges_by_to: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
     claim_ids_by_asserted_ts_desc: list[str] = field(default_factory=list)
     node_ids_by_asserted_ts_desc: list[str] = field(default_factory=list)
+    # Provenance: EvidenceLog event_id -> ids of claims/nodes/edges whose `source_refs` cite it (append order).
+    ids_by_source_event: dict[str, list[str]] = field(default_factory=dict)
+    # edge_id -> position in `edges` (first occurrence); canonical id -> ids that same_as-redirect to it.
+    edge_pos_by_id: dict[str, int] = field(default_factory=dict)
+    aliases_by_canonical: dict[str, set[str]] = field(default_factory=dict)
+    # Word -> ids inverted indices over claim text / node title+text (None = build lazily on first use).
+    claim_token_index: TokenIndex | None = None
+    node_token_index: TokenIndex | None = None
+    # Dedupe indices for mining: claim_id -> `claim_signature`, signature -> first non-alias claim id
+    # (claims_by_id order), and `edge_key`s of all edges. Maintained on append like the indices above.
+    signature_by_claim_id: dict[str, str] = field(default_factory=dict)
+    claim_id_by_signature: dict[str, str] = field(default_factory=dict)
+    edge_keys: set[str] = field(default_factory=set)
+    # Claim validity windows with sorted boundaries for `as_of_ts` queries (None = build lazily on first use).
+    claim_validity_index: ValidityIndex | None = None
 
     def resolve_id(self, claim_id: str) -> str:
         return follow_redirects(claim_id, self.redirects_same_as)
@@ -114,7 +153,7 @@ class ThoughtDbView:
         - as_of_ts (RFC3339) filters by valid_from/valid_to when provided.
         """
 
-        t = (as_of_ts or "").strip()
+        hidden = self.claim_validity.invalid_at(as_of_ts) if (as_of_ts or "").strip() else set()
         for cid, c in self.claims_by_id.items():
             if not isinstance(c, dict):
                 continue
@@ -123,20 +162,117 @@ class ThoughtDbView:
             status = self.claim_status(cid)
             if not include_inactive and status != "active":
                 continue
-
-            if t:
-                vf = c.get("valid_from")
-                vt = c.get("valid_to")
-                if isinstance(vf, str) and vf.strip() and vf.strip() > t:
-                    continue
-                if isinstance(vt, str) and vt.strip() and t >= vt.strip():
-                    continue
+            if cid in hidden:
+                continue
 
             out = dict(c)
             out["status"] = status
             out["canonical_id"] = self.resolve_id(cid)
             yield out
 
+    def claim_for_listing(
+        self,
+        claim_id: str,
+        *,
+        include_inactive: bool,
+        include_aliases: bool,
+        as_of_ts: str = "",
+    ) -> dict[str, Any] | None:
+        """One claim as `iter_claims` would yield it (None when absent or filtered out)."""
+
+        c = self.claims_by_id.get(claim_id)
+        if not isinstance(c, dict):
+            return None
+        if not include_aliases and claim_id in self.redirects_same_as:
+            return None
+        status = self.claim_status(claim_id)
+        if not include_inactive and status != "active":
+            return None
+        if not self.claim_validity.valid_at(claim_id, as_of_ts):
+            return None
+        out = dict(c)
+        out["status"] = status
+        out["canonical_id"] = self.resolve_id(claim_id)
+        return out
+
+    # Lazily built lookup. A view is never mutated after construction (appends build a new view),
+    # so caching on the instance is safe.
+    @functools.cached_property
+    def claim_ids_by_text_key(self) -> dict[str, list[str]]:
+        """`claim_text_key` -> claim ids (for effective project/global dedupe without hashing every claim)."""
+
+        out: dict[str, list[str]] = {}
+        for cid, c in self.claims_by_id.items():
+            if isinstance(c, dict):
+                key = claim_text_key(claim_type=str(c.get("claim_type") or ""), text=str(c.get("text") or ""))
+                out.setdefault(key, []).append(cid)
+        return out
+
+    @functools.cached_property
+    def claim_tokens(self) -> TokenIndex:
+        if self.claim_token_index is not None:
+            return self.claim_token_index
+        return TokenIndex.build((cid, claim_index_text(c)) for cid, c in self.claims_by_id.items() if isinstance(c, dict))
+
+    @functools.cached_property
+    def node_tokens(self) -> TokenIndex:
+        if self.node_token_index is not None:
+            return self.node_token_index
+        return TokenIndex.build((nid, node_index_text(n)) for nid, n in self.nodes_by_id.items() if isinstance(n, dict))
+
+    @functools.cached_property
+    def claim_validity(self) -> ValidityIndex:
+        if self.claim_validity_index is not None:
+            return self.claim_validity_index
+        return ValidityIndex.build((cid, c) for cid, c in self.claims_by_id.items() if isinstance(c, dict))
+
+    def claim_valid_at(self, claim_id: str, as_of_ts: str) -> bool:
+        """True iff `as_of_ts` (RFC3339; empty = no filter) falls in the claim's valid_from/valid_to window."""
+
+        return self.claim_validity.valid_at((claim_id or "").strip(), as_of_ts)
+
+    def validity_index_built(self) -> ValidityIndex | None:
+        return self.__dict__.get("claim_validity", self.claim_validity_index)
+
+    def token_indexes_built(self) -> tuple[TokenIndex | None, TokenIndex | None]:
+        """(claim, node) token indices if already materialized (no build)."""
+
+        d = self.__dict__
+        return d.get("claim_tokens", self.claim_token_index), d.get("node_tokens", self.node_token_index)
+
+    def ids_citing_event(self, event_id: str, *, kind: str = "") -> list[str]:
+        """Claim/node/edge ids derived from an EvidenceLog event (kind: claim|node|edge; empty = all)."""
+
+        ids = self.ids_by_source_event.get((event_id or "").strip()) or []
+        k = (kind or "").strip()
+        if k == "claim":
+            return [x for x in ids if x in self.claims_by_id]
+        if k == "node":
+            return [x for x in ids if x in self.nodes_by_id]
+        if k == "edge":
+            return [x for x in ids if x not in self.claims_by_id and x not in self.nodes_by_id]
+        return list(ids)
+
+    def edge_by_id(self, edge_id: str) -> dict[str, Any] | None:
+        pos = self.edge_pos_by_id.get((edge_id or "").strip())
+        if pos is None or pos >= len(self.edges):
+            return None
+        e = self.edges[pos]
+        return e if isinstance(e, dict) else None
+
+    def aliases_of(self, canonical_id: str) -> set[str]:
+        """Ids whose same_as redirects resolve to `canonical_id` (excluding itself)."""
+
+        return self.aliases_by_canonical.get((canonical_id or "").strip()) or set()
+
+    def claim_id_for_signature(self, signature: str) -> str:
+        """Canonical claim id with this `claim_signature` ("" when none)."""
+
+        return self.claim_id_by_signature.get((signature or "").strip(), "")
+
+    def has_edge_key(self, key: str) -> bool:
+        return (key or "").strip() in self.edge_keys
+
     def node_status(self, node_id: str) -> str:
         nid = (node_id or "").strip()
         if not nid:
@@ -167,3 +303,19 @@ class ThoughtDbView:
             out["status"] = status
             out["canonical_id"] = self.resolve_id(nid)
             yield out
+
+    def node_for_listing(self, node_id: str, *, include_inactive: bool, include_aliases: bool) -> dict[str, Any] | None:
+        """One node as `iter_nodes` would yield it (None when absent or filtered out)."""
+
+        n = self.nodes_by_id.get(node_id)
+        if not isinstance(n, dict):
+            return None
+        if not include_aliases and node_id in self.redirects_same_as:
+            return None
+        status = self.node_status(node_id)
+        if not include_inactive and status != "active":
+            return None
+        out = dict(n)
+        out["status"] = status
+        out["canonical_id"] = self.resolve_id(node_id)
+        return out
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from .global_ledger import append_global_event, iter_global_events
+from .global_ledger import append_global_event, last_global_event
 from .pins import ASK_WHEN_UNCERTAIN_TAG, REFACTOR_INTENT_TAG
 from ..core.storage import now_rfc3339
 from .store import ThoughtDbStore, ThoughtDbView, claim_signature
@@ -67,24 +67,25 @@ def _tagset(obj: dict[str, Any]) -> set[str]:
 def _find_tagged_claim(*, view: ThoughtDbView, as_of_ts: str, tag: str) -> dict[str, Any] | None:
     """Find the newest active canonical preference/goal claim with a given tag (best-effort)."""
 
-    best: dict[str, Any] | None = None
-    best_ts = ""
     want = str(tag or "").strip()
     if not want:
         return None
-    for c in view.iter_claims(include_inactive=False, include_aliases=False, as_of_ts=as_of_ts):
-        if not isinstance(c, dict):
+    # Only claims carrying the tag can match: walk the tag index instead of every claim.
+    hits: list[dict[str, Any]] = []
+    for cid in view.claims_by_tag.get(want) or ():
+        c = view.claim_for_listing(cid, include_inactive=False, include_aliases=False, as_of_ts=as_of_ts)
+        if c is None or str(c.get("claim_type") or "").strip() not in ("preference", "goal") or want not in _tagset(c):
             continue
-        ct = str(c.get("claim_type") or "").strip()
-        if ct not in ("preference", "goal"):
-            continue
-        if want not in _tagset(c):
-            continue
-        ts = str(c.get("asserted_ts") or "").strip()
-        if ts >= best_ts:
-            best = c
-            best_ts = ts
-    return best
+        hits.append(c)
+    if not hits:
+        return None
+    best_ts = max(str(c.get("asserted_ts") or "").strip() for c in hits)
+    tied = [c for c in hits if str(c.get("asserted_ts") or "").strip() == best_ts]
+    if len(tied) == 1:
+        return tied[0]
+    # Newest wins; among equal timestamps the one appended last (claims_by_id order), as a full scan would pick.
+    order = {cid: i for i, cid in enumerate(view.claims_by_id)}
+    return max(tied, key=lambda c: order.get(str(c.get("claim_id") or ""), -1))
 
 
 @dataclass(frozen=True)
@@ -108,14 +109,22 @@ def resolve_operational_defaults(
     tdb: ThoughtDbStore,
     as_of_ts: str,
 ) -> OperationalDefaults:
-    """Resolve operational defaults from canonical Thought DB claims (project overrides global)."""
+    """Resolve operational defaults from canonical Thought DB claims (project overrides global).
+
+    Memoised per (project view, global view) generation until the next claim validity boundary.
+    """
+
+    return tdb.memo_for_views(
+        "operational_defaults",
+        as_of_ts=as_of_ts,
+        build=lambda v_proj, v_glob: _resolve_operational_defaults(v_proj=v_proj, v_glob=v_glob, as_of_ts=as_of_ts),
+    )
+
 
+def _resolve_operational_defaults(*, v_proj: ThoughtDbView, v_glob: ThoughtDbView, as_of_ts: str) -> OperationalDefaults:
     fb_ref = DEFAULT_REFACTOR_INTENT
     fb_ask = bool(DEFAULT_ASK_WHEN_UNCERTAIN)
 
-    v_proj = tdb.load_view(scope="project")
-    v_glob = tdb.load_view(scope="global")
-
     ask_src: dict[str, str] = {"scope": "", "claim_id": ""}
     ref_src: dict[str, str] = {"scope": "", "claim_id": ""}
 
@@ -149,17 +158,11 @@ def resolve_operational_defaults(
 
 
 def _last_defaults_event(*, home_dir: Path) -> tuple[str, dict[str, Any]]:
-    last_id = ""
-    last_payload: dict[str, Any] = {}
-    for ev in iter_global_events(home_dir=home_dir):
-        if not isinstance(ev, dict):
-            continue
-        if str(ev.get("kind") or "").strip() != DEFAULTS_EVENT_KIND:
-            continue
-        last_id = str(ev.get("event_id") or "").strip()
-        payload = ev.get("payload") if isinstance(ev.get("payload"), dict) else {}
-        last_payload = payload if isinstance(payload, dict) else {}
-    return last_id, last_payload
+    ev = last_global_event(home_dir=home_dir, kind=DEFAULTS_EVENT_KIND)
+    if not isinstance(ev, dict):
+        return "", {}
+    payload = ev.get("payload") if isinstance(ev.get("payload"), dict) else {}
+    return str(ev.get("event_id") or "").strip(), payload
 
 
 def ensure_operational_defaults_claims_current(
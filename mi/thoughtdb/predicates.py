@@ -15,18 +15,9 @@ def claim_active_and_valid(view: ThoughtDbView, claim_id: str, *, as_of_ts: str)
         return False
     if view.claim_status(cid) != "active":
         return False
-    c = view.claims_by_id.get(cid)
-    if not isinstance(c, dict):
+    if not isinstance(view.claims_by_id.get(cid), dict):
         return False
-    t = str(as_of_ts or "").strip()
-    if t:
-        vf = c.get("valid_from")
-        vt = c.get("valid_to")
-        if isinstance(vf, str) and vf.strip() and vf.strip() > t:
-            return False
-        if isinstance(vt, str) and vt.strip() and t >= vt.strip():
-            return False
-    return True
+    return view.claim_valid_at(cid, as_of_ts)
 
 
 def node_active(view: ThoughtDbView, node_id: str) -> bool:
@@ -5,7 +5,7 @@ from typing import Any
 
 from ..memory.service import MemoryService
 from ..memory.types import MemoryItem
-from .predicates import claim_active_and_valid, edges_adjacent, node_active
+from .predicates import claim_active_and_valid, node_active
 from .store import ThoughtDbView
 
 
@@ -175,38 +175,41 @@ def expand_one_hop(
 
     for view in (v_proj, v_glob):  # prefer project edges
         for sid in sorted(seeds):
-            for e in edges_adjacent(view, sid):
-                if len(added_claims) >= max_c and len(added_nodes) >= max_n:
-                    break
-                if not isinstance(e, dict):
-                    continue
-                if str(e.get("kind") or "").strip() != "edge":
-                    continue
-                et = str(e.get("edge_type") or "").strip()
-                if et not in allow:
-                    continue
-                frm = str(e.get("from_id") or "").strip()
-                to = str(e.get("to_id") or "").strip()
-                if not frm or not to:
-                    continue
-                ek = f"{view.scope}:{et}:{frm}->{to}"
-                if ek in seen_edges:
-                    continue
-                seen_edges.add(ek)
-
-                other = to if frm == sid else (frm if to == sid else "")
-                if not other or other in seeds or other in seen_added:
-                    continue
-                knd = classify(other)
-                if not knd or not ok_other(other, knd):
-                    continue
-
-                if knd == "claim" and len(added_claims) < max_c:
-                    added_claims.append(other)
-                    seen_added.add(other)
-                elif knd == "node" and len(added_nodes) < max_n:
-                    added_nodes.append(other)
-                    seen_added.add(other)
+            # Walk the adjacency lists in place (out-edges, then in-edges); the far end is known
+            # from the list, so no per-edge list copies or endpoint comparisons.
+            for adj, far in ((view.edges_by_from.get(sid), "to_id"), (view.edges_by_to.get(sid), "from_id")):
+                for e in adj or ():
+                    if len(added_claims) >= max_c and len(added_nodes) >= max_n:
+                        break
+                    if not isinstance(e, dict):
+                        continue
+                    if str(e.get("kind") or "").strip() != "edge":
+                        continue
+                    et = str(e.get("edge_type") or "").strip()
+                    if et not in allow:
+                        continue
+                    frm = str(e.get("from_id") or "").strip()
+                    to = str(e.get("to_id") or "").strip()
+                    if not frm or not to:
+                        continue
+                    ek = f"{view.scope}:{et}:{frm}->{to}"
+                    if ek in seen_edges:
+                        continue
+                    seen_edges.add(ek)
+
+                    other = to if far == "to_id" else frm
+                    if other in seeds or other in seen_added:
+                        continue
+                    knd = classify(other)
+                    if not knd or not ok_other(other, knd):
+                        continue
+
+                    if knd == "claim" and len(added_claims) < max_c:
+                        added_claims.append(other)
+                        seen_added.add(other)
+                    elif knd == "node" and len(added_nodes) < max_n:
+                        added_nodes.append(other)
+                        seen_added.add(other)
             if len(added_claims) >= max_c and len(added_nodes) >= max_n:
                 break
         if len(added_claims) >= max_c and len(added_nodes) >= max_n:
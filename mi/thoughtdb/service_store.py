@@ -51,14 +51,10 @@ class ThoughtServiceStore:
         edges_in = mined_edges if isinstance(mined_edges, list) else []
 
         # Dedup obvious identical claims per-scope; also allow linking to an existing canonical claim id.
-        existing_sig_to_id = {
-            "project": self._view.existing_signature_map(scope="project"),
-            "global": self._view.existing_signature_map(scope="global"),
-        }
-        existing_sig = {
-            "project": set(existing_sig_to_id["project"].keys()),
-            "global": set(existing_sig_to_id["global"].keys()),
-        }
+        # Lookups hit the views' maintained signature index (O(1) per candidate); `written_sig_to_id`
+        # covers claims written by this call.
+        sig_views = {"project": self._view.load_view(scope="project"), "global": self._view.load_view(scope="global")}
+        written_sig_to_id: dict[str, dict[str, str]] = {"project": {}, "global": {}}
 
         # Filter and sort claims by confidence descending.
         sugs: list[dict[str, Any]] = []
@@ -118,14 +114,11 @@ class ThoughtServiceStore:
                 continue
 
             sig = claim_signature(claim_type=ct, scope=scope, project_id=self._project_id_for_scope(scope), text=text)
-            if sig in existing_sig.get(scope, set()):
-                existing_id = existing_sig_to_id.get(scope, {}).get(sig, "")
-                if existing_id:
-                    local_to_claim[local_id] = existing_id
-                    local_meta[local_id] = {"scope": scope, "visibility": vis}
-                    linked_existing.append({"local_id": local_id, "claim_id": existing_id, "scope": scope})
-                    continue
-                skipped.append({"kind": "claim", "reason": "duplicate_signature", "detail": text[:200]})
+            existing_id = written_sig_to_id[scope].get(sig) or sig_views[scope].claim_id_for_signature(sig)
+            if existing_id:
+                local_to_claim[local_id] = existing_id
+                local_meta[local_id] = {"scope": scope, "visibility": vis}
+                linked_existing.append({"local_id": local_id, "claim_id": existing_id, "scope": scope})
                 continue
 
             vf = raw.get("valid_from")
@@ -157,18 +150,14 @@ class ThoughtServiceStore:
                 skipped.append({"kind": "claim", "reason": f"write_error:{type(e).__name__}", "detail": text[:200]})
                 continue
 
-            existing_sig.setdefault(scope, set()).add(sig)
-            existing_sig_to_id.setdefault(scope, {})[sig] = cid
+            written_sig_to_id[scope][sig] = cid
             local_to_claim[local_id] = cid
             local_meta[local_id] = {"scope": scope, "visibility": vis}
             written.append({"local_id": local_id, "claim_id": cid, "scope": scope})
 
         # Apply edges (optional, best-effort). Edge refs can be local_id or existing claim_id.
         written_edges: list[dict[str, str]] = []
-        edge_keys_by_scope = {
-            "project": self._view.existing_edge_keys(scope="project"),
-            "global": self._view.existing_edge_keys(scope="global"),
-        }
+        written_edge_keys: dict[str, set[str]] = {"project": set(), "global": set()}
         view_project = self._view.load_view(scope="project")
         view_global = self._view.load_view(scope="global")
 
@@ -230,7 +219,7 @@ class ThoughtServiceStore:
                 continue
 
             ek = edge_key(edge_type=et, from_id=frm_id, to_id=to_id)
-            if ek in edge_keys_by_scope.get(sc, set()):
+            if ek in written_edge_keys[sc] or (view_project if sc == "project" else view_global).has_edge_key(ek):
                 skipped.append({"kind": "edge", "reason": "duplicate_edge", "detail": ek})
                 continue
 
@@ -250,7 +239,7 @@ class ThoughtServiceStore:
                 skipped.append({"kind": "edge", "reason": f"write_error:{type(e).__name__}", "detail": ek})
                 continue
 
-            edge_keys_by_scope.setdefault(sc, set()).add(ek)
+            written_edge_keys[sc].add(ek)
             written_edges.append({"edge_id": eid, "scope": sc, "edge_type": et, "from_id": frm_id, "to_id": to_id})
 
         return {
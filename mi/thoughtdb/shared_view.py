@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import gc
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+from dataclasses import fields
+from pathlib import Path
+from typing import Any
+
+from .model import ThoughtDbView
+from .temporal_index import ValidityIndex
+from .token_index import TokenIndex
+
+# Immutable, generation-stamped image of a fully materialized global view (base records plus every
+# derived index), shared by all MI processes of one home. Readers map the file and unmarshal it
+# directly, skipping JSON parsing and index rebuilds; writers replace it atomically, so a reader
+# never sees a partial image. A stale image (source metas differ) is ignored.
+SHARED_VIEW_FILENAME = "view.shared.bin"
+SHARED_VIEW_KIND = "mi.thoughtdb.shared_view"
+
+_MAGIC = b"MIVIEW1\n"
+_LEN = struct.Struct(">I")
+# marshal's format is interpreter-specific: an image written by another Python is ignored.
+_FORMAT = f"marshal{marshal.version}:py{sys.version_info[0]}.{sys.version_info[1]}"
+# Index objects are stored as their plain-data form.
+_INDEX_FIELDS = ("claim_token_index", "node_token_index", "claim_validity_index")
+
+
+def read_shared_view_header(path: Path) -> dict[str, Any] | None:
+    """Header of a shared view image (kind/format/generation/source_metas/project_id), or None."""
+
+    try:
+        with open(path, "rb") as f:
+            head = f.read(len(_MAGIC) + _LEN.size)
+            if len(head) < len(_MAGIC) + _LEN.size or not head.startswith(_MAGIC):
+                return None
+            (n,) = _LEN.unpack_from(head, len(_MAGIC))
+            obj = json.loads(f.read(n).decode("utf-8"))
+    except Exception:
+        return None
+    if not isinstance(obj, dict) or obj.get("kind") != SHARED_VIEW_KIND or obj.get("format") != _FORMAT:
+        return None
+    return obj
+
+
+def load_shared_view(path: Path, *, source_metas: dict[str, Any], project_id: str) -> tuple[int, ThoughtDbView] | None:
+    """(generation, view) from a shared image built from files with `source_metas` (None otherwise)."""
+
+    header = read_shared_view_header(path)
+    if header is None or header.get("source_metas") != source_metas or str(header.get("project_id") or "") != project_id:
+        return None
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = len(_MAGIC) + _LEN.size + _LEN.unpack_from(mm, len(_MAGIC))[0]
+            # The image is one big tree of fresh containers: cyclic GC passes during the load only cost time.
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                with memoryview(mm) as buf:
+                    state = marshal.loads(buf[start:])
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+    except Exception:
+        return None
+    if not isinstance(state, dict):
+        return None
+    try:
+        claims_by_id = state["claims_by_id"]
+        nodes_by_id = state["nodes_by_id"]
+        for name in ("claim_token_index", "node_token_index"):
+            ids = claims_by_id if name == "claim_token_index" else nodes_by_id
+            state[name] = TokenIndex.from_obj(state.get(name), ids=ids) if state.get(name) is not None else None
+        windows = state.get("claim_validity_index")
+        state["claim_validity_index"] = ValidityIndex(windows) if isinstance(windows, dict) else None
+        view = ThoughtDbView(**state)
+    except Exception:
+        return None
+    try:
+        generation = int(header.get("generation") or 0)
+    except Exception:
+        generation = 0
+    return generation, view
+
+
+def write_shared_view(path: Path, *, view: ThoughtDbView, source_metas: dict[str, Any]) -> int:
+    """Atomically publish `view` as the shared image; returns the new generation."""
+
+    prev = read_shared_view_header(path) or {}
+    try:
+        generation = int(prev.get("generation") or 0) + 1
+    except Exception:
+        generation = 1
+    state = {f.name: getattr(view, f.name) for f in fields(view) if f.name not in _INDEX_FIELDS}
+    claim_tokens, node_tokens = view.token_indexes_built()
+    validity = view.validity_index_built()
+    state["claim_token_index"] = claim_tokens.to_obj() if claim_tokens is not None else None
+    state["node_token_index"] = node_tokens.to_obj() if node_tokens is not None else None
+    state["claim_validity_index"] = validity.windows if validity is not None else None
+    header = json.dumps(
+        {
+            "kind": SHARED_VIEW_KIND,
+            "format": _FORMAT,
+            "generation": generation,
+            "scope": view.scope,
+            "project_id": str(view.project_id or ""),
+            "source_metas": source_metas,
+        },
+        sort_keys=True,
+    ).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.tmp.{os.getpid()}")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_MAGIC)
+            f.write(_LEN.pack(len(header)))
+            f.write(header)
+            f.write(marshal.dumps(state))
+        # Readers that already mapped the previous image keep their (unlinked) inode.
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return generation
+
+
+__all__ = [
+    "SHARED_VIEW_FILENAME",
+    "SHARED_VIEW_KIND",
+    "load_shared_view",
+    "read_shared_view_header",
+    "write_shared_view",
+]
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Mapping
 
 from ..core.paths import GlobalPaths, ProjectPaths
+from ..core.perf import span
 from ..core.storage import ensure_dir, iter_jsonl
 from .append_store import ThoughtAppendStore
 from .model import (
@@ -14,6 +15,7 @@ from .model import (
     new_node_id,
 )
 from .service_store import ThoughtServiceStore
+from .shared_view import SHARED_VIEW_FILENAME
 from .view_store import ThoughtViewStore
 
 
@@ -29,7 +31,14 @@ class ThoughtDbStore:
     - ThoughtServiceStore: mined-output application and business rules
     """
 
-    def __init__(self, *, home_dir: Path, project_paths: ProjectPaths) -> None:
+    def __init__(
+        self,
+        *,
+        home_dir: Path,
+        project_paths: ProjectPaths,
+        global_view_cache: dict[str, Any] | None = None,
+        shared_global_view: bool = False,
+    ) -> None:
         self._home_dir = Path(home_dir).expanduser().resolve()
         self._project_paths = project_paths
         self._gp = GlobalPaths(home_dir=self._home_dir)
@@ -42,6 +51,8 @@ class ThoughtDbStore:
             project_id_for_scope=self._project_id_for_scope,
             scope_metas=self._scope_metas,
             view_snapshot_path=self._view_snapshot_path,
+            global_view_cache=global_view_cache,
+            shared_view_path=self._shared_view_path if shared_global_view else None,
         )
         self._append = ThoughtAppendStore(
             claims_path_for_scope=self._claims_path,
@@ -56,6 +67,8 @@ class ThoughtDbStore:
             view_store=self._view,
             project_id_for_scope=self._project_id_for_scope,
         )
+        # key -> (v_proj, v_glob, as_of_ts, valid_until_ts, value); see `memo_for_views`.
+        self._view_memo: dict[str, tuple[ThoughtDbView, ThoughtDbView, str, str, Any]] = {}
 
     @property
     def home_dir(self) -> Path:
@@ -111,12 +124,40 @@ class ThoughtDbStore:
             return self._gp.thoughtdb_global_dir / "view.snapshot.json"
         return self._project_paths.thoughtdb_dir / "view.snapshot.json"
 
+    def _shared_view_path(self, scope: str) -> Path:
+        return self._gp.thoughtdb_global_dir / SHARED_VIEW_FILENAME
+
     # View layer
     def flush_snapshots_best_effort(self) -> None:
         self._view.flush_snapshots_best_effort()
 
     def load_view(self, *, scope: str) -> ThoughtDbView:
-        return self._view.load_view(scope=scope)
+        with span("tdb.load_view"):
+            return self._view.load_view(scope=scope)
+
+    def ids_citing_event(self, *, scope: str, event_id: str, kind: str = "") -> list[str]:
+        """Claim/node/edge ids whose `source_refs` cite `event_id` (provenance index; O(hits))."""
+
+        return self.load_view(scope=scope).ids_citing_event(event_id, kind=kind)
+
+    def memo_for_views(self, key: str, *, as_of_ts: str, build: Callable[[ThoughtDbView, ThoughtDbView], Any]) -> Any:
+        """Memoise `build(v_proj, v_glob)` for results that depend only on the views and `as_of_ts`.
+
+        A view object is never mutated (appends and reloads produce a new one), so view identity is
+        its generation. The value is reused while both views are the same objects and `as_of_ts`
+        has not crossed the next claim validity boundary. Callers must not mutate the value.
+        """
+
+        v_proj = self.load_view(scope="project")
+        v_glob = self.load_view(scope="global")
+        t = str(as_of_ts or "").strip()
+        hit = self._view_memo.get(key)
+        if hit is not None and hit[0] is v_proj and hit[1] is v_glob and hit[2] <= t and (not hit[3] or t < hit[3]):
+            return hit[4]
+        value = build(v_proj, v_glob)
+        bounds = [b for b in (v_proj.claim_validity.next_boundary_after(t), v_glob.claim_validity.next_boundary_after(t)) if b]
+        self._view_memo[key] = (v_proj, v_glob, t, min(bounds) if bounds else "", value)
+        return value
 
     def existing_signatures(self, *, scope: str) -> set[str]:
         return self._view.existing_signatures(scope=scope)
@@ -124,6 +165,9 @@ class ThoughtDbStore:
     def existing_signature_map(self, *, scope: str) -> dict[str, str]:
         return self._view.existing_signature_map(scope=scope)
 
+    def signature_index(self, *, scope: str) -> Mapping[str, str]:
+        return self._view.signature_index(scope=scope)
+
     def existing_edge_keys(self, *, scope: str) -> set[str]:
         return self._view.existing_edge_keys(scope=scope)
 
@@ -231,6 +275,9 @@ class ThoughtDbStore:
             notes=notes,
         )
 
+    def append_edges(self, edges: list[dict[str, Any]]) -> list[str]:
+        return self._append.append_edges(edges)
+
     # Service layer
     def apply_mined_output(
         self,
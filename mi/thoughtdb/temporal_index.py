@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import bisect
+import functools
+from typing import Any, Iterable
+
+
+def validity_window(c: dict[str, Any]) -> tuple[str, str]:
+    """(valid_from, valid_to) of a claim, stripped ("" = unbounded on that side)."""
+
+    vf = c.get("valid_from")
+    vt = c.get("valid_to")
+    return (vf.strip() if isinstance(vf, str) else "", vt.strip() if isinstance(vt, str) else "")
+
+
+class ValidityIndex:
+    """Claim validity windows `[valid_from, valid_to)` (RFC3339 strings) of one view.
+
+    Only claims with at least one bound are stored, so `valid_at` is a dict miss for the (usual)
+    unbounded claim and two string compares otherwise. Bounds are also kept sorted, so
+    `next_boundary_after` and `invalid_at` are range lookups instead of scans. Instances are
+    never mutated once shared; `with_claim` returns a copy-on-write successor.
+    """
+
+    def __init__(self, windows: dict[str, tuple[str, str]]) -> None:
+        self.windows = windows
+
+    @classmethod
+    def build(cls, claims: Iterable[tuple[str, dict[str, Any]]]) -> ValidityIndex:
+        windows: dict[str, tuple[str, str]] = {}
+        for cid, c in claims:
+            w = validity_window(c)
+            if w[0] or w[1]:
+                windows[cid] = w
+        return cls(windows)
+
+    def with_claim(self, cid: str, c: dict[str, Any]) -> ValidityIndex:
+        w = validity_window(c)
+        if self.windows.get(cid) == w or (cid not in self.windows and not (w[0] or w[1])):
+            return self
+        windows = dict(self.windows)
+        if w[0] or w[1]:
+            windows[cid] = w
+        else:
+            windows.pop(cid, None)
+        return ValidityIndex(windows)
+
+    def valid_at(self, cid: str, as_of_ts: str) -> bool:
+        t = (as_of_ts or "").strip()
+        w = self.windows.get(cid)
+        if not t or w is None:
+            return True
+        vf, vt = w
+        return not ((vf and vf > t) or (vt and t >= vt))
+
+    @functools.cached_property
+    def _starts(self) -> tuple[list[str], list[str]]:
+        pairs = sorted((vf, cid) for cid, (vf, _vt) in self.windows.items() if vf)
+        return [p[0] for p in pairs], [p[1] for p in pairs]
+
+    @functools.cached_property
+    def _ends(self) -> tuple[list[str], list[str]]:
+        pairs = sorted((vt, cid) for cid, (_vf, vt) in self.windows.items() if vt)
+        return [p[0] for p in pairs], [p[1] for p in pairs]
+
+    @functools.cached_property
+    def boundaries(self) -> list[str]:
+        return sorted({b for w in self.windows.values() for b in w if b})
+
+    def next_boundary_after(self, as_of_ts: str) -> str:
+        """Earliest valid_from/valid_to strictly after `as_of_ts` ("" when none)."""
+
+        bs = self.boundaries
+        i = bisect.bisect_right(bs, (as_of_ts or "").strip())
+        return bs[i] if i < len(bs) else ""
+
+    def invalid_at(self, as_of_ts: str) -> set[str]:
+        """Ids whose window does not contain `as_of_ts`: not yet started (valid_from > t) or ended (valid_to <= t)."""
+
+        t = (as_of_ts or "").strip()
+        if not t:
+            return set()
+        starts, start_ids = self._starts
+        ends, end_ids = self._ends
+        out = set(start_ids[bisect.bisect_right(starts, t) :])
+        out.update(end_ids[: bisect.bisect_right(ends, t)])
+        return out
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import bisect
+import collections
+import functools
+import re
+from typing import Any, Iterable
+
+# Query tokens (`mi.memory.text.tokenize_query`) are runs of [a-z0-9_]; a token is a substring of
+# normalized text iff it is a substring of one of the text's maximal [a-z0-9_] runs ("words").
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+
+
+def text_words(text: str) -> set[str]:
+    # Whitespace normalization never changes [a-z0-9_] runs, so lowering is enough.
+    return set(_WORD_RE.findall((text or "").lower()))
+
+
+class TokenIndex:
+    """Inverted index word -> ids over normalized record text (claims or nodes of one view).
+
+    `candidates(tokens)` returns every id whose normalized text contains any token as a substring
+    (a superset is fine: callers re-score candidates exactly), in indexing order. Instances are
+    never mutated once shared; `with_doc` returns a copy-on-write successor.
+    """
+
+    def __init__(self, postings: dict[str, list[str]], order: dict[str, int]) -> None:
+        self.postings = postings
+        self.order = order
+
+    @classmethod
+    def build(cls, docs: Iterable[tuple[str, str]]) -> TokenIndex:
+        postings: collections.defaultdict[str, list[str]] = collections.defaultdict(list)
+        order: dict[str, int] = {}
+        for rid, text in docs:
+            if rid in order:
+                continue
+            order[rid] = len(order)
+            for w in text_words(text):
+                postings[w].append(rid)
+        return cls(dict(postings), order)
+
+    def with_doc(self, rid: str, text: str) -> TokenIndex:
+        postings = dict(self.postings)
+        for w in text_words(text):
+            # Duplicates (re-appended ids) are harmless: `candidates` dedupes.
+            postings[w] = [*(postings.get(w) or ()), rid]
+        order = self.order
+        if rid not in order:
+            order = dict(order)
+            order[rid] = len(order)
+        return TokenIndex(postings, order)
+
+    @functools.cached_property
+    def _vocab(self) -> tuple[str, list[int], list[str]]:
+        words = list(self.postings)
+        starts: list[int] = []
+        pos = 0
+        for w in words:
+            starts.append(pos)
+            pos += len(w) + 1
+        return "\n".join(words), starts, words
+
+    def words_containing(self, token: str) -> list[str]:
+        tok = (token or "").strip()
+        if not tok or "\n" in tok:
+            return []
+        blob, starts, words = self._vocab
+        out: list[str] = []
+        i = blob.find(tok)
+        while i >= 0:
+            wi = bisect.bisect_right(starts, i) - 1
+            out.append(words[wi])
+            nxt = starts[wi + 1] if wi + 1 < len(starts) else len(blob)
+            i = blob.find(tok, nxt)
+        return out
+
+    def candidates(self, tokens: Iterable[str]) -> list[str]:
+        hit: set[str] = set()
+        for tok in tokens:
+            for w in self.words_containing(tok):
+                hit.update(self.postings.get(w) or ())
+        big = len(self.order)
+        return sorted(hit, key=lambda x: self.order.get(x, big))
+
+    def to_obj(self) -> dict[str, list[str]]:
+        return self.postings
+
+    @classmethod
+    def from_obj(cls, obj: Any, *, ids: Iterable[str]) -> TokenIndex | None:
+        """Rebuild from a persisted postings map (None when malformed); `ids` gives indexing order."""
+
+        if not isinstance(obj, dict):
+            return None
+        postings: dict[str, list[str]] = {}
+        for w, rids in obj.items():
+            if not isinstance(w, str) or not isinstance(rids, list):
+                return None
+            postings[w] = [str(x) for x in rids]
+        return cls(postings, {rid: i for i, rid in enumerate(ids)})
+
+
+def claim_index_text(c: dict[str, Any]) -> str:
+    return str(c.get("text") or "").strip()
+
+
+def node_index_text(n: dict[str, Any]) -> str:
+    title = str(n.get("title") or "").strip()
+    text = str(n.get("text") or "").strip()
+    return (title + "\n" + text).strip()
@@ -7,8 +7,10 @@ from typing import Any
 
 from ..memory.service import MemoryService
 from ..core.paths import ProjectPaths
-from ..runtime.prompts import why_trace_prompt
+from ..runtime.evidence import evidence_order_key
+from ..runtime.prompts import why_trace_batch_prompt, why_trace_prompt
 from ..core.storage import iter_jsonl, now_rfc3339
+from .model import ThoughtDbView
 from .retrieval import expand_one_hop
 from .store import ThoughtDbStore
 
@@ -86,8 +88,13 @@ def collect_candidate_claims(
     query: str,
     top_k: int,
     target_event_id: str = "",
+    ingest: bool = True,
+    views: tuple[ThoughtDbView, ThoughtDbView] | None = None,
 ) -> list[dict[str, Any]]:
-    """Collect a bounded candidate claim list (project + global) for WhyTrace."""
+    """Collect a bounded candidate claim list (project + global) for WhyTrace.
+
+    Batch callers pass `ingest=False` (memory already ingested) and preloaded (project, global) `views`.
+    """
 
     try:
         k = int(top_k)
@@ -101,12 +108,12 @@ def collect_candidate_claims(
     if not q:
         return []
 
-    mem.ingest_structured()
+    if ingest:
+        mem.ingest_structured()
     hits = mem.search(query=q, top_k=min(80, k * 5), kinds={"claim"}, include_global=True, exclude_project_id="")
 
     # Load views once.
-    v_proj = tdb.load_view(scope="project")
-    v_glob = tdb.load_view(scope="global")
+    v_proj, v_glob = views or (tdb.load_view(scope="project"), tdb.load_view(scope="global"))
 
     out: list[dict[str, Any]] = []
     seen: set[str] = set()
@@ -115,17 +122,13 @@ def collect_candidate_claims(
     if target_event_id.strip():
         te = target_event_id.strip()
         for v in (v_proj, v_glob):
-            for c in v.claims_by_id.values():
-                if not isinstance(c, dict):
-                    continue
-                refs = c.get("source_refs") if isinstance(c.get("source_refs"), list) else []
-                if any(isinstance(r, dict) and str(r.get("event_id") or "").strip() == te for r in refs):
-                    cid = str(c.get("claim_id") or "").strip()
-                    if cid and cid not in seen:
-                        seen.add(cid)
-                        out.append(_compact_claim(c, status=v.claim_status(cid), canonical_id=v.resolve_id(cid)))
-                        if len(out) >= k:
-                            return out
+            for cid in v.ids_citing_event(te, kind="claim"):
+                c = v.claims_by_id.get(cid)
+                if isinstance(c, dict) and cid not in seen:
+                    seen.add(cid)
+                    out.append(_compact_claim(c, status=v.claim_status(cid), canonical_id=v.resolve_id(cid)))
+                    if len(out) >= k:
+                        return out
 
     for it in hits:
         if it.kind != "claim":
@@ -225,6 +228,8 @@ def collect_candidate_claims_for_target(
     top_k: int,
     as_of_ts: str,
     target_event_id: str = "",
+    ingest: bool = True,
+    views: tuple[ThoughtDbView, ThoughtDbView] | None = None,
 ) -> list[dict[str, Any]]:
     """Collect candidate claims for WhyTrace, preferring deterministic EvidenceLog hints when present."""
 
@@ -238,6 +243,8 @@ def collect_candidate_claims_for_target(
             query=query,
             top_k=top_k,
             target_event_id=target_event_id,
+            ingest=ingest,
+            views=views,
         )
 
     try:
@@ -250,8 +257,7 @@ def collect_candidate_claims_for_target(
     ev_id = str(target_event_id or "").strip()
 
     # Load views once.
-    v_proj = tdb.load_view(scope="project")
-    v_glob = tdb.load_view(scope="global")
+    v_proj, v_glob = views or (tdb.load_view(scope="project"), tdb.load_view(scope="global"))
 
     def _claim_active_and_valid(view: Any, cid: str) -> bool:
         ccid = str(cid or "").strip()
@@ -321,17 +327,9 @@ def collect_candidate_claims_for_target(
     if ev_id:
         te = ev_id
         for view in (v_proj, v_glob):
-            for c in view.claims_by_id.values():
+            for cid in view.ids_citing_event(te, kind="claim"):
                 if len(out) >= k:
                     return out
-                if not isinstance(c, dict):
-                    continue
-                refs = c.get("source_refs") if isinstance(c.get("source_refs"), list) else []
-                if not any(isinstance(r, dict) and str(r.get("event_id") or "").strip() == te for r in refs):
-                    continue
-                cid = str(c.get("claim_id") or "").strip()
-                if not cid:
-                    continue
                 canon = view.resolve_id(cid)
                 if canon in seen:
                     continue
@@ -366,7 +364,8 @@ def collect_candidate_claims_for_target(
     # 4) Backfill from memory search (FTS) if needed.
     q = str(query or "").strip() or ev_id
     if len(out) < k and q:
-        mem.ingest_structured()
+        if ingest:
+            mem.ingest_structured()
         hits = mem.search(query=q, top_k=min(80, k * 5), kinds={"claim"}, include_global=True, exclude_project_id="")
         for it in hits:
             if len(out) >= k:
@@ -386,11 +385,84 @@ def collect_candidate_claims_for_target(
     return out
 
 
+def _candidate_ids(candidate_claims: list[dict[str, Any]]) -> set[str]:
+    return {str(c.get("claim_id") or "").strip() for c in candidate_claims if isinstance(c, dict) and str(c.get("claim_id") or "").strip()}
+
+
+def _enforce_candidates(out: dict[str, Any], candidate_claims: list[dict[str, Any]]) -> dict[str, Any]:
+    """Keep only chosen ids that are candidates (deduped, at most 10); mutates and returns `out`."""
+
+    cand_ids = _candidate_ids(candidate_claims)
+    raw_chosen = out.get("chosen_claim_ids") if isinstance(out.get("chosen_claim_ids"), list) else []
+    chosen = [str(x).strip() for x in raw_chosen if isinstance(x, str) and str(x).strip()]
+    chosen2: list[str] = []
+    seen: set[str] = set()
+    for cid in chosen:
+        if cid in seen or cid not in cand_ids:
+            continue
+        seen.add(cid)
+        chosen2.append(cid)
+        if len(chosen2) >= 10:
+            break
+    out["chosen_claim_ids"] = chosen2
+    return out
+
+
+def _depends_on_edge_specs(
+    *,
+    out: dict[str, Any],
+    candidate_claims: list[dict[str, Any]],
+    event_id: str,
+    min_write_confidence: float,
+) -> list[dict[str, Any]]:
+    """`append_edges` items for depends_on(event_id -> chosen claim) when the trace is confident enough."""
+
+    ev_id = str(event_id or "").strip()
+    chosen = out.get("chosen_claim_ids") if isinstance(out.get("chosen_claim_ids"), list) else []
+    if not ev_id or not chosen:
+        return []
+    try:
+        conf = float(out.get("confidence") or 0.0)
+    except Exception:
+        conf = 0.0
+    if str(out.get("status") or "").strip() != "ok" or conf < float(min_write_confidence):
+        return []
+    vis_by_id: dict[str, str] = {}
+    for c in candidate_claims or []:
+        if not isinstance(c, dict):
+            continue
+        cid = str(c.get("claim_id") or "").strip()
+        if cid:
+            vis_by_id[cid] = str(c.get("visibility") or "").strip()
+    return [
+        {
+            "edge_type": "depends_on",
+            "from_id": ev_id,
+            "to_id": cid,
+            "scope": "project",
+            "visibility": "private" if vis_by_id.get(cid) == "private" else "project",
+            "source_event_ids": [ev_id],
+            "notes": "why_trace materialized",
+        }
+        for cid in chosen
+    ]
+
+
+def _append_edges_best_effort(tdb: ThoughtDbStore, specs: list[dict[str, Any]]) -> list[str]:
+    if not specs:
+        return []
+    try:
+        return tdb.append_edges(specs)
+    except Exception:
+        return []
+
+
 @dataclass(frozen=True)
 class WhyTraceOutcome:
     obj: dict[str, Any]
     mind_transcript_ref: str
     written_edge_ids: list[str]
+    state: str = "ok"
 
 
 def run_why_trace(
@@ -418,57 +490,228 @@ def run_why_trace(
     out = res.obj if hasattr(res, "obj") else {}
     if not isinstance(out, dict):
         out = {"status": "insufficient", "confidence": 0.0, "chosen_claim_ids": [], "explanation": "", "notes": "invalid output"}
-
-    cand_ids = {str(c.get("claim_id") or "").strip() for c in candidate_claims if isinstance(c, dict) and str(c.get("claim_id") or "").strip()}
-    raw_chosen = out.get("chosen_claim_ids") if isinstance(out.get("chosen_claim_ids"), list) else []
-    chosen = [str(x).strip() for x in raw_chosen if isinstance(x, str) and str(x).strip()]
     # Enforce: only choose from candidates.
-    chosen2: list[str] = []
-    seen: set[str] = set()
-    for cid in chosen:
-        if cid in seen or cid not in cand_ids:
-            continue
-        seen.add(cid)
-        chosen2.append(cid)
-        if len(chosen2) >= 10:
-            break
-    out["chosen_claim_ids"] = chosen2
+    _enforce_candidates(out, candidate_claims)
 
-    written_edge_ids: list[str] = []
-    ev_id = str(write_edges_from_event_id or "").strip()
-    if ev_id:
-        try:
-            conf = float(out.get("confidence") or 0.0)
-        except Exception:
-            conf = 0.0
-        if str(out.get("status") or "").strip() == "ok" and conf >= float(min_write_confidence) and chosen2:
-            # Materialize depends_on edges into the project store (event_id -> claim_id).
-            vis_by_id = {}
-            for c in candidate_claims or []:
-                if not isinstance(c, dict):
-                    continue
-                cid = str(c.get("claim_id") or "").strip()
-                if cid:
-                    vis_by_id[cid] = str(c.get("visibility") or "").strip()
-            for cid in chosen2:
-                try:
-                    vis = "private" if vis_by_id.get(cid) == "private" else "project"
-                    eid = tdb.append_edge(
-                        edge_type="depends_on",
-                        from_id=ev_id,
-                        to_id=cid,
-                        scope="project",
-                        visibility=vis,
-                        source_event_ids=[ev_id],
-                        notes="why_trace materialized",
-                    )
-                except Exception:
-                    continue
-                written_edge_ids.append(eid)
+    # Materialize depends_on edges into the project store (event_id -> claim_id).
+    specs = _depends_on_edge_specs(
+        out=out,
+        candidate_claims=candidate_claims,
+        event_id=write_edges_from_event_id,
+        min_write_confidence=min_write_confidence,
+    )
+    written_edge_ids = _append_edges_best_effort(tdb, specs)
 
     mind_ref = str(getattr(res, "transcript_path", "") or "").strip()
     return WhyTraceOutcome(obj=out, mind_transcript_ref=mind_ref, written_edge_ids=written_edge_ids)
 
 
+def evidence_events_for_run(*, evidence_log_path: Path, run_id: str, kinds: set[str]) -> tuple[str, list[dict[str, Any]]]:
+    """EvidenceLog records of `kinds` written by one run, in run order ((seq, sub_seq); see EvidenceWriter).
+
+    `run_id="last"` selects the run of the most recent matching record. Returns (run_id, records).
+    """
+
+    rid = (run_id or "").strip()
+    if rid == "last":
+        rid = ""
+        for obj in iter_jsonl(evidence_log_path):
+            if isinstance(obj, dict) and str(obj.get("kind") or "").strip() in kinds and str(obj.get("event_id") or "").strip():
+                rid = str(obj.get("run_id") or "").strip() or rid
+    if not rid:
+        return "", []
+    out: list[dict[str, Any]] = []
+    for obj in iter_jsonl(evidence_log_path):
+        if not isinstance(obj, dict) or str(obj.get("run_id") or "").strip() != rid:
+            continue
+        if str(obj.get("kind") or "").strip() in kinds and str(obj.get("event_id") or "").strip():
+            out.append(obj)
+    # Lines of a deferred (async checkpoint) block may follow records with a higher seq.
+    out.sort(key=evidence_order_key)
+    return rid, out
+
+
+@dataclass(frozen=True)
+class WhyTraceTarget:
+    """One prepared batch target: the prompt target, its query and candidates, and the edge source event."""
+
+    key: str
+    target: dict[str, Any]
+    query: str
+    candidate_claims: list[dict[str, Any]]
+    write_edges_from_event_id: str = ""
+
+
+def collect_why_targets_for_events(
+    *,
+    tdb: ThoughtDbStore,
+    mem: MemoryService,
+    project_paths: ProjectPaths,
+    target_objs: list[dict[str, Any]],
+    top_k: int,
+    as_of_ts: str,
+) -> list[WhyTraceTarget]:
+    """Prepare EvidenceLog event targets in one pass (memory ingested once, views loaded once)."""
+
+    mem.ingest_structured()
+    views = (tdb.load_view(scope="project"), tdb.load_view(scope="global"))
+    out: list[WhyTraceTarget] = []
+    seen: set[str] = set()
+    for obj in target_objs:
+        if not isinstance(obj, dict):
+            continue
+        ev_id = str(obj.get("event_id") or "").strip()
+        if not ev_id or ev_id in seen:
+            continue
+        seen.add(ev_id)
+        query = query_from_evidence_event(obj)
+        cands = collect_candidate_claims_for_target(
+            tdb=tdb,
+            mem=mem,
+            project_paths=project_paths,
+            target_obj=obj,
+            query=query,
+            top_k=top_k,
+            as_of_ts=as_of_ts,
+            target_event_id=ev_id,
+            ingest=False,
+            views=views,
+        )
+        target = {
+            "target_type": "evidence_event",
+            "event_id": ev_id,
+            "evidence_kind": str(obj.get("kind") or "").strip() or "evidence_item",
+            "batch_id": str(obj.get("batch_id") or "").strip(),
+        }
+        out.append(WhyTraceTarget(key=ev_id, target=target, query=query, candidate_claims=cands, write_edges_from_event_id=ev_id))
+    return out
+
+
+def _estimate_tokens(text: str) -> int:
+    # Rough budget estimate (~4 chars per token); only used to size batches.
+    return len(text) // 4 + 1
+
+
+def pack_why_targets(
+    targets: list[WhyTraceTarget],
+    *,
+    as_of_ts: str,
+    max_prompt_tokens: int,
+    max_targets_per_call: int,
+) -> list[list[WhyTraceTarget]]:
+    """Greedily group targets (in order) so each batch prompt stays within the token budget.
+
+    Targets without candidates are left out (nothing to ask). A single target larger than the
+    budget still gets its own chunk.
+    """
+
+    cap = max(1, int(max_targets_per_call))
+    budget = max(1, int(max_prompt_tokens))
+    base = _estimate_tokens(why_trace_batch_prompt(items=[], as_of_ts=as_of_ts, notes="why_trace:batch"))
+    chunks: list[list[WhyTraceTarget]] = []
+    cur: list[WhyTraceTarget] = []
+    used = base
+    for t in targets:
+        if not t.candidate_claims:
+            continue
+        cost = _estimate_tokens(why_trace_batch_prompt(items=[_batch_item(t)], as_of_ts=as_of_ts, notes="")) - base
+        if cur and (len(cur) >= cap or used + cost > budget):
+            chunks.append(cur)
+            cur, used = [], base
+        cur.append(t)
+        used += cost
+    if cur:
+        chunks.append(cur)
+    return chunks
+
+
+def _batch_item(t: WhyTraceTarget) -> dict[str, Any]:
+    return {"target_key": t.key, "target": t.target, "candidate_claims": t.candidate_claims}
+
+
+def _insufficient(notes: str) -> dict[str, Any]:
+    return {"status": "insufficient", "confidence": 0.0, "chosen_claim_ids": [], "explanation": "", "notes": notes}
+
+
+def run_why_trace_batch(
+    *,
+    mind: Any,
+    tdb: ThoughtDbStore,
+    targets: list[WhyTraceTarget],
+    as_of_ts: str,
+    max_prompt_tokens: int = 12000,
+    max_targets_per_call: int = 8,
+    write_edges: bool = True,
+    min_write_confidence: float = 0.7,
+) -> list[WhyTraceOutcome]:
+    """Run WhyTrace for many targets with one `why_trace_batch` Mind call per packed chunk.
+
+    Per-target output is validated like `run_why_trace` (chosen ids limited to that target's
+    candidates). Confident traces' depends_on edges are written with one bulk append at the end.
+    Returns one outcome per target, in input order. A failed chunk call marks only its own
+    targets insufficient.
+    """
+
+    outs: dict[str, dict[str, Any]] = {}
+    refs: dict[str, str] = {}
+    states: dict[str, str] = {}
+    for t in targets:
+        outs[t.key] = _insufficient("no candidate claims")
+        refs[t.key] = ""
+        states[t.key] = "ok"
+
+    chunks = pack_why_targets(
+        targets,
+        as_of_ts=as_of_ts,
+        max_prompt_tokens=max_prompt_tokens,
+        max_targets_per_call=max_targets_per_call,
+    )
+    for n, chunk in enumerate(chunks):
+        prompt = why_trace_batch_prompt(items=[_batch_item(t) for t in chunk], as_of_ts=as_of_ts, notes=f"why_trace:batch {n + 1}/{len(chunks)}")
+        try:
+            res = mind.call(schema_filename="why_trace_batch.json", prompt=prompt, tag=f"why_trace_batch:{n + 1}")
+        except Exception as e:
+            for t in chunk:
+                outs[t.key] = _insufficient(f"mind_error: why_trace_batch failed ({type(e).__name__})")
+                states[t.key] = "error"
+            continue
+        obj = res.obj if hasattr(res, "obj") else {}
+        traces = obj.get("traces") if isinstance(obj, dict) and isinstance(obj.get("traces"), list) else []
+        by_key: dict[str, dict[str, Any]] = {}
+        for tr in traces:
+            if isinstance(tr, dict):
+                by_key.setdefault(str(tr.get("target_key") or "").strip(), tr)
+        ref = str(getattr(res, "transcript_path", "") or "").strip()
+        for t in chunk:
+            tr = by_key.get(t.key)
+            if tr is None:
+                outs[t.key] = _insufficient("missing from why_trace_batch output")
+            else:
+                out = {k: v for k, v in tr.items() if k != "target_key"}
+                outs[t.key] = _enforce_candidates(out, t.candidate_claims)
+            refs[t.key] = ref
+
+    specs_by_key: dict[str, list[dict[str, Any]]] = {}
+    if write_edges:
+        for t in targets:
+            specs_by_key[t.key] = _depends_on_edge_specs(
+                out=outs[t.key],
+                candidate_claims=t.candidate_claims,
+                event_id=t.write_edges_from_event_id,
+                min_write_confidence=min_write_confidence,
+            )
+    all_specs = [s for t in targets for s in specs_by_key.get(t.key, [])]
+    edge_ids = _append_edges_best_effort(tdb, all_specs)
+
+    results: list[WhyTraceOutcome] = []
+    pos = 0
+    for t in targets:
+        n_specs = len(specs_by_key.get(t.key, []))
+        written = edge_ids[pos : pos + n_specs] if edge_ids else []
+        pos += n_specs
+        results.append(WhyTraceOutcome(obj=outs[t.key], mind_transcript_ref=refs[t.key], written_edge_ids=list(written), state=states[t.key]))
+    return results
+
+
 def default_as_of_ts() -> str:
     return now_rfc3339()
@@ -0,0 +1,554 @@
+#!/usr/bin/env python3
+"""Replay benchmark: MI-side time per batch of the autopilot loop (zero Hands/Mind latency).
+
+Builds a synthetic MI home (N claims per Thought DB scope, M EvidenceLog records per project,
+K projects; memory index pre-ingested), then replays a recording through
+`bootstrap_autopilot_run` + `run_autopilot_from_boot`:
+
+- Hands: one recorded event stream per batch (Codex `--json` events), returned instantly
+- Mind: recorded responses keyed by (schema, tag), then (schema, batch index), then schema
+
+Perf spans (`runtime.perf.enabled`) are on in the synthetic home, so the report breaks the
+MI-side time per batch down by phase (context building, EvidenceLog/Thought DB I/O, memory
+search, checkpoints). Every run starts from a fresh copy of the synthetic home.
+
+Recording directory layout (`--recording DIR`; `--write-recording DIR` dumps the built-in one):
+- `hands/*.jsonl`: one file per batch (sorted by name); MI Hands transcripts (`stream=stdout`
+  lines holding Codex events) or raw Codex `--json` event lines
+- `mind.jsonl`: `{"schema": "decide_next.json", "tag": "decide_b0"?, "batch": 0?, "obj": {...}}`
+
+Usage: python scripts/bench_batch_loop.py [--claims N] [--evidence M] [--projects K] [--batches B]
+       [--runs R] [--recording DIR] [--write-recording DIR] [--baseline FILE] [--max-regression F] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from mi.core.config import config_path, default_config  # noqa: E402
+from mi.core.paths import ProjectPaths  # noqa: E402
+from mi.core.perf import iter_perf_records, summarize_perf  # noqa: E402
+from mi.core.storage import append_jsonl, ensure_dir, iter_jsonl, write_json  # noqa: E402
+from mi.memory.service import MemoryService  # noqa: E402
+from mi.providers.codex_runner import CodexRunResult  # noqa: E402
+from mi.providers.mind_errors import MindCallError  # noqa: E402
+from mi.providers.types import MindProviderResult  # noqa: E402
+from mi.runtime import wiring as W  # noqa: E402
+from mi.runtime.evidence import EvidenceWriter, new_run_id  # noqa: E402
+from mi.runtime.transcript_store import write_transcript_header  # noqa: E402
+from mi.runtime.wiring.run_from_boot import run_autopilot_from_boot  # noqa: E402
+from mi.thoughtdb import ThoughtDbStore  # noqa: E402
+
+_WORDS = (
+    "cache index parser config test build deploy schema module refactor retry timeout queue worker "
+    "thread lock snapshot journal segment claim node edge evidence batch prompt context memory search "
+    "token budget latency throughput release migration api client server request response error "
+    "logging metrics trace span profile benchmark fixture mock stub coverage lint format typing docs "
+    "readme changelog version branch commit merge rebase review ci pipeline artifact package wheel"
+).split()
+_CLAIM_TYPES = ("fact",) * 6 + ("preference",) * 2 + ("assumption", "goal")
+
+
+# ---------------------------------------------------------------------------
+# Synthetic home
+
+
+def _sentence(rng: random.Random, lo: int, hi: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(lo, hi)))
+
+
+def _fill_thoughtdb(tdb: ThoughtDbStore, *, scope: str, n: int, rng: random.Random) -> None:
+    ids: list[str] = []
+    for i in range(n):
+        ids.append(
+            tdb.append_claim_create(
+                claim_type=rng.choice(_CLAIM_TYPES),
+                text=f"{_sentence(rng, 6, 14)} #{i}",
+                scope=scope,
+                visibility="global" if scope == "global" else "project",
+                valid_from=None,
+                valid_to=None,
+                tags=[f"topic:{rng.choice(_WORDS)}" for _ in range(rng.randint(0, 3))],
+                source_event_ids=[],
+                confidence=round(rng.uniform(0.6, 0.99), 2),
+                notes="",
+            )
+        )
+    for _ in range(n // 2):
+        a, b = rng.sample(ids, 2) if len(ids) >= 2 else (None, None)
+        if a is None:
+            break
+        tdb.append_edge(
+            edge_type=rng.choice(("depends_on", "supports", "mentions")),
+            from_id=a,
+            to_id=b,
+            scope=scope,
+            visibility="global" if scope == "global" else "project",
+            source_event_ids=[],
+            notes="",
+        )
+
+
+def build_home(root: Path, *, claims: int, evidence: int, projects: int, seed: int = 0) -> tuple[Path, list[Path]]:
+    """Create `root/home` and `root/repos/p<i>`; returns (home, project_roots)."""
+
+    rng = random.Random(seed)
+    home = root / "home"
+    ensure_dir(home)
+    cfg = default_config()
+    cfg["runtime"]["perf"]["enabled"] = True
+    write_json(config_path(home), cfg)
+
+    roots: list[Path] = []
+    for k in range(max(1, projects)):
+        repo = root / "repos" / f"p{k}"
+        ensure_dir(repo)
+        (repo / "README.md").write_text(f"# p{k}\n", encoding="utf-8")
+        roots.append(repo)
+        pp = ProjectPaths(home_dir=home, project_root=repo)
+        ensure_dir(pp.project_dir)
+        evw = EvidenceWriter(path=pp.evidence_log_path, run_id=new_run_id("run"))
+        for i in range(evidence):
+            evw.append(
+                {
+                    "kind": "evidence",
+                    "batch_id": f"b{i % 8}",
+                    "thread_id": "t_synth",
+                    "hands_transcript_ref": "",
+                    "mind_transcript_ref": "",
+                    "mi_input": _sentence(rng, 4, 10),
+                    "transcript_observation": {},
+                    "repo_observation": {},
+                    "facts": [_sentence(rng, 5, 12)],
+                    "actions": [{"kind": "command", "detail": "pytest -q"}],
+                    "results": [_sentence(rng, 3, 8)],
+                    "unknowns": [],
+                    "risk_signals": [],
+                }
+            )
+        tdb = ThoughtDbStore(home_dir=home, project_paths=pp)
+        _fill_thoughtdb(tdb, scope="project", n=claims, rng=rng)
+        if k == 0:
+            _fill_thoughtdb(tdb, scope="global", n=claims, rng=rng)
+        tdb.flush_snapshots_best_effort()
+
+    MemoryService(home).ingest_structured()
+    return home, roots
+
+
+# ---------------------------------------------------------------------------
+# Recording + replay providers
+
+
+@dataclass
+class Recording:
+    hands: list[list[dict[str, Any]]]
+    mind: list[dict[str, Any]] = field(default_factory=list)
+
+
+def default_recording(batches: int) -> Recording:
+    """A plain multi-batch run: each batch runs tests; checkpoints mine claims/preferences; last batch stops."""
+
+    n = max(1, int(batches))
+    hands = []
+    for i in range(n):
+        last = "All done." if i == n - 1 else f"Step {i + 1} done; continuing."
+        hands.append(
+            [
+                {"type": "thread.started", "thread_id": "t_bench"},
+                {
+                    "type": "item.completed",
+                    "item": {"type": "command_execution", "command": "pytest -q", "exit_code": 0, "aggregated_output": f"{10 + i} passed"},
+                },
+                {"type": "item.completed", "item": {"type": "agent_message", "text": last}},
+            ]
+        )
+    decide = {
+        "next_action": "send_to_hands",
+        "status": "not_done",
+        "confidence": 0.9,
+        "next_hands_input": "Continue with the next step and re-run the tests.",
+        "ask_user_question": "",
+        "learn_suggested": [],
+        "update_project_overlay": {"set_testless_strategy": None},
+        "notes": "continue",
+    }
+    mind: list[dict[str, Any]] = [
+        {
+            "schema": "extract_evidence.json",
+            "obj": {
+                "facts": ["ran the test suite"],
+                "actions": [{"kind": "command", "detail": "pytest -q"}],
+                "results": ["tests passed"],
+                "unknowns": [],
+                "risk_signals": [],
+            },
+        },
+        {"schema": "decide_next.json", "obj": decide},
+        {
+            "schema": "decide_next.json",
+            "batch": n - 1,
+            "obj": {**decide, "next_action": "stop", "status": "done", "next_hands_input": "", "notes": "done"},
+        },
+        {
+            "schema": "checkpoint_decide.json",
+            "obj": {
+                "should_checkpoint": True,
+                "checkpoint_kind": "subtask_complete",
+                "should_mine_workflow": False,
+                "should_mine_preferences": True,
+                "confidence": 0.9,
+                "notes": "step done",
+            },
+        },
+        {"schema": "mine_claims.json", "obj": {"claims": [], "edges": [], "notes": ""}},
+        {"schema": "mine_preferences.json", "obj": {"suggestions": [], "notes": ""}},
+        {
+            "schema": "plan_min_checks.json",
+            "obj": {
+                "should_run_checks": False,
+                "needs_testless_strategy": False,
+                "testless_strategy_question": "",
+                "check_goals": [],
+                "commands_hints": [],
+                "hands_check_input": "",
+                "notes": "tests already ran",
+            },
+        },
+        {
+            "schema": "risk_judge.json",
+            "obj": {"category": "other", "severity": "low", "should_ask_user": False, "mitigation": [], "learn_suggested": []},
+        },
+        {
+            "schema": "workflow_progress.json",
+            "obj": {
+                "should_update": False,
+                "completed_step_ids": [],
+                "next_step_id": "",
+                "should_close": False,
+                "close_reason": "",
+                "confidence": 0.9,
+                "notes": "",
+            },
+        },
+        {
+            "schema": "auto_answer_to_hands.json",
+            "obj": {
+                "should_answer": False,
+                "confidence": 0.9,
+                "hands_answer_input": "",
+                "needs_user_input": False,
+                "ask_user_question": "",
+                "unanswered_questions": [],
+                "notes": "",
+            },
+        },
+        {
+            "schema": "loop_break.json",
+            "obj": {
+                "action": "rewrite_next_input",
+                "confidence": 0.9,
+                "rewritten_next_input": "Finish the remaining step and re-run the tests.",
+                "check_intent": "",
+                "ask_user_question": "",
+                "notes": "",
+            },
+        },
+        {
+            "schema": "why_trace.json",
+            "obj": {"status": "insufficient", "confidence": 0.5, "chosen_claim_ids": [], "explanation": "", "notes": ""},
+        },
+    ]
+    return Recording(hands=hands, mind=mind)
+
+
+def _events_from_transcript(path: Path) -> list[dict[str, Any]]:
+    events: list[dict[str, Any]] = []
+    for rec in iter_jsonl(path):
+        if not isinstance(rec, dict):
+            continue
+        if "stream" in rec:
+            if rec.get("stream") != "stdout":
+                continue
+            line = str(rec.get("line") or "").strip()
+            if not (line.startswith("{") and line.endswith("}")):
+                continue
+            try:
+                ev = json.loads(line)
+            except Exception:
+                continue
+            if isinstance(ev, dict):
+                events.append(ev)
+        elif rec.get("type") and not str(rec.get("type")).startswith("mi."):
+            events.append(rec)
+    return events
+
+
+def load_recording(path: Path) -> Recording:
+    d = Path(path)
+    hands = [_events_from_transcript(p) for p in sorted((d / "hands").glob("*.jsonl"))]
+    mind = [r for r in iter_jsonl(d / "mind.jsonl") if isinstance(r, dict)] if (d / "mind.jsonl").exists() else []
+    if not hands:
+        raise SystemExit(f"recording has no Hands transcripts: {d / 'hands'}")
+    return Recording(hands=hands, mind=mind)
+
+
+def write_recording(rec: Recording, path: Path) -> None:
+    d = Path(path)
+    ensure_dir(d / "hands")
+    for i, events in enumerate(rec.hands):
+        p = d / "hands" / f"b{i:03d}.jsonl"
+        write_transcript_header(p, {"provider": "replay"})
+        for ev in events:
+            append_jsonl(p, {"ts": "", "stream": "stdout", "line": json.dumps(ev, sort_keys=True)})
+    (d / "mind.jsonl").unlink(missing_ok=True)
+    for r in rec.mind:
+        append_jsonl(d / "mind.jsonl", r)
+
+
+_BATCH_IN_TAG = re.compile(r"(?:_b|:b)(\d+)\b")
+
+
+class ReplayMind:
+    def __init__(self, entries: list[dict[str, Any]]) -> None:
+        self._by_tag: dict[tuple[str, str], dict[str, Any]] = {}
+        self._by_batch: dict[tuple[str, int], dict[str, Any]] = {}
+        self._default: dict[str, dict[str, Any]] = {}
+        for e in entries:
+            schema = str(e.get("schema") or "")
+            obj = e.get("obj")
+            if not schema or not isinstance(obj, dict):
+                continue
+            if str(e.get("tag") or ""):
+                self._by_tag[(schema, str(e["tag"]))] = obj
+            elif isinstance(e.get("batch"), int):
+                self._by_batch[(schema, int(e["batch"]))] = obj
+            else:
+                self._default[schema] = obj
+        self.calls = 0
+        self.misses: set[str] = set()
+
+    def call(self, *, schema_filename: str, prompt: str, tag: str) -> MindProviderResult:
+        self.calls += 1
+        obj = self._by_tag.get((schema_filename, tag))
+        if obj is None:
+            m = _BATCH_IN_TAG.search(tag or "")
+            if m:
+                obj = self._by_batch.get((schema_filename, int(m.group(1))))
+        if obj is None:
+            obj = self._default.get(schema_filename)
+        if obj is None:
+            self.misses.add(schema_filename)
+            raise MindCallError("replay: no recorded response", schema_filename=schema_filename, tag=tag)
+        return MindProviderResult(obj=json.loads(json.dumps(obj)), transcript_path=Path("replay_mind.jsonl"))
+
+
+class ReplayHands:
+    def __init__(self, batches: list[list[dict[str, Any]]]) -> None:
+        self._batches = batches
+        self._i = 0
+
+    def _next(self, transcript_path: Path) -> CodexRunResult:
+        events = self._batches[min(self._i, len(self._batches) - 1)]
+        self._i += 1
+        write_transcript_header(transcript_path, {"provider": "replay"})
+        with transcript_path.open("a", encoding="utf-8") as f:
+            for ev in events:
+                f.write(json.dumps({"ts": "", "stream": "stdout", "line": json.dumps(ev)}) + "\n")
+        tid = next((str(ev.get("thread_id")) for ev in events if ev.get("type") == "thread.started"), "t_replay")
+        return CodexRunResult(thread_id=tid, exit_code=0, events=list(events), raw_transcript_path=transcript_path)
+
+    def exec(self, **kwargs: Any) -> CodexRunResult:
+        return self._next(Path(kwargs["transcript_path"]))
+
+    def resume(self, **kwargs: Any) -> CodexRunResult:
+        return self._next(Path(kwargs["transcript_path"]))
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+
+
+def _replay_once(*, home: Path, project_root: Path, rec: Recording, batches: int) -> dict[str, Any]:
+    mind = ReplayMind(rec.mind)
+    hands = ReplayHands(rec.hands)
+    t0 = time.perf_counter()
+    boot = W.bootstrap_autopilot_run(
+        task="Replay benchmark task: run the steps and verify with tests.",
+        project_root=str(project_root),
+        home_dir=str(home),
+        hands_provider="",
+        continue_hands=False,
+        reset_hands=False,
+        llm=mind,
+        hands_exec=hands.exec,
+        hands_resume=hands.resume,
+        hands_resume_default_sentinel=object(),
+        live=False,
+        quiet=True,
+        redact=False,
+        read_user_answer=lambda _q: "",
+    )
+    t1 = time.perf_counter()
+    result = run_autopilot_from_boot(
+        boot=boot,
+        task="Replay benchmark task: run the steps and verify with tests.",
+        max_batches=batches,
+        continue_hands=False,
+        reset_hands=False,
+        why_trace_on_run_end=False,
+        no_mi_prompt=False,
+    )
+    t2 = time.perf_counter()
+    return {
+        "status": result.status,
+        "batches": int(result.batches),
+        "bootstrap_ms": round((t1 - t0) * 1000, 3),
+        "loop_ms": round((t2 - t1) * 1000, 3),
+        "mind_calls": mind.calls,
+        "mind_misses": sorted(mind.misses),
+        "perf_path": str(boot.project_paths.perf_log_path),
+    }
+
+
+def run(
+    *,
+    claims: int,
+    evidence: int,
+    projects: int,
+    batches: int,
+    runs: int,
+    recording: Recording | None = None,
+    seed: int = 0,
+) -> dict[str, Any]:
+    rec = recording or default_recording(batches)
+    batches = max(1, int(batches))
+    with tempfile.TemporaryDirectory() as td:
+        root = Path(td)
+        t0 = time.perf_counter()
+        template_home, roots = build_home(root / "template", claims=claims, evidence=evidence, projects=projects, seed=seed)
+        build_s = time.perf_counter() - t0
+
+        results: list[dict[str, Any]] = []
+        records: list[dict[str, Any]] = []
+        for i in range(max(1, int(runs))):
+            home = root / f"run{i}"
+            shutil.copytree(template_home, home)
+            res = _replay_once(home=home, project_root=roots[0], rec=rec, batches=batches)
+            records.extend(iter_perf_records(Path(res.pop("perf_path"))))
+            results.append(res)
+            shutil.rmtree(home, ignore_errors=True)
+
+    per_batch = sorted(r["loop_ms"] / max(1, r["batches"]) for r in results)
+    summary = summarize_perf(records)
+    return {
+        "config": {"claims": claims, "evidence": evidence, "projects": projects, "batches": batches, "runs": len(results)},
+        "build_s": round(build_s, 3),
+        "runs": results,
+        "mi_ms_per_batch": {
+            "median": round(statistics.median(per_batch), 3),
+            "min": round(per_batch[0], 3),
+            "max": round(per_batch[-1], 3),
+        },
+        "bootstrap_ms_median": round(statistics.median(r["bootstrap_ms"] for r in results), 3),
+        "mind_misses": sorted({m for r in results for m in r["mind_misses"]}),
+        "phases": summary["phases"],
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any], *, max_regression: float) -> list[str]:
+    """Return regressions (median ms/batch and per-phase p50) above `max_regression` (e.g. 0.2 = +20%)."""
+
+    out: list[str] = []
+
+    def _check(name: str, cur: float, base: float) -> None:
+        # Ignore sub-millisecond phases; their noise dominates any ratio.
+        if base >= 1.0 and cur > base * (1.0 + max_regression):
+            out.append(f"{name}: {base:.1f} -> {cur:.1f} ms (+{(cur / base - 1.0) * 100:.0f}%)")
+
+    _check("mi_ms_per_batch", float(report["mi_ms_per_batch"]["median"]), float(baseline.get("mi_ms_per_batch", {}).get("median", 0.0)))
+    base_phases = {p["phase"]: p for p in baseline.get("phases", []) if isinstance(p, dict)}
+    for p in report["phases"]:
+        b = base_phases.get(p["phase"])
+        if b is not None:
+            _check(str(p["phase"]), float(p["p50_ms"]), float(b.get("p50_ms", 0.0)))
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Replay a recorded run through the batch loop and report MI-side time per batch.")
+    ap.add_argument("--claims", type=int, default=2000, help="Claims per Thought DB scope (project scopes + global; default: 2000).")
+    ap.add_argument("--evidence", type=int, default=5000, help="EvidenceLog records per project (default: 5000).")
+    ap.add_argument("--projects", type=int, default=3, help="Projects in the synthetic home (default: 3).")
+    ap.add_argument("--batches", type=int, default=6, help="Batches per replayed run (default: 6).")
+    ap.add_argument("--runs", type=int, default=3, help="Replayed runs, each on a fresh copy of the home (default: 3).")
+    ap.add_argument("--seed", type=int, default=0, help="Synthetic data seed (default: 0).")
+    ap.add_argument("--recording", default="", help="Replay this recording directory instead of the built-in one.")
+    ap.add_argument("--write-recording", default="", help="Write the built-in recording to this directory and exit.")
+    ap.add_argument("--baseline", default="", help="A previous `--json` report; exit 1 on regressions.")
+    ap.add_argument("--max-regression", type=float, default=0.25, help="Allowed slowdown vs baseline (default: 0.25 = +25%%).")
+    ap.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = ap.parse_args(argv)
+
+    if args.write_recording:
+        write_recording(default_recording(args.batches), Path(args.write_recording))
+        print(f"wrote recording to {args.write_recording}")
+        return 0
+
+    recording = load_recording(Path(args.recording)) if args.recording else None
+    res = run(
+        claims=max(0, int(args.claims)),
+        evidence=max(0, int(args.evidence)),
+        projects=max(1, int(args.projects)),
+        batches=max(1, int(args.batches)),
+        runs=max(1, int(args.runs)),
+        recording=recording,
+        seed=int(args.seed),
+    )
+    regressions: list[str] = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(res, baseline, max_regression=float(args.max_regression))
+        res["regressions"] = regressions
+
+    if args.json:
+        print(json.dumps(res, indent=2, sort_keys=True))
+    else:
+        c = res["config"]
+        print(
+            f"home: {c['claims']} claims/scope, {c['evidence']} evidence/project, {c['projects']} projects "
+            f"(built in {res['build_s']}s); {c['runs']} runs x {c['batches']} batches"
+        )
+        print(f"statuses: {', '.join(r['status'] for r in res['runs'])}; bootstrap median {res['bootstrap_ms_median']} ms")
+        m = res["mi_ms_per_batch"]
+        print(f"MI ms/batch: median {m['median']} (min {m['min']}, max {m['max']})")
+        if res["mind_misses"]:
+            print(f"WARNING: no recorded Mind response for: {', '.join(res['mind_misses'])}")
+        phases = res["phases"]
+        if phases:
+            width = max(len("phase"), *(len(str(p["phase"])) for p in phases))
+            print(f"{'phase':<{width}}  {'calls':>6}  {'p50_ms':>9}  {'p95_ms':>9}  {'total_ms':>10}")
+            for p in phases:
+                print(f"{p['phase']:<{width}}  {p['calls']:>6}  {p['p50_ms']:>9.2f}  {p['p95_ms']:>9.2f}  {p['total_ms']:>10.1f}")
+        for r in regressions:
+            print(f"REGRESSION {r}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Startup benchmark: `mi status` in a large git repo, cold vs warm project identity cache.
+
+Builds a throwaway repository with N linear commits via `git fast-import` (no origin remote,
+so the identity falls back to the root commit and `git rev-list --max-parents=0 HEAD` has to
+walk the whole history), then times `python -m mi status` with a fresh MI home:
+
+- cold: first command (identity computed with git subprocesses, cache written)
+- warm: later commands (identity served from `<home>/cache/project_identity.json`)
+- nocache: identity cache file removed before each command (previous behavior per command)
+
+Usage: python scripts/bench_project_identity.py [--commits N] [--runs N] [--repo PATH] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def build_repo(path: Path, commits: int) -> None:
+    """Create `path` with `commits` linear commits (one tiny file rewritten per commit)."""
+
+    path.mkdir(parents=True, exist_ok=True)
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    p = subprocess.Popen(["git", "fast-import", "--quiet"], cwd=path, stdin=subprocess.PIPE)
+    assert p.stdin is not None
+    w = p.stdin.write
+    for i in range(1, commits + 1):
+        data = f"{i}\n".encode()
+        msg = f"c{i}\n".encode()
+        w(b"commit refs/heads/master\n")
+        w(f"committer Bench <bench@example.com> {1_600_000_000 + i} +0000\n".encode())
+        w(b"data %d\n%s" % (len(msg), msg))
+        w(b"M 100644 inline n.txt\n")
+        w(b"data %d\n%s\n" % (len(data), data))
+    p.stdin.close()
+    if p.wait() != 0:
+        raise SystemExit("git fast-import failed")
+    subprocess.run(["git", "checkout", "-q", "master"], cwd=path, check=True)
+
+
+def _time_status(repo: Path, home: Path) -> float:
+    env = {**os.environ, "MI_HOME": str(home), "PYTHONPATH": str(_REPO_ROOT)}
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "mi", "--cd", str(repo), "status"], env=env, check=True, capture_output=True)
+    return time.perf_counter() - t0
+
+
+def run(repo: Path, runs: int) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory() as td:
+        home = Path(td)
+        cache_path = home / "cache" / "project_identity.json"
+        cold = _time_status(repo, home)
+        warm = [_time_status(repo, home) for _ in range(runs)]
+        nocache = []
+        for _ in range(runs):
+            cache_path.unlink(missing_ok=True)
+            nocache.append(_time_status(repo, home))
+
+    t0 = time.perf_counter()
+    subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"], cwd=repo, check=True, capture_output=True)
+    rev_list_s = time.perf_counter() - t0
+    return {
+        "runs": runs,
+        "cold_s": round(cold, 4),
+        "warm_median_s": round(statistics.median(warm), 4),
+        "nocache_median_s": round(statistics.median(nocache), 4),
+        "rev_list_root_s": round(rev_list_s, 4),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark `mi status` startup with/without the project identity cache.")
+    ap.add_argument("--commits", type=int, default=500_000, help="Commits in the generated repo (default: 500000).")
+    ap.add_argument("--runs", type=int, default=5, help="Timed runs per mode (default: 5).")
+    ap.add_argument("--repo", default="", help="Use (or create, if missing) this repo path instead of a temp dir.")
+    ap.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = ap.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as td:
+        repo = Path(args.repo).expanduser().resolve() if args.repo else Path(td) / "repo"
+        t0 = time.perf_counter()
+        if not (repo / ".git").exists():
+            build_repo(repo, max(1, int(args.commits)))
+        build_s = time.perf_counter() - t0
+        res = {"commits": int(args.commits), "build_s": round(build_s, 2), **run(repo, max(1, int(args.runs)))}
+
+    if args.json:
+        print(json.dumps(res, indent=2, sort_keys=True))
+        return 0
+    print(f"repo: {res['commits']} commits (built in {res['build_s']}s); rev-list root: {res['rev_list_root_s']}s")
+    print(f"mi status cold (cache miss):        {res['cold_s']}s")
+    print(f"mi status warm (identity cached):   {res['warm_median_s']}s (median of {res['runs']})")
+    print(f"mi status without identity cache:   {res['nocache_median_s']}s (median of {res['runs']})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: compiled risk-pattern engine vs per-line substring checks.
+
+Generates a synthetic Hands output corpus (mostly ordinary build/test output, a small share of
+lines with risk markers) and times, per line:
+
+- signals: `detect_risk_signals_from_text_line` (engine) vs the previous `lower()` + ~20 `in` checks
+- interrupt: `should_interrupt_text` for `on_high_risk` / `on_any_external` (engine vs substring)
+- interrupt +N: the same predicate with N extra user markers (`runtime.violation_response.risk_markers`)
+- transcript: a full scan of MI JSONL transcript rows (chunked raw-row pre-filter, as in
+  `_detect_risk_signals_from_transcript`) vs `json.loads` on every row
+
+Results are asserted identical before timing.
+
+Usage: python scripts/bench_risk_patterns.py [--lines N] [--risky-share F] [--user-markers N] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from mi.runtime.autopilot.observation import _iter_risk_candidate_rows  # noqa: E402
+from mi.runtime.risk import (  # noqa: E402
+    default_risk_engine,
+    detect_risk_signals_from_text_line,
+    risk_engine_from_config,
+    should_interrupt_text,
+)
+
+_EXTERNAL = ["pip install", "npm install", "pnpm install", "yarn add", "curl ", "wget ", "git push", "npm publish", "twine upload", "rm -rf", "rm -r", "sudo "]
+_HIGH = ["git push", "npm publish", "twine upload", "rm -rf", "rm -r", "sudo ", "curl | sh", "curl|sh", "wget | sh", "wget|sh"]
+
+_PLAIN = [
+    "collected 412 items",
+    "tests/test_parser.py::TestParser::test_roundtrip PASSED                  [ 12%]",
+    "src/mi/runtime/risk.py:88: note: Revealed type is 'builtins.list[builtins.str]'",
+    "Compiling module mi.thoughtdb.store ...",
+    "  File \"/work/app/server.py\", line 214, in handle_request",
+    "INFO 2026-10-18 12:00:01 worker-3 processed batch 88 in 12.4ms",
+    "diff --git a/README.md b/README.md",
+    "=================== 412 passed, 3 skipped in 18.22s ===================",
+    "warning: unused variable `ctx` at src/lib.rs:120:9",
+    "Running `python -m unittest discover -s tests`",
+]
+_RISKY = [
+    "/bin/zsh -lc 'pip install -r requirements.txt'",
+    "$ git push origin feature/risk-engine",
+    "Run: curl -fsSL https://example.com/install.sh | sh",
+    "sudo rm -rf /var/cache/app",
+    "npm publish --access public",
+    "wget https://example.com/data.tar.gz",
+    "yarn add left-pad",
+    "twine upload dist/*",
+]
+
+
+def legacy_signals(line: str, *, limit: int = 200) -> list[str]:
+    """The pre-engine implementation (kept here as the reference and baseline)."""
+
+    raw = str(line or "").strip()
+    if not raw:
+        return []
+    lower = raw.lower()
+    detail = raw if len(raw) <= limit else raw[: limit - 3] + "..."
+    signals: list[str] = []
+    if "git push" in lower:
+        signals.append(f"push: {detail}")
+    if "npm publish" in lower or "twine upload" in lower:
+        signals.append(f"publish: {detail}")
+    if "pip install" in lower or "npm install" in lower or "pnpm install" in lower or "yarn add" in lower:
+        signals.append(f"install: {detail}")
+    if "curl " in lower or "wget " in lower:
+        signals.append(f"network: {detail}")
+    if "rm -rf" in lower or "rm -r" in lower:
+        signals.append(f"delete: {detail}")
+    if "sudo " in lower:
+        signals.append(f"privilege: {detail}")
+    return signals
+
+
+def legacy_interrupt(mode: str, text: str) -> bool:
+    mode = (mode or "").strip()
+    if mode == "off":
+        return False
+    lower = (text or "").lower()
+    markers = _EXTERNAL if mode == "on_any_external" else _HIGH
+    return any(m in lower for m in markers)
+
+
+def make_corpus(n: int, *, risky_share: float, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    out: list[str] = []
+    for i in range(n):
+        if rng.random() < risky_share:
+            out.append(rng.choice(_RISKY))
+        else:
+            out.append(f"{rng.choice(_PLAIN)} #{i}")
+    return out
+
+
+def _rate(fn: Callable[[], Any], n: int) -> tuple[float, Any]:
+    t0 = time.perf_counter()
+    res = fn()
+    dt = time.perf_counter() - t0
+    return (n / dt if dt > 0 else float("inf")), res
+
+
+def user_markers(n: int) -> list[str]:
+    return [f"deploy-tool-{i} apply" for i in range(n)]
+
+
+def _scan_rows(rows: Any, signals: Callable[[str], list[str]]) -> int:
+    hits = 0
+    for row in rows:
+        row = row.strip()
+        if not row:
+            continue
+        rec = json.loads(row)
+        if isinstance(rec, dict) and rec.get("stream") in ("stdout", "stderr") and signals(str(rec.get("line") or "").strip()):
+            hits += 1
+    return hits
+
+
+def run(lines: int, *, risky_share: float = 0.01, extra_markers: int = 40) -> dict[str, Any]:
+    corpus = make_corpus(lines, risky_share=risky_share)
+    eng = default_risk_engine()
+
+    for line in corpus[:20000]:
+        assert detect_risk_signals_from_text_line(line) == legacy_signals(line), line
+        for mode in ("on_high_risk", "on_any_external"):
+            assert should_interrupt_text(mode, line) == legacy_interrupt(mode, line), (mode, line)
+
+    out: dict[str, Any] = {"lines": lines, "risky_share": risky_share}
+    legacy_rate, legacy_hits = _rate(lambda: sum(1 for x in corpus if legacy_signals(x)), lines)
+    engine_rate, engine_hits = _rate(lambda: sum(1 for x in corpus if detect_risk_signals_from_text_line(x)), lines)
+    assert legacy_hits == engine_hits
+    out["signals"] = {"legacy_lines_per_s": round(legacy_rate), "engine_lines_per_s": round(engine_rate), "hits": engine_hits}
+
+    for mode in ("on_high_risk", "on_any_external"):
+        lr, lh = _rate(lambda: sum(1 for x in corpus if legacy_interrupt(mode, x)), lines)
+        er, eh = _rate(lambda: sum(1 for x in corpus if eng.should_interrupt(mode, x)), lines)
+        assert lh == eh
+        out[f"interrupt.{mode}"] = {"legacy_lines_per_s": round(lr), "engine_lines_per_s": round(er), "hits": eh}
+
+    extra = user_markers(extra_markers)
+    user_eng = risk_engine_from_config({"violation_response": {"risk_markers": {"deploy": extra}}})
+    ext = _EXTERNAL + extra
+    lr, lh = _rate(lambda: sum(1 for x in corpus if any(m in x.lower() for m in ext)), lines)
+    er, eh = _rate(lambda: sum(1 for x in corpus if user_eng.should_interrupt("on_any_external", x)), lines)
+    assert lh == eh
+    out["interrupt.user_markers"] = {"markers": len(ext), "legacy_lines_per_s": round(lr), "engine_lines_per_s": round(er), "hits": eh}
+
+    with tempfile.TemporaryDirectory() as td:
+        path = Path(td) / "hands.jsonl"
+        with path.open("w", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "mi.transcript.header"}) + "\n")
+            for x in corpus:
+                f.write(json.dumps({"ts": "2026-10-18T12:00:00Z", "stream": "stdout", "line": x}, sort_keys=True) + "\n")
+
+        def _legacy_scan() -> int:
+            with path.open("r", encoding="utf-8") as f:
+                return _scan_rows(f, legacy_signals)
+
+        def _engine_scan() -> int:
+            with path.open("r", encoding="utf-8") as f:
+                return _scan_rows(_iter_risk_candidate_rows(f, eng), detect_risk_signals_from_text_line)
+
+        lr, lh = _rate(_legacy_scan, lines)
+        er, eh = _rate(_engine_scan, lines)
+        assert lh == eh
+        out["transcript"] = {"legacy_rows_per_s": round(lr), "engine_rows_per_s": round(er), "hits": eh}
+    return out
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the compiled risk-pattern engine against substring checks.")
+    ap.add_argument("--lines", type=int, default=1_000_000, help="Corpus size (default: 1000000).")
+    ap.add_argument("--risky-share", type=float, default=0.01, help="Share of lines with a risk marker (default: 0.01).")
+    ap.add_argument("--user-markers", type=int, default=40, help="Extra user markers for the scaling row (default: 40).")
+    ap.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = ap.parse_args(argv)
+
+    res = run(
+        max(1, int(args.lines)),
+        risky_share=max(0.0, min(1.0, float(args.risky_share))),
+        extra_markers=max(0, int(args.user_markers)),
+    )
+    if args.json:
+        print(json.dumps(res, indent=2, sort_keys=True))
+        return 0
+    print(f"corpus: {res['lines']} lines, risky share {res['risky_share']}")
+    for key in ("signals", "interrupt.on_high_risk", "interrupt.on_any_external", "interrupt.user_markers"):
+        r = res[key]
+        label = f"{key} ({r['markers']})" if "markers" in r else key
+        print(f"{label:<28} legacy {r['legacy_lines_per_s']:>12,} lines/s   engine {r['engine_lines_per_s']:>12,} lines/s")
+    t = res["transcript"]
+    print(f"{'transcript scan (JSONL)':<28} legacy {t['legacy_rows_per_s']:>12,} rows/s    engine {t['engine_rows_per_s']:>12,} rows/s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
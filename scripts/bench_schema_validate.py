@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: interpreted vs compiled JSON Schema validation over `mi/schemas/*.json`.
+
+For each schema, a valid example plus a set of invalid mutations are synthesized and
+validated repeatedly with `validate_json_schema` (re-walks the schema dict per call) and
+with the closure from `compile_json_schema`. Error lists are asserted identical.
+
+Usage: python scripts/bench_schema_validate.py [--iterations N] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from mi.core.schema_validate import compile_json_schema, validate_json_schema  # noqa: E402
+from mi.providers.mind_utils import load_schema  # noqa: E402
+
+
+def example_for(schema: Any) -> Any:
+    """Return a (usually) valid instance for the MI schema subset."""
+
+    if not isinstance(schema, dict):
+        return None
+    if isinstance(schema.get("anyOf"), list) and schema["anyOf"]:
+        subs = [s for s in schema["anyOf"] if isinstance(s, dict)]
+        # Prefer the non-null branch so nested structure gets exercised.
+        non_null = [s for s in subs if s.get("type") != "null"]
+        return example_for((non_null or subs or [{}])[0])
+    if isinstance(schema.get("enum"), list) and schema["enum"]:
+        return schema["enum"][0]
+    t = schema.get("type")
+    if t == "object":
+        props = schema.get("properties") if isinstance(schema.get("properties"), dict) else {}
+        return {k: example_for(v) for k, v in props.items()}
+    if t == "array":
+        items = schema.get("items")
+        return [example_for(items), example_for(items)] if isinstance(items, dict) else []
+    if t == "string":
+        return "x"
+    if t == "number":
+        mn = schema.get("minimum")
+        return mn if isinstance(mn, (int, float)) else 0
+    if t == "boolean":
+        return True
+    return None
+
+
+def _leaf_paths(obj: Any, prefix: tuple[Any, ...] = ()) -> list[tuple[Any, ...]]:
+    out: list[tuple[Any, ...]] = [prefix]
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            out.extend(_leaf_paths(v, prefix + (k,)))
+    elif isinstance(obj, list):
+        for i, v in enumerate(obj):
+            out.extend(_leaf_paths(v, prefix + (i,)))
+    return out
+
+
+def _set_at(obj: Any, path: tuple[Any, ...], value: Any) -> Any:
+    if not path:
+        return value
+    cur = obj
+    for p in path[:-1]:
+        cur = cur[p]
+    cur[path[-1]] = value
+    return obj
+
+
+def mutations_for(valid: Any) -> list[Any]:
+    """Invalid variants: wrong-typed values at every position, dropped keys, extra keys."""
+
+    out: list[Any] = []
+    for path in _leaf_paths(valid):
+        for bad in (12345, "bad", None, [1], {"z": 1}, True, -5.5, 99):
+            out.append(_set_at(copy.deepcopy(valid), path, bad))
+        if path:
+            parent = copy.deepcopy(valid)
+            cur = parent
+            for p in path[:-1]:
+                cur = cur[p]
+            if isinstance(cur, dict):
+                cur.pop(path[-1], None)
+                out.append(parent)
+    for path in _leaf_paths(valid):
+        probe = copy.deepcopy(valid)
+        cur = probe
+        for p in path:
+            cur = cur[p]
+        if isinstance(cur, dict):
+            cur["unexpected_extra_key"] = 1
+            out.append(probe)
+    return out
+
+
+def _time(fn: Any, samples: list[Any], iterations: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        for s in samples:
+            fn(s)
+    return time.perf_counter() - t0
+
+
+def run(iterations: int) -> dict[str, Any]:
+    schema_dir = _REPO_ROOT / "mi" / "schemas"
+    rows: list[dict[str, Any]] = []
+    tot_interp = 0.0
+    tot_comp = 0.0
+    tot_n = 0
+    for path in sorted(schema_dir.glob("*.json")):
+        schema = json.loads(path.read_text(encoding="utf-8"))
+        valid = example_for(schema)
+        samples = [valid, *mutations_for(valid)]
+        compiled = compile_json_schema(schema)
+        for s in samples:
+            a = validate_json_schema(s, schema)
+            b = compiled(s)
+            if a != b:
+                raise SystemExit(f"mismatch for {path.name}: {a!r} != {b!r} on {s!r}")
+
+        t_interp = _time(lambda o: validate_json_schema(o, schema), samples, iterations)
+        t_comp = _time(compiled, samples, iterations)
+        n = len(samples) * iterations
+        tot_interp += t_interp
+        tot_comp += t_comp
+        tot_n += n
+        rows.append(
+            {
+                "schema": path.name,
+                "samples": len(samples),
+                "interpreted_per_s": round(n / t_interp) if t_interp else None,
+                "compiled_per_s": round(n / t_comp) if t_comp else None,
+                "speedup": round(t_interp / t_comp, 2) if t_comp else None,
+            }
+        )
+
+    # Schema loading: read + parse per call (old provider path) vs the process-wide cache.
+    names = [p.name for p in sorted(schema_dir.glob("*.json"))]
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        for name in names:
+            json.loads((schema_dir / name).read_text(encoding="utf-8"))
+    t_load_raw = time.perf_counter() - t0
+    for name in names:
+        load_schema(name)
+    t0 = time.perf_counter()
+    for _ in range(iterations):
+        for name in names:
+            load_schema(name)
+    t_load_cached = time.perf_counter() - t0
+
+    return {
+        "iterations": iterations,
+        "schemas": rows,
+        "total": {
+            "validations": tot_n,
+            "interpreted_per_s": round(tot_n / tot_interp) if tot_interp else None,
+            "compiled_per_s": round(tot_n / tot_comp) if tot_comp else None,
+            "speedup": round(tot_interp / tot_comp, 2) if tot_comp else None,
+        },
+        "schema_load": {
+            "loads": iterations * len(names),
+            "read_parse_s": round(t_load_raw, 6),
+            "cached_s": round(t_load_cached, 6),
+        },
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark MI JSON Schema validation (interpreted vs compiled).")
+    ap.add_argument("--iterations", type=int, default=200, help="Passes over each schema's samples (default: 200).")
+    ap.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = ap.parse_args(argv)
+
+    res = run(max(1, int(args.iterations)))
+    if args.json:
+        print(json.dumps(res, indent=2, sort_keys=True))
+        return 0
+
+    print(f"{'schema':<28} {'samples':>7} {'interp/s':>10} {'compiled/s':>11} {'speedup':>8}")
+    for r in res["schemas"]:
+        print(f"{r['schema']:<28} {r['samples']:>7} {r['interpreted_per_s']:>10} {r['compiled_per_s']:>11} {r['speedup']:>8}")
+    t = res["total"]
+    print(f"{'TOTAL':<28} {t['validations']:>7} {t['interpreted_per_s']:>10} {t['compiled_per_s']:>11} {t['speedup']:>8}")
+    sl = res["schema_load"]
+    print(f"schema load x{sl['loads']}: read+parse={sl['read_parse_s']}s cached={sl['cached_s']}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: Thought DB graph lookups on a synthetic dense graph (default 500k edges).
+
+Builds in-memory project/global views (claims + nodes, random edges, a share of same_as
+redirects) and times, indexed vs the previous implementation:
+
+- related: `ThoughtDbApplicationService.related_edges_for_id` (adjacency lists) vs a scan of `view.edges`
+- edge_by_id: `ThoughtDbView.edge_by_id` vs a scan of `view.edges`
+- aliases: the view's maintained canonical -> aliases index vs rebuilding it from all redirects
+  (previously done on every `build_subgraph_for_id` call)
+- subgraph: `build_subgraph_for_id` (effective scope, `--depth`)
+- one_hop: `expand_one_hop` vs the previous per-seed `edges_adjacent` list copies
+
+Results are asserted identical before timing.
+
+Usage: python scripts/bench_thoughtdb_graph.py [--edges N] [--ids N] [--depth D] [--json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from mi.thoughtdb._view_store_impl import _alias_index, _edge_pos_index  # noqa: E402
+from mi.thoughtdb.app_service import ThoughtDbApplicationService  # noqa: E402
+from mi.thoughtdb.graph import build_subgraph_for_id  # noqa: E402
+from mi.thoughtdb.model import ThoughtDbView  # noqa: E402
+from mi.thoughtdb.predicates import claim_active_and_valid, edges_adjacent, node_active  # noqa: E402
+from mi.thoughtdb.retrieval import expand_one_hop  # noqa: E402
+
+_EDGE_TYPES = ["depends_on", "supports", "contradicts", "derived_from", "mentions"]
+
+
+def _make_view(scope: str, *, n_edges: int, n_ids: int, rng: random.Random) -> ThoughtDbView:
+    ts = "2026-01-01T00:00:00Z"
+    claims = {f"cl_{scope}_{i}": {"claim_id": f"cl_{scope}_{i}", "claim_type": "fact", "text": f"c{i}", "asserted_ts": ts} for i in range(n_ids // 2)}
+    nodes = {f"nd_{scope}_{i}": {"node_id": f"nd_{scope}_{i}", "node_type": "decision", "title": f"n{i}", "asserted_ts": ts} for i in range(n_ids // 2)}
+    ids = list(claims) + list(nodes)
+    edges: list[dict[str, Any]] = []
+    by_from: dict[str, list[dict[str, Any]]] = {}
+    by_to: dict[str, list[dict[str, Any]]] = {}
+    redirects: dict[str, str] = {}
+    for i in range(n_edges):
+        frm, to = rng.choice(ids), rng.choice(ids)
+        et = "same_as" if i % 200 == 0 and frm != to and frm not in redirects else rng.choice(_EDGE_TYPES)
+        e = {"kind": "edge", "edge_id": f"ed_{scope}_{i}", "edge_type": et, "from_id": frm, "to_id": to, "scope": scope, "asserted_ts": ts}
+        edges.append(e)
+        by_from.setdefault(frm, []).append(e)
+        by_to.setdefault(to, []).append(e)
+        if et == "same_as":
+            redirects[frm] = to
+    return ThoughtDbView(
+        scope=scope,
+        project_id="bench",
+        claims_by_id=claims,
+        nodes_by_id=nodes,
+        edges=edges,
+        redirects_same_as=redirects,
+        superseded_ids=set(),
+        retracted_ids=set(),
+        retracted_node_ids=set(),
+        edges_by_from=by_from,
+        edges_by_to=by_to,
+        edge_pos_by_id=_edge_pos_index(edges),
+        aliases_by_canonical=_alias_index(redirects),
+    )
+
+
+class _Views:
+    """Just enough of ThoughtDbStore for the graph helpers."""
+
+    def __init__(self, views: dict[str, ThoughtDbView]) -> None:
+        self._views = views
+
+    def load_view(self, *, scope: str) -> ThoughtDbView:
+        return self._views[scope]
+
+
+def _legacy_related(v: ThoughtDbView, iid: str) -> list[dict[str, Any]]:
+    canon = v.resolve_id(iid)
+    out: list[dict[str, Any]] = []
+    for e in v.edges:
+        frm = str(e.get("from_id") or "").strip()
+        to = str(e.get("to_id") or "").strip()
+        if iid in (frm, to) or (canon and canon in (frm, to)):
+            out.append(e)
+    return out
+
+
+def _legacy_edge_by_id(v: ThoughtDbView, eid: str) -> dict[str, Any] | None:
+    for e in v.edges:
+        if str(e.get("edge_id") or "").strip() == eid:
+            return e
+    return None
+
+
+def _legacy_reverse_aliases(v: ThoughtDbView) -> dict[str, set[str]]:
+    rev: dict[str, set[str]] = {}
+    for dup in v.redirects_same_as:
+        canon = v.resolve_id(dup)
+        if canon and canon != dup:
+            rev.setdefault(canon, set()).add(dup)
+    return rev
+
+
+def _legacy_one_hop(v_proj: ThoughtDbView, v_glob: ThoughtDbView, seeds: set[str], *, max_c: int, max_n: int) -> tuple[list[str], list[str]]:
+    """The previous `expand_one_hop` loop (combined `edges_adjacent` list per seed)."""
+
+    allow = {"depends_on", "supports", "contradicts", "derived_from", "mentions", "supersedes", "same_as"}
+    added_c: list[str] = []
+    added_n: list[str] = []
+    seen_added: set[str] = set()
+    seen_edges: set[str] = set()
+
+    def classify(other: str) -> str:
+        if other.startswith("cl_") or other in v_proj.claims_by_id or other in v_glob.claims_by_id:
+            return "claim"
+        if other.startswith("nd_") or other in v_proj.nodes_by_id or other in v_glob.nodes_by_id:
+            return "node"
+        return ""
+
+    def ok_other(other: str, kind: str) -> bool:
+        if kind == "claim":
+            return claim_active_and_valid(v_proj, other, as_of_ts="") or claim_active_and_valid(v_glob, other, as_of_ts="")
+        return node_active(v_proj, other) or node_active(v_glob, other)
+
+    for view in (v_proj, v_glob):
+        for sid in sorted(seeds):
+            for e in edges_adjacent(view, sid):
+                if len(added_c) >= max_c and len(added_n) >= max_n:
+                    break
+                if not isinstance(e, dict) or str(e.get("kind") or "").strip() != "edge":
+                    continue
+                et = str(e.get("edge_type") or "").strip()
+                if et not in allow:
+                    continue
+                frm = str(e.get("from_id") or "").strip()
+                to = str(e.get("to_id") or "").strip()
+                if not frm or not to:
+                    continue
+                ek = f"{view.scope}:{et}:{frm}->{to}"
+                if ek in seen_edges:
+                    continue
+                seen_edges.add(ek)
+                other = to if frm == sid else (frm if to == sid else "")
+                if not other or other in seeds or other in seen_added:
+                    continue
+                knd = classify(other)
+                if not knd or not ok_other(other, knd):
+                    continue
+                if knd == "claim" and len(added_c) < max_c:
+                    added_c.append(other)
+                    seen_added.add(other)
+                elif knd == "node" and len(added_n) < max_n:
+                    added_n.append(other)
+                    seen_added.add(other)
+    return added_c, added_n
+
+
+def _time(fn: Callable[[], Any], *, min_s: float = 0.3) -> float:
+    """Seconds per call (repeats until `min_s` elapsed)."""
+
+    n = 0
+    t0 = time.perf_counter()
+    while True:
+        fn()
+        n += 1
+        dt = time.perf_counter() - t0
+        if dt >= min_s:
+            return dt / n
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--edges", type=int, default=500_000, help="Edges per scope (project and global).")
+    ap.add_argument("--ids", type=int, default=100_000, help="Claims + nodes per scope.")
+    ap.add_argument("--depth", type=int, default=2, help="Subgraph depth (max 6).")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    t0 = time.perf_counter()
+    v_proj = _make_view("project", n_edges=args.edges, n_ids=args.ids, rng=rng)
+    v_glob = _make_view("global", n_edges=args.edges, n_ids=args.ids, rng=rng)
+    build_s = time.perf_counter() - t0
+
+    stores = _Views({"project": v_proj, "global": v_glob})
+    app = ThoughtDbApplicationService.__new__(ThoughtDbApplicationService)
+    app._view = lambda sc: stores.load_view(scope=sc)  # type: ignore[method-assign]
+
+    probe = rng.choice(list(v_proj.claims_by_id))
+    eid = v_proj.edges[len(v_proj.edges) // 2]["edge_id"]
+    seeds = set(rng.sample(list(v_proj.claims_by_id), 64))
+
+    assert app.related_edges_for_id(scope="project", item_id=probe) == _legacy_related(v_proj, probe)
+    assert v_proj.edge_by_id(eid) is _legacy_edge_by_id(v_proj, eid)
+    assert v_proj.aliases_by_canonical == _legacy_reverse_aliases(v_proj)
+    new_hop = expand_one_hop(v_proj=v_proj, v_glob=v_glob, seed_ids=seeds, as_of_ts="", max_new_claims=10_000, max_new_nodes=10_000)
+    assert (new_hop.claim_ids, new_hop.node_ids) == _legacy_one_hop(v_proj, v_glob, seeds, max_c=10_000, max_n=10_000)
+
+    def _subgraph() -> dict[str, Any]:
+        return build_subgraph_for_id(
+            tdb=stores,  # type: ignore[arg-type]
+            scope="effective",
+            root_id=probe,
+            depth=args.depth,
+            direction="both",
+            edge_types=None,
+            include_inactive=False,
+            include_aliases=False,
+        )
+
+    sub = _subgraph()
+    rows = {
+        "related": (_time(lambda: _legacy_related(v_proj, probe)), _time(lambda: app.related_edges_for_id(scope="project", item_id=probe))),
+        "edge_by_id": (_time(lambda: _legacy_edge_by_id(v_proj, eid)), _time(lambda: v_proj.edge_by_id(eid))),
+        "aliases": (_time(lambda: (_legacy_reverse_aliases(v_proj), _legacy_reverse_aliases(v_glob))), _time(lambda: (v_proj.aliases_of(probe), v_glob.aliases_of(probe)))),
+        "one_hop": (
+            _time(lambda: _legacy_one_hop(v_proj, v_glob, seeds, max_c=10_000, max_n=10_000)),
+            _time(lambda: expand_one_hop(v_proj=v_proj, v_glob=v_glob, seed_ids=seeds, as_of_ts="", max_new_claims=10_000, max_new_nodes=10_000)),
+        ),
+    }
+    subgraph_s = _time(_subgraph, min_s=1.0)
+
+    report = {
+        "edges_per_scope": args.edges,
+        "ids_per_scope": args.ids,
+        "redirects_per_scope": len(v_proj.redirects_same_as),
+        "view_build_s": round(build_s, 3),
+        "subgraph": {"depth": args.depth, "edges": len(sub["edges"]), "claims": len(sub["claims"]), "nodes": len(sub["nodes"]), "ms": round(subgraph_s * 1000, 2)},
+        "ops": {k: {"legacy_ms": round(a * 1000, 4), "indexed_ms": round(b * 1000, 4), "speedup": round(a / b, 1) if b else None} for k, (a, b) in rows.items()},
+    }
+    if args.json:
+        print(json.dumps(report, indent=2, sort_keys=True))
+        return 0
+    print(f"views: {args.edges} edges / {args.ids} ids / {report['redirects_per_scope']} redirects per scope (built in {build_s:.1f}s)")
+    for k, r in report["ops"].items():
+        print(f"{k:<11} legacy {r['legacy_ms']:>10.4f} ms   indexed {r['indexed_ms']:>10.4f} ms   x{r['speedup']}")
+    s = report["subgraph"]
+    print(f"subgraph    depth={s['depth']} edges={s['edges']} claims={s['claims']} nodes={s['nodes']}: {s['ms']} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from mi.providers.mind_errors import MindCallError
+from mi.providers.mind_utils import load_schema
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+_BENCH_PATH = _ROOT / "scripts" / "bench_batch_loop.py"
+
+
+def _load_bench():
+    spec = importlib.util.spec_from_file_location("bench_batch_loop", _BENCH_PATH)
+    assert spec and spec.loader
+    mod = importlib.util.module_from_spec(spec)
+    # Registered first: the script defines dataclasses, which look up their module.
+    sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class TestBenchBatchLoop(unittest.TestCase):
+    def test_default_recording_is_schema_valid_and_round_trips(self) -> None:
+        bench = _load_bench()
+        rec = bench.default_recording(3)
+        for entry in rec.mind:
+            self.assertEqual(load_schema(entry["schema"]).validate(entry["obj"]), [], entry["schema"])
+
+        with tempfile.TemporaryDirectory() as td:
+            bench.write_recording(rec, Path(td))
+            loaded = bench.load_recording(Path(td))
+        self.assertEqual(loaded.hands, rec.hands)
+        self.assertEqual(loaded.mind, rec.mind)
+
+    def test_replay_mind_prefers_tag_then_batch_then_schema(self) -> None:
+        bench = _load_bench()
+        mind = bench.ReplayMind(
+            [
+                {"schema": "s.json", "obj": {"v": "default"}},
+                {"schema": "s.json", "batch": 2, "obj": {"v": "batch"}},
+                {"schema": "s.json", "tag": "decide_b2", "obj": {"v": "tag"}},
+            ]
+        )
+        self.assertEqual(mind.call(schema_filename="s.json", prompt="", tag="decide_b2").obj, {"v": "tag"})
+        self.assertEqual(mind.call(schema_filename="s.json", prompt="", tag="checkpoint:b2").obj, {"v": "batch"})
+        self.assertEqual(mind.call(schema_filename="s.json", prompt="", tag="decide_b0").obj, {"v": "default"})
+        with self.assertRaises(MindCallError):
+            mind.call(schema_filename="other.json", prompt="", tag="x")
+        self.assertEqual(mind.misses, {"other.json"})
+
+    def test_small_replay_reports_phases(self) -> None:
+        bench = _load_bench()
+        res = bench.run(claims=20, evidence=20, projects=2, batches=2, runs=1)
+        self.assertEqual([(r["status"], r["batches"]) for r in res["runs"]], [("done", 2)])
+        self.assertEqual(res["mind_misses"], [])
+        phases = {p["phase"] for p in res["phases"]}
+        for name in ("batch.predecide", "batch.decide", "tdb.decide_context", "evidence.append"):
+            self.assertIn(name, phases)
+
+        slower = {**res, "mi_ms_per_batch": {**res["mi_ms_per_batch"], "median": res["mi_ms_per_batch"]["median"] * 3 + 10}}
+        self.assertEqual(bench.compare(res, res, max_regression=0.25), [])
+        self.assertEqual(len(bench.compare(slower, res, max_regression=0.25)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
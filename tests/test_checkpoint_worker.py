@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from mi.runtime.autopilot import CheckpointWorker
+from mi.runtime.evidence import EvidenceWriter, evidence_order_key
+
+
+def _read(path: Path) -> list[dict]:
+    return [json.loads(x) for x in path.read_text(encoding="utf-8").splitlines() if x.strip()]
+
+
+class TestEvidenceSlots(unittest.TestCase):
+    def test_reserved_block_is_written_contiguously_with_stable_ids(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            evw = EvidenceWriter(path=Path(td) / "evidence.jsonl", run_id="r1")
+            evw.append({"kind": "a"})
+            slots = evw.reserve()
+            evw.append({"kind": "c"})
+            b1 = slots.append({"kind": "b1"})
+            evw.append({"kind": "d"})
+            # Any number of records fits one reservation; nothing is written before the flush.
+            for i in range(2, 100):
+                slots.append({"kind": f"b{i}"})
+            self.assertEqual([r["kind"] for r in _read(evw.path)], ["a", "c", "d"])
+            slots.flush()
+
+            recs = _read(evw.path)
+            kinds = [r["kind"] for r in recs]
+            self.assertEqual(kinds[:3], ["a", "c", "d"])
+            self.assertEqual(kinds[3:], [f"b{i}" for i in range(1, 100)])
+            self.assertEqual(b1["event_id"], "ev_r1_000002_001")
+            self.assertEqual(b1, recs[3])
+            # One seq per job: no burnt numbers; (seq, sub_seq) restores run order.
+            self.assertEqual(sorted({r["seq"] for r in recs}), [1, 2, 3, 4])
+            ordered = [r["kind"] for r in sorted(recs, key=evidence_order_key)]
+            self.assertEqual(ordered[:2], ["a", "b1"])
+            self.assertEqual(ordered[-2:], ["c", "d"])
+            self.assertEqual(len({r["event_id"] for r in recs}), len(recs))
+
+
+class TestCheckpointWorker(unittest.TestCase):
+    def _worker(self, evw: EvidenceWriter, **kwargs) -> CheckpointWorker:
+        return CheckpointWorker(reserve_slots=evw.reserve, evidence_append=evw.append, **kwargs)
+
+    def test_mining_overlaps_with_hands_and_keeps_evidence_order(self) -> None:
+        latency = 0.2
+        with tempfile.TemporaryDirectory() as td:
+            evw = EvidenceWriter(path=Path(td) / "evidence.jsonl", run_id="r1")
+            worker = self._worker(evw)
+            mind = worker.unlocked(lambda: time.sleep(latency))
+            hands = worker.unlocked(lambda: time.sleep(latency))
+
+            def _job() -> None:
+                worker.evidence_append({"kind": "claim_mining"})
+                mind()
+                worker.evidence_append({"kind": "node_materialized"})
+
+            worker.start()
+            t0 = time.perf_counter()
+            try:
+                worker.evidence_append({"kind": "checkpoint"})
+                worker.submit(_job)
+                hands()
+                worker.evidence_append({"kind": "hands_input"})
+                worker.drain()
+            finally:
+                worker.close()
+            elapsed = time.perf_counter() - t0
+
+            self.assertLess(elapsed, 1.8 * latency)
+            self.assertEqual(worker.stats, {"submitted": 1, "completed": 1, "failed": 0})
+            recs = _read(evw.path)
+            kinds = [r["kind"] for r in sorted(recs, key=evidence_order_key)]
+            self.assertEqual(kinds, ["checkpoint", "claim_mining", "node_materialized", "hands_input"])
+            # The job's records are written as one contiguous block (never interleaved with the run loop's).
+            in_log = [r["kind"] for r in recs]
+            self.assertEqual(in_log.index("node_materialized"), in_log.index("claim_mining") + 1)
+
+    def test_pinned_getters_return_submit_time_values_inside_jobs(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            evw = EvidenceWriter(path=Path(td) / "evidence.jsonl", run_id="r1")
+            worker = self._worker(evw)
+            cur = {"segment_id": "seg_1"}
+            get_segment = worker.pin("segment_id", lambda: cur["segment_id"])
+            seen: list[str] = []
+
+            worker.start()
+            try:
+                worker.submit(lambda: seen.append(get_segment()))
+                cur["segment_id"] = "seg_2"
+                self.assertEqual(get_segment(), "seg_2")
+                worker.drain()
+            finally:
+                worker.close()
+            self.assertEqual(seen, ["seg_1"])
+
+    def test_drain_reraises_job_error(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            evw = EvidenceWriter(path=Path(td) / "evidence.jsonl", run_id="r1")
+            worker = self._worker(evw, max_pending=1)
+
+            def _boom() -> None:
+                raise RuntimeError("miner failed")
+
+            worker.start()
+            try:
+                worker.submit(_boom)
+                worker.submit(lambda: worker.evidence_append({"kind": "after"}))
+                with self.assertRaises(RuntimeError):
+                    worker.drain()
+            finally:
+                worker.close()
+            self.assertEqual(worker.stats["failed"], 1)
+            self.assertEqual([r["kind"] for r in _read(evw.path)], ["after"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+
+# Agreed budgets: number of `mi.*` modules a command may import (see `python -X importtime`).
+# Raise deliberately (and review why) if a change needs more.
+_MI_MODULE_BUDGET = {
+    "version": 16,
+    "tail": 24,
+    "perf": 24,
+}
+# Heavy packages that lightweight commands must never import.
+_FORBIDDEN_PREFIXES = (
+    "mi.runtime.runner",
+    "mi.runtime.autopilot",
+    "mi.runtime.wiring",
+    "mi.providers",
+    "mi.thoughtdb",
+    "mi.memory",
+    "mi.cli_commands.runtime_ops",
+)
+
+
+def _imported_mi_modules(argv: list[str]) -> list[str]:
+    with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as cwd:
+        env = {**os.environ, "MI_HOME": home, "PYTHONPATH": str(_REPO_ROOT)}
+        env.pop("MI_CD", None)
+        p = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "mi", "--cd", cwd, *argv],
+            cwd=cwd,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+    mods: list[str] = []
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        name = line.rsplit("|", 1)[-1].strip()
+        if name == "mi" or name.startswith("mi."):
+            mods.append(name)
+    return mods
+
+
+class TestCliImportBudget(unittest.TestCase):
+    def _check(self, cmd: str) -> None:
+        mods = _imported_mi_modules([cmd])
+        self.assertIn("mi.cli", mods)
+        heavy = [m for m in mods if m.startswith(_FORBIDDEN_PREFIXES)]
+        self.assertEqual(heavy, [], f"`mi {cmd}` imported heavy modules")
+        self.assertLessEqual(len(mods), _MI_MODULE_BUDGET[cmd], f"`mi {cmd}` imported: {mods}")
+
+    def test_version_import_budget(self) -> None:
+        self._check("version")
+
+    def test_tail_import_budget(self) -> None:
+        self._check("tail")
+
+    def test_perf_import_budget(self) -> None:
+        self._check("perf")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -81,6 +81,39 @@ class EvidenceFlowHelpersTests(unittest.TestCase):
         self.assertEqual(evidence_window, [{}])
         self.assertEqual(segment_written, [{}])
 
+    def test_repo_probe_is_logged_but_not_tracked(self) -> None:
+        evidence_window: list[dict[str, object]] = []
+        evidence_written: list[dict[str, object]] = []
+        segment_written: list[dict[str, object]] = []
+
+        def _ev_append(rec: dict[str, object]):
+            evidence_written.append(dict(rec))
+            return dict(rec)
+
+        rec = append_evidence_with_tracking(
+            batch_id="b1",
+            hands_transcript_ref="",
+            mind_transcript_ref="",
+            mi_input="",
+            transcript_observation={},
+            repo_observation={"git_head": "main"},
+            evidence_obj={},
+            evidence_window=evidence_window,
+            repo_probe={"git_probe_ms": {"status": 1.5}, "git_probe_reused": ["head"]},
+            deps=EvidenceAppendDeps(
+                evidence_append=_ev_append,
+                append_window=lambda window, obj: window.append(dict(obj)),
+                segment_add=lambda item: segment_written.append(dict(item)),
+                now_ts=lambda: "2026-02-01T00:00:00Z",
+                thread_id="t_1",
+            ),
+        )
+
+        self.assertEqual(evidence_written[0].get("repo_probe"), {"git_probe_ms": {"status": 1.5}, "git_probe_reused": ["head"]})
+        self.assertNotIn("repo_probe", rec)
+        self.assertNotIn("repo_probe", evidence_window[0])
+        self.assertNotIn("repo_probe", segment_written[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import Any
+
+from mi.providers.types import MindProviderResult
+from mi.runtime.autopilot import MindPhaseSpec, MindPrefetcher
+from mi.runtime.wiring.mind_call import MindCaller
+
+
+class _SlowMind:
+    """Fake Mind provider: fixed latency per call; optionally fails for some tags."""
+
+    def __init__(self, *, latency_s: float, fail_tags: tuple[str, ...] = ()) -> None:
+        self.latency_s = latency_s
+        self.fail_tags = fail_tags
+        self.calls: list[tuple[str, str, str]] = []
+        self._lock = threading.Lock()
+
+    def call(self, *, schema_filename: str, prompt: str, tag: str) -> MindProviderResult:
+        with self._lock:
+            self.calls.append((schema_filename, tag, prompt))
+        time.sleep(self.latency_s)
+        if tag in self.fail_tags:
+            raise RuntimeError(f"boom:{tag}")
+        return MindProviderResult(obj={"tag": tag, "prompt": prompt}, transcript_path=Path(f"/tmp/{tag}.jsonl"))
+
+
+def _specs() -> list[MindPhaseSpec]:
+    def _aa_prompt(objs: dict[str, dict[str, Any] | None]) -> str | None:
+        checks = objs.get("checks")
+        return f"aa:{checks['tag']}" if isinstance(checks, dict) else None
+
+    return [
+        MindPhaseSpec(name="wf", schema_filename="workflow_progress.json", tag="wf_progress_b0", build_prompt=lambda _o: "wf"),
+        MindPhaseSpec(name="risk", schema_filename="risk_judge.json", tag="risk_b0", build_prompt=lambda _o: "risk"),
+        MindPhaseSpec(name="checks", schema_filename="plan_min_checks.json", tag="checks_b0", build_prompt=lambda _o: "checks"),
+        MindPhaseSpec(
+            name="aa",
+            schema_filename="auto_answer_to_hands.json",
+            tag="autoanswer_b0",
+            build_prompt=_aa_prompt,
+            after=("checks",),
+        ),
+    ]
+
+
+def _run_pipeline(caller: MindCaller, prefetcher: MindPrefetcher | None = None) -> list[Any]:
+    """The sequential batch pipeline: same call order with or without prefetch."""
+
+    out = []
+    for schema, tag, prompt in (
+        ("workflow_progress.json", "wf_progress_b0", "wf"),
+        ("risk_judge.json", "risk_b0", "risk"),
+        ("plan_min_checks.json", "checks_b0", "checks"),
+        ("auto_answer_to_hands.json", "autoanswer_b0", "aa:checks_b0"),
+    ):
+        obj, _ref, state = caller.call(schema_filename=schema, prompt=prompt, tag=tag, batch_id="b0")
+        out.append((tag, obj, state))
+        if prefetcher is not None and tag == "checks_b0":
+            prefetcher.release("checks", obj)
+    return out
+
+
+def _caller(llm_call: Any, records: list[dict[str, Any]]) -> MindCaller:
+    return MindCaller(
+        llm_call=llm_call,
+        evidence_append=records.append,
+        now_ts=lambda: "ts",
+        truncate=lambda s, n: s[:n],
+        thread_id_getter=lambda: "t1",
+        evidence_window=[],
+        threshold=5,
+    )
+
+
+class TestMindPrefetch(unittest.TestCase):
+    def test_prefetch_reduces_batch_wall_clock(self) -> None:
+        latency = 0.15
+
+        seq_llm = _SlowMind(latency_s=latency)
+        seq_records: list[dict[str, Any]] = []
+        t0 = time.perf_counter()
+        seq_out = _run_pipeline(_caller(seq_llm.call, seq_records))
+        seq_s = time.perf_counter() - t0
+
+        par_llm = _SlowMind(latency_s=latency)
+        pf = MindPrefetcher(llm_call=par_llm.call, max_workers=4)
+        par_records: list[dict[str, Any]] = []
+        t0 = time.perf_counter()
+        pf.prefetch(_specs())
+        par_out = _run_pipeline(_caller(pf, par_records), pf)
+        par_s = time.perf_counter() - t0
+        pf.close()
+
+        self.assertEqual(seq_out, par_out)
+        self.assertEqual(len(par_llm.calls), 4)
+        self.assertEqual(pf.stats["consumed"], 4)
+        # 3 independent phases + 1 dependent phase: ~2 latencies instead of 4.
+        self.assertGreaterEqual(seq_s, 4 * latency)
+        self.assertLess(par_s, 3 * latency)
+
+    def test_error_records_keep_sequential_order(self) -> None:
+        fail = ("risk_b0", "wf_progress_b0")
+
+        seq_records: list[dict[str, Any]] = []
+        _run_pipeline(_caller(_SlowMind(latency_s=0.0, fail_tags=fail).call, seq_records))
+
+        # Make the earliest pipeline phase finish last in the pool.
+        class _Skewed(_SlowMind):
+            def call(self, *, schema_filename: str, prompt: str, tag: str) -> MindProviderResult:
+                self.latency_s = 0.1 if tag == "wf_progress_b0" else 0.0
+                return super().call(schema_filename=schema_filename, prompt=prompt, tag=tag)
+
+        pf = MindPrefetcher(llm_call=_Skewed(latency_s=0.0, fail_tags=fail).call)
+        par_records: list[dict[str, Any]] = []
+        pf.prefetch(_specs())
+        _run_pipeline(_caller(pf, par_records), pf)
+        pf.close()
+
+        self.assertEqual([r.get("tag") for r in par_records], ["wf_progress_b0", "risk_b0"])
+        self.assertEqual(
+            [(r.get("kind"), r.get("tag"), r.get("schema_filename")) for r in par_records],
+            [(r.get("kind"), r.get("tag"), r.get("schema_filename")) for r in seq_records],
+        )
+
+    def test_falls_back_to_live_call_when_not_prefetched(self) -> None:
+        llm = _SlowMind(latency_s=0.0)
+        pf = MindPrefetcher(llm_call=llm.call, enabled_getter=lambda: False)
+        pf.prefetch(_specs())
+        out = _run_pipeline(_caller(pf, []), pf)
+        pf.close()
+
+        self.assertEqual(pf.stats["prefetched"], 0)
+        self.assertEqual([c[2] for c in llm.calls], ["wf", "risk", "checks", "aa:checks_b0"])
+        self.assertEqual(out[3][2], "ok")
+
+    def test_dependent_phase_skipped_when_dependency_fails(self) -> None:
+        llm = _SlowMind(latency_s=0.0, fail_tags=("checks_b0",))
+        pf = MindPrefetcher(llm_call=llm.call)
+        pf.prefetch(_specs())
+        caller = _caller(pf, [])
+        _run_pipeline(caller, pf)
+        pf.close()
+
+        # auto_answer saw no check plan at the fork point, so it ran live in the pipeline.
+        self.assertEqual(pf.stats["consumed"], 3)
+        self.assertEqual([c[1] for c in llm.calls].count("autoanswer_b0"), 1)
+
+    def test_unconsumed_results_are_discarded_on_next_batch(self) -> None:
+        llm = _SlowMind(latency_s=0.0)
+        pf = MindPrefetcher(llm_call=llm.call)
+        pf.prefetch(_specs()[:2])
+        pf.prefetch([])
+        obj, _, _ = _caller(pf, []).call(schema_filename="risk_judge.json", prompt="live", tag="risk_b0", batch_id="b1")
+        pf.close()
+
+        self.assertEqual(pf.stats["discarded"], 2)
+        self.assertEqual((obj or {}).get("prompt"), "live")
+
+    def test_changed_prompt_discards_prefetch_and_calls_live(self) -> None:
+        llm = _SlowMind(latency_s=0.0)
+        pf = MindPrefetcher(llm_call=llm.call)
+        pf.prefetch(_specs()[:3])
+        caller = _caller(pf, [])
+        # The pipeline state moved on since the fork point: the checks prompt differs.
+        obj, _ref, state = caller.call(schema_filename="plan_min_checks.json", prompt="checks+risk_event", tag="checks_b0", batch_id="b0")
+        pf.close()
+
+        self.assertEqual(state, "ok")
+        self.assertEqual((obj or {}).get("prompt"), "checks+risk_event")
+        self.assertEqual(pf.stats["stale"], 1)
+        self.assertEqual(pf.stats["consumed"], 0)
+        self.assertEqual(sorted(c[2] for c in llm.calls if c[1] == "checks_b0"), ["checks", "checks+risk_event"])
+
+    def test_prompt_build_error_is_not_a_mind_error(self) -> None:
+        def _boom(_objs: dict[str, dict[str, Any] | None]) -> str | None:
+            raise RuntimeError("dictionary changed size during iteration")
+
+        llm = _SlowMind(latency_s=0.0)
+        pf = MindPrefetcher(llm_call=llm.call)
+        pf.prefetch(
+            [
+                MindPhaseSpec(name="checks", schema_filename="plan_min_checks.json", tag="checks_b0", build_prompt=_boom),
+                MindPhaseSpec(name="aa", schema_filename="auto_answer_to_hands.json", tag="autoanswer_b0", build_prompt=_boom, after=("checks",)),
+            ]
+        )
+        records: list[dict[str, Any]] = []
+        caller = _caller(pf, records)
+        out = [caller.call(schema_filename="plan_min_checks.json", prompt="checks", tag="checks_b0", batch_id="b0")]
+        pf.release("checks", out[0][0])
+        out.append(caller.call(schema_filename="auto_answer_to_hands.json", prompt="aa", tag="autoanswer_b0", batch_id="b0"))
+        pf.close()
+
+        self.assertEqual([o[2] for o in out], ["ok", "ok"])
+        self.assertEqual(pf.stats["build_errors"], 2)
+        self.assertEqual(pf.stats["prefetched"], 0)
+        self.assertEqual(records, [])
+        self.assertEqual(caller.failures_total, 0)
+
+    def test_dependent_prompt_is_built_on_calling_thread(self) -> None:
+        threads: list[str] = []
+
+        def _aa_prompt(objs: dict[str, dict[str, Any] | None]) -> str | None:
+            threads.append(threading.current_thread().name)
+            checks = objs.get("checks")
+            return f"aa:{checks['tag']}" if isinstance(checks, dict) else None
+
+        specs = _specs()
+        specs[3] = MindPhaseSpec(
+            name="aa", schema_filename="auto_answer_to_hands.json", tag="autoanswer_b0", build_prompt=_aa_prompt, after=("checks",)
+        )
+        pf = MindPrefetcher(llm_call=_SlowMind(latency_s=0.01).call)
+        pf.prefetch(specs)
+        _run_pipeline(_caller(pf, []), pf)
+        pf.close()
+
+        self.assertEqual(threads, [threading.current_thread().name])
+        self.assertEqual(pf.stats["consumed"], 4)
+
+    def test_only_blocking_calls_run_unlocked(self) -> None:
+        state = {"unlocked": False}
+        built_unlocked: list[bool] = []
+
+        def _unlocked(fn: Any) -> Any:
+            def _call(*args: Any, **kwargs: Any) -> Any:
+                state["unlocked"] = True
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    state["unlocked"] = False
+
+            return _call
+
+        def _aa_prompt(objs: dict[str, dict[str, Any] | None]) -> str | None:
+            built_unlocked.append(state["unlocked"])
+            checks = objs.get("checks")
+            return f"aa:{checks['tag']}" if isinstance(checks, dict) else None
+
+        specs = _specs()
+        specs[3] = MindPhaseSpec(
+            name="aa", schema_filename="auto_answer_to_hands.json", tag="autoanswer_b0", build_prompt=_aa_prompt, after=("checks",)
+        )
+        pf = MindPrefetcher(llm_call=_SlowMind(latency_s=0.0).call, unlocked=_unlocked)
+        pf.prefetch(specs)
+        _run_pipeline(_caller(pf, []), pf)
+        pf.close()
+
+        self.assertEqual(built_unlocked, [False])
+        self.assertEqual(pf.stats["consumed"], 4)
+        self.assertEqual(pf.stats["stale"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -8,6 +8,9 @@ from pathlib import Path
 from mi.providers.mind_anthropic import AnthropicMindProvider
 from mi.providers.mind_errors import MindCallError
 from mi.providers.mind_openai_compat import OpenAICompatibleMindProvider
+from mi.providers.mind_stream import JsonObjectScanner, iter_sse_data
+from mi.runtime.prompts import decide_next_prompt
+from mi.runtime.prompts._util import SplitPrompt
 
 
 _DECIDE_NEXT_OK = {
@@ -186,5 +189,159 @@ class TestMindProvidersFakeHttp(unittest.TestCase):
             self.assertEqual(calls["n"], 2)
 
 
+    def test_json_object_scanner_handles_strings_and_split_chunks(self) -> None:
+        sc = JsonObjectScanner()
+        self.assertEqual(sc.feed('prefix {"a": "x}{'), [])
+        self.assertEqual(sc.feed('\\"", "b": {"c": 1}'), [])
+        self.assertEqual(sc.feed('} trailing {"d": 2}'), ['{"a": "x}{\\"", "b": {"c": 1}}', '{"d": 2}'])
+
+    def test_iter_sse_data_joins_lines_and_stops_at_done(self) -> None:
+        lines = [": comment", "event: x", "data: a", "data: b", "", "data: c", "", "data: [DONE]", "", "data: d", ""]
+        self.assertEqual(list(iter_sse_data(lines)), ["a\nb", "c"])
+
+    def test_openai_compatible_stream_stops_after_valid_object(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            out_dir = Path(td)
+            text = json.dumps(_DECIDE_NEXT_OK)
+            state = {"closed": False, "body": None}
+
+            def fake_stream(_url: str, body: dict, _headers: dict, _timeout_s: int):
+                state["body"] = body
+                try:
+                    for i in range(0, len(text), 7):
+                        yield "data: " + json.dumps({"choices": [{"delta": {"content": text[i : i + 7]}}]})
+                        yield ""
+                    # Trailing tokens after the object closed must never be read.
+                    while True:
+                        yield "data: " + json.dumps({"choices": [{"delta": {"content": " ..."}}]})
+                        yield ""
+                finally:
+                    state["closed"] = True
+
+            p = OpenAICompatibleMindProvider(
+                base_url="https://example.com/v1",
+                model="fake-model",
+                api_key="fake-key",
+                transcripts_dir=out_dir,
+                timeout_s=1,
+                max_retries=0,
+                stream=True,
+                http_post_stream=fake_stream,
+            )
+            r = p.call(schema_filename="decide_next.json", prompt="x", tag="t")
+            self.assertEqual(r.obj, _DECIDE_NEXT_OK)
+            self.assertTrue(state["closed"])
+            self.assertTrue(state["body"]["stream"])
+
+            recs = [json.loads(x) for x in r.transcript_path.read_text(encoding="utf-8").splitlines()]
+            resp = [x for x in recs if x.get("type") == "mi.mind_transcript.response"][-1]
+            self.assertTrue(resp["stream"])
+            self.assertTrue(resp["stopped_early"])
+            self.assertIsInstance(resp["time_to_first_token_ms"], int)
+            self.assertIsInstance(resp["time_to_valid_object_ms"], int)
+
+    def test_anthropic_stream_repairs_invalid_object(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            out_dir = Path(td)
+            calls = {"n": 0}
+
+            def fake_stream(_url: str, _body: dict, _headers: dict, _timeout_s: int):
+                calls["n"] += 1
+                out = {"next_action": "stop"} if calls["n"] == 1 else _DECIDE_NEXT_OK
+                yield "event: message_start"
+                yield "data: " + json.dumps({"type": "message_start", "message": {}})
+                yield ""
+                yield "data: " + json.dumps({"type": "content_block_delta", "delta": {"type": "text_delta", "text": json.dumps(out)}})
+                yield ""
+                yield "data: " + json.dumps({"type": "message_stop"})
+                yield ""
+
+            p = AnthropicMindProvider(
+                base_url="https://example.com",
+                model="fake-model",
+                api_key="fake-key",
+                transcripts_dir=out_dir,
+                timeout_s=1,
+                max_retries=1,
+                anthropic_version="2023-06-01",
+                max_tokens=256,
+                stream=True,
+                http_post_stream=fake_stream,
+            )
+            r = p.call(schema_filename="decide_next.json", prompt="x", tag="t")
+            self.assertEqual(r.obj, _DECIDE_NEXT_OK)
+            self.assertEqual(calls["n"], 2)
+
+
+    def test_anthropic_prompt_cache_reduces_uncached_prompt_bytes(self) -> None:
+        def blocks(v: object) -> list[dict]:
+            return [{"type": "text", "text": v}] if isinstance(v, str) else list(v)  # type: ignore[arg-type]
+
+        def run(prompt_cache: bool) -> list[tuple[int, float]]:
+            # Fake server with Anthropic-like prefix caching: everything up to a previously
+            # seen cache_control breakpoint is "cached"; latency scales with uncached bytes.
+            seen: set[str] = set()
+            per_call: list[tuple[int, float]] = []
+
+            def fake_http(_url: str, body: dict, _headers: dict, _timeout_s: int) -> dict:
+                seq = blocks(body["system"]) + [b for m in body["messages"] for b in blocks(m["content"])]
+                prefix, total, cached = "", 0, 0
+                for b in seq:
+                    prefix += b["text"]
+                    total = len(prefix.encode("utf-8"))
+                    if "cache_control" in b:
+                        if prefix in seen:
+                            cached = total
+                        seen.add(prefix)
+                uncached = total - cached
+                per_call.append((uncached, 50.0 + uncached / 100.0))
+                return {"content": [{"type": "text", "text": json.dumps(_DECIDE_NEXT_OK)}]}
+
+            with tempfile.TemporaryDirectory() as td:
+                p = AnthropicMindProvider(
+                    base_url="https://example.com",
+                    model="fake-model",
+                    api_key="fake-key",
+                    transcripts_dir=Path(td),
+                    timeout_s=1,
+                    max_retries=0,
+                    anthropic_version="2023-06-01",
+                    max_tokens=256,
+                    prompt_cache=prompt_cache,
+                    http_post_json=fake_http,
+                )
+                for i in range(3):
+                    prompt = decide_next_prompt(
+                        task="fix the flaky test",
+                        hands_provider="codex",
+                        runtime_cfg={"autopilot": {"max_batches": 8}},
+                        project_overlay={},
+                        thought_db_context={"nodes": [], "claims": []},
+                        recent_evidence=[{"kind": "evidence", "batch_id": f"b{i}"}],
+                        hands_last_message=f"batch {i} output",
+                        repo_observation={"git_head": f"h{i}"},
+                        check_plan={},
+                        auto_answer={},
+                    )
+                    self.assertIsInstance(prompt, SplitPrompt)
+                    r = p.call(schema_filename="decide_next.json", prompt=prompt, tag=f"decide_b{i}")
+                    self.assertEqual(r.obj, _DECIDE_NEXT_OK)
+            return per_call
+
+        off = run(False)
+        on = run(True)
+        # First call pays full price either way; later batches reuse the cached prefix only when enabled.
+        self.assertEqual(off[1][0], off[0][0])
+        for i in (1, 2):
+            self.assertLess(on[i][0] * 2, off[i][0])
+            self.assertLess(on[i][1], off[i][1])
+
+    def test_split_prompt_text_matches_plain_join(self) -> None:
+        p = SplitPrompt("static\ndynamic\n", "static\n")
+        self.assertEqual(str(p), "static\ndynamic\n")
+        self.assertEqual(p.dynamic_suffix, "dynamic\n")
+        self.assertEqual(SplitPrompt("x\n", "other").static_prefix, "")
+
+
 if __name__ == "__main__":
     unittest.main()
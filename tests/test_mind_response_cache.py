@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from mi.cli import _rewrite_cli_argv
+from mi.core.paths import GlobalPaths
+from mi.providers.llm import MiLlm
+from mi.providers.mind_cache import CachingMindProvider, MindResponseCache, mind_cache_key
+from mi.providers.provider_factory import make_mind_provider
+from mi.providers.types import MindProviderResult
+
+
+class _CountingMind:
+    def __init__(self, transcripts_dir: Path) -> None:
+        self.calls = 0
+        self._dir = transcripts_dir
+
+    def call(self, *, schema_filename: str, prompt: str, tag: str) -> MindProviderResult:
+        self.calls += 1
+        p = self._dir / f"inner_{self.calls}.jsonl"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("{}\n", encoding="utf-8")
+        return MindProviderResult(obj={"n": self.calls, "prompt": prompt}, transcript_path=p)
+
+
+class TestMindResponseCache(unittest.TestCase):
+    def _provider(self, root: Path, *, mode: str, ttl_s: int = 0, max_entries: int = 0) -> tuple[CachingMindProvider, _CountingMind, MindResponseCache]:
+        inner = _CountingMind(root / "transcripts")
+        cache = MindResponseCache(root / "cache", ttl_s=ttl_s, max_entries=max_entries)
+        p = CachingMindProvider(inner=inner, cache=cache, mode=mode, provider="fake", model="m", transcripts_dir=root / "transcripts")
+        return p, inner, cache
+
+    def test_readwrite_serves_repeated_prompt_from_cache(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            p, inner, cache = self._provider(Path(td), mode="readwrite")
+            r1 = p.call(schema_filename="decide_next.json", prompt="same", tag="a")
+            r2 = p.call(schema_filename="decide_next.json", prompt="same", tag="b")
+            r3 = p.call(schema_filename="decide_next.json", prompt="other", tag="c")
+
+            self.assertEqual(inner.calls, 2)
+            self.assertEqual(r1.obj, r2.obj)
+            self.assertNotEqual(r1.obj, r3.obj)
+            self.assertEqual(p.stats, {"hits": 1, "misses": 2, "writes": 2})
+
+            # Hits still produce an auditable mind transcript that points at the cache entry.
+            self.assertNotEqual(r1.transcript_path, r2.transcript_path)
+            recs = [json.loads(x) for x in r2.transcript_path.read_text(encoding="utf-8").splitlines()]
+            hit = [x for x in recs if x.get("type") == "mi.mind_transcript.cache_hit"][0]
+            self.assertEqual(hit["source_transcript_path"], str(r1.transcript_path))
+
+            st = cache.status()
+            self.assertEqual(st["entries"], 2)
+            self.assertEqual(st["stats"]["hits"], 1)
+            self.assertEqual(st["stats"]["misses"], 2)
+
+    def test_key_depends_on_schema_and_model(self) -> None:
+        k1 = mind_cache_key(provider="p", model="m", schema_filename="decide_next.json", prompt="x")
+        self.assertNotEqual(k1, mind_cache_key(provider="p", model="m2", schema_filename="decide_next.json", prompt="x"))
+        self.assertNotEqual(k1, mind_cache_key(provider="p", model="m", schema_filename="risk_judge.json", prompt="x"))
+
+    def test_key_depends_on_endpoint_and_generation_params(self) -> None:
+        def _key(base_url: str, **params: int) -> str:
+            return mind_cache_key(provider="p", model="m", schema_filename="decide_next.json", prompt="x", base_url=base_url, params=params)
+
+        local = _key("http://localhost:8000/v1")
+        self.assertNotEqual(local, _key("https://api.example.com/v1"))
+        self.assertNotEqual(local, _key("http://localhost:8000/v1", max_tokens=1024))
+        self.assertEqual(local, _key(" HTTP://LocalHost:8000/v1/ "))
+
+    def test_factory_keys_openai_compatible_entries_by_base_url(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            inner = _CountingMind(root / "transcripts")
+
+            def _cfg(base_url: str) -> dict:
+                oc = {"base_url": base_url, "model": "same-model"}
+                return {"mind": {"provider": "openai_compatible", "openai_compatible": oc, "cache": {"mode": "readwrite"}}}
+
+            with mock.patch("mi.providers.mind_registry.OpenAICompatibleMindProvider", return_value=inner):
+                local = make_mind_provider(_cfg("http://localhost:8000/v1"), project_root=root, transcripts_dir=root, home_dir=root)
+                hosted = make_mind_provider(_cfg("https://api.example.com/v1"), project_root=root, transcripts_dir=root, home_dir=root)
+                local.call(schema_filename="decide_next.json", prompt="x", tag="a")
+                local.call(schema_filename="decide_next.json", prompt="x", tag="a")
+                r = hosted.call(schema_filename="decide_next.json", prompt="x", tag="a")
+
+            self.assertEqual(inner.calls, 2)
+            self.assertEqual(r.obj["n"], 2)
+
+    def test_read_mode_never_writes(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            p, inner, cache = self._provider(Path(td), mode="read")
+            p.call(schema_filename="decide_next.json", prompt="x", tag="a")
+            p.call(schema_filename="decide_next.json", prompt="x", tag="a")
+            self.assertEqual(inner.calls, 2)
+            self.assertEqual(cache.status()["entries"], 0)
+
+    def test_ttl_expiry_and_max_entries_eviction(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            p, inner, cache = self._provider(Path(td), mode="readwrite", ttl_s=60, max_entries=2)
+            for i in range(3):
+                p.call(schema_filename="decide_next.json", prompt=f"x{i}", tag="a")
+                # Give each entry a distinct mtime so eviction order is deterministic.
+                for ent in cache.entries_dir.glob("*.json"):
+                    st = ent.stat()
+                    os.utime(ent, (st.st_atime, st.st_mtime - 1))
+            self.assertEqual(cache.status()["entries"], 2)
+            self.assertEqual(cache.status()["stats"]["evicted"], 1)
+
+            # Age the remaining entries past the TTL (the file mtime is the only clock): lookups miss and delete them.
+            for ent in cache.entries_dir.glob("*.json"):
+                old = time.time() - 120
+                os.utime(ent, (old, old))
+            before = inner.calls
+            p.call(schema_filename="decide_next.json", prompt="x2", tag="a")
+            self.assertEqual(inner.calls, before + 1)
+            self.assertEqual(cache.status()["stats"]["expired"], 1)
+
+    def test_writes_do_not_rescan_entries_below_the_bound(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            p, _inner, cache = self._provider(Path(td), mode="readwrite", max_entries=20)
+            with mock.patch.object(cache, "_entries_oldest_first", wraps=cache._entries_oldest_first) as scan:
+                for i in range(20):
+                    p.call(schema_filename="decide_next.json", prompt=f"x{i}", tag="a")
+                # One initial count; no per-write directory scan.
+                self.assertEqual(scan.call_count, 1)
+                p.call(schema_filename="decide_next.json", prompt="x20", tag="a")
+                self.assertEqual(scan.call_count, 2)
+            # Over the bound: pruned to 90% so the next writes do not rescan again.
+            self.assertEqual(cache.status()["entries"], 18)
+
+    def test_stats_from_concurrent_instances_are_merged(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            a = MindResponseCache(Path(td) / "cache")
+            b = MindResponseCache(Path(td) / "cache")
+            for _ in range(3):
+                a.get("missing")
+            for _ in range(5):
+                b.get("missing")
+            # Counters stay in memory until flushed; neither instance overwrites the other's.
+            self.assertFalse(a.stats_path.exists())
+            a.flush_stats()
+            b.flush_stats()
+            self.assertEqual(a.status()["stats"]["misses"], 8)
+
+    def test_factory_wraps_only_when_enabled_and_home_given(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            cfg_off = {"mind": {"provider": "codex_schema"}}
+            cfg_on = {"mind": {"provider": "codex_schema", "cache": {"mode": "readwrite"}}}
+            self.assertIsInstance(make_mind_provider(cfg_off, project_root=root, transcripts_dir=root, home_dir=root), MiLlm)
+            self.assertIsInstance(make_mind_provider(cfg_on, project_root=root, transcripts_dir=root), MiLlm)
+            m = make_mind_provider(cfg_on, project_root=root, transcripts_dir=root, home_dir=root)
+            self.assertIsInstance(m, CachingMindProvider)
+            self.assertIsInstance(m.inner, MiLlm)
+            self.assertEqual(m.mode, "readwrite")
+            self.assertEqual(GlobalPaths(home_dir=root).mind_cache_dir, root / "cache" / "mind")
+
+    def test_cli_flag_value_is_not_treated_as_subcommand(self) -> None:
+        self.assertEqual(_rewrite_cli_argv(["--mind-cache", "read"]), ["--mind-cache", "read", "status"])
+        self.assertEqual(_rewrite_cli_argv(["--mind-cache", "read", "last"]), ["--mind-cache", "read", "show", "last"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from mi.runtime.autopilot import RepoObservationCache, _observe_repo
+
+_GIT_KEYS = ("git_is_repo", "git_root", "git_head", "git_status_porcelain", "git_diff_stat", "git_diff_cached_stat")
+
+
+def _git(root: Path, *args: str) -> None:
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_NAME": "t",
+        "GIT_AUTHOR_EMAIL": "t@example.com",
+        "GIT_COMMITTER_NAME": "t",
+        "GIT_COMMITTER_EMAIL": "t@example.com",
+    }
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True, env=env)
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestObserveRepoCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td = tempfile.TemporaryDirectory()
+        self.root = Path(self._td.name)
+        _git(self.root, "init", "-q")
+        (self.root / "a.py").write_text("x = 1\n", encoding="utf-8")
+        _git(self.root, "add", "a.py")
+        _git(self.root, "commit", "-q", "-m", "init")
+
+    def tearDown(self) -> None:
+        self._td.cleanup()
+
+    def _assert_same_as_uncached(self, obs: dict) -> None:
+        fresh = _observe_repo(self.root)
+        self.assertEqual({k: obs[k] for k in _GIT_KEYS}, {k: fresh[k] for k in _GIT_KEYS})
+
+    def test_unchanged_tree_reuses_dynamic_probes(self) -> None:
+        cache = RepoObservationCache()
+        first = _observe_repo(self.root, cache=cache)
+        self.assertTrue(first["git_is_repo"])
+        self.assertEqual(cache.last_probe["git_probe_reused"], [])
+        self.assertIn("status", cache.last_probe["git_probe_ms"])
+
+        second = _observe_repo(self.root, cache=cache)
+        self.assertEqual(sorted(cache.last_probe["git_probe_reused"]), ["diff", "diff_cached", "head", "rev_parse"])
+        self.assertEqual(set(cache.last_probe["git_probe_ms"]), {"status"})
+        self._assert_same_as_uncached(second)
+        # Timings stay out of the observation (it is embedded verbatim in Mind prompts).
+        self.assertEqual(first, second)
+        self.assertNotIn("git_probe_ms", second)
+
+    def test_worktree_and_index_changes_rerun_probes(self) -> None:
+        cache = RepoObservationCache()
+        _observe_repo(self.root, cache=cache)
+
+        (self.root / "a.py").write_text("x = 2\ny = 3\n", encoding="utf-8")
+        edited = _observe_repo(self.root, cache=cache)
+        self.assertIn("diff", cache.last_probe["git_probe_ms"])
+        self.assertIn("a.py", edited["git_diff_stat"])
+        self._assert_same_as_uncached(edited)
+
+        (self.root / "a.py").write_text("x = 2\ny = 4\nz = 5\n", encoding="utf-8")
+        edited_again = _observe_repo(self.root, cache=cache)
+        self.assertIn("diff", cache.last_probe["git_probe_ms"])
+        self._assert_same_as_uncached(edited_again)
+
+        _git(self.root, "add", "a.py")
+        staged = _observe_repo(self.root, cache=cache)
+        self.assertIn("diff_cached", cache.last_probe["git_probe_ms"])
+        self.assertIn("a.py", staged["git_diff_cached_stat"])
+        self._assert_same_as_uncached(staged)
+
+        _git(self.root, "commit", "-q", "-m", "second")
+        committed = _observe_repo(self.root, cache=cache)
+        self.assertEqual(committed["git_diff_cached_stat"], "")
+        self._assert_same_as_uncached(committed)
+
+    def test_non_repo_is_not_memoised(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            root = Path(td)
+            cache = RepoObservationCache()
+            self.assertFalse(_observe_repo(root, cache=cache)["git_is_repo"])
+            _git(root, "init", "-q")
+            self.assertTrue(_observe_repo(root, cache=cache)["git_is_repo"])
+
+
+if __name__ == "__main__":
+    unittest.main()
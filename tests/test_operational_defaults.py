@@ -3,10 +3,12 @@ from __future__ import annotations
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from mi.core.paths import GlobalPaths, ProjectPaths
 from mi.core.storage import iter_jsonl, now_rfc3339
-from mi.thoughtdb.global_ledger import append_global_event
+from mi.thoughtdb import operational_defaults
+from mi.thoughtdb.global_ledger import append_global_event, last_global_event
 from mi.thoughtdb.operational_defaults import (
     DEFAULTS_EVENT_KIND,
     ensure_operational_defaults_claims_current,
@@ -119,6 +121,57 @@ class TestOperationalDefaults(unittest.TestCase):
             self.assertTrue(bool(out2.get("ok", False)))
             self.assertFalse(bool(out2.get("changed", True)))
 
+    def test_resolve_operational_defaults_is_memoised_per_view_generation(self) -> None:
+        with tempfile.TemporaryDirectory() as td_home, tempfile.TemporaryDirectory() as td_proj:
+            home = Path(td_home)
+            pp = ProjectPaths(home_dir=home, project_root=Path(td_proj))
+            tdb = ThoughtDbStore(home_dir=home, project_paths=pp)
+            real = operational_defaults._resolve_operational_defaults
+            with mock.patch.object(operational_defaults, "_resolve_operational_defaults", side_effect=real) as m:
+                op1 = resolve_operational_defaults(tdb=tdb, as_of_ts=now_rfc3339())
+                op2 = resolve_operational_defaults(tdb=tdb, as_of_ts=now_rfc3339())
+                self.assertIs(op1, op2)
+                self.assertEqual(m.call_count, 1)
+
+                # An append produces a new view generation: the memo is recomputed.
+                cid = tdb.append_claim_create(
+                    claim_type="preference",
+                    text=ask_when_uncertain_claim_text(False),
+                    scope="project",
+                    visibility="project",
+                    valid_from=None,
+                    valid_to=None,
+                    tags=[ASK_WHEN_UNCERTAIN_TAG],
+                    source_event_ids=["ev_test_p1"],
+                    confidence=1.0,
+                    notes="t",
+                )
+                op3 = resolve_operational_defaults(tdb=tdb, as_of_ts=now_rfc3339())
+                self.assertEqual(m.call_count, 2)
+                self.assertFalse(op3.ask_when_uncertain)
+                self.assertEqual(op3.ask_when_uncertain_source.get("claim_id"), cid)
+
+    def test_last_global_event_uses_pointer_index(self) -> None:
+        with tempfile.TemporaryDirectory() as td_home:
+            home = Path(td_home)
+            self.assertIsNone(last_global_event(home_dir=home, kind=DEFAULTS_EVENT_KIND))
+            r1 = append_global_event(home_dir=home, kind=DEFAULTS_EVENT_KIND, payload={"defaults": {"ask_when_uncertain": True}})
+            append_global_event(home_dir=home, kind="other_kind", payload={})
+            ev = last_global_event(home_dir=home, kind=DEFAULTS_EVENT_KIND)
+            self.assertEqual((ev or {}).get("event_id"), r1.get("event_id"))
+
+            gp = GlobalPaths(home_dir=home)
+            self.assertTrue((gp.global_dir / "evidence.last_by_kind.json").exists())
+
+            # Only the appended tail is read: corrupting the already-indexed prefix goes unnoticed.
+            log = gp.global_evidence_log_path
+            raw = log.read_bytes()
+            log.write_bytes(b"x" * (raw.index(b"\n")) + raw[raw.index(b"\n") :])
+            r2 = append_global_event(home_dir=home, kind=DEFAULTS_EVENT_KIND, payload={"defaults": {"ask_when_uncertain": False}})
+            ev2 = last_global_event(home_dir=home, kind=DEFAULTS_EVENT_KIND)
+            self.assertEqual((ev2 or {}).get("event_id"), r2.get("event_id"))
+            self.assertEqual(((ev2 or {}).get("payload") or {}).get("defaults"), {"ask_when_uncertain": False})
+
 
 if __name__ == "__main__":
     unittest.main()
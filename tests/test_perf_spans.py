@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from mi.core import perf
+from mi.core.perf import PerfRecorder, iter_perf_records, span, summarize_perf, traced
+
+
+class TestPerfSpans(unittest.TestCase):
+    def test_disabled_span_is_shared_noop(self) -> None:
+        self.assertFalse(perf.enabled())
+        self.assertIs(span("a"), span("b"))
+        with span("a"):
+            pass
+        self.assertEqual(traced("x", lambda v: v + 1)(1), 2)
+
+    def test_nested_spans_flush_one_record_per_batch(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "perf.jsonl"
+            with PerfRecorder(path=path, run_id="r1") as rec:
+                self.assertTrue(perf.enabled())
+                rec.begin_batch("b0")
+                with span("batch"):
+                    with span("mind.decide_next"):
+                        pass
+                    traced("hands", lambda: None)()
+
+                def _worker() -> None:
+                    with span("worker"):
+                        pass
+
+                t = threading.Thread(target=_worker)
+                t.start()
+                t.join()
+                rec.begin_batch("b1")
+                with span("batch"):
+                    pass
+            self.assertFalse(perf.enabled())
+
+            recs = list(iter_perf_records(path))
+            self.assertEqual([r["batch_id"] for r in recs], ["b0", "b1"])
+            spans = {s[0]: s for s in recs[0]["spans"]}
+            self.assertEqual(spans["mind.decide_next"][1], "batch")
+            self.assertEqual(spans["hands"][1], "batch")
+            self.assertEqual(spans["batch"][1], "")
+            self.assertEqual(spans["worker"][1], "")
+            self.assertGreaterEqual(spans["batch"][3], spans["mind.decide_next"][3])
+
+    def test_summarize_percentiles_over_batch_totals(self) -> None:
+        records = [
+            {"kind": "perf", "run_id": "r1", "batch_id": f"b{i}", "spans": [["mind.decide_next", "", 0.0, float(i + 1)]] * 2}
+            for i in range(10)
+        ]
+        records.append({"kind": "perf", "run_id": "r2", "batch_id": "b0", "spans": [["hands", "", 0.0, 500.0]]})
+
+        rep = summarize_perf(records)
+        self.assertEqual(rep["runs"], ["r1", "r2"])
+        self.assertEqual(rep["batches"], 11)
+        by = {p["phase"]: p for p in rep["phases"]}
+        self.assertEqual(by["mind.decide_next"]["calls"], 20)
+        self.assertEqual(by["mind.decide_next"]["p50_ms"], 10.0)
+        self.assertEqual(by["mind.decide_next"]["p95_ms"], 20.0)
+        self.assertEqual(by["mind.decide_next"]["total_ms"], 110.0)
+
+        last = summarize_perf(records, run_id="last")
+        self.assertEqual([p["phase"] for p in last["phases"]], ["hands"])
+        self.assertEqual(summarize_perf(records, run_id="r1")["batches"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -37,6 +37,8 @@ class PredecideFlowTests(unittest.TestCase):
         def _extract_context(**_kwargs):
             return {"s": 1}, {"e": 1}, "hands last", {"tdb": 1}
 
+        stages: list[str] = []
+
         def _risk(**_kwargs):
             return False
 
@@ -63,10 +65,13 @@ class PredecideFlowTests(unittest.TestCase):
                 ),
                 checks_deps=PlanChecksAutoAnswerDeps(plan_checks=_checks, maybe_auto_answer=_checks),
                 preaction_deps=PreactionPhaseDeps(apply_preactions=_preactions, empty_auto_answer=lambda: {}),
+                prefetch_mind_phases=lambda **kw: stages.append(kw["stage"]),
             ),
         )
         self.assertEqual(out.batch_id, "b0")
         self.assertIs(out.out, False)
+        # The risk gate stopped the batch: checks/auto_answer were never declared for prefetch.
+        self.assertEqual(stages, ["post_extract"])
         self.assertEqual(calls["checks"], 0)
         self.assertEqual(calls["pre"], 0)
 
@@ -74,6 +79,8 @@ class PredecideFlowTests(unittest.TestCase):
         def _extract_context(**_kwargs):
             return {"s": 1}, {"e": 1}, "hands last", {"tdb": 1}
 
+        stages: list[str] = []
+
         def _risk(**_kwargs):
             return None
 
@@ -101,8 +108,10 @@ class PredecideFlowTests(unittest.TestCase):
                 ),
                 checks_deps=PlanChecksAutoAnswerDeps(plan_checks=_plan_checks, maybe_auto_answer=_auto_answer),
                 preaction_deps=PreactionPhaseDeps(apply_preactions=_preactions, empty_auto_answer=lambda: {}),
+                prefetch_mind_phases=lambda **kw: stages.append(kw["stage"]),
             ),
         )
+        self.assertEqual(stages, ["post_extract", "post_risk"])
         self.assertEqual(out.batch_id, "b2")
         self.assertIsInstance(out.out, PreactionDecision)
         d = out.out
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import mi.core.paths as paths_mod
+from mi.core.paths import GlobalPaths, project_identity, resolve_project_id
+
+
+def _git(cwd: Path, args: list[str]) -> None:
+    subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True, text=True)
+
+
+@unittest.skipUnless(shutil.which("git"), "git not installed")
+class TestProjectIdentityCache(unittest.TestCase):
+    def setUp(self) -> None:
+        paths_mod._identity_cache_mem.clear()
+        self._home = tempfile.TemporaryDirectory()
+        self._td = tempfile.TemporaryDirectory()
+        self.home = Path(self._home.name)
+        self.repo = Path(self._td.name) / "repo"
+        (self.repo / "sub").mkdir(parents=True)
+        _git(self.repo, ["init", "-q"])
+        _git(self.repo, ["config", "user.email", "mi@example.com"])
+        _git(self.repo, ["config", "user.name", "MI"])
+        (self.repo / "a.txt").write_text("a\n", encoding="utf-8")
+        _git(self.repo, ["add", "a.txt"])
+        _git(self.repo, ["commit", "-q", "-m", "init"])
+
+    def tearDown(self) -> None:
+        paths_mod._identity_cache_mem.clear()
+        self._home.cleanup()
+        self._td.cleanup()
+
+    def _count_subprocesses(self, fn):
+        real = subprocess.run
+        calls: list[list[str]] = []
+
+        def _run(args, *a, **kw):
+            calls.append(list(args))
+            return real(args, *a, **kw)
+
+        with mock.patch.object(paths_mod.subprocess, "run", side_effect=_run):
+            out = fn()
+        return out, calls
+
+    def test_warm_lookup_spawns_no_git(self) -> None:
+        sub = self.repo / "sub"
+        cold, cold_calls = self._count_subprocesses(lambda: project_identity(sub, home_dir=self.home))
+        self.assertEqual(cold, project_identity(sub))
+        self.assertGreater(len(cold_calls), 0)
+        self.assertTrue(GlobalPaths(home_dir=self.home).project_identity_cache_path.is_file())
+
+        # New process (empty in-memory copy) still hits the on-disk cache.
+        paths_mod._identity_cache_mem.clear()
+        warm, warm_calls = self._count_subprocesses(lambda: resolve_project_id(self.home, sub))
+        self.assertEqual(warm_calls, [])
+        self.assertEqual(warm, paths_mod.project_id_for_identity_key(cold["key"]))
+
+    def test_config_change_and_nested_repo_invalidate(self) -> None:
+        sub = self.repo / "sub"
+        before = project_identity(sub, home_dir=self.home)
+        self.assertTrue(before["repo_key"].startswith("root:"))
+
+        _git(self.repo, ["remote", "add", "origin", "git@github.com:Owner/Repo.git"])
+        after_remote = project_identity(sub, home_dir=self.home)
+        self.assertEqual(after_remote["repo_key"], "origin:github.com/Owner/Repo")
+
+        _git(sub, ["init", "-q"])
+        nested = project_identity(sub, home_dir=self.home)
+        self.assertEqual(nested, project_identity(sub))
+        self.assertEqual(Path(nested["git_toplevel"]), sub.resolve())
+
+    def test_non_git_path_is_cached_until_git_init(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            plain = Path(td)
+            self.assertEqual(project_identity(plain, home_dir=self.home)["kind"], "path")
+            _, calls = self._count_subprocesses(lambda: project_identity(plain, home_dir=self.home))
+            self.assertEqual(calls, [])
+
+            _git(plain, ["init", "-q"])
+            self.assertEqual(project_identity(plain, home_dir=self.home)["kind"], "git")
+
+    def test_concurrent_threads_and_processes_keep_all_entries(self) -> None:
+        cache_path = GlobalPaths(home_dir=self.home).project_identity_cache_path
+        project_identity(self.repo / "sub", home_dir=self.home)
+        # Another process loaded the (then empty) cache earlier; its write must not drop "sub".
+        paths_mod._identity_cache_mem[str(cache_path)] = {}
+
+        dirs = [self.repo]
+        for i in range(8):
+            d = self.repo / f"p{i}"
+            d.mkdir()
+            dirs.append(d)
+        errors: list[BaseException] = []
+
+        def _resolve(d: Path) -> None:
+            try:
+                for _ in range(5):
+                    project_identity(d, home_dir=self.home)
+            except BaseException as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=_resolve, args=(d,)) for d in dirs]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+        on_disk = json.loads(cache_path.read_text(encoding="utf-8"))["entries"]
+        expected = {str(d.resolve()) for d in [self.repo / "sub", *dirs]}
+        self.assertEqual(set(on_disk), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import io
+import json
+import random
+import tempfile
+import unittest
+from pathlib import Path
+
+from mi.core.config import default_config, validate_config
+from mi.runtime.autopilot.observation import _detect_risk_signals_from_transcript, _iter_risk_candidate_rows
+from mi.runtime.risk import (
+    RiskPatternEngine,
+    default_risk_engine,
+    detect_risk_signals_from_command,
+    detect_risk_signals_from_text_line,
+    risk_engine_from_config,
+    should_interrupt_text,
+)
+
+
+_ALPHABET = ["git push", "npm ", "publish", "twine upload", "pnpm install", "yarn add", "curl", " ", "|", "sh", "wget", "rm -r", "f", "sudo", "GIT PUSH", "x", "\u212a"]  # U+212A (Kelvin sign) lower()s to "k"
+
+
+def _legacy_categories(lower: str) -> list[str]:
+    out: list[str] = []
+    if "git push" in lower:
+        out.append("push")
+    if "npm publish" in lower or "twine upload" in lower:
+        out.append("publish")
+    if "pip install" in lower or "npm install" in lower or "pnpm install" in lower or "yarn add" in lower:
+        out.append("install")
+    if "curl " in lower or "wget " in lower:
+        out.append("network")
+    if "rm -rf" in lower or "rm -r" in lower:
+        out.append("delete")
+    if "sudo " in lower:
+        out.append("privilege")
+    return out
+
+
+class TestRiskPatternEngine(unittest.TestCase):
+    def test_matches_substring_semantics(self) -> None:
+        rng = random.Random(7)
+        high = ["git push", "npm publish", "twine upload", "rm -rf", "rm -r", "sudo ", "curl | sh", "curl|sh", "wget | sh", "wget|sh"]
+        for _ in range(3000):
+            text = "".join(rng.choice(_ALPHABET) for _ in range(rng.randint(0, 8)))
+            lower = text.lower()
+            cats = _legacy_categories(lower)
+            self.assertEqual(default_risk_engine().categories(text), cats, text)
+            self.assertEqual(detect_risk_signals_from_command(text), [f"{c}: {text}" for c in cats])
+            self.assertEqual(should_interrupt_text("on_any_external", text), bool(cats), text)
+            self.assertEqual(should_interrupt_text("on_high_risk", text), any(m in lower for m in high), text)
+            self.assertFalse(should_interrupt_text("off", text))
+
+    def test_overlapping_markers_imply_contained_categories(self) -> None:
+        eng = RiskPatternEngine([("a", ["deploy prod"]), ("b", ["prod"]), ("c", ["deploy"])], high_risk_categories=["b"])
+        self.assertEqual(eng.categories("Deploy Prod now"), ["a", "b", "c"])
+        self.assertTrue(eng.should_interrupt("on_high_risk", "deploy prod"))
+        self.assertFalse(eng.should_interrupt("on_high_risk", "deploy staging"))
+
+    def test_user_markers_from_config(self) -> None:
+        self.assertIs(risk_engine_from_config(default_config()["runtime"]), default_risk_engine())
+
+        vr = {"risk_markers": {"deploy": ["kubectl apply"], "install": ["cargo install"]}, "high_risk_categories": ["deploy"]}
+        eng = risk_engine_from_config({"violation_response": vr})
+        self.assertIs(eng, risk_engine_from_config({"violation_response": dict(vr)}))
+        self.assertEqual(
+            detect_risk_signals_from_text_line("  KUBECTL apply -f x.yaml && cargo install ripgrep ", engine=eng),
+            ["install: KUBECTL apply -f x.yaml && cargo install ripgrep", "deploy: KUBECTL apply -f x.yaml && cargo install ripgrep"],
+        )
+        self.assertTrue(eng.should_interrupt("on_high_risk", "kubectl apply -f x.yaml"))
+        # Built-in categories are only high-risk when listed.
+        self.assertFalse(eng.should_interrupt("on_high_risk", "git push origin main"))
+        self.assertTrue(eng.should_interrupt("on_high_risk", "curl | sh -s"))
+        self.assertTrue(eng.should_interrupt("on_any_external", "cargo install x"))
+
+    def test_validate_config_rejects_bad_risk_markers(self) -> None:
+        cfg = default_config()
+        cfg["runtime"]["violation_response"]["risk_markers"] = {"deploy": "kubectl apply"}
+        self.assertTrue(any("risk_markers" in e for e in validate_config(cfg)["errors"]))
+        cfg["runtime"]["violation_response"]["risk_markers"] = {"deploy": ["kubectl apply"]}
+        self.assertFalse(any("risk_markers" in e for e in validate_config(cfg)["errors"]))
+
+
+class TestTranscriptRiskScan(unittest.TestCase):
+    def test_candidate_rows_keep_every_matching_row(self) -> None:
+        rows = [
+            json.dumps({"stream": "stdout", "line": "ok"}),
+            json.dumps({"stream": "stdout", "line": "Running git push origin"}),
+            json.dumps({"stream": "stderr", "line": "\u212aelvin"}),
+            json.dumps({"stream": "stdout", "line": "rm -rf a; sudo rm -r b"}),
+            json.dumps({"stream": "stdout", "line": "fine"}),
+        ]
+        text = "\n".join(rows) + "\n"
+        eng = default_risk_engine()
+        self.assertEqual(eng.candidate_rows(text), [rows[1], rows[2], rows[3]])
+        # Small chunks: rows split across reads are reassembled.
+        import mi.runtime.autopilot.observation as obs
+
+        old = obs._RISK_SCAN_CHUNK_CHARS
+        obs._RISK_SCAN_CHUNK_CHARS = 7
+        try:
+            self.assertEqual(list(_iter_risk_candidate_rows(io.StringIO(text.rstrip("\n")), eng)), [rows[1], rows[2], rows[3]])
+        finally:
+            obs._RISK_SCAN_CHUNK_CHARS = old
+
+    def test_transcript_signals(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "hands.jsonl"
+            lines = ["collecting", "$ npm publish --dry-run", "meta git push", "Sudo make install"]
+            with path.open("w", encoding="utf-8") as f:
+                f.write(json.dumps({"type": "mi.transcript.header", "note": "git push"}) + "\n")
+                for i, x in enumerate(lines):
+                    stream = "meta" if x.startswith("meta") else "stdout"
+                    f.write(json.dumps({"ts": f"t{i}", "stream": stream, "line": x}) + "\n")
+            self.assertEqual(
+                _detect_risk_signals_from_transcript(path),
+                ["publish: $ npm publish --dry-run", "privilege: Sudo make install"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import json
+import tempfile
+import threading
+import time
+import unittest
+from dataclasses import dataclass
+from pathlib import Path
+
+from mi.core.paths import ProjectPaths
+from mi.core.storage import iter_jsonl
+from mi.memory.backends.sqlite_fts import SqliteFtsBackend
+from mi.memory.types import MemoryItem
+from mi.providers.codex_runner import CodexRunResult
+from mi.runtime.run_many import RunManyEntry, RunManyLimits, load_run_many_manifest, run_many
+
+
+@dataclass(frozen=True)
+class _FakePromptResult:
+    obj: dict
+    transcript_path: Path
+
+
+_RESPONSES = {
+    "extract_evidence.json": {
+        "facts": ["ran ls"],
+        "actions": [{"kind": "command", "detail": "ls"}],
+        "results": ["ok"],
+        "unknowns": [],
+        "risk_signals": [],
+    },
+    "decide_next.json": {
+        "next_action": "stop",
+        "status": "done",
+        "confidence": 0.9,
+        "next_hands_input": "",
+        "ask_user_question": "",
+        "learn_suggested": [],
+        "update_project_overlay": {"set_testless_strategy": None},
+        "notes": "done",
+    },
+    "checkpoint_decide.json": {
+        "should_checkpoint": False,
+        "checkpoint_kind": "none",
+        "should_mine_workflow": False,
+        "should_mine_preferences": False,
+        "confidence": 0.9,
+        "notes": "no",
+    },
+}
+
+
+class _FakeLlm:
+    def call(self, *, schema_filename: str, prompt: str, tag: str) -> _FakePromptResult:
+        obj = _RESPONSES.get(schema_filename)
+        if obj is None:
+            raise AssertionError(f"FakeLlm: unexpected call schema={schema_filename}")
+        return _FakePromptResult(obj=json.loads(json.dumps(obj)), transcript_path=Path("fake_mind.jsonl"))
+
+
+class _ConcurrencyProbe:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    def exec(self, **kwargs) -> CodexRunResult:
+        with self._lock:
+            self.active += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        events = [
+            {"type": "thread.started", "thread_id": "t1"},
+            {"type": "item.completed", "item": {"type": "agent_message", "text": "All done."}},
+        ]
+        return CodexRunResult(thread_id="t1", exit_code=0, events=events, raw_transcript_path=Path("fake.jsonl"))
+
+
+class TestRunMany(unittest.TestCase):
+    def test_manifest_json_and_jsonl(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            d = Path(td)
+            (d / "m.json").write_text(json.dumps({"runs": [{"project_root": "repo1", "task": "fix", "max_batches": 3}]}), encoding="utf-8")
+            (d / "m.jsonl").write_text('{"cd": "/abs/repo", "task": "t"}\n\n', encoding="utf-8")
+            (d / "bad.json").write_text(json.dumps([{"task": "no root"}]), encoding="utf-8")
+
+            self.assertEqual(
+                load_run_many_manifest(d / "m.json"),
+                [RunManyEntry(project_root=str((d / "repo1").resolve()), task="fix", max_batches=3)],
+            )
+            entries = load_run_many_manifest(d / "m.jsonl")
+            self.assertEqual((entries[0].project_root, entries[0].max_batches), (str(Path("/abs/repo").resolve()), 8))
+            with self.assertRaises(ValueError):
+                load_run_many_manifest(d / "bad.json")
+
+    def test_runs_concurrently_under_hands_cap_and_reports_throughput(self) -> None:
+        with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as work:
+            roots = [Path(work) / f"p{i}" for i in range(3)]
+            for r in roots:
+                r.mkdir()
+            # The same project twice: its runs must not overlap (per-project state is not shared).
+            entries = [RunManyEntry(project_root=str(r), task="do it", max_batches=1) for r in roots]
+            entries.append(RunManyEntry(project_root=str(roots[0]), task="again", max_batches=1))
+
+            probe = _ConcurrencyProbe()
+            report = run_many(
+                entries=entries,
+                home_dir=Path(home),
+                limits=RunManyLimits(max_parallel=4, hands_cap=2, mind_cap=2),
+                make_hands=lambda: (probe.exec, None),
+                make_llm=lambda _root: _FakeLlm(),
+            )
+
+            self.assertEqual([r["status"] for r in report["runs"]], ["done"] * 4, report["runs"])
+            self.assertEqual(probe.calls, 4)
+            self.assertLessEqual(probe.peak, 2)
+            totals = report["totals"]
+            self.assertEqual((totals["runs"], totals["done"], totals["batches"]), (4, 4, 4))
+            self.assertEqual(totals["mind_calls"], 12)
+            self.assertGreater(totals["batches_per_min"], 0)
+            self.assertEqual(report["queue_wait"]["hands"]["count"], 4)
+            self.assertEqual(report["queue_wait"]["run"]["count"], 4)
+
+            # Each project keeps its own EvidenceLog; the repeated project holds both runs.
+            pp0 = ProjectPaths(home_dir=Path(home), project_root=roots[0])
+            run_ids = {str(r.get("run_id") or "") for r in iter_jsonl(pp0.evidence_log_path) if isinstance(r, dict)}
+            self.assertEqual(len(run_ids - {""}), 2)
+            pp1 = ProjectPaths(home_dir=Path(home), project_root=roots[1])
+            self.assertNotEqual(pp0.evidence_log_path, pp1.evidence_log_path)
+
+    def test_same_project_entries_hold_one_parallel_slot(self) -> None:
+        with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as work:
+            a, b = Path(work) / "a", Path(work) / "b"
+            a.mkdir()
+            b.mkdir()
+            entries = [RunManyEntry(project_root=str(a), task=f"a{i}", max_batches=1) for i in range(3)]
+            entries.append(RunManyEntry(project_root=str(b), task="b", max_batches=1))
+
+            probe = _ConcurrencyProbe()
+            report = run_many(
+                entries=entries,
+                home_dir=Path(home),
+                limits=RunManyLimits(max_parallel=2, hands_cap=4, mind_cap=4),
+                make_hands=lambda: (probe.exec, None),
+                make_llm=lambda _root: _FakeLlm(),
+            )
+
+            runs = report["runs"]
+            self.assertEqual([r["index"] for r in runs], [0, 1, 2, 3])
+            self.assertEqual([r["status"] for r in runs], ["done"] * 4, runs)
+            # Project b got the second slot right away instead of queueing behind blocked a-runs.
+            self.assertEqual(probe.peak, 2)
+            self.assertLess(runs[3]["queue_wait_s"], runs[2]["queue_wait_s"])
+
+    def test_shared_sqlite_connection_across_threads(self) -> None:
+        with tempfile.TemporaryDirectory() as home:
+            backend = SqliteFtsBackend(Path(home), shared_connection=True)
+
+            def _worker(i: int) -> None:
+                backend.upsert_items(
+                    [
+                        MemoryItem(
+                            item_id=f"it{i}",
+                            kind="snapshot",
+                            scope="project",
+                            project_id=f"p{i}",
+                            ts="2026-01-01T00:00:00Z",
+                            title=f"title {i}",
+                            body="shared index body",
+                            tags=[],
+                            source_refs=[],
+                        )
+                    ]
+                )
+
+            threads = [threading.Thread(target=_worker, args=(i,)) for i in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            hits = backend.search(query="shared index", top_k=10, kinds={"snapshot"}, include_global=True, exclude_project_id="")
+            self.assertEqual({h.item_id for h in hits}, {f"it{i}" for i in range(4)})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ import tempfile
 import unittest
 from dataclasses import dataclass
 from pathlib import Path
+from unittest.mock import patch
 
 from mi.core.config import config_path, default_config
 from mi.core.paths import GlobalPaths, ProjectPaths
@@ -307,6 +308,88 @@ class TestRunnerIntegrationFake(unittest.TestCase):
             v = tdb.load_view(scope="project")
             self.assertTrue(any(isinstance(n, dict) and n.get("kind") == "node" for n in v.nodes_by_id.values()))
 
+    def test_checkpoint_async_mode_keeps_evidence_seq_order(self) -> None:
+        def _run(*, async_mode: bool, speculative: bool = False) -> tuple[str, list[str], list[str], int, int]:
+            with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
+                cfg = default_config()
+                cfg["runtime"]["thought_db"]["auto_mine"] = False
+                cfg["runtime"]["thought_db"]["auto_materialize_nodes"] = True
+                cfg["runtime"]["thought_db"]["speculative_context"] = bool(speculative)
+                cfg["runtime"]["checkpoint_async"]["enabled"] = bool(async_mode)
+                write_json(config_path(Path(home)), cfg)
+
+                extract = {
+                    "facts": ["ran ls"],
+                    "actions": [{"kind": "command", "detail": "ls"}],
+                    "results": ["ok"],
+                    "unknowns": [],
+                    "risk_signals": [],
+                }
+                decide = {
+                    "next_action": "send_to_hands",
+                    "status": "not_done",
+                    "confidence": 0.9,
+                    "next_hands_input": "continue with part two",
+                    "ask_user_question": "",
+                    "learn_suggested": [],
+                    "update_project_overlay": {"set_testless_strategy": None},
+                    "notes": "continue",
+                }
+                checkpoint = {
+                    "should_checkpoint": True,
+                    "checkpoint_kind": "subtask",
+                    "should_mine_workflow": False,
+                    "should_mine_preferences": False,
+                    "confidence": 0.9,
+                    "notes": "part one done",
+                }
+                fake_hands = _FakeHands(
+                    [
+                        _mk_result(thread_id="t_async", last_message="Part one done.", command="ls"),
+                        _mk_result(thread_id="t_async", last_message="All done.", command="ls"),
+                    ]
+                )
+                fake_llm = _FakeLlm(
+                    {
+                        "extract_evidence.json": [extract, extract],
+                        "decide_next.json": [decide, {**decide, "next_action": "stop", "status": "done", "next_hands_input": ""}],
+                        "checkpoint_decide.json": [checkpoint, {**checkpoint, "should_checkpoint": False, "checkpoint_kind": "none"}],
+                    }
+                )
+
+                result = run_autopilot(
+                    task="two parts",
+                    project_root=project_root,
+                    home_dir=home,
+                    max_batches=3,
+                    hands_exec=fake_hands.exec,
+                    hands_resume=fake_hands.resume,
+                    llm=fake_llm,
+                )
+                recs = []
+                with open(result.evidence_log_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        obj = json.loads(line)
+                        if isinstance(obj, dict) and isinstance(obj.get("seq"), int):
+                            recs.append(obj)
+                by_seq = sorted((int(r["seq"]), int(r.get("sub_seq") or 0), str(r.get("kind") or "")) for r in recs)
+                mat = [r for r in recs if r.get("kind") == "node_materialized"]
+                spec = [r for r in recs if r.get("kind") == "tdb_context_speculation"]
+                kinds = [k for _, _, k in by_seq if k != "tdb_context_speculation"]
+                return result.status, list(fake_llm.calls), kinds, len(mat), len(spec)
+
+        sync = _run(async_mode=False)
+        async_ = _run(async_mode=True)
+        self.assertEqual(sync[0], "done")
+        self.assertEqual(async_[:3], sync[:3])
+        self.assertGreaterEqual(async_[3], 1)
+
+        # Speculative decide context: same calls/records, plus one speculation record per batch.
+        for mode in (False, True):
+            spec = _run(async_mode=mode, speculative=True)
+            self.assertEqual(spec[:3], sync[:3])
+            self.assertEqual(spec[4], 2)
+
     def test_nodes_only_mode_still_checkpoints_and_materializes_nodes(self) -> None:
         with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
             # Nodes-only: disable all checkpoint mining but keep deterministic node materialization on.
@@ -2019,6 +2102,252 @@ class TestRunnerIntegrationFake(unittest.TestCase):
             self.assertEqual(result.status, "done")
             self.assertEqual(fake_llm.calls, ["extract_evidence.json", "risk_judge.json", "decide_next.json", "checkpoint_decide.json"])
 
+    def test_mind_concurrency_keeps_calls_and_evidence_order(self) -> None:
+        def _run(*, concurrent: bool) -> tuple[str, list[str], list[str]]:
+            with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
+                cfg = default_config()
+                cfg["runtime"]["violation_response"]["ask_user_risk_severities"] = ["high", "critical"]
+                cfg["runtime"]["mind_concurrency"]["enabled"] = bool(concurrent)
+                write_json(config_path(Path(home)), cfg)
+
+                fake_hands = _FakeHands(
+                    [
+                        _mk_result(thread_id="t5", last_message="All done.", command="git push origin main"),
+                    ]
+                )
+                fake_llm = _FakeLlm(
+                    {
+                        "extract_evidence.json": [
+                            {"facts": [], "actions": [], "results": [], "unknowns": [], "risk_signals": []},
+                        ],
+                        "risk_judge.json": [
+                            {"category": "push", "severity": "medium", "should_ask_user": False, "mitigation": [], "learn_suggested": []},
+                        ],
+                        "decide_next.json": [
+                            {
+                                "next_action": "stop",
+                                "status": "done",
+                                "confidence": 0.9,
+                                "next_hands_input": "",
+                                "ask_user_question": "",
+                                "learn_suggested": [],
+                                "update_project_overlay": {"set_testless_strategy": None},
+                                "notes": "done",
+                            },
+                        ],
+                        "checkpoint_decide.json": [
+                            {
+                                "should_checkpoint": False,
+                                "checkpoint_kind": "none",
+                                "should_mine_workflow": False,
+                                "should_mine_preferences": False,
+                                "confidence": 0.9,
+                                "notes": "no",
+                            }
+                        ],
+                    }
+                )
+
+                result = run_autopilot(
+                    task="x",
+                    project_root=project_root,
+                    home_dir=home,
+                    max_batches=1,
+                    hands_exec=fake_hands.exec,
+                    hands_resume=fake_hands.resume,
+                    llm=fake_llm,
+                )
+                kinds: list[str] = []
+                with open(result.evidence_log_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        obj = json.loads(line)
+                        if isinstance(obj, dict) and obj.get("kind"):
+                            kinds.append(str(obj["kind"]))
+                return result.status, list(fake_llm.calls), kinds
+
+        seq = _run(concurrent=False)
+        par = _run(concurrent=True)
+        self.assertEqual(seq[0], "done")
+        self.assertEqual(par, seq)
+
+    def test_mind_concurrency_prefetched_auto_answer_is_consumed(self) -> None:
+        import mi.runtime.autopilot as AP
+
+        prefetchers: list[AP.MindPrefetcher] = []
+
+        class _RecordingPrefetcher(AP.MindPrefetcher):
+            def __init__(self, **kwargs) -> None:
+                super().__init__(**kwargs)
+                prefetchers.append(self)
+
+        def _run(*, concurrent: bool) -> tuple[str, list[tuple[str, str]]]:
+            with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
+                cfg = default_config()
+                cfg["runtime"]["mind_concurrency"]["enabled"] = bool(concurrent)
+                write_json(config_path(Path(home)), cfg)
+
+                fake_hands = _FakeHands(
+                    [
+                        _mk_result(thread_id="t7", last_message="Should I use pytest or unittest?"),
+                        _mk_result(thread_id="t7", last_message="All done."),
+                    ]
+                )
+                fake_llm = _FakeLlm(
+                    {
+                        "extract_evidence.json": [
+                            {"facts": [], "actions": [], "results": [], "unknowns": ["test runner"], "risk_signals": []},
+                            {"facts": [], "actions": [], "results": ["done"], "unknowns": [], "risk_signals": []},
+                        ],
+                        "workflow_progress.json": [],
+                        "plan_min_checks.json": [
+                            {
+                                "should_run_checks": False,
+                                "needs_testless_strategy": False,
+                                "testless_strategy_question": "",
+                                "check_goals": [],
+                                "commands_hints": [],
+                                "hands_check_input": "",
+                                "notes": "skip",
+                            }
+                        ],
+                        "auto_answer_to_hands.json": [
+                            {
+                                "should_answer": True,
+                                "confidence": 0.9,
+                                "hands_answer_input": "Use unittest (the repo's runner).",
+                                "needs_user_input": False,
+                                "ask_user_question": "",
+                                "unanswered_questions": [],
+                                "notes": "repo uses unittest",
+                            }
+                        ],
+                        "decide_next.json": [
+                            {
+                                "next_action": "stop",
+                                "status": "done",
+                                "confidence": 0.9,
+                                "next_hands_input": "",
+                                "ask_user_question": "",
+                                "learn_suggested": [],
+                                "update_project_overlay": {"set_testless_strategy": None},
+                                "notes": "done",
+                            }
+                        ],
+                        "checkpoint_decide.json": [
+                            {
+                                "should_checkpoint": False,
+                                "checkpoint_kind": "none",
+                                "should_mine_workflow": False,
+                                "should_mine_preferences": False,
+                                "confidence": 0.9,
+                                "notes": "no",
+                            }
+                        ]
+                        * 2,
+                    }
+                )
+                calls: list[tuple[str, str]] = []
+                llm_call = fake_llm.call
+
+                def _call(*, schema_filename: str, prompt: str, tag: str) -> _FakePromptResult:
+                    calls.append((schema_filename, tag))
+                    return llm_call(schema_filename=schema_filename, prompt=prompt, tag=tag)
+
+                fake_llm.call = _call  # type: ignore[method-assign]
+                with patch.object(AP, "MindPrefetcher", _RecordingPrefetcher):
+                    result = run_autopilot(
+                        task="x",
+                        project_root=project_root,
+                        home_dir=home,
+                        max_batches=3,
+                        hands_exec=fake_hands.exec,
+                        hands_resume=fake_hands.resume,
+                        llm=fake_llm,
+                    )
+                return result.status, calls
+
+        seq = _run(concurrent=False)
+        par = _run(concurrent=True)
+        self.assertEqual(seq[0], "done")
+        self.assertEqual(par, seq)
+        self.assertEqual([c for c in seq[1] if c[0] == "auto_answer_to_hands.json"], [("auto_answer_to_hands.json", "autoanswer_b0")])
+        self.assertEqual(len(prefetchers), 1)
+        self.assertEqual(prefetchers[0].stats["stale"], 0)
+        self.assertGreaterEqual(prefetchers[0].stats["consumed"], 2)
+
+    def test_perf_spans_are_recorded_per_batch_without_changing_evidence(self) -> None:
+        def _run(*, perf: bool) -> tuple[str, list[str], list[dict]]:
+            with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
+                cfg = default_config()
+                cfg["runtime"]["perf"]["enabled"] = bool(perf)
+                write_json(config_path(Path(home)), cfg)
+
+                fake_hands = _FakeHands(
+                    [
+                        _mk_result(thread_id="t6", last_message="Step one done.", command="ls"),
+                        _mk_result(thread_id="t6", last_message="All done.", command="ls"),
+                    ]
+                )
+                fake_llm = _FakeLlm(
+                    {
+                        "extract_evidence.json": [
+                            {"facts": [], "actions": [], "results": [], "unknowns": [], "risk_signals": []},
+                            {"facts": [], "actions": [], "results": [], "unknowns": [], "risk_signals": []},
+                        ],
+                        "decide_next.json": [
+                            {
+                                "next_action": "send_to_hands",
+                                "status": "not_done",
+                                "confidence": 0.9,
+                                "next_hands_input": "continue",
+                                "ask_user_question": "",
+                                "learn_suggested": [],
+                                "update_project_overlay": {"set_testless_strategy": None},
+                                "notes": "continue",
+                            },
+                            {
+                                "next_action": "stop",
+                                "status": "done",
+                                "confidence": 0.9,
+                                "next_hands_input": "",
+                                "ask_user_question": "",
+                                "learn_suggested": [],
+                                "update_project_overlay": {"set_testless_strategy": None},
+                                "notes": "done",
+                            },
+                        ],
+                    }
+                )
+
+                result = run_autopilot(
+                    task="x",
+                    project_root=project_root,
+                    home_dir=home,
+                    max_batches=2,
+                    hands_exec=fake_hands.exec,
+                    hands_resume=fake_hands.resume,
+                    llm=fake_llm,
+                )
+                kinds = [str(obj.get("kind") or "") for obj in iter_jsonl(result.evidence_log_path) if isinstance(obj, dict)]
+                perf_path = result.project_dir / "perf.jsonl"
+                recs = list(iter_jsonl(perf_path)) if perf_path.exists() else []
+                return result.status, kinds, recs
+
+        plain = _run(perf=False)
+        timed = _run(perf=True)
+        self.assertEqual(plain[2], [])
+        self.assertEqual(timed[:2], plain[:2])
+
+        recs = timed[2]
+        self.assertEqual([r["batch_id"] for r in recs if r["batch_id"] != "run_end"], ["b0", "b1"])
+        self.assertEqual({r["run_id"] for r in recs}, {recs[0]["run_id"]})
+        names = {s[0] for r in recs if r["batch_id"] == "b0" for s in r["spans"]}
+        for phase in ("batch.predecide", "batch.decide", "hands", "observe_repo", "mind.extract_evidence", "mind.decide_next", "evidence.append"):
+            self.assertIn(phase, names)
+        parents = {s[0]: s[1] for r in recs if r["batch_id"] == "b0" for s in r["spans"]}
+        self.assertEqual(parents["hands"], "batch.predecide")
+        self.assertEqual(parents["mind.decide_next"], "batch.decide")
+
     def test_mind_error_extract_evidence_is_logged_and_run_continues(self) -> None:
         with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
             fake_hands = _FakeHands(
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import unittest
+from pathlib import Path
+
+from mi.core.schema_validate import compile_json_schema, validate_json_schema
+from mi.providers.mind_utils import load_schema
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+_BENCH_PATH = _ROOT / "scripts" / "bench_schema_validate.py"
+
+
+def _load_bench():
+    spec = importlib.util.spec_from_file_location("bench_schema_validate", _BENCH_PATH)
+    assert spec and spec.loader
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class TestCompiledSchemaValidator(unittest.TestCase):
+    def test_compiled_matches_interpreted_for_all_mi_schemas(self) -> None:
+        bench = _load_bench()
+        for path in sorted((_ROOT / "mi" / "schemas").glob("*.json")):
+            schema = json.loads(path.read_text(encoding="utf-8"))
+            compiled = compile_json_schema(schema)
+            valid = bench.example_for(schema)
+            self.assertEqual(compiled(valid), [], path.name)
+            for sample in bench.mutations_for(valid):
+                self.assertEqual(compiled(sample), validate_json_schema(sample, schema), path.name)
+
+    def test_edge_cases_keep_identical_messages(self) -> None:
+        cases = [
+            ("not a schema", {"a": 1}),
+            ({"anyOf": []}, 1),
+            ({"anyOf": ["x", {"type": "string"}]}, 1),
+            ({"anyOf": [{"type": "null"}, {"type": "number", "minimum": 0, "maximum": 1}]}, 2),
+            ({"enum": ["a", "b"], "type": "string"}, "c"),
+            ({"type": "object", "properties": {"a": "bad"}, "required": ["a", 3]}, {"a": 1}),
+            ({"type": "object", "properties": {"a": {"type": "string"}}, "additionalProperties": False}, {"b": 1}),
+            ({"type": "array", "items": {"type": "boolean"}}, [True, 1, None]),
+            ({"type": "number"}, True),
+            ({"type": "unknown"}, object()),
+            ({}, 1),
+        ]
+        for schema, obj in cases:
+            compiled = compile_json_schema(schema)  # type: ignore[arg-type]
+            self.assertEqual(compiled(obj), validate_json_schema(obj, schema), schema)  # type: ignore[arg-type]
+            self.assertEqual(compiled(obj, path="$.x"), validate_json_schema(obj, schema, path="$.x"), schema)  # type: ignore[arg-type]
+
+    def test_load_schema_is_cached_per_process(self) -> None:
+        a = load_schema("decide_next.json")
+        b = load_schema("decide_next.json")
+        self.assertIs(a, b)
+        self.assertEqual(a.obj, json.loads(a.path.read_text(encoding="utf-8")))
+        self.assertEqual(a.validate({"next_action": "stop"}), validate_json_schema({"next_action": "stop"}, a.obj))
+
+    def test_benchmark_runs(self) -> None:
+        res = _load_bench().run(1)
+        self.assertEqual(len(res["schemas"]), len(list((_ROOT / "mi" / "schemas").glob("*.json"))))
+        self.assertGreater(res["total"]["validations"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
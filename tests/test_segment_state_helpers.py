@@ -5,15 +5,22 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from mi.core.storage import read_json_best_effort
 from mi.runtime.autopilot.segment_state import (
+    SegmentJournal,
     add_segment_record,
     clear_segment_state,
     load_segment_state,
     new_segment_state,
     persist_segment_state,
+    segment_journal_path,
 )
 
 
+def _write_json(p: Path, obj: object) -> None:
+    p.write_text(json.dumps(obj), encoding="utf-8")
+
+
 class SegmentStateHelpersTests(unittest.TestCase):
     def test_new_segment_state_sets_defaults_and_truncates_task(self) -> None:
         state = new_segment_state(
@@ -65,9 +72,6 @@ class SegmentStateHelpersTests(unittest.TestCase):
                 "records": [{"idx": i} for i in range(10)],
             }
 
-            def _write_json(p: Path, obj: object) -> None:
-                p.write_text(json.dumps(obj), encoding="utf-8")
-
             persist_segment_state(
                 enabled=True,
                 path=path,
@@ -85,6 +89,95 @@ class SegmentStateHelpersTests(unittest.TestCase):
             clear_segment_state(path=path)
             self.assertFalse(path.exists())
 
+    def _persist(self, path: Path, state: dict, journal: SegmentJournal, *, max_records: int = 4) -> None:
+        persist_segment_state(
+            enabled=True,
+            path=path,
+            segment_state=state,
+            segment_max_records=max_records,
+            now_ts=lambda: "2026-02-21T00:00:00Z",
+            write_json_atomic=_write_json,
+            journal=journal,
+        )
+
+    def _load(self, path: Path, *, thread_hint: str = "tid_a", warnings: list | None = None) -> dict | None:
+        return load_segment_state(
+            path=path,
+            read_json_best_effort=read_json_best_effort,
+            state_warnings=warnings if warnings is not None else [],
+            thread_hint=thread_hint,
+            journal=SegmentJournal(),
+            segment_max_records=4,
+        )
+
+    def test_journal_appends_records_and_compacts_periodically(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "segment_state.json"
+            jpath = segment_journal_path(path)
+            journal = SegmentJournal()
+            state = {"version": "v1", "open": True, "segment_id": "seg_1", "thread_id": "tid_a", "records": []}
+            recs = state["records"]
+
+            self._persist(path, state, journal)
+            self.assertTrue(path.exists())
+            self.assertFalse(jpath.exists())
+            snap_mtime = path.stat().st_mtime_ns
+
+            for i in range(3):
+                recs.append({"idx": i})
+                self._persist(path, state, journal)
+            self.assertEqual(path.stat().st_mtime_ns, snap_mtime)
+            self.assertEqual(len(jpath.read_text(encoding="utf-8").splitlines()), 3)
+            self.assertEqual([r["idx"] for r in self._load(path)["records"]], [0, 1, 2])
+
+            # Past `segment_max_records` journal lines: fold into a new snapshot.
+            for i in range(3, 6):
+                recs.append({"idx": i})
+                recs[:] = recs[-4:]
+                self._persist(path, state, journal)
+            self.assertEqual([r["idx"] for r in json.loads(path.read_text(encoding="utf-8"))["records"]], [1, 2, 3, 4])
+            self.assertEqual([r["idx"] for r in self._load(path)["records"]], [2, 3, 4, 5])
+
+            # Header changes (e.g., thread id set at a checkpoint) are snapshotted.
+            state["thread_id"] = "tid_b"
+            self._persist(path, state, journal)
+            self.assertFalse(jpath.exists())
+            self.assertIsNone(self._load(path, thread_hint="tid_a"))
+            self.assertEqual(len(self._load(path, thread_hint="tid_b")["records"]), 4)
+
+    def test_journal_replay_skips_stale_lines_and_quarantines_corruption(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            path = Path(td) / "segment_state.json"
+            jpath = segment_journal_path(path)
+            journal = SegmentJournal()
+            state = {"version": "v1", "open": True, "segment_id": "seg_1", "thread_id": "tid_a", "records": []}
+            self._persist(path, state, journal)
+            state["records"].append({"idx": 0})
+            self._persist(path, state, journal)
+            stale = jpath.read_text(encoding="utf-8")
+
+            # Crash between a snapshot and the journal reset: old lines must not be applied twice.
+            _write_json(path, {**state, "journal_n": 1})
+            jpath.write_text(stale, encoding="utf-8")
+            self.assertEqual(self._load(path)["records"], [{"idx": 0}])
+
+            # A torn last line is ignored without a warning.
+            jpath.write_text(stale + '{"segment_id": "seg_1", "n": 2', encoding="utf-8")
+            _write_json(path, {**state, "records": [], "journal_n": 0})
+            warnings: list = []
+            self.assertEqual(self._load(path, warnings=warnings)["records"], [{"idx": 0}])
+            self.assertEqual(warnings, [])
+
+            # Corruption before the last line keeps the replayed prefix and quarantines the journal.
+            line2 = json.dumps({"segment_id": "seg_1", "n": 2, "ts": "", "record": {"idx": 1}})
+            jpath.write_text(stale + "garbage\n" + line2 + "\n", encoding="utf-8")
+            self.assertEqual(self._load(path, warnings=warnings)["records"], [{"idx": 0}])
+            self.assertEqual(warnings[0]["label"], "segment_journal")
+            self.assertFalse(jpath.exists())
+
+            clear_segment_state(path=path)
+            self.assertFalse(path.exists())
+
     def test_add_segment_record_compacts_and_bounds(self) -> None:
         recs: list[dict[str, object]] = []
         add_segment_record(
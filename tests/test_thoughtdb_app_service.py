@@ -3,8 +3,9 @@ from __future__ import annotations
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from mi.core.paths import ProjectPaths
+from mi.core.paths import GlobalPaths, ProjectPaths
 from mi.thoughtdb import ThoughtDbStore
 from mi.thoughtdb.app_service import ThoughtDbApplicationService
 
@@ -57,6 +58,95 @@ class TestThoughtDbApplicationService(unittest.TestCase):
             same_text = [c for c in items if isinstance(c, dict) and str(c.get("text") or "").strip() == "Keep behavior unchanged"]
             self.assertEqual(len(same_text), 1)
 
+    def test_streamed_listing_matches_sorted_listing_and_pages_by_cursor(self) -> None:
+        with tempfile.TemporaryDirectory() as td_home, tempfile.TemporaryDirectory() as td_proj:
+            home = Path(td_home)
+            pp = ProjectPaths(home_dir=home, project_root=Path(td_proj))
+            tdb = ThoughtDbStore(home_dir=home, project_paths=pp)
+            app = ThoughtDbApplicationService(tdb=tdb, project_paths=pp)
+            _ = tdb.load_view(scope="project"), tdb.load_view(scope="global")
+
+            # Out-of-order and tied asserted_ts across both scopes; one project/global duplicate text.
+            plan = [
+                ("project", "a", "2026-01-01T00:00:02Z"),
+                ("global", "b", "2026-01-01T00:00:02Z"),
+                ("project", "c", "2026-01-01T00:00:01Z"),
+                ("global", "dup", "2026-01-01T00:00:03Z"),
+                ("project", "dup", "2026-01-01T00:00:01Z"),
+                ("global", "d", "2026-01-01T00:00:02Z"),
+                ("project", "e", "2026-01-01T00:00:02Z"),
+                ("global", "f", "2026-01-01T00:00:00Z"),
+            ]
+            ids: dict[str, str] = {}
+            for sc, text, ts in plan:
+                with mock.patch("mi.thoughtdb.append_store.now_rfc3339", return_value=ts):
+                    ids[f"{sc}:{text}"] = tdb.append_claim_create(
+                        claim_type="fact",
+                        text=text,
+                        scope=sc,
+                        visibility=sc,
+                        valid_from=None,
+                        valid_to=None,
+                        tags=[],
+                        source_event_ids=[],
+                        confidence=1.0,
+                        notes="",
+                    )
+            tdb.append_claim_retract(claim_id=ids["project:c"], scope="project", rationale="r", source_event_ids=[])
+
+            def _sorted(scopes: list[str]) -> list[str]:
+                out: list[dict] = []
+                seen: set[str] = set()
+                for sc in scopes:
+                    for c in tdb.load_view(scope=sc).iter_claims(include_inactive=False, include_aliases=False):
+                        key = f"{c.get('claim_type')}|{c.get('text')}"
+                        if key in seen:
+                            continue
+                        if sc == "project":
+                            seen.add(key)
+                        out.append(c)
+                out.sort(key=lambda x: str(x.get("asserted_ts") or ""), reverse=True)
+                return [str(c.get("claim_id")) for c in out]
+
+            def _streamed(scope: str, after_id: str = "", limit: int = 0) -> list[str]:
+                it = app.iter_claims_recent_first(
+                    scope=scope, include_inactive=False, include_aliases=False, as_of_ts="", after_id=after_id
+                )
+                out = [str(c.get("claim_id")) for c in it]
+                return out[:limit] if limit > 0 else out
+
+            expected = {"project": _sorted(["project"]), "global": _sorted(["global"]), "effective": _sorted(["project", "global"])}
+            self.assertNotIn(ids["global:dup"], expected["effective"])
+            self.assertNotIn(ids["project:c"], expected["project"])
+
+            # Hot (incrementally maintained) views and a cold rebuild list the same order.
+            for d in (pp.thoughtdb_dir, GlobalPaths(home_dir=home).thoughtdb_global_dir):
+                (d / "view.snapshot.json").unlink(missing_ok=True)
+            tdb_cold = ThoughtDbStore(home_dir=home, project_paths=pp)
+            app_cold = ThoughtDbApplicationService(tdb=tdb_cold, project_paths=pp)
+            for scope, want in expected.items():
+                self.assertEqual(_streamed(scope), want, scope)
+                cold = app_cold.iter_claims_recent_first(scope=scope, include_inactive=False, include_aliases=False, as_of_ts="")
+                self.assertEqual([str(c.get("claim_id")) for c in cold], want, scope)
+
+                # Pages of 2 chained by --after cursors concatenate to the full listing.
+                pages: list[str] = []
+                after = ""
+                while True:
+                    page = _streamed(scope, after_id=after, limit=2)
+                    if not page:
+                        break
+                    pages.extend(page)
+                    after = page[-1]
+                self.assertEqual(pages, want, scope)
+
+            self.assertEqual(
+                [c["claim_id"] for c in app.list_effective_claims(include_inactive=False, include_aliases=False, as_of_ts="", limit=3)],
+                expected["effective"][:3],
+            )
+            with self.assertRaises(ValueError):
+                _streamed("effective", after_id="cl_missing")
+
     def test_node_lookup_edges_and_subgraph(self) -> None:
         with tempfile.TemporaryDirectory() as td_home, tempfile.TemporaryDirectory() as td_proj:
             home = Path(td_home)
@@ -117,5 +207,39 @@ class TestThoughtDbApplicationService(unittest.TestCase):
             self.assertTrue(any(str(e.get("edge_type") or "") == "supports" for e in graph.get("edges", [])))
 
 
+    def test_related_edges_and_subgraph_follow_aliases_via_indexes(self) -> None:
+        with tempfile.TemporaryDirectory() as td_home, tempfile.TemporaryDirectory() as td_proj:
+            home = Path(td_home)
+            pp = ProjectPaths(home_dir=home, project_root=Path(td_proj))
+            tdb = ThoughtDbStore(home_dir=home, project_paths=pp)
+            app = ThoughtDbApplicationService(tdb=tdb, project_paths=pp)
+
+            def _edge(et: str, frm: str, to: str) -> str:
+                return tdb.append_edge(edge_type=et, from_id=frm, to_id=to, scope="project", visibility="project", source_event_ids=[], notes="")
+
+            e1 = _edge("depends_on", "ev_1", "cl_dup")
+            e2 = _edge("supports", "cl_canon", "ev_2")
+            e3 = _edge("same_as", "cl_dup", "cl_canon")
+            _edge("mentions", "ev_3", "ev_4")
+            e5 = _edge("depends_on", "cl_dup", "cl_dup")
+
+            # Append order; the self-loop is listed once; only the requested id and its canonical id match.
+            got = [e["edge_id"] for e in app.related_edges_for_id(scope="project", item_id="cl_dup")]
+            self.assertEqual(got, [e1, e2, e3, e5])
+            self.assertEqual([e["edge_id"] for e in app.related_edges_for_id(scope="project", item_id="cl_canon")], [e2, e3])
+
+            graph = app.build_subgraph(
+                scope="project",
+                root_id="cl_canon",
+                depth=1,
+                direction="both",
+                edge_types={"depends_on", "supports"},
+                include_inactive=True,
+                include_aliases=False,
+            )
+            # Edges attached to the alias are reached from the canonical root (endpoints canonicalised).
+            self.assertEqual({e["edge_id"] for e in graph["edges"]}, {e1, e2, e5})
+            self.assertEqual(sorted(graph["missing_ids"]), ["cl_canon", "ev_1", "ev_2"])
+
 if __name__ == "__main__":
     unittest.main()
@@ -38,6 +38,43 @@ class TestThoughtDbApplicationServiceShowRefs(unittest.TestCase):
             self.assertEqual(scope2, "global")
             self.assertEqual(str((obj2 or {}).get("batch_id") or ""), "bg")
 
+    def test_derived_from_event_lists_citing_records_in_both_scopes(self) -> None:
+        with tempfile.TemporaryDirectory() as td_home, tempfile.TemporaryDirectory() as td_proj:
+            home = Path(td_home)
+            pp = ProjectPaths(home_dir=home, project_root=Path(td_proj))
+            tdb = ThoughtDbStore(home_dir=home, project_paths=pp)
+            app = ThoughtDbApplicationService(tdb=tdb, project_paths=pp)
+
+            def _claim(scope: str, text: str, ev: list[str]) -> str:
+                return tdb.append_claim_create(
+                    claim_type="fact",
+                    text=text,
+                    scope=scope,
+                    visibility=scope,
+                    valid_from=None,
+                    valid_to=None,
+                    tags=[],
+                    source_event_ids=ev,
+                    confidence=1.0,
+                    notes="",
+                )
+
+            cp = _claim("project", "project fact", ["ev_x"])
+            cg = _claim("global", "global fact", ["ev_x"])
+            _claim("project", "unrelated", ["ev_y"])
+            tdb.append_claim_retract(claim_id=cg, scope="global", rationale="r", source_event_ids=[])
+
+            derived = app.derived_from_event("ev_x")
+            self.assertEqual(
+                derived["claims"],
+                [
+                    {"scope": "project", "claim_id": cp, "status": "active"},
+                    {"scope": "global", "claim_id": cg, "status": "retracted"},
+                ],
+            )
+            self.assertEqual((derived["nodes"], derived["edges"]), ([], []))
+            self.assertEqual(app.derived_from_event("ev_missing"), {"claims": [], "nodes": [], "edges": []})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,7 +6,8 @@ from pathlib import Path
 
 from mi.core.paths import ProjectPaths
 from mi.memory.service import MemoryService
-from mi.thoughtdb import ThoughtDbStore
+from mi.thoughtdb import ThoughtDbStore, ThoughtDbView
+from mi.thoughtdb.app_service import ThoughtDbApplicationService
 
 
 class TestThoughtDbClaims(unittest.TestCase):
@@ -214,6 +215,60 @@ class TestThoughtDbClaims(unittest.TestCase):
             ids = {str(c.get("claim_id") or "") for c in v2.iter_claims(include_inactive=True, include_aliases=False)}
             self.assertNotIn(dup, ids)
 
+    def test_as_of_queries_match_window_scan_across_appends(self) -> None:
+        with tempfile.TemporaryDirectory() as td_home, tempfile.TemporaryDirectory() as td_proj:
+            home = Path(td_home)
+            pp = ProjectPaths(home_dir=home, project_root=Path(td_proj))
+            tdb = ThoughtDbStore(home_dir=home, project_paths=pp)
+
+            def _claim(text: str, vf: str | None, vt: str | None) -> str:
+                return tdb.append_claim_create(
+                    claim_type="fact",
+                    text=text,
+                    scope="project",
+                    visibility="project",
+                    valid_from=vf,
+                    valid_to=vt,
+                    tags=[],
+                    source_event_ids=[],
+                    confidence=1.0,
+                    notes="",
+                )
+
+            _claim("always", None, None)
+            _claim("from march", "2026-03-01T00:00:00Z", None)
+            _claim("until march", None, "2026-03-01T00:00:00Z")
+            # Materialize the index on the hot view; later appends must carry it forward.
+            self.assertEqual(tdb.load_view(scope="project").claim_validity.next_boundary_after("2026-01-01T00:00:00Z"), "2026-03-01T00:00:00Z")
+            _claim("february only", "2026-02-01T00:00:00Z", "2026-03-01T00:00:00Z")
+            _claim("from june", "2026-06-01T00:00:00Z", None)
+
+            def _scan(v: ThoughtDbView, t: str) -> list[str]:
+                out = []
+                for c in v.claims_by_id.values():
+                    vf = str(c.get("valid_from") or "")
+                    vt = str(c.get("valid_to") or "")
+                    if (vf and vf > t) or (vt and t >= vt):
+                        continue
+                    out.append(str(c["text"]))
+                return out
+
+            hot = tdb.load_view(scope="project")
+            self.assertIsNotNone(hot.validity_index_built())
+            cold = ThoughtDbStore(home_dir=home, project_paths=pp)
+            (pp.thoughtdb_dir / "view.snapshot.json").unlink(missing_ok=True)
+            cold_view = cold.load_view(scope="project")
+            self.assertEqual(hot.claim_validity.windows, cold_view.claim_validity.windows)
+            app = ThoughtDbApplicationService(tdb=cold, project_paths=pp)
+
+            for t in ("2026-01-15T00:00:00Z", "2026-02-01T00:00:00Z", "2026-03-01T00:00:00Z", "2026-07-01T00:00:00Z"):
+                got = [c["text"] for c in hot.iter_claims(include_inactive=False, include_aliases=False, as_of_ts=t)]
+                self.assertEqual(got, _scan(hot, t), t)
+                listed = app.iter_claims_recent_first(scope="project", include_inactive=False, include_aliases=False, as_of_ts=t)
+                self.assertEqual(sorted(c["text"] for c in listed), sorted(_scan(cold_view, t)), t)
+            self.assertEqual(hot.claim_validity.next_boundary_after("2026-03-01T00:00:00Z"), "2026-06-01T00:00:00Z")
+            self.assertEqual(hot.claim_validity.next_boundary_after("2026-06-01T00:00:00Z"), "")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
+import json
 import tempfile
+import threading
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from mi.core.paths import ProjectPaths
 from mi.thoughtdb import ThoughtDbStore
-from mi.thoughtdb.compaction import compact_thoughtdb_dir
+from mi.core.storage import advisory_lock
+from mi.thoughtdb import compaction
+from mi.thoughtdb.compaction import COMPACTION_LOCK_FILENAME, compact_thoughtdb_dir
 
 
 class TestThoughtDbCompaction(unittest.TestCase):
@@ -138,6 +143,85 @@ class TestThoughtDbCompaction(unittest.TestCase):
             cs = edges.get("compact_stats") if isinstance(edges.get("compact_stats"), dict) else {}
             self.assertLessEqual(int(cs.get("output_lines") or 0), int(cs.get("input_lines") or 0))
 
+    def test_online_compaction_keeps_records_appended_during_compaction(self) -> None:
+        with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
+            pp = ProjectPaths(home_dir=Path(home), project_root=Path(project_root))
+            tdb = ThoughtDbStore(home_dir=Path(home), project_paths=pp)
+
+            def claim(text: str) -> str:
+                return tdb.append_claim_create(
+                    claim_type="fact",
+                    text=text,
+                    scope="project",
+                    visibility="project",
+                    valid_from=None,
+                    valid_to=None,
+                    tags=[],
+                    source_event_ids=[],
+                    confidence=1.0,
+                    notes="",
+                )
+
+            ids = [claim(f"fact {i}") for i in range(5)]
+            for _ in range(3):
+                tdb.append_edge(edge_type="supports", from_id=ids[0], to_id=ids[1], scope="project", visibility="project", source_event_ids=[], notes="")
+            tdb.append_claim_retract(claim_id=ids[2], scope="project", rationale="r1", source_event_ids=[])
+            tdb.append_claim_retract(claim_id=ids[2], scope="project", rationale="r2", source_event_ids=[])
+
+            # A concurrent writer appends after the offsets are recorded (while the prefix is archived).
+            late: list[str] = []
+            real_archive = compaction._archive_gzip
+
+            def archive_then_append(**kw):  # type: ignore[no-untyped-def]
+                if not late:
+                    late.append(claim("late fact"))
+                    tdb.append_edge(edge_type="depends_on", from_id=late[0], to_id=ids[0], scope="project", visibility="project", source_event_ids=[], notes="late")
+                return real_archive(**kw)
+
+            snap = pp.thoughtdb_dir / "view.snapshot.json"
+            rebuilt: list[bool] = []
+            with mock.patch.object(compaction, "_archive_gzip", side_effect=archive_then_append):
+                res = compact_thoughtdb_dir(
+                    thoughtdb_dir=pp.thoughtdb_dir,
+                    snapshot_path=snap,
+                    dry_run=False,
+                    rebuild_snapshot=lambda: rebuilt.append(True),
+                )
+            self.assertTrue(res["ok"])
+            self.assertEqual(rebuilt, [True])
+            self.assertTrue(res["snapshot"]["rebuilt"])
+            files = res["files"]
+            self.assertGreater(files["claims"]["write"]["tail_bytes"], 0)
+            self.assertGreater(files["edges"]["write"]["tail_bytes"], 0)
+            self.assertEqual(files["edges"]["compact_stats"], {"input_lines": 3, "output_lines": 1, "unique_keys": 1})
+            self.assertEqual(files["claims"]["compact_stats"], {"input_lines": 7, "output_lines": 6, "claims": 5, "retracts": 1})
+            self.assertFalse(list(pp.thoughtdb_dir.glob("*.compact.*")))
+
+            v = ThoughtDbStore(home_dir=Path(home), project_paths=pp).load_view(scope="project")
+            self.assertEqual(set(v.claims_by_id), {*ids, late[0]})
+            self.assertEqual(v.retracted_ids, {ids[2]})
+            self.assertEqual(len(v.edges), 2)
+            lines = (pp.thoughtdb_dir / "claims.jsonl").read_text(encoding="utf-8").splitlines()
+            self.assertEqual(json.loads(lines[-1])["claim_id"], late[0])
+
+    def test_appenders_wait_for_the_exclusive_compaction_lock(self) -> None:
+        with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
+            pp = ProjectPaths(home_dir=Path(home), project_root=Path(project_root))
+            tdb = ThoughtDbStore(home_dir=Path(home), project_paths=pp)
+            pp.thoughtdb_dir.mkdir(parents=True, exist_ok=True)
+            done = threading.Event()
+
+            def append() -> None:
+                tdb.append_edge(edge_type="supports", from_id="cl_a", to_id="cl_b", scope="project", visibility="project", source_event_ids=[], notes="")
+                done.set()
+
+            with advisory_lock(pp.thoughtdb_dir / COMPACTION_LOCK_FILENAME):
+                t = threading.Thread(target=append)
+                t.start()
+                self.assertFalse(done.wait(0.2))
+            t.join(5)
+            self.assertTrue(done.is_set())
+
 
 if __name__ == "__main__":
     unittest.main()
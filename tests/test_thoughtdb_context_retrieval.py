@@ -3,11 +3,13 @@ from __future__ import annotations
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 from mi.core.paths import ProjectPaths
 from mi.core.storage import now_rfc3339
 from mi.thoughtdb import ThoughtDbStore
 from mi.thoughtdb.context import build_decide_next_thoughtdb_context
+from mi.thoughtdb.token_index import TokenIndex
 
 
 class TestThoughtDbContextRetrieval(unittest.TestCase):
@@ -113,6 +115,77 @@ class TestThoughtDbContextRetrieval(unittest.TestCase):
             self.assertNotIn(cid, q_ids)
 
 
+    def test_token_index_fallback_matches_full_scan(self) -> None:
+        with tempfile.TemporaryDirectory() as td_home, tempfile.TemporaryDirectory() as td_proj:
+            home = Path(td_home)
+            pp = ProjectPaths(home_dir=home, project_root=Path(td_proj))
+            tdb = ThoughtDbStore(home_dir=home, project_paths=pp)
+
+            def _claim(scope: str, ct: str, text: str, *, tags: list[str] | None = None, valid_to: str | None = None) -> str:
+                with mock.patch("mi.thoughtdb.append_store.now_rfc3339", return_value="2026-01-01T00:00:00Z"):
+                    return tdb.append_claim_create(
+                        claim_type=ct,
+                        text=text,
+                        scope=scope,
+                        visibility=scope,
+                        valid_from=None,
+                        valid_to=valid_to,
+                        tags=tags or [],
+                        source_event_ids=[],
+                        confidence=1.0,
+                        notes="",
+                    )
+
+            for i in range(6):
+                _claim("project", "fact", f"Retry flaky pytest run {i} before reporting")
+                _claim("global", "fact", f"Deploys use the staging_cluster ({i})")
+            _claim("project", "preference", "Prefer   small\nPRs with tests")
+            _claim("global", "goal", "Keep the CLI entrypoint stable")
+            _claim("project", "fact", "Old pytest note", valid_to="2025-01-01T00:00:00Z")
+            dup = _claim("project", "fact", "pytest alias note")
+            canon = _claim("project", "fact", "pytest canonical note")
+            tdb.append_edge(edge_type="same_as", from_id=dup, to_id=canon, scope="project", visibility="project", source_event_ids=[], notes="")
+            gone = _claim("global", "fact", "Retracted staging note")
+            tdb.append_claim_retract(claim_id=gone, scope="global", rationale="r", source_event_ids=[])
+            tdb.append_node_create(
+                node_type="decision",
+                title="Use pytest markers",
+                text="Tag slow tests; run them in CI on the staging_cluster.",
+                scope="project",
+                visibility="project",
+                tags=[],
+                source_event_ids=[],
+                confidence=1.0,
+                notes="",
+            )
+
+            def _all_ids(self: TokenIndex, tokens: object) -> list[str]:
+                return sorted(self.order, key=self.order.get)
+
+            def _ctx(task: str) -> dict:
+                return build_decide_next_thoughtdb_context(
+                    tdb=tdb,
+                    as_of_ts="2026-06-01T00:00:00Z",
+                    task=task,
+                    hands_last_message="",
+                    recent_evidence=[{"kind": "evidence", "facts": ["tests failed on the staging cluster"]}],
+                    max_query_claims=5,
+                ).to_prompt_obj()
+
+            for task in ("fix the flaky pytest run", "deploy to staging_cluster", "prs cli", "ing", "nothing matches zzz"):
+                indexed = _ctx(task)
+                with mock.patch.object(TokenIndex, "candidates", _all_ids):
+                    scanned = _ctx(task)
+                self.assertEqual(indexed, scanned, task)
+
+            # The materialized indices are persisted with the snapshot and reused by a fresh store.
+            want = _ctx("fix the flaky pytest run")
+            tdb.flush_snapshots_best_effort()
+            tdb2 = ThoughtDbStore(home_dir=home, project_paths=pp)
+            self.assertIsNotNone(tdb2.load_view(scope="project").claim_token_index)
+            tdb = tdb2
+            self.assertEqual(_ctx("fix the flaky pytest run"), want)
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from typing import Any
+
+from mi.core.paths import ProjectPaths
+from mi.thoughtdb import ThoughtDbStore
+from mi.thoughtdb.app_service import ThoughtDbApplicationService
+from mi.runtime.wiring import SpeculativeDecideContext
+
+
+def _claim(tdb: ThoughtDbStore, text: str, *, valid_from: str | None = None, valid_to: str | None = None) -> str:
+    return tdb.append_claim_create(
+        claim_type="preference",
+        text=text,
+        scope="project",
+        visibility="project",
+        valid_from=valid_from,
+        valid_to=valid_to,
+        tags=["test"],
+        source_event_ids=["ev_test"],
+        confidence=1.0,
+        notes="t",
+    )
+
+
+class TestThoughtDbContextSpeculation(unittest.TestCase):
+    def setUp(self) -> None:
+        self._td_home = tempfile.TemporaryDirectory()
+        self._td_proj = tempfile.TemporaryDirectory()
+        pp = ProjectPaths(home_dir=Path(self._td_home.name), project_root=Path(self._td_proj.name))
+        self.tdb = ThoughtDbStore(home_dir=Path(self._td_home.name), project_paths=pp)
+        self.app = ThoughtDbApplicationService(tdb=self.tdb, project_paths=pp)
+        _claim(self.tdb, "Prefer small foo patches.")
+        _claim(self.tdb, "Run bar tests before committing.", valid_to="2030-06-01T00:00:00Z")
+
+    def tearDown(self) -> None:
+        self._td_home.cleanup()
+        self._td_proj.cleanup()
+
+    def _full(self, as_of_ts: str) -> dict[str, Any]:
+        return self.app.build_decide_context(
+            as_of_ts=as_of_ts, task="foo", hands_last_message="bar", recent_evidence=[]
+        ).to_prompt_obj()
+
+    def _finished(self, base: Any, as_of_ts: str) -> dict[str, Any]:
+        return self.app.finish_decide_context(
+            base=base, as_of_ts=as_of_ts, task="foo", hands_last_message="bar", recent_evidence=[]
+        ).to_prompt_obj()
+
+    def test_base_plus_finish_equals_full_build(self) -> None:
+        base = self.app.build_decide_context_base(as_of_ts="2030-01-01T00:00:00Z")
+        self.assertTrue(self.app.decide_context_base_is_fresh(base, as_of_ts="2030-02-01T00:00:00Z"))
+        self.assertEqual(self._finished(base, "2030-02-01T00:00:00Z"), self._full("2030-02-01T00:00:00Z"))
+
+    def test_base_goes_stale_after_append_or_validity_boundary(self) -> None:
+        base = self.app.build_decide_context_base(as_of_ts="2030-01-01T00:00:00Z")
+        self.assertEqual(base.next_validity_boundary_ts, "2030-06-01T00:00:00Z")
+        self.assertFalse(self.app.decide_context_base_is_fresh(base, as_of_ts="2030-06-01T00:00:00Z"))
+        self.assertFalse(self.app.decide_context_base_is_fresh(base, as_of_ts="2029-12-31T00:00:00Z"))
+
+        _claim(self.tdb, "Prefer foo over baz.")
+        self.assertFalse(self.app.decide_context_base_is_fresh(base, as_of_ts="2030-01-02T00:00:00Z"))
+
+    def test_speculator_hit_reuses_base_and_records_time_saved(self) -> None:
+        delay = 0.1
+        app = self.app
+        records: list[dict[str, Any]] = []
+
+        class _SlowBase:
+            def __getattr__(self, name: str) -> Any:
+                return getattr(app, name)
+
+            def build_decide_context_base(self, **kwargs: Any) -> Any:
+                time.sleep(delay)
+                return app.build_decide_context_base(**kwargs)
+
+        spec = SpeculativeDecideContext(
+            tdb_app=_SlowBase(),
+            task="foo",
+            now_ts=lambda: "2030-01-01T00:00:00Z",
+            evidence_append=records.append,
+            thread_id_getter=lambda: "t1",
+        )
+        run_hands = spec.wrap_hands(lambda *, ctx: time.sleep(2 * delay) or "hands_ok")
+        try:
+            self.assertEqual(run_hands(ctx=type("Ctx", (), {"batch_id": "b0"})()), "hands_ok")
+            t0 = time.perf_counter()
+            out = spec.build(hands_last_message="bar", recent_evidence=[]).to_prompt_obj()
+            elapsed = time.perf_counter() - t0
+            # A second build without a new speculation reuses the cached base and records nothing.
+            spec.build(hands_last_message="bar", recent_evidence=[])
+        finally:
+            spec.close()
+
+        self.assertEqual(out, self._full("2030-01-01T00:00:00Z"))
+        self.assertLess(elapsed, delay)
+        self.assertEqual(len(records), 1)
+        rec = records[0]
+        self.assertEqual((rec["kind"], rec["batch_id"], rec["hit"], rec["reason"]), ("tdb_context_speculation", "b0", True, "fresh"))
+        self.assertGreater(rec["saved_ms"], 0.5 * delay * 1000.0)
+        self.assertEqual(spec.stats["hits"], 1)
+
+    def test_speculator_rebuilds_when_store_changed(self) -> None:
+        records: list[dict[str, Any]] = []
+        spec = SpeculativeDecideContext(
+            tdb_app=self.app,
+            task="foo",
+            now_ts=lambda: "2030-01-01T00:00:00Z",
+            evidence_append=records.append,
+            thread_id_getter=lambda: "t1",
+        )
+
+        def _hands(*, ctx: Any) -> None:
+            spec.settle()
+            _claim(self.tdb, "Prefer foo over baz.")
+
+        try:
+            spec.wrap_hands(_hands)(ctx=type("Ctx", (), {"batch_id": "b1"})())
+            out = spec.build(hands_last_message="bar", recent_evidence=[]).to_prompt_obj()
+        finally:
+            spec.close()
+
+        self.assertEqual(out, self._full("2030-01-01T00:00:00Z"))
+        self.assertEqual((records[0]["hit"], records[0]["reason"], records[0]["saved_ms"]), (False, "stale", 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,8 +5,9 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
-from mi.core.paths import ProjectPaths
+from mi.core.paths import GlobalPaths, ProjectPaths
 from mi.thoughtdb import ThoughtDbStore
+from mi.thoughtdb.shared_view import SHARED_VIEW_FILENAME, read_shared_view_header
 
 
 class TestThoughtDbSnapshot(unittest.TestCase):
@@ -112,6 +113,206 @@ class TestThoughtDbSnapshot(unittest.TestCase):
                 v2 = tdb2.load_view(scope="project")
             self.assertIn(cid, v2.claims_by_id)
 
+    def test_source_event_index_matches_across_rebuild_incremental_and_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
+            pp = ProjectPaths(home_dir=Path(home), project_root=Path(project_root))
+            tdb = ThoughtDbStore(home_dir=Path(home), project_paths=pp)
+            _ = tdb.load_view(scope="project")
+
+            c1 = tdb.append_claim_create(
+                claim_type="fact",
+                text="The CLI entrypoint is mi/cli.py.",
+                scope="project",
+                visibility="project",
+                valid_from=None,
+                valid_to=None,
+                tags=[],
+                source_event_ids=["ev_a", "ev_b", "ev_a"],
+                confidence=1.0,
+                notes="",
+            )
+            n1 = tdb.append_node_create(
+                node_type="decision",
+                title="Keep CLI",
+                text="Keep the CLI entrypoint.",
+                scope="project",
+                visibility="project",
+                tags=[],
+                source_event_ids=["ev_b"],
+                confidence=1.0,
+                notes="",
+            )
+            e1 = tdb.append_edge(
+                edge_type="depends_on",
+                from_id="ev_b",
+                to_id=c1,
+                scope="project",
+                visibility="project",
+                source_event_ids=["ev_b"],
+                notes="",
+            )
+            tdb.append_claim_retract(claim_id=c1, scope="project", rationale="stale", source_event_ids=["ev_c"])
+
+            hot = tdb.load_view(scope="project")
+            self.assertEqual(hot.ids_by_source_event, {"ev_a": [c1], "ev_b": [c1, n1, e1]})
+            self.assertEqual(tdb.ids_citing_event(scope="project", event_id="ev_b", kind="node"), [n1])
+            self.assertEqual(tdb.ids_citing_event(scope="project", event_id="ev_b", kind="edge"), [e1])
+            self.assertEqual(tdb.ids_citing_event(scope="project", event_id="ev_c"), [])
+
+            # Full rebuild (no snapshot) and snapshot load agree with the incrementally maintained index.
+            (pp.thoughtdb_dir / "view.snapshot.json").unlink(missing_ok=True)
+            rebuilt = ThoughtDbStore(home_dir=Path(home), project_paths=pp).load_view(scope="project")
+            self.assertEqual(rebuilt.ids_by_source_event, hot.ids_by_source_event)
+            with mock.patch("mi.thoughtdb.store.iter_jsonl", side_effect=AssertionError("iter_jsonl should not be called")):
+                snap = ThoughtDbStore(home_dir=Path(home), project_paths=pp).load_view(scope="project")
+            self.assertEqual(snap.ids_by_source_event, hot.ids_by_source_event)
+
+
+    def test_edge_and_alias_indexes_match_across_rebuild_incremental_and_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
+            pp = ProjectPaths(home_dir=Path(home), project_root=Path(project_root))
+            tdb = ThoughtDbStore(home_dir=Path(home), project_paths=pp)
+            _ = tdb.load_view(scope="project")
+
+            def _edge(et: str, frm: str, to: str) -> str:
+                return tdb.append_edge(edge_type=et, from_id=frm, to_id=to, scope="project", visibility="project", source_event_ids=[], notes="")
+
+            e1 = _edge("depends_on", "cl_a", "cl_b")
+            _edge("same_as", "cl_a2", "cl_a")
+            _edge("same_as", "cl_a3", "cl_a2")
+            # Re-homes the whole chain cl_a3 -> cl_a2 -> cl_a onto cl_c.
+            e4 = _edge("same_as", "cl_a", "cl_c")
+
+            hot = tdb.load_view(scope="project")
+            self.assertEqual(hot.aliases_by_canonical, {"cl_c": {"cl_a", "cl_a2", "cl_a3"}})
+            self.assertEqual(hot.aliases_of("cl_c"), {"cl_a", "cl_a2", "cl_a3"})
+            self.assertEqual(hot.aliases_of("cl_a"), set())
+            self.assertEqual((hot.edge_by_id(e1) or {}).get("to_id"), "cl_b")
+            self.assertEqual((hot.edge_by_id(e4) or {}).get("edge_type"), "same_as")
+            self.assertIsNone(hot.edge_by_id("ed_missing"))
+
+            (pp.thoughtdb_dir / "view.snapshot.json").unlink(missing_ok=True)
+            rebuilt = ThoughtDbStore(home_dir=Path(home), project_paths=pp).load_view(scope="project")
+            with mock.patch("mi.thoughtdb.store.iter_jsonl", side_effect=AssertionError("iter_jsonl should not be called")):
+                snap = ThoughtDbStore(home_dir=Path(home), project_paths=pp).load_view(scope="project")
+            for v in (rebuilt, snap):
+                self.assertEqual(v.aliases_by_canonical, hot.aliases_by_canonical)
+                self.assertEqual(v.edge_pos_by_id, hot.edge_pos_by_id)
+
+    def test_signature_and_edge_key_indexes_match_across_rebuild_incremental_and_snapshot(self) -> None:
+        with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
+            pp = ProjectPaths(home_dir=Path(home), project_root=Path(project_root))
+            tdb = ThoughtDbStore(home_dir=Path(home), project_paths=pp)
+            _ = tdb.load_view(scope="project")
+
+            def _claim(text: str) -> str:
+                return tdb.append_claim_create(
+                    claim_type="fact",
+                    text=text,
+                    scope="project",
+                    visibility="project",
+                    valid_from=None,
+                    valid_to=None,
+                    tags=[],
+                    source_event_ids=[],
+                    confidence=1.0,
+                    notes="",
+                )
+
+            c1 = _claim("Alpha  uses Python")
+            c2 = _claim("alpha uses python")
+            c3 = _claim("Beta uses Rust")
+            # c1 becomes an alias: c2 takes over the shared signature.
+            tdb.append_edge(edge_type="same_as", from_id=c1, to_id=c2, scope="project", visibility="project", source_event_ids=[], notes="")
+            tdb.append_edge(edge_type="depends_on", from_id=c3, to_id=c2, scope="project", visibility="project", source_event_ids=[], notes="")
+
+            hot = tdb.load_view(scope="project")
+            sig = hot.signature_by_claim_id[c1]
+            self.assertEqual(hot.signature_by_claim_id[c2], sig)
+            self.assertEqual(hot.claim_id_for_signature(sig), c2)
+            self.assertTrue(hot.has_edge_key(f"depends_on|{c3}|{c2}"))
+            self.assertEqual(tdb.existing_signature_map(scope="project"), {sig: c2, hot.signature_by_claim_id[c3]: c3})
+
+            (pp.thoughtdb_dir / "view.snapshot.json").unlink(missing_ok=True)
+            rebuilt = ThoughtDbStore(home_dir=Path(home), project_paths=pp).load_view(scope="project")
+            # Signatures are persisted: a snapshot load hashes nothing.
+            with mock.patch("mi.thoughtdb._view_store_impl.claim_signature", side_effect=AssertionError("claim_signature should not be called")):
+                snap = ThoughtDbStore(home_dir=Path(home), project_paths=pp).load_view(scope="project")
+            for v in (rebuilt, snap):
+                self.assertEqual(v.signature_by_claim_id, hot.signature_by_claim_id)
+                self.assertEqual(v.claim_id_by_signature, hot.claim_id_by_signature)
+                self.assertEqual(v.edge_keys, hot.edge_keys)
+
+            # Mining dedupe on a hot view is a lookup: only the mined candidate itself is hashed.
+            _ = tdb.load_view(scope="global")
+            with mock.patch("mi.thoughtdb._view_store_impl._claim_signature_index", side_effect=AssertionError("full signature pass")):
+                applied = tdb.apply_mined_output(
+                    output={
+                        "claims": [{"local_id": "m1", "claim_type": "fact", "text": "ALPHA uses python", "scope": "project", "confidence": 0.95, "source_event_ids": ["ev_1"]}],
+                        "edges": [{"edge_type": "depends_on", "from_claim_id": c3, "to_claim_id": "m1", "confidence": 0.95, "source_event_ids": ["ev_1"]}],
+                        "notes": "",
+                    },
+                    allowed_event_ids={"ev_1"},
+                    min_confidence=0.9,
+                    max_claims=6,
+                )
+            self.assertEqual(applied["linked_existing"], [{"local_id": "m1", "claim_id": c2, "scope": "project"}])
+            self.assertEqual(applied["written_edges"], [])
+            self.assertEqual(applied["skipped"][0]["reason"], "duplicate_edge")
+
+    def test_shared_global_view_is_reused_across_stores_and_republished_when_stale(self) -> None:
+        with tempfile.TemporaryDirectory() as home, tempfile.TemporaryDirectory() as project_root:
+            pp = ProjectPaths(home_dir=Path(home), project_root=Path(project_root))
+            tdb = ThoughtDbStore(home_dir=Path(home), project_paths=pp, shared_global_view=True)
+
+            def _claim(text: str) -> str:
+                return tdb.append_claim_create(
+                    claim_type="preference",
+                    text=text,
+                    scope="global",
+                    visibility="global",
+                    valid_from=None,
+                    valid_to="2030-01-01T00:00:00Z",
+                    tags=["values:base"],
+                    source_event_ids=["ev_1"],
+                    confidence=1.0,
+                    notes="",
+                )
+
+            c1 = _claim("Prefer small diffs.")
+            v1 = tdb.load_view(scope="global")
+            _ = v1.claim_validity
+            tdb.flush_snapshots_best_effort()
+            shared = GlobalPaths(home_dir=Path(home)).thoughtdb_global_dir / SHARED_VIEW_FILENAME
+            self.assertTrue(shared.exists())
+            gen1 = int((read_shared_view_header(shared) or {}).get("generation") or 0)
+            self.assertGreaterEqual(gen1, 1)
+
+            # Another process/store maps the image: no JSONL or JSON snapshot reads, all indices present.
+            other = ThoughtDbStore(home_dir=Path(home), project_paths=pp, shared_global_view=True)
+            with mock.patch("mi.thoughtdb.store.iter_jsonl", side_effect=AssertionError("iter_jsonl should not be called")), mock.patch(
+                "mi.thoughtdb._view_store_impl.read_json", side_effect=AssertionError("JSON snapshot should not be read")
+            ):
+                v2 = other.load_view(scope="global")
+            self.assertEqual(v2.claims_by_id, v1.claims_by_id)
+            self.assertEqual(v2.claims_by_tag, v1.claims_by_tag)
+            self.assertEqual(v2.ids_by_source_event, v1.ids_by_source_event)
+            self.assertEqual(v2.claim_id_by_signature, v1.claim_id_by_signature)
+            self.assertEqual(v2.claim_validity.windows, v1.claim_validity.windows)
+            self.assertEqual(other._view.shared_view_generation, gen1)
+
+            # A stale image (files changed) is ignored; the next cold load republishes a newer generation.
+            c2 = _claim("Ask before deleting files.")
+            fresh = ThoughtDbStore(home_dir=Path(home), project_paths=pp, shared_global_view=True)
+            v3 = fresh.load_view(scope="global")
+            self.assertEqual(set(v3.claims_by_id), {c1, c2})
+            self.assertGreater(int((read_shared_view_header(shared) or {}).get("generation") or 0), gen1)
+
+            # Disabled (default): the image is neither read nor written.
+            shared.unlink()
+            _ = ThoughtDbStore(home_dir=Path(home), project_paths=pp).load_view(scope="global")
+            self.assertFalse(shared.exists())
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,13 +3,22 @@ from __future__ import annotations
 import json
 import tempfile
 import unittest
+from unittest import mock
 from dataclasses import dataclass
 from pathlib import Path
 
 from mi.core.paths import ProjectPaths
 from mi.memory.service import MemoryService
 from mi.thoughtdb import ThoughtDbStore
-from mi.thoughtdb.why import collect_candidate_claims_for_target, query_from_evidence_event, run_why_trace
+from mi.thoughtdb.why import (
+    collect_candidate_claims_for_target,
+    collect_why_targets_for_events,
+    evidence_events_for_run,
+    pack_why_targets,
+    query_from_evidence_event,
+    run_why_trace,
+    run_why_trace_batch,
+)
 
 
 @dataclass(frozen=True)
@@ -151,6 +160,82 @@ class TestWhyTrace(unittest.TestCase):
             v = tdb.load_view(scope="project")
             self.assertTrue(any(e.get("edge_type") == "depends_on" and e.get("from_id") == event_id and e.get("to_id") == cid for e in v.edges if isinstance(e, dict)))
 
+    def test_batch_why_trace_packs_targets_and_appends_edges_once(self) -> None:
+        with tempfile.TemporaryDirectory() as td_home, tempfile.TemporaryDirectory() as td_proj:
+            home = Path(td_home)
+            pp = ProjectPaths(home_dir=home, project_root=Path(td_proj))
+            tdb = ThoughtDbStore(home_dir=home, project_paths=pp)
+            mem = MemoryService(home)
+
+            events: list[dict] = []
+            claim_ids: list[str] = []
+            for i in range(5):
+                ev_id = f"ev_run_a_{i:06d}"
+                events.append({"kind": "decide_next", "run_id": "run_a", "event_id": ev_id, "batch_id": f"b{i}", "notes": f"topic{i}"})
+                claim_ids.append(
+                    tdb.append_claim_create(
+                        claim_type="goal",
+                        text=f"Decision support for topic{i}",
+                        scope="project",
+                        visibility="project",
+                        valid_from=None,
+                        valid_to=None,
+                        tags=[],
+                        source_event_ids=[ev_id],
+                        confidence=1.0,
+                        notes="",
+                    )
+                )
+            other = {"kind": "decide_next", "run_id": "run_b", "event_id": "ev_run_b_000001", "batch_id": "b9", "notes": "x"}
+            pp.evidence_log_path.parent.mkdir(parents=True, exist_ok=True)
+            pp.evidence_log_path.write_text("".join(json.dumps(o) + "\n" for o in [*events, other]), encoding="utf-8")
+
+            rid, objs = evidence_events_for_run(evidence_log_path=pp.evidence_log_path, run_id="run_a", kinds={"decide_next"})
+            self.assertEqual((rid, [o["event_id"] for o in objs]), ("run_a", [e["event_id"] for e in events]))
+            self.assertEqual(evidence_events_for_run(evidence_log_path=pp.evidence_log_path, run_id="last", kinds={"decide_next"})[0], "run_b")
+
+            with mock.patch.object(mem, "ingest_structured", wraps=mem.ingest_structured) as ingest:
+                targets = collect_why_targets_for_events(tdb=tdb, mem=mem, project_paths=pp, target_objs=objs, top_k=12, as_of_ts="2026-01-01T00:00:00Z")
+            self.assertEqual(ingest.call_count, 1)
+            self.assertEqual([t.key for t in targets], [e["event_id"] for e in events])
+            for t, cid in zip(targets, claim_ids):
+                self.assertIn(cid, [c["claim_id"] for c in t.candidate_claims])
+
+            chunks = pack_why_targets(targets, as_of_ts="", max_prompt_tokens=100_000, max_targets_per_call=2)
+            self.assertEqual([len(c) for c in chunks], [2, 2, 1])
+            self.assertEqual(len(pack_why_targets(targets, as_of_ts="", max_prompt_tokens=1, max_targets_per_call=8)), 5)
+
+            calls: list[str] = []
+
+            class _BatchMind:
+                def call(self, *, schema_filename: str, prompt: str, tag: str) -> _FakeMindResult:
+                    calls.append(schema_filename)
+                    traces = []
+                    for t, cid in zip(targets, claim_ids):
+                        if t.key in prompt and t.key != targets[3].key:
+                            # Target 3 is omitted; target 1 also picks a non-candidate id (dropped).
+                            extra = [claim_ids[0]] if t.key == targets[1].key else []
+                            traces.append({"target_key": t.key, "status": "ok", "confidence": 0.9, "chosen_claim_ids": [cid, *extra], "explanation": "", "notes": ""})
+                    return _FakeMindResult(obj={"traces": traces, "notes": ""}, transcript_path=Path(f"batch_{len(calls)}.jsonl"))
+
+            with mock.patch.object(tdb, "append_edge", side_effect=AssertionError("per-edge append")), mock.patch.object(
+                tdb, "append_edges", wraps=tdb.append_edges
+            ) as bulk:
+                outs = run_why_trace_batch(mind=_BatchMind(), tdb=tdb, targets=targets, as_of_ts="2026-01-01T00:00:00Z", max_prompt_tokens=100_000, max_targets_per_call=2)
+            self.assertEqual(calls, ["why_trace_batch.json"] * 3)
+            self.assertEqual(bulk.call_count, 1)
+            self.assertEqual(len(outs), 5)
+            self.assertEqual(outs[1].obj["chosen_claim_ids"], [claim_ids[1]])
+            self.assertEqual(outs[3].obj["status"], "insufficient")
+            self.assertEqual(outs[3].written_edge_ids, [])
+            self.assertEqual(outs[4].mind_transcript_ref, "batch_3.jsonl")
+
+            v = tdb.load_view(scope="project")
+            for i in (0, 1, 2, 4):
+                (eid,) = outs[i].written_edge_ids
+                e = v.edge_by_id(eid)
+                self.assertEqual((e["from_id"], e["to_id"]), (targets[i].key, claim_ids[i]))
+
 
 if __name__ == "__main__":
     unittest.main()